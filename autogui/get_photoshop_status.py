@@ -13,6 +13,7 @@ Exposes a JSON payload containing:
 
 from __future__ import annotations
 
+from enum import Enum
 import json
 import sys
 from pathlib import Path
@@ -63,10 +64,57 @@ def color_to_dict(solid_color: Any) -> Dict[str, Any]:
     return result
 
 
+# Everything gather_status reports, read with a single Application.snapshot call.
+DOCUMENT_FIELDS = {
+    "name": "activeDocument.name",
+    "path": "activeDocument.path",
+    "full_name": "activeDocument.fullName",
+    "width": "activeDocument.width",
+    "height": "activeDocument.height",
+    "resolution": "activeDocument.resolution",
+    "mode": "activeDocument.mode",
+    "bits_per_channel": "activeDocument.bitsPerChannel",
+    "color_profile": "activeDocument.colorProfileName",
+    "layers": "activeDocument.layers.length",
+}
+LAYER_FIELDS = {
+    "name": "activeDocument.activeLayer.name",
+    "kind": "activeDocument.activeLayer.kind",
+    "visible": "activeDocument.activeLayer.visible",
+    "locked": "activeDocument.activeLayer.allLocked",
+    "opacity": "activeDocument.activeLayer.opacity",
+    "fillOpacity": "activeDocument.activeLayer.fillOpacity",
+    "is_background": "activeDocument.activeLayer.isBackgroundLayer",
+}
+COLOR_FIELDS = ("model", "rgb.red", "rgb.green", "rgb.blue")
+STATUS_FIELDS = (
+    "currentTool",
+    *DOCUMENT_FIELDS.values(),
+    *LAYER_FIELDS.values(),
+    "activeDocument.selection.bounds",
+    *(f"{color}.{field}" for color in ("foregroundColor", "backgroundColor") for field in COLOR_FIELDS),
+)
+
+
+def snapshot_color(values: Dict[str, Any], color: str) -> Optional[Dict[str, Any]]:
+    """Build the color_to_dict payload of an application color from snapshot values."""
+    if values.get(f"{color}.rgb.red") is None:
+        return None
+    result: Dict[str, Any] = {}
+    if values.get(f"{color}.model") is not None:
+        model = values[f"{color}.model"]
+        result["model"] = getattr(model, "name", str(model))
+    result["rgb"] = {channel: values.get(f"{color}.rgb.{channel}") for channel in ("red", "green", "blue")}
+    return result
+
+
 def gather_status() -> Dict[str, Any]:
-    """Return the aggregated Photoshop status dictionary."""
+    """Return the aggregated Photoshop status dictionary.
+
+    All values are read with one ``doJavaScript`` round trip, properties
+    Photoshop cannot provide (no document, no selection...) come back as None.
+    """
     from photoshop import Session  # pylint: disable=import-outside-toplevel
-    from photoshop.api import errors  # pylint: disable=import-outside-toplevel
 
     status: Dict[str, Any] = {
         "tool": None,
@@ -77,100 +125,35 @@ def gather_status() -> Dict[str, Any]:
     }
 
     with Session() as ps:
-        try:
-            status["tool"] = ps.app.currentTool
-        except Exception:
-            status["tool"] = None
-
-        try:
-            doc = ps.active_document
-        except errors.PhotoshopPythonAPIError:
-            doc = None
-
-        def safe_attr(target: Any, name: str, fallback: Any = None) -> Any:
-            try:
-                return getattr(target, name)
-            except Exception:
-                return fallback
-
-        def safe_str(value: Any) -> Optional[str]:
-            if value is None:
-                return None
-            try:
-                text = str(value)
-                return text if text else None
-            except Exception:
-                return None
-
-        if doc:
-            layer_count = None
-            try:
-                layers_obj = safe_attr(doc, "layers")
-                if layers_obj is not None:
-                    try:
-                        layer_count = safe_attr(layers_obj, "length")
-                    except Exception:
-                        try:
-                            layer_count = len(list(layers_obj))  # type: ignore[arg-type]
-                        except Exception:
-                            layer_count = None
-            except Exception:
-                layer_count = None
-
-            status["document"] = {
-                "name": safe_attr(doc, "name"),
-                "path": safe_str(safe_attr(doc, "path")),
-                "full_name": safe_str(safe_attr(doc, "fullName")),
-                "width": serialize_unit(safe_attr(doc, "width")),
-                "height": serialize_unit(safe_attr(doc, "height")),
-                "resolution": serialize_unit(safe_attr(doc, "resolution")),
-                "mode": safe_str(safe_attr(doc, "mode")),
-                "bits_per_channel": safe_attr(doc, "bitsPerChannel"),
-                "color_profile": safe_attr(doc, "colorProfileName"),
-                "layers": layer_count,
-            }
-
-            # Active layer info
-            try:
-                layer = safe_attr(doc, "activeLayer")
-            except Exception:
-                layer = None
-
-            if layer:
-                status["layer"] = {
-                    "name": safe_attr(layer, "name"),
-                    "kind": safe_str(safe_attr(layer, "kind")),
-                    "visible": safe_attr(layer, "visible"),
-                    "locked": safe_attr(layer, "allLocked"),
-                    "opacity": safe_attr(layer, "opacity"),
-                    "fillOpacity": safe_attr(layer, "fillOpacity"),
-                    "is_background": safe_attr(layer, "isBackgroundLayer"),
-                }
-
-            # Selection
-            try:
-                selection = safe_attr(doc, "selection")
-                bounds = selection.bounds if selection else None  # type: ignore[attr-defined]
-                if selection and bounds:
-                    status["selection"] = {
-                        "has_selection": True,
-                        "bounds": [serialize_unit(val) for val in bounds],
-                    }
-                else:
-                    raise ValueError
-            except Exception:
-                status["selection"] = {"has_selection": False, "bounds": None}
-
-        # Colors are app-level and exist even without documents
-        try:
-            status["colors"]["foreground"] = color_to_dict(ps.app.foregroundColor)
-        except Exception:
-            status["colors"]["foreground"] = None
-        try:
-            status["colors"]["background"] = color_to_dict(ps.app.backgroundColor)
-        except Exception:
-            status["colors"]["background"] = None
-
+        values = ps.app.snapshot(STATUS_FIELDS)
+
+    def safe_str(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        text = value.name if isinstance(value, Enum) else str(value)
+        return text if text else None
+
+    status["tool"] = values["currentTool"]
+    if values[DOCUMENT_FIELDS["name"]] is not None:
+        document = {key: values[field] for key, field in DOCUMENT_FIELDS.items()}
+        for key in ("path", "full_name", "mode"):
+            document[key] = safe_str(document[key])
+        for key in ("width", "height", "resolution"):
+            document[key] = serialize_unit(document[key])
+        status["document"] = document
+
+        if values[LAYER_FIELDS["name"]] is not None:
+            layer = {key: values[field] for key, field in LAYER_FIELDS.items()}
+            layer["kind"] = safe_str(layer["kind"])
+            status["layer"] = layer
+
+        bounds = values["activeDocument.selection.bounds"]
+        if bounds:
+            status["selection"] = {"has_selection": True, "bounds": [serialize_unit(val) for val in bounds]}
+
+    # Colors are app-level and exist even without documents
+    status["colors"]["foreground"] = snapshot_color(values, "foregroundColor")
+    status["colors"]["background"] = snapshot_color(values, "backgroundColor")
     return status
 
 
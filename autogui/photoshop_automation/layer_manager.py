@@ -116,31 +116,40 @@ def _find_layer_position(records: List[LayerRecord], target_index: int) -> Optio
 def list_layers(flat: bool = True) -> List[LayerRecord]:
     """Return flattened list of layers for the active document."""
     with Session() as ps:
-        doc = ps.active_document
-        return _build_layer_records(doc)
+        # One call lists the layers, in the order activate_layer_by_index indexes them.
+        return [
+            LayerRecord(
+                index=position,
+                name=node.name,
+                visible=node.visible,
+                kind=str(node.kind),
+                depth=node.depth,
+                is_group=node.is_group,
+                handle=node.ref,
+            )
+            for position, node in enumerate(ps.active_document.layer_tree())
+        ]
 
 
 def activate_layer_by_name(target: str) -> Tuple[bool, Optional[str]]:
     name_norm = target.strip().lower()
     with Session() as ps:
-        doc = ps.active_document
-        layers: List[LayerRecord] = []
-        _flatten_layers(doc.layers, layers)
-        for record in layers:
-            if record.name.lower() == name_norm:
-                doc.activeLayer = record.handle
-                return True, record.name
+        # One call lists the layers, selecting one by its ID does not walk the document again.
+        for node in ps.active_document.layer_tree():
+            if node.name.lower() == name_norm:
+                node.ref.select()
+                return True, node.name
     return False, None
 
 
 def activate_layer_by_index(idx: int) -> Tuple[bool, Optional[str]]:
     with Session() as ps:
-        doc = ps.active_document
-        layers = _build_layer_records(doc)
-        if 0 <= idx < len(layers):
-            record = layers[idx]
-            doc.activeLayer = record.handle
-            return True, record.name
+        # Same tree as list_layers, so its indices select the listed layers.
+        tree = ps.active_document.layer_tree()
+        if 0 <= idx < len(tree):
+            node = tree[idx]
+            node.ref.select()
+            return True, node.name
     return False, None
 
 
@@ -2,16 +2,15 @@
 
 This example demonstrates how to:
 1. Export each layer of a document as a separate PNG file
-2. Handle layer visibility during export
-3. Manage layer selection and activation
+2. Leave the visibility of the layers untouched during export
+3. Follow the progress of the export file by file
 4. Configure export settings for PNG format
 
 Key concepts:
-- Layer iteration
-- Visibility management
+- Layer export inside Photoshop
 - PNG export settings
 - File naming conventions
-- Layer selection
+- Export records
 """
 
 # Import built-in modules
@@ -21,38 +20,23 @@ import os
 from photoshop import Session
 
 
+def report(record):
+    """Print the result of each file as soon as it is saved."""
+    print(record["path"], record["error"] or "saved")
+
+
 with Session() as ps:
     doc = ps.active_document
-    
-    # Store original layer visibilities
-    layer_visibilities = []
-    for layer in doc.layers:
-        layer_visibilities.append(layer.visible)
-        layer.visible = False
-    
-    try:
-        # Export each layer individually
-        for i, layer in enumerate(doc.layers):
-            # Show only current layer
-            layer.visible = True
-            
-            # Configure PNG save options
-            options = ps.PNGSaveOptions()
-            options.interlaced = False
-            
-            # Generate unique filename for each layer
-            file_path = os.path.join(
-                os.path.dirname(__file__),
-                f"layer_{i}_{layer.name}.png"
-            )
-            
-            # Save the file
-            doc.saveAs(file_path, options, True)
-            
-            # Hide the layer again
-            layer.visible = False
-    
-    finally:
-        # Restore original layer visibilities
-        for layer, visibility in zip(doc.layers, layer_visibilities):
-            layer.visible = visibility
+
+    # Each top level layer is copied to a new document and saved inside
+    # Photoshop, so the document itself is never changed
+    records = doc.export_layers(
+        os.path.dirname(__file__),
+        "png",
+        options={"interlaced": False},
+        naming="layer_{index}_{name}",
+        on_file=report,
+    )
+
+    failed = [record for record in records if record["error"]]
+    print(f"Exported {len(records) - len(failed)} of {len(records)} layers")
@@ -2,15 +2,22 @@
 import os
 
 # Import local modules
-from photoshop import Session
+from photoshop.batch import NativeBatch
 
 
 root = "your/images/root"
 files = []
 for name in os.listdir(root):
     files.append(os.path.join(root, name))
-with Session() as api:
-    options = api.BatchOptions()
-    options.destination = 3
-    options.destinationFolder = "c:\\test"
-    api.app.batch(files=files, actionName="Quadrant Colors", actionSet="Default Actions", options=options)
+
+# Run Photoshop's batch command on chunks of files, so a bad file only fails its
+# own chunk, and print the throughput of each chunk as it completes.
+batch = NativeBatch(
+    files,
+    "Quadrant Colors",
+    "Default Actions",
+    options={"destination": 3, "destinationFolder": "c:\\test"},
+    on_chunk=lambda chunk: print(f"{len(chunk.files)} files, {chunk.files_per_minute:.0f} files/min"),
+)
+report = batch.run()
+print(report)
@@ -1,5 +1,21 @@
-# Import local modules
-from photoshop.session import Session
+# Import built-in modules
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    # Import local modules
+    from photoshop.session import Session
 
 
 __all__ = ["Session"]
+
+
+def __getattr__(name: str):
+    # Import `photoshop.session` on first use, see `photoshop.api` for the lazy API names.
+    if name == "Session":
+        # Import local modules
+        from photoshop.session import Session
+
+        globals()["Session"] = Session
+        return Session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,217 @@
+"""Automate Photoshop from asyncio without blocking the event loop.
+
+Every Photoshop call runs on the worker thread of an `STAExecutor`, see
+`photoshop.sta`, while the event loop keeps running other tasks. Attribute
+paths are awaitable and resolved in one call on that thread:
+``await doc.activeLayer.name`` reads the name, ``await doc.artLayers.add()``
+adds a layer, and `AsyncProxy.set` writes a property. Objects read or returned
+are `AsyncProxy` objects again, numbers, strings and enumeration values are
+returned as they are. `AsyncProxy.run` runs a function taking the object on
+the worker thread, to do several steps in one call.
+
+Awaiting a call can be cancelled, or limited with `asyncio.wait_for` or the
+``timeout`` of `AsyncSession`. A call that did not start yet is removed from
+the queue; one Photoshop is already running finishes on the worker thread,
+but its result is dropped.
+
+Examples:
+    ```python
+
+        import asyncio
+
+        from photoshop.aio import AsyncSession
+
+        async def main():
+            async with AsyncSession(action="new_document", timeout=30) as ps:
+                doc = await ps.active_document
+                layer = await doc.artLayers.add()
+                await layer.set("name", "Title")
+                print(await doc.activeLayer.name, await ps.app.doJavaScript("app.version"))
+                async for layer in doc.layers:
+                    print(await layer.name)
+
+        asyncio.run(main())
+    ```
+
+"""
+
+# Import built-in modules
+import asyncio
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+
+# Import local modules
+from photoshop.sta import STAExecutor
+from photoshop.sta import STAProxy
+from photoshop.sta import _PLAIN_TYPES
+
+
+def _resolve(target: Any, path: Tuple) -> Any:
+    for step, key in path:
+        target = getattr(target, key) if step == "attr" else target[key]
+    return target
+
+
+def _call(target: Any, path: Tuple, args: tuple, kwargs: dict) -> Any:
+    return _resolve(target, path)(*args, **kwargs)
+
+
+def _assign(target: Any, path: Tuple, name: str, value: Any):
+    setattr(_resolve(target, path), name, value)
+
+
+def _items(target: Any, path: Tuple) -> list:
+    # Photoshop collections are enumerated in one call on the worker thread.
+    return list(_resolve(target, path))
+
+
+def _apply(target: Any, func: Callable, args: tuple, kwargs: dict) -> Any:
+    return func(target, *args, **kwargs)
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, AsyncProxy):
+        return value._proxy
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+class AsyncProxy:
+    """Awaitable counterpart of a Photoshop object, e.g. a `Document` or an `ArtLayer`.
+
+    Reading an attribute returns an awaitable path, see the module documentation.
+    """
+
+    def __init__(self, proxy: Optional[STAProxy], timeout: Optional[float] = None):
+        self._proxy = proxy
+        self._timeout = timeout
+
+    def __repr__(self):
+        # The repr of Photoshop objects reads from Photoshop, only use the type here.
+        target = type(self._proxy._target).__name__ if self._proxy is not None else "closed"
+        return f"<{type(self).__name__} {target}>"
+
+    def __getattr__(self, name: str) -> "AsyncPath":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return AsyncPath(self, (("attr", name),))
+
+    def __getitem__(self, key: Any) -> "AsyncPath":
+        return AsyncPath(self, (("item", key),))
+
+    def __aiter__(self):
+        return AsyncPath(self, ()).__aiter__()
+
+    async def set(self, name: str, value: Any):
+        """Write a property of the object."""
+        await self._submit(_assign, (), name, value)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Call ``func(obj, *args, **kwargs)`` on the worker thread with the Photoshop object.
+
+        Returns:
+            The value returned by `func`, objects wrapped in an `AsyncProxy`.
+
+        """
+        return await self._submit(_apply, func, args, kwargs)
+
+    async def _submit(self, func: Callable, *args) -> Any:
+        if self._proxy is None:
+            raise RuntimeError(f"{type(self).__name__} is not open, use it with `async with`.")
+        executor = self._proxy._executor
+        future = asyncio.wrap_future(executor.submit(func, self._proxy, *_unwrap(args)))
+        # Cancelling the awaited future cancels the call if the worker thread did not start it yet.
+        value = await asyncio.wait_for(future, self._timeout)
+        return self._wrap(value)
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, _PLAIN_TYPES):
+            return value
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._wrap(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return AsyncProxy(self._proxy._executor.proxy(value), self._timeout)
+
+
+class AsyncPath:
+    """Attributes and items read from an `AsyncProxy`, resolved in one call when awaited or called."""
+
+    __slots__ = ("_owner", "_path")
+
+    def __init__(self, owner: AsyncProxy, path: Tuple):
+        self._owner = owner
+        self._path = path
+
+    def __repr__(self):
+        steps = "".join(f".{key}" if step == "attr" else f"[{key!r}]" for step, key in self._path)
+        return f"<AsyncPath {steps}>"
+
+    def __getattr__(self, name: str) -> "AsyncPath":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return AsyncPath(self._owner, (*self._path, ("attr", name)))
+
+    def __getitem__(self, key: Any) -> "AsyncPath":
+        return AsyncPath(self._owner, (*self._path, ("item", key)))
+
+    def __await__(self):
+        return self._owner._submit(_resolve, self._path).__await__()
+
+    def __call__(self, *args, **kwargs):
+        return self._owner._submit(_call, self._path, args, kwargs)
+
+    async def __aiter__(self):
+        for item in await self._owner._submit(_items, self._path):
+            yield item
+
+    async def set(self, name: str, value: Any):
+        """Write a property of the object at this path."""
+        await self._owner._submit(_assign, self._path, name, value)
+
+
+class AsyncSession(AsyncProxy):
+    """Awaitable counterpart of `Session`, opened with `async with`.
+
+    Args:
+        *args: The arguments of `Session`.
+        executor: The executor running the calls, a new one owned by the session by default.
+        timeout: Seconds each call may take, None to wait as long as Photoshop takes.
+        **kwargs: The keyword arguments of `Session`.
+
+    """
+
+    def __init__(self, *args, executor: Optional[STAExecutor] = None, timeout: Optional[float] = None, **kwargs):
+        super().__init__(None, timeout)
+        self._args = args
+        self._kwargs = kwargs
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    async def __aenter__(self) -> "AsyncSession":
+        # Import local modules
+        from photoshop.session import Session
+
+        if self._executor is None:
+            self._executor = STAExecutor()
+        future = self._executor.submit(lambda: Session(*self._args, **self._kwargs).__enter__())
+        session = await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+        self._proxy = self._executor.proxy(session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.run(lambda session: session.__exit__(exc_type, exc_val, exc_tb))
+        finally:
+            self._proxy = None
+            if self._owns_executor:
+                # The worker thread exits once the queued calls ran.
+                self._executor.shutdown(wait=False)
+                self._executor = None
@@ -1,36 +1,82 @@
-"""Python API for Photoshop."""
-# Import local modules
-from photoshop.api import constants
-from photoshop.api.action_descriptor import ActionDescriptor
-from photoshop.api.action_list import ActionList
-from photoshop.api.action_reference import ActionReference
-from photoshop.api.application import Application
-from photoshop.api.batch_options import BatchOptions
-from photoshop.api.colors import CMYKColor
-from photoshop.api.colors import GrayColor
-from photoshop.api.colors import HSBColor
-from photoshop.api.colors import LabColor
-from photoshop.api.colors import RGBColor
-from photoshop.api.enumerations import *  # noqa: F403
-from photoshop.api.errors import PhotoshopPythonAPICOMError
-from photoshop.api.errors import PhotoshopPythonAPIError
-from photoshop.api.event_id import EventID
-from photoshop.api.open_options import EPSOpenOptions
-from photoshop.api.save_options import BMPSaveOptions
-from photoshop.api.save_options import EPSSaveOptions
-from photoshop.api.save_options import ExportOptionsSaveForWeb
-from photoshop.api.save_options import GIFSaveOptions
-from photoshop.api.save_options import JPEGSaveOptions
-from photoshop.api.save_options import PDFSaveOptions
-from photoshop.api.save_options import PNGSaveOptions
-from photoshop.api.save_options import PhotoshopSaveOptions
-from photoshop.api.save_options import TargaSaveOptions
-from photoshop.api.save_options import TiffSaveOptions
-from photoshop.api.solid_color import SolidColor
-from photoshop.api.text_item import TextItem
-
-
-__all__ = [  # noqa: F405
+"""Python API for Photoshop.
+
+The names of this package are imported on first access (PEP 562), importing
+`photoshop.api` does not load the wrapper classes and the enumerations until
+they are used.
+"""
+# Import built-in modules
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    # Import local modules
+    from photoshop.api import constants
+    from photoshop.api import enumerations
+    from photoshop.api._layer_ref import LayerRef
+    from photoshop.api.action_descriptor import ActionDescriptor
+    from photoshop.api.action_list import ActionList
+    from photoshop.api.action_reference import ActionReference
+    from photoshop.api.application import Application
+    from photoshop.api.batch_options import BatchOptions
+    from photoshop.api.colors import CMYKColor
+    from photoshop.api.colors import GrayColor
+    from photoshop.api.colors import HSBColor
+    from photoshop.api.colors import LabColor
+    from photoshop.api.colors import RGBColor
+    from photoshop.api.enumerations import *  # noqa: F401,F403
+    from photoshop.api.errors import PhotoshopPythonAPICOMError
+    from photoshop.api.errors import PhotoshopPythonAPIError
+    from photoshop.api.event_id import EventID
+    from photoshop.api.open_options import EPSOpenOptions
+    from photoshop.api.save_options import BMPSaveOptions
+    from photoshop.api.save_options import EPSSaveOptions
+    from photoshop.api.save_options import ExportOptionsSaveForWeb
+    from photoshop.api.save_options import GIFSaveOptions
+    from photoshop.api.save_options import JPEGSaveOptions
+    from photoshop.api.save_options import PDFSaveOptions
+    from photoshop.api.save_options import PNGSaveOptions
+    from photoshop.api.save_options import PhotoshopSaveOptions
+    from photoshop.api.save_options import TargaSaveOptions
+    from photoshop.api.save_options import TiffSaveOptions
+    from photoshop.api.solid_color import SolidColor
+    from photoshop.api.text_item import TextItem
+
+
+# The module defining each name, other capitalized names are looked up in `enumerations`.
+_EXPORTS = {
+    "ActionDescriptor": "photoshop.api.action_descriptor",
+    "ActionReference": "photoshop.api.action_reference",
+    "ActionList": "photoshop.api.action_list",
+    "Application": "photoshop.api.application",
+    "BatchOptions": "photoshop.api.batch_options",
+    "PhotoshopPythonAPIError": "photoshop.api.errors",
+    "PhotoshopPythonAPICOMError": "photoshop.api.errors",
+    "CMYKColor": "photoshop.api.colors",
+    "GrayColor": "photoshop.api.colors",
+    "HSBColor": "photoshop.api.colors",
+    "LabColor": "photoshop.api.colors",
+    "RGBColor": "photoshop.api.colors",
+    "SolidColor": "photoshop.api.solid_color",
+    "EventID": "photoshop.api.event_id",
+    "LayerRef": "photoshop.api._layer_ref",
+    "BMPSaveOptions": "photoshop.api.save_options",
+    "GIFSaveOptions": "photoshop.api.save_options",
+    "JPEGSaveOptions": "photoshop.api.save_options",
+    "PDFSaveOptions": "photoshop.api.save_options",
+    "ExportOptionsSaveForWeb": "photoshop.api.save_options",
+    "PNGSaveOptions": "photoshop.api.save_options",
+    "PhotoshopSaveOptions": "photoshop.api.save_options",
+    "TiffSaveOptions": "photoshop.api.save_options",
+    "TargaSaveOptions": "photoshop.api.save_options",
+    "EPSOpenOptions": "photoshop.api.open_options",
+    "EPSSaveOptions": "photoshop.api.save_options",
+    "TextItem": "photoshop.api.text_item",
+}
+
+_SUBMODULES = ("constants", "enumerations")
+
+__all__ = [
     "ActionDescriptor",
     "ActionReference",
     "ActionList",
@@ -47,6 +93,7 @@ __all__ = [  # noqa: F405
     "RGBColor",
     "SolidColor",
     "EventID",
+    "LayerRef",
     "BMPSaveOptions",
     "GIFSaveOptions",
     "JPEGSaveOptions",
@@ -60,3 +107,29 @@ __all__ = [  # noqa: F405
     "EPSSaveOptions",
     "TextItem",
 ]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif not name[:1].isupper():
+        # Submodules, `from photoshop.api import errors` looks them up here before importing them.
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        enumerations = importlib.import_module(f"{__name__}.enumerations")
+        try:
+            value = getattr(enumerations, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Later accesses find the name without calling this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    enumerations = importlib.import_module(f"{__name__}.enumerations")
+    names = (name for name in dir(enumerations) if not name.startswith("_"))
+    return sorted({*globals(), *__all__, *names})
@@ -1,7 +1,13 @@
 # Import built-in modules
 from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
 
 # Import local modules
+from photoshop.api import _batch
+from photoshop.api import _dispid_cache
+from photoshop.api import _snapshot
 from photoshop.api._core import Photoshop
 from photoshop.api.enumerations import RasterizeType
 from photoshop.api.text_item import TextItem
@@ -15,50 +21,53 @@ class ArtLayer(Photoshop):
 
     """
 
+    app = _batch.BatchedApp("layer")
+
+    _method_flags = (
+        "add",
+        "adjustBrightnessContrast",
+        "adjustColorBalance",
+        "adjustCurves",
+        "adjustLevels",
+        "applyAddNoise",
+        "applyAverage",
+        "applyBlur",
+        "applyBlurMore",
+        "applyClouds",
+        "applyCustomFilter",
+        "applyDeInterlace",
+        "applyDespeckle",
+        "applyDifferenceClouds",
+        "applyDiffuseGlow",
+        "applyDisplace",
+        "applyDustAndScratches",
+        "applyGaussianBlur",
+        "applyGlassEffect",
+        "applyHighPass",
+        "applyLensBlur",
+        "applyLensFlare",
+        "applyMaximum",
+        "applyMedianNoise",
+        "applyMinimum",
+        "applyMotionBlur",
+        "applyNTSC",
+        "applyOceanRipple",
+        "applyOffset",
+        "applyPinch",
+        "delete",
+        "duplicate",
+        "invert",
+        "link",
+        "merge",
+        "move",
+        "posterize",
+        "rasterize",
+        "unlink",
+        "convertToSmartObject",
+    )
+
     def __init__(self, parent: Any = None):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "add",
-            "adjustBrightnessContrast",
-            "adjustColorBalance",
-            "adjustCurves",
-            "adjustLevels",
-            "applyAddNoise",
-            "applyAverage",
-            "applyBlur",
-            "applyBlurMore",
-            "applyClouds",
-            "applyCustomFilter",
-            "applyDeInterlace",
-            "applyDespeckle",
-            "applyDifferenceClouds",
-            "applyDiffuseGlow",
-            "applyDisplace",
-            "applyDustAndScratches",
-            "applyGaussianBlur",
-            "applyGlassEffect",
-            "applyHighPass",
-            "applyLensBlur",
-            "applyLensFlare",
-            "applyMaximum",
-            "applyMedianNoise",
-            "applyMinimum",
-            "applyMotionBlur",
-            "applyNTSC",
-            "applyOceanRipple",
-            "applyOffset",
-            "applyPinch",
-            "delete",
-            "duplicate",
-            "invert",
-            "link",
-            "merge",
-            "move",
-            "posterize",
-            "rasterize",
-            "unlink",
-            "convertToSmartObject",
-        )
 
     @property
     def allLocked(self):
@@ -87,7 +96,7 @@ class ArtLayer(Photoshop):
 
         Returns:
             list: Layer objects"""
-        return [ArtLayer(layer) for layer in self.app.linkedLayers]
+        return [ArtLayer(_dispid_cache.set_interface(layer, None)) for layer in self.app.linkedLayers]
 
     @property
     def name(self) -> str:
@@ -566,3 +575,16 @@ class ArtLayer(Photoshop):
         """
         self.eval_javascript(js)
         return self
+
+    def snapshot(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Read many properties of the layer with a single call to Photoshop.
+
+        Args:
+            fields: Property names or dotted paths, e.g. ``textItem.contents``.
+                The name, kind, visibility, opacity and bounds of the layer by default.
+
+        Returns:
+            dict: The typed values by field, see `photoshop.api._snapshot`.
+
+        """
+        return _snapshot.snapshot(self, "layer", fields)
@@ -1,43 +1,33 @@
-# Import third-party modules
-from comtypes import ArgumentError
-
 # Import local modules
+from photoshop.api import _layer_ref
+from photoshop.api import _snapshot
 from photoshop.api._artlayer import ArtLayer
-from photoshop.api._core import Photoshop
+from photoshop.api._collection import Collection
+from photoshop.api._layer_setters import LayerSetters
 from photoshop.api.errors import PhotoshopPythonAPIError
 
 
 # pylint: disable=too-many-public-methods
-class ArtLayers(Photoshop):
+class ArtLayers(LayerSetters, Collection):
     """The collection of art layer objects in the document."""
 
+    _method_flags = ("add",)
+    _collection_name = "artLayers"
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "add",
-        )
-
-    @property
-    def _layers(self):
-        return list(self.app)
-
-    def __len__(self):
-        return self.length
 
     def __iter__(self):
         for layer in self.app:
             yield layer
 
-    def __getitem__(self, key: str):
-        """Access a given ArtLayer using dictionary key lookup."""
-        try:
-            return ArtLayer(self.app[key])
-        except ArgumentError:
-            raise PhotoshopPythonAPIError(f'Could not find an artLayer named "{key}"')
-
-    @property
-    def length(self):
-        return len(self._layers)
+    def __getitem__(self, key):
+        """Access a given ArtLayer using list index, slice or dictionary key lookup."""
+        if isinstance(key, str):
+            return self.getByName(key)
+        if isinstance(key, slice):
+            return [ArtLayer(layer) for layer in self._item(key)]
+        return ArtLayer(self._item(key))
 
     @property
     def parent(self):
@@ -49,11 +39,12 @@ class ArtLayers(Photoshop):
 
     def add(self):
         """Adds an element."""
+        self._invalidate()
         return ArtLayer(self.app.add())
 
     def getByIndex(self, index: int):
         """Access ArtLayer using list index lookup."""
-        return ArtLayer(self._layers[index])
+        return ArtLayer(self._item(index))
 
     def getByName(self, name: str) -> ArtLayer:
         """Get the first element in the collection with the provided name.
@@ -61,12 +52,16 @@ class ArtLayers(Photoshop):
         Raises:
             PhotoshopPythonAPIError: Could not find a artLayer.
         """
-        for layer in self.app:
-            if layer.name == name:
-                return ArtLayer(layer)
-        raise PhotoshopPythonAPIError(f'Could not find an artLayer named "{name}"')
+        layer = self._find(name)
+        if layer is None:
+            raise PhotoshopPythonAPIError(f'Could not find an artLayer named "{name}"')
+        return ArtLayer(layer)
+
+    def _layers_document_id(self) -> int:
+        return self._owner_locator()["doc"]
 
     def removeAll(self):
-        """Deletes all elements."""
-        for layer in self.app:
-            ArtLayer(layer).remove()
+        """Deletes all elements with a single action, undone as one history state."""
+        ids = [layer["id"] for layer in _snapshot.snapshot_collection(self, ["id"])]
+        _layer_ref.delete(self._layers_document_id(), ids)
+        self._invalidate()
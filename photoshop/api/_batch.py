@@ -0,0 +1,380 @@
+"""Record changes to documents and layers and apply them in a single round trip.
+
+Inside ``with session.batch():`` property writes and method calls made
+through `Document`, `ArtLayer`, `LayerSet` and `TextItem` objects are not
+sent to Photoshop one by one. They are recorded, compiled into one
+ExtendScript program when the block exits and executed with a single
+`doJavaScript` call.
+
+Reads inside the block return a `BatchFuture` instead of the value, its
+result is available once the block exited. Objects returned by calls made in
+the block, e.g. a duplicated layer, can be used by later calls of the same
+block but not after it. Wrapper properties converting the value they read,
+e.g. `ArtLayer.opacity`, cannot be read inside a batch. Only the thread or
+asyncio task opening a batch records into it, see `BatchedApp`.
+
+Examples:
+    ```python
+
+        from photoshop import Session
+
+        with Session(action="new_document") as ps:
+            doc = ps.active_document
+            with ps.batch():
+                for index in range(20):
+                    layer = doc.artLayers.add()
+                    layer.name = f"Layer {index}"
+                    layer.visible = index % 2 == 0
+                name = doc.activeLayer.name
+            print(name.result())
+    ```
+
+"""
+
+# Import built-in modules
+from contextvars import ContextVar
+from enum import Enum
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+# `__color(hex)` creates the SolidColor objects passed as arguments.
+COLOR_FUNCTION = r"""
+function __color(hex) {
+    var color = new SolidColor();
+    color.rgb.hexValue = hex;
+    return color;
+}
+"""
+
+_PENDING = object()
+
+# The batches open in the current context, the innermost last. Threads and asyncio tasks
+# started elsewhere do not see them.
+_batches: "ContextVar[Tuple[Batch, ...]]" = ContextVar("photoshop_batches", default=())
+
+
+class BatchedApp:
+    """The `app` attribute of the wrappers a batch records, e.g. ``app = BatchedApp("layer")`` in `ArtLayer`.
+
+    Returns the dispatch object of the wrapper, or a recording proxy while a
+    batch is open in the current context.
+
+    Args:
+        kind: How programs find the object of a wrapper, see `_jsx.locate`.
+
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            app = instance.__dict__["app"]
+        except KeyError:
+            raise AttributeError("app") from None
+        batches = _batches.get()
+        if not batches or app is None or isinstance(app, BatchFuture):
+            return app
+        return batches[-1].target(instance, app, self.kind)
+
+    def __set__(self, instance, value):
+        instance.__dict__["app"] = value
+
+
+def _kind(wrapper: Any) -> Optional[str]:
+    """The kind of the `BatchedApp` of a wrapper, None if batches do not record it."""
+    attribute = getattr(type(wrapper), "app", None)
+    return attribute.kind if isinstance(attribute, BatchedApp) else None
+
+
+class BatchFuture:
+    """The result of a read or a call recorded in a batch, and a proxy recording the uses of that result.
+
+    Reading an attribute records a read, calling the future turns that read into
+    a method call, assigning an attribute records a property write. Use
+    `result` once the batch exited to get the value.
+    """
+
+    __slots__ = ("_batch", "_index", "_wrapper", "_dispatch", "_kind", "_value", "_error")
+
+    def __init__(self, batch: "Batch", index: Optional[int], wrapper: Any = None, dispatch: Any = None, kind: str = ""):
+        object.__setattr__(self, "_batch", batch)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_wrapper", wrapper)
+        object.__setattr__(self, "_dispatch", dispatch)
+        object.__setattr__(self, "_kind", kind)
+        object.__setattr__(self, "_value", _PENDING)
+        object.__setattr__(self, "_error", None)
+
+    def __repr__(self):
+        if self._index is None:
+            return f"<BatchFuture {type(self._wrapper).__name__}>"
+        state = "pending" if not self.done() else "failed" if self._error else "done"
+        return f"<BatchFuture #{self._index} {state}>"
+
+    def __getattr__(self, name: str) -> "BatchFuture":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._batch._record("get", self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        self._batch._record("set", self, name, value=value)
+
+    def __call__(self, *args, **kwargs) -> "BatchFuture":
+        if kwargs:
+            raise TypeError("Keyword arguments cannot be recorded in a batch.")
+        self._batch._check_open()
+        op = self._batch._ops[self._index] if self._index is not None else None
+        if op is None or op["op"] != "get":
+            raise TypeError(f"{self!r} is not a method.")
+        op["op"] = "call"
+        op["args"] = list(args)
+        return self
+
+    def __iter__(self):
+        raise TypeError("Collections cannot be iterated in a batch.")
+
+    def done(self) -> bool:
+        """bool: Whether the batch ran, successfully or not."""
+        return self._value is not _PENDING or self._error is not None
+
+    def result(self) -> Any:
+        """The value read or returned, DOM objects as a dict of their typename and ID.
+
+        Raises:
+            PhotoshopPythonAPIError: The batch did not run yet, or this operation failed.
+
+        """
+        if self._error is not None:
+            raise self._error
+        if self._value is _PENDING:
+            raise PhotoshopPythonAPIError("The batch has not run yet.")
+        return self._value
+
+    def exception(self) -> Optional[Exception]:
+        """Optional[Exception]: The error of this operation, None if it succeeded."""
+        if not self.done():
+            raise PhotoshopPythonAPIError("The batch has not run yet.")
+        return self._error
+
+    def _resolve(self, value: Any = None, error: Exception = None):
+        object.__setattr__(self, "_value", value)
+        object.__setattr__(self, "_error", error)
+
+
+class Batch:
+    """Records the changes made in a `with` block and applies them with one `doJavaScript` call.
+
+    Use `Session.batch` to create one.
+
+    Args:
+        application: The `Application` running the program, created on exit by default.
+
+    """
+
+    def __init__(self, application: Any = None):
+        self.application = application
+        self.futures: List[BatchFuture] = []
+        self._ops: List[Dict[str, Any]] = []
+        self._targets: Dict[int, BatchFuture] = {}
+        self._open = False
+        self._closed = False
+
+    def __enter__(self) -> "Batch":
+        if self._open or self._closed:
+            raise PhotoshopPythonAPIError("A batch can only be used once.")
+        self._open = True
+        _batches.set(_batches.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _batches.set(tuple(batch for batch in _batches.get() if batch is not self))
+        self._open, self._closed = False, True
+        if exc_type is not None:
+            error = PhotoshopPythonAPIError("The batch was discarded.")
+            for future in self.futures:
+                future._resolve(error=error)
+            return
+        self._run()
+
+    def __len__(self):
+        return len(self._ops)
+
+    def target(self, wrapper: Any, dispatch: Any, kind: str) -> BatchFuture:
+        """Get the proxy recording the uses of a wrapper created outside the batch."""
+        future = self._targets.get(id(wrapper))
+        if future is None:
+            future = self._targets[id(wrapper)] = BatchFuture(self, None, wrapper, dispatch, kind)
+        return future
+
+    def _check_open(self):
+        if not self._open:
+            raise PhotoshopPythonAPIError("Objects created in a batch can only be used inside of it.")
+
+    def _record(self, op: str, target: BatchFuture, name: str, value: Any = None) -> BatchFuture:
+        self._check_open()
+        index = len(self._ops)
+        self._ops.append({"op": op, "target": target, "name": name, "value": value})
+        future = BatchFuture(self, index)
+        self.futures.append(future)
+        return future
+
+    """
+    * Compilation
+    """
+
+    def _encode(self, value: Any) -> Any:
+        """Convert an argument to the JSON form read by the program."""
+        if isinstance(value, Enum):
+            return value.value
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [self._encode(item) for item in value]
+        if isinstance(value, BatchFuture):
+            if value._batch is not self:
+                if value.done():
+                    return self._encode(value.result())
+                raise PhotoshopPythonAPIError("Results of another batch cannot be used before it ran.")
+            if value._index is None:
+                return {"$target": self._locate(value)}
+            return {"$ref": value._index}
+        # Import local modules
+        from photoshop.api.solid_color import SolidColor
+
+        app = getattr(value, "__dict__", {}).get("app")
+        if isinstance(app, BatchFuture):
+            return self._encode(app)
+        if app is not None and isinstance(value, SolidColor):
+            return {"$color": app.rgb.hexValue}
+        kind = _kind(value)
+        if app is not None and kind is not None:
+            return {"$target": self._locate(self.target(value, app, kind))}
+        raise TypeError(f"Cannot use {value!r} in a batch.")
+
+    @staticmethod
+    def _locate(target: BatchFuture) -> Dict[str, Any]:
+        return _jsx.locate(target._wrapper, target._dispatch, target._kind)
+
+    @staticmethod
+    def _variable(locator: Optional[Dict[str, Any]], variables: Dict[tuple, str], lookups: List[str]) -> str:
+        """The variable holding the object of a locator, found by a statement added to `lookups` on first use.
+
+        Each document and layer is found once per program, not once per operation.
+        """
+        if locator is None:
+            return "app"
+        key = (locator["doc"], locator.get("layer"))
+        name = variables.get(key)
+        if name is None:
+            if "layer" in locator:
+                document = Batch._variable({"doc": locator["doc"]}, variables, lookups)
+                value = f"__layer({document}, {_jsx.literal(locator['layer'])})"
+            else:
+                value = f"__document({_jsx.literal(locator['doc'])})"
+            name = variables[key] = f"$t{len(variables)}"
+            lookups.append(f"{name} = {value};")
+        return f"{name}.textItem" if locator.get("text") else name
+
+    @staticmethod
+    def _expression(value: Any, variables: Dict[tuple, str], lookups: List[str]) -> str:
+        """Format an encoded argument as an ExtendScript expression."""
+        if isinstance(value, list):
+            return "[" + ", ".join(Batch._expression(item, variables, lookups) for item in value) + "]"
+        if isinstance(value, dict):
+            if "$ref" in value:
+                return f"$r[{value['$ref']}]"
+            if "$color" in value:
+                return f"__color({_jsx.literal(value['$color'])})"
+            return Batch._variable(value["$target"], variables, lookups)
+        return _jsx.literal(value)
+
+    def compile(self) -> str:
+        """str: The ExtendScript program applying the recorded operations."""
+        ops = []
+        lines = []
+        variables: Dict[tuple, str] = {}
+        for index, op in enumerate(self._ops):
+            # The objects used for the first time are found in the statement of the operation,
+            # so a missing one fails that operation.
+            lookups: List[str] = []
+            target = self._encode(op["target"])
+            entry = {"op": op["op"], "target": target, "name": op["name"]}
+            member = f"{self._expression(target, variables, lookups)}[{_jsx.literal(op['name'])}]"
+            if op["op"] == "set":
+                entry["value"] = self._encode(op["value"])
+                statement = f"{member} = {self._expression(entry['value'], variables, lookups)};"
+            elif op["op"] == "call":
+                entry["args"] = self._encode(op["args"])
+                arguments = ", ".join(self._expression(arg, variables, lookups) for arg in entry["args"])
+                statement = f"$r[{index}] = {member}({arguments});"
+            else:
+                statement = f"$r[{index}] = {member};"
+            ops.append(entry)
+            lines.append(" ".join([f"    __i = {index};", *lookups, statement]))
+        declarations = f"var {', '.join(variables.values())};" if variables else ""
+        body = "\n".join(
+            [
+                "(function () {",
+                _jsx.JSON_FUNCTION,
+                _jsx.FIND_FUNCTIONS,
+                COLOR_FUNCTION,
+                "var $r = [], __i = -1;",
+                declarations,
+                "try {",
+                *lines,
+                "} catch (e) {",
+                '    return __json({"results": $r, "error": {"index": __i, "message": String(e.message || e)}});',
+                "}",
+                'return __json({"results": $r, "error": null});',
+                "})();",
+            ]
+        )
+        return _jsx.program("batch", {"ops": ops}, body)
+
+    def _run(self):
+        if not self._ops:
+            return
+        try:
+            script = self.compile()
+            if self.application is None:
+                # Import local modules
+                from photoshop.api.application import Application
+
+                self.application = Application()
+            output = json.loads(self.application.eval_javascript(script))
+        except Exception as err:
+            error = PhotoshopPythonAPIError(f"The batch could not be executed: {err}")
+            for future in self.futures:
+                future._resolve(error=error)
+            raise error from err
+
+        results = output["results"]
+        failure = output["error"]
+        failed_at = len(self._ops) if failure is None else failure["index"]
+        for future in self.futures:
+            index = future._index
+            if index < failed_at:
+                future._resolve(results[index] if index < len(results) else None)
+            elif index == failed_at:
+                future._resolve(error=PhotoshopPythonAPIError(failure["message"]))
+            else:
+                future._resolve(
+                    error=PhotoshopPythonAPIError("Not executed, an earlier operation of the batch failed.")
+                )
+        if failure is not None:
+            op = self._ops[failed_at]
+            raise PhotoshopPythonAPIError(
+                f"Batch operation {failed_at} ({op['op']} {op['name']}) failed: {failure['message']}"
+            )
@@ -4,12 +4,13 @@ from photoshop.api._core import Photoshop
 
 # pylint: disable=too-many-public-methods
 class Channel(Photoshop):
+    _method_flags = (
+        "duplicate",
+        "merge",
+    )
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "duplicate",
-            "merge",
-        )
 
     @property
     def color(self):
@@ -0,0 +1,181 @@
+"""Base class of the wrappers of Photoshop collections, e.g. `ArtLayers` and `Channels`.
+
+Photoshop collections have a native ``length`` and a 1 based ``item`` member,
+so counting the elements or reading one of them costs one round trip, while
+enumerating a collection costs one round trip per element. `Collection` reads
+lengths and indexes through those members, and only enumerates the elements
+for slices and iteration.
+
+Inside ``with collection.cached():`` the elements are enumerated once, on first
+use, and lengths and indexes are read from that list. The list is dropped when
+the collection is changed through the wrapper, e.g. by `ArtLayers.add`, and
+when the block exits. Changes made through other objects, e.g.
+`ArtLayer.remove`, are not seen by the cache.
+
+Elements are found by name with the native ``getByName`` member, one round
+trip per lookup. Inside a `cached` block, the names of all elements are read
+with one program instead, and later lookups only read the element found. Like
+``getByName``, lookups return the first of the elements sharing a name, see
+`Collection.indexes_of` for the others, and only search the collection itself,
+not the layer sets it contains.
+
+Examples:
+    ```python
+
+        from photoshop import Session
+
+        with Session() as ps:
+            layers = ps.active_document.artLayers
+            with layers.cached():
+                for index in range(len(layers)):
+                    print(layers[index].name)
+    ```
+
+"""
+
+# Import built-in modules
+from contextlib import contextmanager
+import json
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api._core import Photoshop
+from photoshop.api.errors import COMError
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+_NAMES_PROGRAM = r"""
+(function () {
+%(functions)s
+var elements = %(target)s[%(collection)s];
+var names = [];
+for (var i = 0; i < elements.length; i++) names.push(elements[i].name);
+return __json(names);
+})();
+"""
+
+
+class Collection(Photoshop):
+    """A collection of Photoshop objects, counted and indexed with its native members."""
+
+    _method_flags = ("item", "getByName")
+
+    # The member of the owning object returning the collection, e.g. ``artLayers``.
+    _collection_name = ""
+    # The elements enumerated by `cached`, None when they were not enumerated yet.
+    _cache: Optional[List[Any]] = None
+    # The indexes of the elements by name, read by `cached`.
+    _names: Optional[Dict[str, List[int]]] = None
+    # The number of `cached` blocks open for this wrapper.
+    _caching = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def length(self) -> int:
+        """int: Number of elements in the collection."""
+        if self._caching:
+            return len(self._elements())
+        return self.app.length
+
+    @contextmanager
+    def cached(self) -> Iterator["Collection"]:
+        """Enumerate the elements once and reuse them for the lengths and indexes read in the block."""
+        self._caching += 1
+        try:
+            yield self
+        finally:
+            self._caching -= 1
+            if not self._caching:
+                self._invalidate()
+
+    def indexes_of(self, name: str) -> List[int]:
+        """Get the indexes of all elements with the provided name, in the order of the collection."""
+        return list(self._name_index().get(name, ()))
+
+    def _invalidate(self):
+        """Drop the cached elements and names, called after changing the collection."""
+        self._cache = None
+        self._names = None
+
+    def _name_index(self) -> Dict[str, List[int]]:
+        """Dict[str, List[int]]: The indexes of the elements by name, read with one program."""
+        if self._names is not None:
+            return self._names
+        locator = self._owner_locator()
+        body = _NAMES_PROGRAM % {
+            "functions": _jsx.JSON_FUNCTION + _jsx.FIND_FUNCTIONS,
+            "target": _jsx.reference(locator),
+            "collection": _jsx.literal(self._collection_name),
+        }
+        script = _jsx.program("names", {"target": locator, "collection": self._collection_name}, body)
+        try:
+            names = json.loads(self.eval_javascript(script))
+        except ValueError as err:
+            raise PhotoshopPythonAPIError(f"Unable to read the names of the {self._collection_name}: {err}") from err
+        index: Dict[str, List[int]] = {}
+        for position, name in enumerate(names):
+            index.setdefault(name, []).append(position)
+        if self._caching:
+            self._names = index
+        return index
+
+    def _owner_locator(self) -> Optional[Dict[str, Any]]:
+        """The locator programs find the object owning the collection by, see `_jsx.locate`."""
+        locator = self.__dict__.get("_jsx_locator")
+        if locator is not None:
+            return locator
+        owner = self.app.parent
+        typename = owner.typename
+        kind = "application" if typename == "Application" else "document" if typename == "Document" else "layer"
+        return _jsx.locate(self, owner, kind)
+
+    def _find(self, name: str) -> Optional[Any]:
+        """The dispatch object of the first element with the provided name, None if there is none."""
+        if not self._caching:
+            try:
+                return self.app.getByName(name)
+            except COMError:
+                return None
+        indexes = self._name_index().get(name)
+        if not indexes:
+            return None
+        # Read the element alone unless the elements were enumerated already.
+        return self._cache[indexes[0]] if self._cache is not None else self.app.item(indexes[0] + 1)
+
+    def _elements(self) -> List[Any]:
+        """List[Any]: The dispatch objects of all elements, enumerated once per `cached` block."""
+        if not self._caching:
+            return list(self.app)
+        if self._cache is None:
+            self._cache = list(self.app)
+        return self._cache
+
+    def _item(self, index: Any) -> Any:
+        """The dispatch object of an element by its 0 based index or its name, or a list of them for a slice.
+
+        Raises:
+            IndexError: The index is out of range, or no element has the name.
+
+        """
+        if isinstance(index, str):
+            element = self._find(index)
+            if element is None:
+                raise IndexError(f'{self.__class__.__name__} has no element named "{index}"')
+            return element
+        if isinstance(index, slice) or self._caching:
+            return self._elements()[index]
+        if index < 0:
+            index += self.app.length
+            if index < 0:
+                raise IndexError(f"{self.__class__.__name__} index out of range")
+        try:
+            return self.app.item(index + 1)
+        except COMError as err:
+            raise IndexError(f"{self.__class__.__name__} index out of range") from err
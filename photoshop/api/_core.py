@@ -7,29 +7,54 @@ from logging import DEBUG
 from logging import Logger
 from logging import getLogger
 import os
-import platform
 from typing import Any
 from typing import List
 from typing import Optional
-import winreg
-
-# Import third-party modules
-from comtypes.client import CreateObject
-from comtypes.client.dynamic import _Dispatch as FullyDynamicDispatch
-from comtypes.client.lazybind import Dispatch
+from typing import Tuple
 
 # Import local modules
+from photoshop.api import _batch
+from photoshop.api import _dispid_cache
+from photoshop.api import _version_cache
+from photoshop.api import backends
+from photoshop.api import profiler
+from photoshop.api import retry
 from photoshop.api.constants import PHOTOSHOP_VERSION_MAPPINGS
 from photoshop.api.errors import PhotoshopPythonAPIError
 
 
+class _Forwarded:
+    """Forward reads of one attribute to the dispatch object of the wrapper.
+
+    Installed on a wrapper class the first time a name not defined in Python was
+    found on the dispatch object, so later reads skip the `__getattr__` fallback.
+    Being a non-data descriptor, instance attributes still take precedence.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.app, self.name)
+
+
 class Photoshop:
     """Core API for all photoshop objects."""
 
     _root = "Photoshop"
-    _reg_path = "SOFTWARE\\Adobe\\Photoshop"
     object_name: str = "Application"
 
+    # Names Photoshop exposes as methods, see `_flag_as_method`. Declared per wrapper class.
+    _method_flags: Tuple[str, ...] = ()
+    # Flag table of the wrapper class including its bases, shared by all of its instances.
+    _method_table: frozenset = frozenset()
+    # Names the dispatch objects of this wrapper class are known not to have.
+    _unresolved_names: set = set()
+
     def __init__(self, ps_version: Optional[str] = None, parent: Any = None):
         """
         Initialize the Photoshop core object.
@@ -38,6 +63,11 @@ class Photoshop:
             ps_version: Optional, Photoshop version to look for explicitly in registry.
             parent: Optional, parent instance to use as app object.
         """
+        # Child wrappers bind straight to the dispatch they were handed.
+        if parent is not None:
+            self._bind(parent)
+            return
+
         # Establish the initial app and program ID
         ps_version = os.getenv("PS_VERSION", ps_version)
         self._app_id = PHOTOSHOP_VERSION_MAPPINGS.get(ps_version, "")
@@ -56,6 +86,15 @@ class Photoshop:
                     f"Unable to retrieve Photoshop object '{self.typename}' using version '{ps_version}'."
                 )
 
+        # Reuse the version ID resolved earlier in this process or persisted on disk
+        if not self.app:
+            cached_version = self._get_cached_version()
+            if cached_version is not None:
+                self.app = self._get_application_object([cached_version])
+                if not self.app:
+                    self._logger.debug(f"Cached Photoshop version '{cached_version}' is no longer valid.")
+                    self._forget_cached_version()
+
         # Look for version ID in registry data
         if not self.app:
             versions = self._get_photoshop_versions()
@@ -63,12 +102,32 @@ class Photoshop:
             if not self.app:
                 # All attempts exhausted
                 raise PhotoshopPythonAPIError("Please check if you have Photoshop installed correctly.")
+            self._store_cached_version(self.app_id)
+
+        self._adopt_dispatch()
+        backend = backends.get_backend()
+        if self.object_name == "Application" and backend.application is None:
+            backend.application = self.app
 
-        # Add the parent app object
-        if parent:
-            self.adobe = self.app
-            self.app = parent
-            self._has_parent = True
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._method_table = frozenset(name for klass in cls.__mro__ for name in klass.__dict__.get("_method_flags", ()))
+        cls._unresolved_names = set()
+
+    def _bind(self, parent: Any):
+        """Wrap an existing dispatch object without touching the registry or COM activation.
+
+        The application object used by `eval_javascript` is resolved on first use
+        and shared across all child wrappers, see `adobe`.
+
+        Args:
+            parent: The dispatch object returned by another Photoshop object.
+        """
+        self._app_id = PHOTOSHOP_VERSION_MAPPINGS.get(
+            os.getenv("PS_VERSION"), backends.get_backend().resolved_version or ""
+        )
+        self._has_parent, self.adobe, self.app = True, None, parent
+        self._adopt_dispatch()
 
     def __repr__(self):
         return self
@@ -79,11 +138,30 @@ class Photoshop:
     def __str__(self):
         return f"{self.__class__.__name__} <{self.program_name}>"
 
-    def __getattribute__(self, item):
+    def __getattr__(self, item):
+        """Forward attributes not defined by the wrapper to its dispatch object.
+
+        Only called when the normal lookup failed, so attributes defined in Python
+        cost a plain attribute read. Names found on the dispatch object are
+        remembered per wrapper class, see `_Forwarded`, and so are names it does not have.
+        """
+        cls = type(self)
+        app = self.__dict__.get("app")
+        if app is None or item in cls._unresolved_names or (item[:2] == "__" and item[-2:] == "__"):
+            raise AttributeError(f"'{cls.__name__}' object has no attribute '{item}'")
+        # A property of the wrapper may have raised AttributeError, never shadow it.
+        defined = any(item in klass.__dict__ for klass in cls.__mro__)
+        # Read through `app` again, it returns a recording proxy inside a batch, see `_batch`.
+        app = self.app
         try:
-            return super().__getattribute__(item)
+            value = getattr(app, item)
         except AttributeError:
-            return getattr(self.app, item)
+            if not defined:
+                cls._unresolved_names.add(item)
+            raise
+        if not defined and not isinstance(app, _batch.BatchFuture):
+            setattr(cls, item, _Forwarded(item))
+        return value
 
     """
     * Debug Logger
@@ -105,6 +183,17 @@ class Photoshop:
     * Properties
     """
 
+    @property
+    def adobe(self) -> Any:
+        """The Photoshop application dispatch for child wrappers, created once per process on first use."""
+        if self._adobe is None and self._has_parent:
+            self._adobe = self._get_shared_application()
+        return self._adobe
+
+    @adobe.setter
+    def adobe(self, value: Any):
+        self._adobe = value
+
     @property
     def typename(self) -> str:
         """str: Current typename."""
@@ -157,22 +246,105 @@ class Photoshop:
         * In this case, Photoshop does not return the proper error code, since it
         blindly treats the property getter as a method call.
         * Fortunately, comtypes provides a way to explicitly flag methods.
+        * Wrapper classes declare their names once in `_method_flags`, use this
+        for names that are only known at runtime.
         """
-        if isinstance(self.app, FullyDynamicDispatch):
+        if isinstance(self.app, backends.dispatch_types):
+            if isinstance(self.app._methods, frozenset):
+                # Copy the shared class table before adding instance specific names.
+                self.app.__dict__["_methods"] = set(self.app._methods)
             self.app._FlagAsMethod(*names)
 
+    def _adopt_dispatch(self):
+        """Share the method flag table of this wrapper class and the DISPID table of its interface with the dispatch.
+
+        Both tables are attached by reference, so wrapping a dispatch costs the same
+        no matter how many methods the wrapper class declares, and names resolved
+        through one object of an interface are never resolved again, see `_dispid_cache`.
+        Calls Photoshop rejects while busy are retried, see `retry`, and the calls made
+        through the dispatch object are recorded while profiling, see `profiler`.
+        """
+        # Not `self.app`, which is a recording proxy inside a batch.
+        app = self.__dict__.get("app")
+        if not isinstance(app, backends.dispatch_types):
+            return
+        methods = app._methods
+        if not methods:
+            app.__dict__["_methods"] = self._method_table
+        elif methods is not self._method_table:
+            app.__dict__["_methods"] = self._method_table.union(methods)
+
+        # The first wrapper of a dispatch names its interface, later wrappers of other classes keep it.
+        interface = app.__dict__.setdefault("_interface", self.__class__.__name__)
+        if interface is not None:
+            ids = app._ids
+            table = _dispid_cache.get_table(interface)
+            if ids is not table:
+                if ids and not isinstance(ids, _dispid_cache.DispidTable):
+                    table.update(ids)
+                app.__dict__["_ids"] = table
+
+        if retry.get_policy() is not None:
+            retry.install(app)
+        if profiler.get_profiler() is not None:
+            profiler.instrument(app, self.__class__.__name__)
+
+    @staticmethod
+    def _get_shared_application() -> Any:
+        """Return the application dispatch of the current backend, creating it on first call."""
+        backend = backends.get_backend()
+        if backend.application is None:
+            backend.application = Photoshop().app
+        return backend.application
+
+    def _get_cached_version(self) -> Optional[str]:
+        """Optional[str]: The version ID resolved earlier in this process, or read from the cache file."""
+        backend = backends.get_backend()
+        if backend.resolved_version is None:
+            cache_path = _version_cache.get_cache_path()
+            if cache_path:
+                backend.resolved_version = _version_cache.load_version(cache_path)
+        return backend.resolved_version
+
+    def _store_cached_version(self, version: str):
+        """Remember the resolved version ID for this process and persist it if a cache file is configured."""
+        backends.get_backend().resolved_version = version
+        cache_path = _version_cache.get_cache_path()
+        if not cache_path:
+            return
+        with suppress(OSError):
+            _version_cache.save_version(cache_path, version, self._get_application_path(version))
+
+    @staticmethod
+    def _forget_cached_version():
+        """Drop the resolved version ID from this process and from the cache file."""
+        backends.get_backend().resolved_version = None
+        cache_path = _version_cache.get_cache_path()
+        if cache_path:
+            _version_cache.clear(cache_path)
+
+    def _get_application_path(self, version: str) -> str:
+        """Look up the installation folder of a Photoshop version.
+
+        Args:
+            version: Photoshop version ID, e.g. 180.
+
+        Returns:
+            The absolute path of the Photoshop installed location.
+
+        Raises:
+            OSError: If the installation folder is unknown.
+        """
+        return backends.get_backend().get_application_path(version)
+
     def _get_photoshop_versions(self) -> List[str]:
-        """Retrieve a list of Photoshop version ID's from registry."""
-        with suppress(OSError, IndexError):
-            key = self._open_key(self._reg_path)
-            key_count = winreg.QueryInfoKey(key)[0]
-            versions = [winreg.EnumKey(key, i).split(".")[0] for i in range(key_count)]
-            # Sort from latest version to oldest, use blank version as a fallback
-            return [*sorted(versions, reverse=True), ""]
-        self._logger.debug("Unable to find Photoshop version number in HKEY_LOCAL_MACHINE registry!")
-        return []
-
-    def _get_application_object(self, versions: List[str] = None) -> Optional[Dispatch]:
+        """Retrieve a list of installed Photoshop version ID's from the backend, e.g. the registry."""
+        versions = backends.get_backend().get_versions()
+        if not versions:
+            self._logger.debug("Unable to find Photoshop version number in HKEY_LOCAL_MACHINE registry!")
+        return versions
+
+    def _get_application_object(self, versions: List[str] = None) -> Any:
         """
         Try each version string until a valid Photoshop application Dispatch object is returned.
 
@@ -185,10 +357,13 @@ class Photoshop:
         Raises:
             OSError: If a Dispatch object wasn't resolved.
         """
+        backend = backends.get_backend()
         for v in versions:
             self.app_id = v
-            with suppress(OSError):
-                return CreateObject(self.program_name, dynamic=True)
+            try:
+                return backend.create_object(self.program_name)
+            except OSError as err:
+                self._logger.debug(f"Unable to create '{self.program_name}': {err}")
         return
 
     """
@@ -197,50 +372,21 @@ class Photoshop:
 
     def get_application_path(self) -> str:
         """str: The absolute path of Photoshop installed location."""
-        key = self.open_key(f"{self._reg_path}\\{self.program_id}")
-        return winreg.QueryValueEx(key, "ApplicationPath")[0]
+        return self._get_application_path(self.app_id or self._get_cached_version() or "")
 
     def get_plugin_path(self) -> str:
         """str: The absolute plugin path of Photoshop."""
-        return os.path.join(self.application_path, "Plug-ins")
+        return os.path.join(self.get_application_path(), "Plug-ins")
 
     def get_presets_path(self) -> str:
         """str: The absolute presets path of Photoshop."""
-        return os.path.join(self.application_path, "Presets")
+        return os.path.join(self.get_application_path(), "Presets")
 
     def get_script_path(self) -> str:
         """str: The absolute scripts path of Photoshop."""
-        return os.path.join(self.presets_path, "Scripts")
+        return os.path.join(self.get_presets_path(), "Scripts")
 
     def eval_javascript(self, javascript: str, Arguments: Any = None, ExecutionMode: Any = None) -> str:
         """Instruct the application to execute javascript code."""
         executor = self.adobe if self._has_parent else self.app
         return executor.doJavaScript(javascript, Arguments, ExecutionMode)
-
-    """
-    * Private Static Methods
-    """
-
-    @staticmethod
-    def _open_key(key: str) -> winreg.HKEYType:
-        """Open the register key.
-
-        Args:
-            key: Photoshop application key path.
-
-        Returns:
-            The handle to the specified key.
-
-        Raises:
-            OSError: if registry key cannot be read.
-        """
-        machine_type = platform.machine()
-        mappings = {"AMD64": winreg.KEY_WOW64_64KEY}
-        access = winreg.KEY_READ | mappings.get(machine_type, winreg.KEY_WOW64_32KEY)
-        try:
-            return winreg.OpenKey(key=winreg.HKEY_LOCAL_MACHINE, sub_key=key, access=access)
-        except FileNotFoundError as err:
-            raise OSError(
-                "Failed to read the registration: <{path}>\n"
-                "Please check if you have Photoshop installed correctly.".format(path=f"HKEY_LOCAL_MACHINE\\{key}")
-            ) from err
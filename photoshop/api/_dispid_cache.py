@@ -0,0 +1,119 @@
+"""Shared DISPID tables for fully dynamic dispatch objects.
+
+Photoshop does not implement `IDispatch::GetTypeInfo`, so comtypes resolves
+every member name through `GetIDsOfNames` and only remembers the result on the
+dispatch object itself. Every new layer, document or color object therefore
+starts with an empty table.
+
+The tables below are shared by all dispatch objects of the same interface,
+so once `name` has been resolved for one `ArtLayer`, reading `name` from any
+other `ArtLayer` is a single `Invoke`. The interface of a dispatch object is
+the class of the first wrapper it is handed to, unless the wrapper cannot
+know it, e.g. the `ArtLayer` wrappers of `Layers`, which may hold layer sets,
+see `set_interface`.
+
+Examples:
+    ```python
+
+        from photoshop.api import _dispid_cache
+
+        for name, stats in _dispid_cache.get_stats().items():
+            print(name, stats["hits"], stats["misses"], stats["hit_rate"])
+    ```
+
+"""
+
+# Import built-in modules
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+
+class DispidTable(dict):
+    """Name to DISPID mapping of one interface, counting lookups.
+
+    comtypes looks names up with `get` and stores newly resolved DISPIDs with
+    item assignment, so every `get` is either a hit or a miss followed by a
+    `GetIDsOfNames` call.
+
+    """
+
+    def __init__(self, interface: str):
+        super().__init__()
+        self.interface = interface
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, default=None):
+        dispid = super().get(name, default)
+        if dispid:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return dispid
+
+    @property
+    def hit_rate(self) -> float:
+        """float: Share of lookups answered without calling `GetIDsOfNames`."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_counters(self):
+        self.hits = self.misses = 0
+
+
+_tables: Dict[str, DispidTable] = {}
+
+
+def get_table(interface: str) -> DispidTable:
+    """Get the shared DISPID table of an interface, creating it on first use.
+
+    Args:
+        interface: The interface name, e.g. ArtLayer.
+
+    """
+    table = _tables.get(interface)
+    if table is None:
+        table = _tables[interface] = DispidTable(interface)
+    return table
+
+
+def set_interface(dispatch: Any, interface: Optional[str]) -> Any:
+    """Name the interface of a dispatch object before it is wrapped.
+
+    Dispatch objects marked with None keep resolving names on their own, since
+    sharing the table of their wrapper class could call them with the DISPIDs of
+    another interface.
+
+    Args:
+        dispatch: The dispatch object.
+        interface: The interface name, None when it is not known.
+
+    Returns:
+        The dispatch object.
+
+    """
+    if hasattr(dispatch, "__dict__"):
+        dispatch.__dict__["_interface"] = interface
+    return dispatch
+
+
+def get_stats() -> Dict[str, Dict[str, float]]:
+    """dict: Cached names, hits, misses and hit rate per interface."""
+    return {
+        name: {"names": len(table), "hits": table.hits, "misses": table.misses, "hit_rate": table.hit_rate}
+        for name, table in sorted(_tables.items())
+    }
+
+
+def reset_stats():
+    """Reset the hit and miss counters, keeping the resolved DISPIDs."""
+    for table in _tables.values():
+        table.reset_counters()
+
+
+def clear():
+    """Forget all resolved DISPIDs, e.g. after Photoshop was restarted."""
+    for table in _tables.values():
+        table.clear()
+        table.reset_counters()
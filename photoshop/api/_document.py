@@ -15,16 +15,23 @@ The basic canvas for the file.
 
 # Import built-in modules
 from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import TypeVar
 from typing import Union
 
-# Import third-party modules
-from comtypes import COMError
-
 # Import local modules
+from photoshop.api import _batch
+from photoshop.api import _export_layers
+from photoshop.api import _jsx
+from photoshop.api import _layer_ref
+from photoshop.api import _layer_tree
+from photoshop.api import _snapshot
 from photoshop.api._artlayer import ArtLayer
 from photoshop.api._artlayers import ArtLayers
 from photoshop.api._channels import Channels
@@ -33,12 +40,15 @@ from photoshop.api._documentinfo import DocumentInfo
 from photoshop.api._layerComps import LayerComps
 from photoshop.api._layerSet import LayerSet
 from photoshop.api._layerSets import LayerSets
+from photoshop.api._layer_setters import LayerSetters
+from photoshop.api._layer_setters import layer_ids
 from photoshop.api._layers import Layers
 from photoshop.api._selection import Selection
 from photoshop.api.enumerations import ExportType
 from photoshop.api.enumerations import ExtensionType
 from photoshop.api.enumerations import SaveOptions
 from photoshop.api.enumerations import TrimType
+from photoshop.api.errors import COMError
 from photoshop.api.save_options import ExportOptionsSaveForWeb
 
 
@@ -47,7 +57,7 @@ PS_Layer = TypeVar("PS_Layer", LayerSet, ArtLayer)
 
 
 # pylint: disable=too-many-public-methods
-class Document(Photoshop):
+class Document(LayerSetters, Photoshop):
     """The active containment object for the layers and all other objects in the script.
 
     the basic canvas for the file.
@@ -55,30 +65,32 @@ class Document(Photoshop):
     """  # noqa: E501
 
     object_name = "Application"
+    app = _batch.BatchedApp("document")
+
+    _method_flags = (
+        "autoCount",
+        "changeMode",
+        "close",
+        "convertProfile",
+        "Flatten",
+        "mergeVisibleLayers",
+        "crop",
+        "export",
+        "duplicate",
+        "printOneCopy",
+        "rasterizeAllLayers",
+        "recordMeasurements",
+        "revealAll",
+        "save",
+        "saveAs",
+        "splitChannels",
+        "trap",
+        "trim",
+        "resizeImage",
+    )
 
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "autoCount",
-            "changeMode",
-            "close",
-            "convertProfile",
-            "Flatten",
-            "mergeVisibleLayers",
-            "crop",
-            "export",
-            "duplicate",
-            "printOneCopy",
-            "rasterizeAllLayers",
-            "recordMeasurements",
-            "revealAll",
-            "save",
-            "saveAs",
-            "splitChannels",
-            "trap",
-            "trim",
-            "resizeImage",
-        )
 
     @property
     def artLayers(self) -> ArtLayers:
@@ -333,6 +345,10 @@ class Document(Photoshop):
         return self.app.xmpMetadata
 
     # Methods
+    def activate(self):
+        """Bring the Document to the front, making it the active document of the application."""
+        self.adobe.activeDocument = self.app
+
     def autoCount(self, *args, **kwargs):
         """Counts the objects in the Document."""
         return self.app.autoCount(*args, **kwargs)
@@ -484,3 +500,90 @@ class Document(Photoshop):
 
         """
         return self.app.resizeImage(width, height, resolution, automatic)
+
+    def layer_tree(self) -> _layer_tree.LayerTree:
+        """Read all layers of the document, nested layer sets included, with a single call to Photoshop.
+
+        Returns:
+            LayerTree: The ID, item index, parent, kind, visibility, bounds, opacity and name of
+                every layer, in the order of the Layers panel, see `photoshop.api._layer_tree`.
+
+        """
+        return _layer_tree.read(self)
+
+    def export_layers(
+        self,
+        destination: Union[str, Path],
+        fmt: str = "png",
+        options: Optional[Dict[str, Any]] = None,
+        layers: Optional[Iterable[Any]] = None,
+        trim: bool = False,
+        naming: str = "{index:03d}_{name}",
+        chunk_size: int = 16,
+        on_file: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Save layers as separate files, each copied to a new document inside Photoshop.
+
+        The document itself is not changed: no layer is hidden or shown. A program exports
+        `chunk_size` layers per call to Photoshop, see `photoshop.api._export_layers`.
+
+        Args:
+            destination: The folder of the files, created if needed.
+            fmt: The file format, a key of `photoshop.api._export_layers.FORMATS`, e.g. ``png`` or ``jpg``.
+            options: The properties of the ExtendScript save options, e.g. ``{"quality": 10}``
+                for ``jpg``, as booleans, numbers or strings.
+            layers: The layers, as layer IDs, `LayerRef`, `LayerNode` or layer objects, the top
+                level layers by default. A layer set is exported with its content.
+            trim: Whether to trim the transparent pixels around each layer.
+            naming: The format of the file names, without extension, using ``index``, ``id`` and ``name``.
+            chunk_size: The number of layers exported per call to Photoshop.
+            on_file: Called with the record of each file once its chunk is exported.
+
+        Returns:
+            list: A record per file, with the ``id`` and ``name`` of the layer, the ``path`` of the
+                file and the ``error`` message, None when the layer was exported.
+
+        """
+        return _export_layers.export(self, destination, fmt, options, layers, trim, naming, chunk_size, on_file)
+
+    def delete_layers(
+        self,
+        layers: Iterable[Any] = (),
+        where: Optional[Callable[[_layer_tree.LayerNode], bool]] = None,
+    ) -> int:
+        """Delete many layers of the document with a single action, undone as one history state.
+
+        Deleting layers one by one costs a round trip and a history state per layer.
+
+        Args:
+            layers: The layers to delete, as layer IDs, `LayerRef`, `LayerNode` or layer objects.
+            where: Also delete the layers of `layer_tree` this function returns True for.
+
+        Returns:
+            int: The number of layers deleted, not counting the content of the layer sets deleted.
+
+        Raises:
+            ValueError: A layer belongs to another document.
+
+        """
+        document_id = self._layers_document_id()
+        ids = layer_ids(document_id, layers)
+        if where is not None:
+            ids.extend(node.id for node in self.layer_tree() if where(node))
+        return _layer_ref.delete(document_id, ids)
+
+    def _layers_document_id(self) -> int:
+        return _jsx.locate(self, self.__dict__["app"], "document")["doc"]
+
+    def snapshot(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Read many properties of the document with a single call to Photoshop.
+
+        Args:
+            fields: Property names or dotted paths, e.g. ``activeLayer.name`` or ``selection.bounds``.
+                The name, size, mode and color profile of the document by default.
+
+        Returns:
+            dict: The typed values by field, see `photoshop.api._snapshot`.
+
+        """
+        return _snapshot.snapshot(self, "document", fields)
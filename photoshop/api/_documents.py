@@ -1,5 +1,14 @@
+# Import built-in modules
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
 # Import local modules
-from photoshop.api._core import Photoshop
+from photoshop.api import _snapshot
+from photoshop.api._collection import Collection
 from photoshop.api._document import Document
 from photoshop.api.enumerations import BitsPerChannelType
 from photoshop.api.enumerations import DocumentFill
@@ -8,15 +17,14 @@ from photoshop.api.errors import PhotoshopPythonAPIError
 
 
 # pylint: disable=too-many-public-methods, too-many-arguments
-class Documents(Photoshop):
+class Documents(Collection):
     """The collection of open documents."""
 
+    _method_flags = ("add",)
+    _collection_name = "documents"
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method("add")
-
-    def __len__(self) -> int:
-        return self.length
 
     def add(
         self,
@@ -48,6 +56,7 @@ class Documents(Photoshop):
             .Document: Document instance.
 
         """
+        self._invalidate()
         return Document(
             self.app.add(
                 width,
@@ -62,24 +71,51 @@ class Documents(Photoshop):
             )
         )
 
-    def __iter__(self) -> Document:
+    def __iter__(self) -> Iterator[Document]:
+        """Iterate the documents without activating them, see `iterate`."""
+        return self.iterate()
+
+    def iterate(self, activate: bool = False) -> Iterator[Document]:
+        """Iterate the open documents.
+
+        Args:
+            activate: Bring each document to the front before yielding it, which makes Photoshop
+                switch windows and redraw. Only needed by code working on ``app.activeDocument``,
+                calls made through the yielded `Document` do not need it.
+
+        """
         for doc in self.app:
-            self.adobe.activeDocument = doc
+            if activate:
+                self.adobe.activeDocument = doc
             yield Document(doc)
 
+    def describe(self, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Read the properties of all open documents with a single call to Photoshop.
+
+        Args:
+            fields: Property names or dotted paths of each document, e.g. ``activeLayer.name``.
+                The ID, name, path, size and mode of the documents by default, the path being
+                None for unsaved documents.
+
+        Returns:
+            list: The typed values by field of each document, see `photoshop.api._snapshot`.
+
+        """
+        return _snapshot.snapshot_collection(self, fields)
+
     def __getitem__(self, item) -> Document:
         try:
-            return Document(self.app[item])
+            return Document(self._item(item))
         except IndexError:
             raise PhotoshopPythonAPIError("Currently Photoshop did not find Documents.")
 
-    @property
-    def length(self) -> int:
-        return len(list(self.app))
+    def _owner_locator(self) -> None:
+        # The documents are found from the application, without reading its typename.
+        return None
 
     def getByName(self, document_name: str) -> Document:
         """Get document by given document name."""
-        for doc in self.app:
-            if doc.name == document_name:
-                return Document(doc)
-        raise PhotoshopPythonAPIError(f'Could not find a document named "{document_name}"')
+        doc = self._find(document_name)
+        if doc is None:
+            raise PhotoshopPythonAPIError(f'Could not find a document named "{document_name}"')
+        return Document(doc)
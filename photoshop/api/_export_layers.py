@@ -0,0 +1,175 @@
+"""Save layers of a document as separate files with one program per chunk of layers.
+
+Exporting a layer by hiding the other layers and saving the document costs
+several round trips per layer, a save of the full document each time, and a
+visibility change to undo afterwards. The program of this module makes a new
+document from each layer with the ``make`` action, which copies the layer
+alone, saves it and closes it. The source document is never changed, so
+nothing has to be restored but the active document, once per program.
+
+The layers are exported in chunks of `export`'s ``chunk_size`` layers, one
+program each, and a record is passed to ``on_file`` for each file as soon as
+its chunk is done. A layer that fails to export does not stop the others, its
+record holds the error.
+
+Examples:
+    ```python
+
+        from photoshop import Session
+
+        with Session() as ps:
+            records = ps.active_document.export_layers(
+                "C:/exports",
+                "png",
+                on_file=lambda record: print(record["path"], record["error"] or "done"),
+            )
+    ```
+
+"""
+
+# Import built-in modules
+import json
+from pathlib import Path
+import re
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api._layer_setters import layer_ids
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+# The ExtendScript class of the save options and the file extension, by format.
+FORMATS = {
+    "bmp": ("BMPSaveOptions", ".bmp"),
+    "gif": ("GIFSaveOptions", ".gif"),
+    "jpg": ("JPEGSaveOptions", ".jpg"),
+    "png": ("PNGSaveOptions", ".png"),
+    "psd": ("PhotoshopSaveOptions", ".psd"),
+    "tif": ("TiffSaveOptions", ".tif"),
+}
+
+# Characters Windows does not allow in file names.
+_UNSAFE_CHARACTERS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+_PROGRAM = r"""
+(function () {
+%(functions)s
+var s = stringIDToTypeID;
+var source = __document(%(document)s);
+var layerIDs = %(layers)s;
+var paths = %(paths)s;
+var values = %(options)s;
+var options = new %(options_class)s();
+for (var i = 0; i < values.length; i++) options[values[i][0]] = values[i][1];
+var errors = [];
+for (var i = 0; i < layerIDs.length; i++) {
+    app.activeDocument = source;
+    var copy = null;
+    try {
+        var target = new ActionReference();
+        target.putClass(s("document"));
+        var using = new ActionReference();
+        using.putIdentifier(s("layer"), layerIDs[i]);
+        var desc = new ActionDescriptor();
+        desc.putReference(s("null"), target);
+        desc.putReference(s("using"), using);
+        executeAction(s("make"), desc, DialogModes.NO);
+        copy = app.activeDocument;
+        for (var j = 0; j < copy.layers.length; j++) copy.layers[j].visible = true;
+        if (%(trim)s) copy.trim(TrimType.TRANSPARENT);
+        var file = new File(paths[i]);
+        file.parent.create();
+        copy.saveAs(file, options, true, Extension.LOWERCASE);
+        errors.push(null);
+    } catch (e) {
+        errors.push(String(e));
+    }
+    if (copy && copy !== source) copy.close(SaveOptions.DONOTSAVECHANGES);
+}
+app.activeDocument = source;
+return __json(errors);
+})();
+"""
+
+
+def file_name(naming: str, index: int, layer_id: int, name: str) -> str:
+    """Format the file name of a layer, without extension.
+
+    Args:
+        naming: A format string using ``index``, the position of the layer among the exported
+            layers, ``id``, the layer ID, and ``name``, the layer name made safe for file names.
+        index: The position of the layer.
+        layer_id: The layer ID.
+        name: The layer name.
+
+    """
+    return naming.format(index=index, id=layer_id, name=_UNSAFE_CHARACTERS.sub("_", name).strip(" ."))
+
+
+def export(
+    document: Any,
+    destination: Union[str, Path],
+    fmt: str = "png",
+    options: Optional[Dict[str, Any]] = None,
+    layers: Optional[Iterable[Any]] = None,
+    trim: bool = False,
+    naming: str = "{index:03d}_{name}",
+    chunk_size: int = 16,
+    on_file: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Save layers of the document of a wrapper as separate files, see `Document.export_layers`."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {', '.join(FORMATS)}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    options_class, extension = FORMATS[fmt]
+    tree = document.layer_tree()
+    if layers is None:
+        ids = [node.id for node in tree.children()]
+    else:
+        ids = layer_ids(tree.document_id, layers)
+    records = []
+    for index, layer_id in enumerate(ids):
+        node = tree.get(layer_id)
+        if node is None:
+            raise ValueError(f"The document has no layer with ID {layer_id}.")
+        path = Path(destination, file_name(naming, index, layer_id, node.name) + extension)
+        records.append({"id": layer_id, "name": node.name, "path": str(path), "error": None})
+    option_values = [[key, value] for key, value in (options or {}).items()]
+    for start in range(0, len(records), chunk_size):
+        end = start + chunk_size
+        chunk = records[start:end]
+        payload = {
+            "doc": tree.document_id,
+            "layers": [record["id"] for record in chunk],
+            "paths": [record["path"].replace("\\", "/") for record in chunk],
+            "format": fmt,
+            "options": option_values,
+            "trim": trim,
+        }
+        body = _PROGRAM % {
+            "functions": _jsx.JSON_FUNCTION + _jsx.FIND_FUNCTIONS,
+            "document": _jsx.literal(payload["doc"]),
+            "layers": _jsx.literal(payload["layers"]),
+            "paths": _jsx.literal(payload["paths"]),
+            "options": _jsx.literal(option_values),
+            "options_class": options_class,
+            "trim": _jsx.literal(trim),
+        }
+        script = _jsx.program("export_layers", payload, body)
+        try:
+            errors = json.loads(document.eval_javascript(script))
+        except ValueError as err:
+            raise PhotoshopPythonAPIError(f"Unable to read the result of the layer export: {err}") from err
+        for record, error in zip(chunk, errors):
+            record["error"] = error
+            if on_file is not None:
+                on_file(record)
+    return records
@@ -0,0 +1,171 @@
+"""Helpers for the ExtendScript programs the API sends through `doJavaScript`.
+
+Programs built here start with a marker comment naming the program and
+carrying its input as JSON, e.g. ``/*photoshop-python-api:batch {...}*/``.
+Photoshop ignores the comment; the simulated backend evaluates marked
+programs with Python handlers instead of running the ExtendScript.
+
+Programs return their results as a JSON string, see `JSON_FUNCTION`.
+
+"""
+
+# Import built-in modules
+from enum import Enum
+import json
+import re
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+
+MARKER = "photoshop-python-api"
+
+_MARKER_PATTERN = re.compile(r"/\*" + MARKER + r":(\w+) (.*?)\*/", re.DOTALL)
+
+# ExtendScript has no JSON object, `__json(value)` serializes values, UnitValues and
+# enumeration values as numbers, File and Folder objects as their platform path and
+# DOM objects as their type name and ID.
+JSON_FUNCTION = r"""
+function __json(v) {
+    if (v === undefined || v === null) return "null";
+    var t = typeof v;
+    if (t == "number") return isFinite(v) ? String(v) : "null";
+    if (t == "boolean") return String(v);
+    if (t == "string") {
+        return '"' + v.replace(/[\\"]/g, "\\$&").replace(/[\u0000-\u001f]/g, function (c) {
+            var code = c.charCodeAt(0).toString(16);
+            return "\\u" + "0000".substr(code.length) + code;
+        }) + '"';
+    }
+    if (t == "function") return "null";
+    if (v instanceof UnitValue) return String(v.value);
+    if (v instanceof File || v instanceof Folder) return __json(v.fsName);
+    if (v instanceof Array) {
+        var items = [];
+        for (var i = 0; i < v.length; i++) items.push(__json(v[i]));
+        return "[" + items.join(",") + "]";
+    }
+    // Enumeration values, e.g. DocumentMode.RGB, as their number.
+    if (t == "object" && v.typename === undefined && /^\w+\.\w+$/.test(String(v)) && !isNaN(Number(v))) {
+        return String(Number(v));
+    }
+    if (v.typename !== undefined) {
+        var id = null;
+        try { id = v.id; } catch (e) {}
+        return '{"typename":' + __json(v.typename) + ',"id":' + __json(id) + "}";
+    }
+    if (t == "object") {
+        var pairs = [];
+        for (var key in v) pairs.push(__json(key) + ":" + __json(v[key]));
+        return "{" + pairs.join(",") + "}";
+    }
+    return __json(String(v));
+}
+"""
+
+# `__document(id)` and `__layer(document, id)` find DOM objects by ID.
+FIND_FUNCTIONS = r"""
+function __document(id) {
+    for (var i = 0; i < app.documents.length; i++) {
+        if (app.documents[i].id == id) return app.documents[i];
+    }
+    throw new Error("No document with ID " + id);
+}
+function __findLayer(container, id) {
+    for (var i = 0; i < container.layers.length; i++) {
+        var layer = container.layers[i];
+        if (layer.id == id) return layer;
+        if (layer.typename == "LayerSet") {
+            var found = __findLayer(layer, id);
+            if (found) return found;
+        }
+    }
+    return null;
+}
+function __layer(document, id) {
+    var layer = __findLayer(document, id);
+    if (!layer) throw new Error("No layer with ID " + id);
+    return layer;
+}
+"""
+
+
+def literal(value: Any) -> str:
+    """Format a Python value as an ExtendScript literal, None as `undefined`."""
+    if value is None:
+        return "undefined"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, Enum):
+        return literal(value.value)
+    if isinstance(value, (int, float, str)):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(literal(item) for item in value) + "]"
+    raise TypeError(f"Cannot use {value!r} in ExtendScript.")
+
+
+def program(name: str, payload: Any, body: str) -> str:
+    """Build a marked program.
+
+    Args:
+        name: The program name, used by the simulated backend to find its handler.
+        payload: The JSON serializable input of the program.
+        body: The ExtendScript, its last expression being the result.
+
+    """
+    # "*/" would end the comment, "\/" is a valid JSON escape of "/".
+    data = json.dumps(payload, separators=(",", ":")).replace("*/", "*\\/")
+    return f"/*{MARKER}:{name} {data}*/\n{body}"
+
+
+def parse_program(script: str) -> Optional[Tuple[str, Any]]:
+    """Get the name and the payload of a marked program, None for other scripts."""
+    match = _MARKER_PATTERN.match(script.lstrip())
+    if match is None:
+        return None
+    return match.group(1), json.loads(match.group(2))
+
+
+def locate(wrapper: Any, dispatch: Any, kind: str) -> Optional[Dict[str, Any]]:
+    """Get the IDs a program finds the object of a wrapper by, cached on the wrapper.
+
+    Args:
+        wrapper: The API object.
+        dispatch: Its dispatch object.
+        kind: ``application``, ``document``, ``layer`` or ``text``.
+
+    Returns:
+        The document and layer IDs, None for the application.
+
+    """
+    if kind == "application":
+        return None
+    locator = wrapper.__dict__.get("_jsx_locator")
+    if locator is not None:
+        return locator
+    if kind == "document":
+        locator = {"doc": dispatch.id}
+    else:
+        layer = dispatch.parent if kind == "text" else dispatch
+        document = layer.parent
+        while document.typename != "Document":
+            document = document.parent
+        locator = {"doc": document.id, "layer": layer.id}
+        if kind == "text":
+            locator["text"] = True
+    wrapper.__dict__["_jsx_locator"] = locator
+    return locator
+
+
+def reference(locator: Optional[Dict[str, Any]]) -> str:
+    """Format the ExtendScript expression finding the object of a locator, see `locate` and `FIND_FUNCTIONS`."""
+    if locator is None:
+        return "app"
+    expression = f"__document({literal(locator['doc'])})"
+    if "layer" in locator:
+        expression = f"__layer({expression}, {literal(locator['layer'])})"
+    if locator.get("text"):
+        expression += ".textItem"
+    return expression
@@ -5,14 +5,15 @@ from photoshop.api._core import Photoshop
 class LayerComp(Photoshop):
     """A snapshot of a state of the layers in a document (can be used to view different page layouts or compostions)."""
 
+    _method_flags = (
+        "apply",
+        "recapture",
+        "remove",
+        "resetfromComp",
+    )
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "apply",
-            "recapture",
-            "remove",
-            "resetfromComp",
-        )
 
     def __len__(self):
         return self.length
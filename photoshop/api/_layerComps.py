@@ -1,25 +1,19 @@
 # Import local modules
-from photoshop.api._core import Photoshop
+from photoshop.api._collection import Collection
 from photoshop.api._layerComp import LayerComp
 from photoshop.api.errors import PhotoshopPythonAPIError
 
 
-class LayerComps(Photoshop):
+class LayerComps(Collection):
     """The layer comps collection in this document."""
 
+    _method_flags = (
+        "add",
+        "removeAll",
+    )
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "add",
-            "removeAll",
-        )
-
-    def __len__(self):
-        return self.length
-
-    @property
-    def length(self):
-        return len(self._layers)
 
     @property
     def _layers(self):
@@ -42,6 +36,7 @@ class LayerComps(Photoshop):
         visibility=True,
         childLayerCompStat=False,
     ):
+        self._invalidate()
         return LayerComp(self.app.add(name, comment, appearance, position, visibility, childLayerCompStat))
 
     def getByName(self, name):
@@ -51,6 +46,7 @@ class LayerComps(Photoshop):
         raise PhotoshopPythonAPIError(f'Could not find a layer named "{name}"')
 
     def removeAll(self):
+        self._invalidate()
         self.app.removeAll()
 
     def __iter__(self):
@@ -1,33 +1,42 @@
 # Import local modules
+from photoshop.api import _batch
+from photoshop.api import _jsx
 from photoshop.api._artlayer import ArtLayer
 from photoshop.api._artlayers import ArtLayers
 from photoshop.api._core import Photoshop
+from photoshop.api._layer_setters import LayerSetters
 from photoshop.api._layers import Layers
 from photoshop.api.enumerations import AnchorPosition
 from photoshop.api.enumerations import BlendMode
 
 
-class LayerSet(Photoshop):
+class LayerSet(LayerSetters, Photoshop):
     """A group of layer objects, which can include art layer objects and other (nested) layer set objects.
 
     A single command or set of commands manipulates all layers in a layer set object.
 
     """
 
+    app = _batch.BatchedApp("layer")
+
+    _method_flags = (
+        "merge",
+        "duplicate",
+        "add",
+        "delete",
+        "link",
+        "move",
+        "resize",
+        "rotate",
+        "translate",
+        "unlink",
+    )
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "merge",
-            "duplicate",
-            "add",
-            "delete",
-            "link",
-            "move",
-            "resize",
-            "rotate",
-            "translate",
-            "unlink",
-        )
+
+    def _layers_document_id(self) -> int:
+        return _jsx.locate(self, self.__dict__["app"], "layer")["doc"]
 
     @property
     def allLocked(self):
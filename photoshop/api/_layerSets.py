@@ -1,62 +1,52 @@
-# Import third-party modules
-from comtypes import ArgumentError
-
 # Import local modules
-from photoshop.api._core import Photoshop
+from photoshop.api._collection import Collection
 from photoshop.api._layerSet import LayerSet
 from photoshop.api.errors import PhotoshopPythonAPIError
 
 
-class LayerSets(Photoshop):
+class LayerSets(Collection):
     """The layer sets collection in the document."""
 
+    _method_flags = (
+        "add",
+        "item",
+        "removeAll",
+    )
+    _collection_name = "layerSets"
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "add",
-            "item",
-            "removeAll",
-        )
-
-    def __len__(self):
-        return self.length
 
     def __iter__(self):
         for layer_set in self.app:
             yield layer_set
 
-    def __getitem__(self, key: str):
-        """Access a given LayerSet using dictionary key lookup."""
-        try:
-            return LayerSet(self.app[key])
-        except ArgumentError:
-            raise PhotoshopPythonAPIError(f'Could not find a LayerSet named "{key}"')
-
-    @property
-    def _layerSets(self):
-        return list(self.app)
-
-    @property
-    def length(self) -> int:
-        """Number of elements in the collection."""
-        return len(self._layerSets)
+    def __getitem__(self, key):
+        """Access a given LayerSet using list index, slice or dictionary key lookup."""
+        if isinstance(key, str):
+            return self.getByName(key)
+        if isinstance(key, slice):
+            return [LayerSet(layer_set) for layer_set in self._item(key)]
+        return LayerSet(self._item(key))
 
     def add(self):
+        self._invalidate()
         return LayerSet(self.app.add())
 
     def item(self, index: int) -> LayerSet:
         return LayerSet(self.app.item(index))
 
     def removeAll(self):
+        self._invalidate()
         self.app.removeAll()
 
     def getByIndex(self, index: int):
         """Access LayerSet using list index lookup."""
-        return LayerSet(self._layerSets[index])
+        return LayerSet(self._item(index))
 
     def getByName(self, name: str) -> LayerSet:
         """Get the first element in the collection with the provided name."""
-        for layer in self.app:
-            if name == layer.name:
-                return LayerSet(layer)
-        raise PhotoshopPythonAPIError(f'Could not find a LayerSet named "{name}"')
+        layer_set = self._find(name)
+        if layer_set is None:
+            raise PhotoshopPythonAPIError(f'Could not find a LayerSet named "{name}"')
+        return LayerSet(layer_set)
@@ -0,0 +1,425 @@
+"""Address layers by their layer ID instead of a live DOM object.
+
+A `LayerRef` holds the ID of a document and the ID of one of its layers.
+Every operation runs one program building Action Manager references with
+``putIdentifier``, so Photoshop finds the layer directly, whatever the size
+of the document and however deeply the layer is nested. Layer IDs never
+change while the layer exists, so a `LayerRef` stays valid when layers are
+added, moved or grouped, and can be stored between sessions of a script.
+
+Operations on a layer that was deleted raise the error of the program.
+
+Examples:
+    ```python
+
+        from photoshop import Session
+        from photoshop.api import LayerRef
+
+        with Session() as ps:
+            doc = ps.active_document
+            refs = [node.ref for node in doc.layer_tree() if not node.is_group]
+            refs[0].select()
+            refs[0].name = "Title"
+            print(refs[-1].read("name", "opacity", "bounds"))
+    ```
+
+"""
+
+# Import built-in modules
+import json
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api._core import Photoshop
+from photoshop.api.enumerations import BlendMode
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+_PROGRAM = r"""
+(function () {
+%(functions)s
+var s = stringIDToTypeID;
+var documentID = %(document)s;
+var layerIDs = %(layers)s;
+function reference(layerID) {
+    var ref = new ActionReference();
+    ref.putIdentifier(s("layer"), layerID);
+    ref.putIdentifier(s("document"), documentID);
+    return ref;
+}
+function targets() {
+    var list = new ActionList();
+    for (var i = 0; i < layerIDs.length; i++) list.putReference(reference(layerIDs[i]));
+    return list;
+}
+function activateDocument() {
+    if (app.activeDocument.id != documentID) app.activeDocument = __document(documentID);
+}
+function select(add) {
+    activateDocument();
+    for (var i = 0; i < layerIDs.length; i++) {
+        var desc = new ActionDescriptor();
+        desc.putReference(s("null"), reference(layerIDs[i]));
+        if (add || i > 0) {
+            desc.putEnumerated(s("selectionModifier"), s("selectionModifierType"), s("addToSelection"));
+        }
+        desc.putBoolean(s("makeVisible"), false);
+        executeAction(s("select"), desc, DialogModes.NO);
+    }
+}
+%(body)s
+})();
+"""
+
+_READ = r"""
+var desc = executeActionGet(reference(layerIDs[0]));
+var keys = %(keys)s;
+var values = [];
+for (var i = 0; i < keys.length; i++) {
+    var key = s(keys[i]);
+    if (!desc.hasKey(key)) {
+        values.push(null);
+        continue;
+    }
+    var type = desc.getType(key);
+    if (type == DescValueType.STRINGTYPE) values.push(desc.getString(key));
+    else if (type == DescValueType.BOOLEANTYPE) values.push(desc.getBoolean(key));
+    else if (type == DescValueType.INTEGERTYPE) values.push(desc.getInteger(key));
+    else if (type == DescValueType.LARGEINTEGERTYPE) values.push(desc.getLargeInteger(key));
+    else if (type == DescValueType.DOUBLETYPE) values.push(desc.getDouble(key));
+    else if (type == DescValueType.UNITDOUBLE) values.push(desc.getUnitDoubleValue(key));
+    else if (type == DescValueType.ENUMERATEDTYPE) values.push(typeIDToStringID(desc.getEnumerationValue(key)));
+    else if (type == DescValueType.OBJECTTYPE) {
+        // Only rectangles, e.g. bounds, are decoded, other objects such as layerLocking are read as null.
+        var box = desc.getObjectValue(key);
+        if (box.hasKey(s("left")) && box.hasKey(s("top")) && box.hasKey(s("right")) && box.hasKey(s("bottom"))) {
+            values.push([
+                box.getUnitDoubleValue(s("left")),
+                box.getUnitDoubleValue(s("top")),
+                box.getUnitDoubleValue(s("right")),
+                box.getUnitDoubleValue(s("bottom"))
+            ]);
+        } else values.push(null);
+    } else values.push(null);
+}
+return __json(values);
+"""
+
+_SET = r"""
+var values = new ActionDescriptor();
+var name = %(name)s;
+var opacity = %(opacity)s;
+if (name !== undefined) values.putString(s("name"), name);
+if (opacity !== undefined) values.putUnitDouble(s("opacity"), s("percentUnit"), opacity);
+for (var i = 0; i < layerIDs.length; i++) {
+    var desc = new ActionDescriptor();
+    desc.putReference(s("null"), reference(layerIDs[i]));
+    desc.putObject(s("to"), s("layer"), values);
+    executeAction(s("set"), desc, DialogModes.NO);
+}
+return "null";
+"""
+
+_SHOW = r"""
+var desc = new ActionDescriptor();
+desc.putList(s("null"), targets());
+executeAction(s(%(event)s), desc, DialogModes.NO);
+return "null";
+"""
+
+_SELECT = r"""
+select(%(add)s);
+return "null";
+"""
+
+# Selecting layers records no history state, deleting the selected layers records one.
+_DELETE = r"""
+var previous = app.activeDocument;
+try {
+    select(false);
+    var ref = new ActionReference();
+    ref.putEnumerated(s("layer"), s("ordinal"), s("targetEnum"));
+    var desc = new ActionDescriptor();
+    desc.putReference(s("null"), ref);
+    executeAction(s("delete"), desc, DialogModes.NO);
+} finally {
+    if (app.activeDocument.id != previous.id) app.activeDocument = previous;
+}
+return "null";
+"""
+
+# The history state of `apply` replaces the states of its actions, `suspendHistory` runs a global function.
+_APPLY = r"""
+$.global.__applyLayers = function () {
+    var names = %(names)s;
+    var opacities = %(opacities)s;
+    var modes = %(modes)s;
+    var locks = %(locks)s;
+    var visibility = %(visibility)s;
+    var shown = new ActionList();
+    var hidden = new ActionList();
+    for (var i = 0; i < layerIDs.length; i++) {
+        var to = new ActionDescriptor();
+        if (names && names[i] !== undefined) to.putString(s("name"), names[i]);
+        if (opacities && opacities[i] !== undefined) to.putUnitDouble(s("opacity"), s("percentUnit"), opacities[i]);
+        if (modes && modes[i] !== undefined) to.putEnumerated(s("mode"), s("blendMode"), s(modes[i]));
+        if (locks && locks[i] !== undefined) {
+            var locking = new ActionDescriptor();
+            locking.putBoolean(s("protectAll"), locks[i]);
+            to.putObject(s("layerLocking"), s("layerLocking"), locking);
+        }
+        if (to.count) {
+            var desc = new ActionDescriptor();
+            desc.putReference(s("null"), reference(layerIDs[i]));
+            desc.putObject(s("to"), s("layer"), to);
+            executeAction(s("set"), desc, DialogModes.NO);
+        }
+        if (visibility && visibility[i] !== undefined) {
+            (visibility[i] ? shown : hidden).putReference(reference(layerIDs[i]));
+        }
+    }
+    var events = [["show", shown], ["hide", hidden]];
+    for (var j = 0; j < events.length; j++) {
+        if (!events[j][1].count) continue;
+        var show = new ActionDescriptor();
+        show.putList(s("null"), events[j][1]);
+        executeAction(s(events[j][0]), show, DialogModes.NO);
+    }
+};
+var previous = app.activeDocument;
+activateDocument();
+try {
+    app.activeDocument.suspendHistory(%(title)s, "__applyLayers()");
+} finally {
+    if (app.activeDocument.id != previous.id) app.activeDocument = previous;
+}
+return "null";
+"""
+
+# The programs of the operations, by the `op` of the payload.
+BODIES = {"read": _READ, "set": _SET, "show": _SHOW, "select": _SELECT, "delete": _DELETE, "apply": _APPLY}
+
+# The Action Manager string IDs of the blend modes.
+BLEND_MODES = {
+    BlendMode.ColorBlend: "color",
+    BlendMode.ColorBurn: "colorBurn",
+    BlendMode.ColorDodge: "colorDodge",
+    BlendMode.Darken: "darken",
+    BlendMode.DarkerColor: "darkerColor",
+    BlendMode.Difference: "difference",
+    BlendMode.Dissolve: "dissolve",
+    BlendMode.Divide: "blendDivide",
+    BlendMode.Exclusion: "exclusion",
+    BlendMode.HardLight: "hardLight",
+    BlendMode.HardMix: "hardMix",
+    BlendMode.Hue: "hue",
+    BlendMode.Lighten: "lighten",
+    BlendMode.LighterColor: "lighterColor",
+    BlendMode.LinearBurn: "linearBurn",
+    BlendMode.LinearDodge: "linearDodge",
+    BlendMode.LinearLight: "linearLight",
+    BlendMode.Luminosity: "luminosity",
+    BlendMode.Multiply: "multiply",
+    BlendMode.NormalBlend: "normal",
+    BlendMode.Overlay: "overlay",
+    BlendMode.PassThrough: "passThrough",
+    BlendMode.PinLight: "pinLight",
+    BlendMode.SaturationBlend: "saturation",
+    BlendMode.Screen: "screen",
+    BlendMode.SoftLight: "softLight",
+    BlendMode.Subtract: "blendSubtraction",
+    BlendMode.VividLight: "vividLight",
+}
+
+
+def run(document_id: int, layer_ids: Iterable[int], op: str, **arguments) -> Any:
+    """Run one operation on layers of a document with one program.
+
+    Args:
+        document_id: The ID of the document.
+        layer_ids: The IDs of the layers.
+        op: The operation, a key of `BODIES`.
+        **arguments: The arguments of the operation, see the programs.
+
+    Returns:
+        The value returned by the program.
+
+    """
+    layer_ids = [int(layer_id) for layer_id in layer_ids]
+    body = BODIES[op] % {key: _jsx.literal(value) for key, value in arguments.items()}
+    source = _PROGRAM % {
+        "functions": _jsx.JSON_FUNCTION + _jsx.FIND_FUNCTIONS,
+        "document": _jsx.literal(document_id),
+        "layers": _jsx.literal(layer_ids),
+        "body": body,
+    }
+    payload = {"doc": document_id, "layers": layer_ids, "op": op, **arguments}
+    script = _jsx.program("layer_ref", payload, source)
+    result = Photoshop._get_shared_application().doJavaScript(script, None, None)
+    try:
+        return json.loads(result)
+    except ValueError as err:
+        raise PhotoshopPythonAPIError(f"Unable to read the result of the layer {op}: {err}") from err
+
+
+def delete(document_id: int, layer_ids: Iterable[int]) -> int:
+    """Delete layers of a document with a single action, undone as one history state.
+
+    Layer sets are deleted with their content. Photoshop refuses to delete all layers of a document.
+
+    Returns:
+        The number of layers deleted, not counting the content of layer sets.
+
+    """
+    layer_ids = list(dict.fromkeys(layer_ids))
+    if layer_ids:
+        run(document_id, layer_ids, "delete")
+    return len(layer_ids)
+
+
+def apply(
+    document_id: int,
+    layer_ids: Sequence[int],
+    names: Optional[Sequence[Optional[str]]] = None,
+    visibility: Optional[Sequence[Optional[bool]]] = None,
+    opacities: Optional[Sequence[Optional[float]]] = None,
+    modes: Optional[Sequence[Optional[BlendMode]]] = None,
+    locks: Optional[Sequence[Optional[bool]]] = None,
+    title: str = "Layer Properties",
+):
+    """Change properties of layers of a document with one program, recorded as one history state.
+
+    Each sequence has one value per layer, None to leave the property of this layer unchanged.
+    Nothing runs when no property is changed. The active document is restored afterwards.
+
+    Args:
+        document_id: The ID of the document.
+        layer_ids: The IDs of the layers.
+        names: The names of the layers.
+        visibility: Whether the layers are visible.
+        opacities: The opacities of the layers, in percent.
+        modes: The blend modes of the layers.
+        locks: Whether the layers are fully locked, like `ArtLayer.allLocked`.
+        title: The name of the history state.
+
+    """
+    if modes is not None:
+        modes = [None if mode is None else BLEND_MODES[BlendMode(mode)] for mode in modes]
+    columns = {"names": names, "visibility": visibility, "opacities": opacities, "modes": modes, "locks": locks}
+    columns = {key: None if values is None else list(values) for key, values in columns.items()}
+    for key, values in columns.items():
+        if values is not None and len(values) != len(layer_ids):
+            raise ValueError(f"Expected one of the {key} per layer, got {len(values)} for {len(layer_ids)} layers.")
+    if layer_ids and any(value is not None for values in columns.values() for value in values or ()):
+        run(document_id, layer_ids, "apply", title=title, **columns)
+
+
+class LayerRef:
+    """A layer addressed by the ID of its document and its layer ID, see the module documentation.
+
+    Args:
+        document_id: The ID of the document, `Document.id`.
+        layer_id: The ID of the layer, `ArtLayer.id`.
+
+    """
+
+    __slots__ = ("document_id", "layer_id")
+
+    def __init__(self, document_id: int, layer_id: int):
+        self.document_id = int(document_id)
+        self.layer_id = int(layer_id)
+
+    def __repr__(self):
+        return f"<LayerRef document={self.document_id} layer={self.layer_id}>"
+
+    def __eq__(self, other):
+        if not isinstance(other, LayerRef):
+            return NotImplemented
+        return (self.document_id, self.layer_id) == (other.document_id, other.layer_id)
+
+    def __hash__(self):
+        return hash((self.document_id, self.layer_id))
+
+    @classmethod
+    def of(cls, layer: Any) -> "LayerRef":
+        """Get the reference of a layer object, e.g. an `ArtLayer` or a `LayerSet`."""
+        locator = _jsx.locate(layer, layer.__dict__["app"], "layer")
+        return cls(locator["doc"], locator["layer"])
+
+    def read(self, *keys: str) -> Dict[str, Any]:
+        """Read Action Manager properties of the layer with a single call to Photoshop.
+
+        Args:
+            *keys: The string IDs of the properties, e.g. ``name``, ``visible``, ``opacity``
+                (from 0 to 255), ``layerKind``, ``itemIndex`` or ``bounds``.
+
+        Returns:
+            dict: The values by key, enumeration values as their string ID, bounds as a list of
+                left, top, right and bottom, None for the properties the layer does not have
+                and for object values other than rectangles.
+
+        """
+        return dict(zip(keys, run(self.document_id, [self.layer_id], "read", keys=list(keys))))
+
+    def delete(self):
+        """Delete the layer, a layer set with its content."""
+        run(self.document_id, [self.layer_id], "delete")
+
+    def set(self, name: Optional[str] = None, opacity: Optional[float] = None):
+        """Change the name and the opacity, in percent, of the layer with a single call to Photoshop."""
+        if name is None and opacity is None:
+            return
+        run(self.document_id, [self.layer_id], "set", name=name, opacity=opacity)
+
+    def select(self, add: bool = False):
+        """Make the layer the active layer, or add it to the selected layers.
+
+        The document of the layer becomes the active document if it was not.
+        """
+        run(self.document_id, [self.layer_id], "select", add=add)
+
+    @property
+    def name(self) -> str:
+        return self.read("name")["name"]
+
+    @name.setter
+    def name(self, value: str):
+        self.set(name=value)
+
+    @property
+    def visible(self) -> bool:
+        return self.read("visible")["visible"]
+
+    @visible.setter
+    def visible(self, value: bool):
+        run(self.document_id, [self.layer_id], "show", event="show" if value else "hide")
+
+    @property
+    def opacity(self) -> float:
+        """float: The opacity in percent."""
+        return round(self.read("opacity")["opacity"] * 100 / 255)
+
+    @opacity.setter
+    def opacity(self, value: float):
+        self.set(opacity=value)
+
+    @property
+    def kind(self) -> int:
+        """int: The Action Manager ``layerKind`` of the layer, like `ArtLayer.kind`."""
+        return self.read("layerKind")["layerKind"]
+
+    @property
+    def item_index(self) -> int:
+        """int: The Action Manager index of the layer, counting from the bottom of the document."""
+        return self.read("itemIndex")["itemIndex"]
+
+    @property
+    def bounds(self) -> List[float]:
+        """List[float]: Left, top, right and bottom in pixels."""
+        return self.read("bounds")["bounds"]
@@ -0,0 +1,138 @@
+"""Change a property of many layers with a single `doJavaScript` call.
+
+Setting a property of a layer through its DOM object costs one round trip,
+and one history state, per layer and per property. The setters of
+`LayerSetters` change any number of layers with one program, built on
+Action Manager references by layer ID, and record a single history state.
+
+The layers are given as layer IDs, `LayerRef`, `LayerNode` or layer objects,
+and may be any layers of the document, not only the layers of the collection
+or layer set the setter is called on. The values are either one value for all
+layers, or a list or tuple with one value per layer, None leaving the
+property of that layer unchanged.
+
+Examples:
+    ```python
+
+        from photoshop import Session
+
+        with Session() as ps:
+            doc = ps.active_document
+            tree = doc.layer_tree()
+            visibility = [node.visible for node in tree]
+            doc.layers.set_visible(tree, False)
+            try:
+                ...
+            finally:
+                doc.layers.set_visible(tree, visibility)
+    ```
+
+"""
+
+# Import built-in modules
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+# Import local modules
+from photoshop.api import _layer_ref
+from photoshop.api._layer_ref import LayerRef
+from photoshop.api._layer_tree import LayerNode
+
+
+def layer_ids(document_id: int, layers: Iterable[Any]) -> List[int]:
+    """Get the IDs of layers given as layer IDs, `LayerRef`, `LayerNode` or layer objects.
+
+    Raises:
+        ValueError: A layer belongs to another document.
+
+    """
+    ids = []
+    for layer in layers:
+        if isinstance(layer, int):
+            ids.append(layer)
+            continue
+        if isinstance(layer, LayerNode):
+            layer = layer.ref
+        elif not isinstance(layer, LayerRef):
+            layer = LayerRef.of(layer)
+        if layer.document_id != document_id:
+            raise ValueError(f"{layer!r} is not a layer of this document.")
+        ids.append(layer.layer_id)
+    return ids
+
+
+def _per_layer(value: Any, count: int) -> Optional[List[Any]]:
+    """One value per layer, repeating a single value."""
+    if value is None or isinstance(value, (list, tuple)):
+        return value
+    return [value] * count
+
+
+class LayerSetters:
+    """Setters of properties of many layers, see `photoshop.api._layer_setters`."""
+
+    def _layers_document_id(self) -> int:
+        """int: The ID of the document of the layers."""
+        raise NotImplementedError
+
+    def set_layers(
+        self,
+        layers: Iterable[Any],
+        name: Any = None,
+        visible: Any = None,
+        opacity: Any = None,
+        blend_mode: Any = None,
+        locked: Any = None,
+    ) -> int:
+        """Change properties of many layers with a single call to Photoshop, recorded as one history state.
+
+        Args:
+            layers: The layers, see `layer_ids`.
+            name: The name, or the names of the layers.
+            visible: Whether the layers are visible, or one flag per layer.
+            opacity: The opacity in percent, or one opacity per layer.
+            blend_mode: The `BlendMode`, or one blend mode per layer.
+            locked: Whether the layers are fully locked, or one flag per layer.
+
+        Returns:
+            int: The number of layers.
+
+        Raises:
+            ValueError: A list of values does not have one value per layer,
+                or a layer belongs to another document.
+
+        """
+        document_id = self._layers_document_id()
+        ids = layer_ids(document_id, layers)
+        _layer_ref.apply(
+            document_id,
+            ids,
+            names=_per_layer(name, len(ids)),
+            visibility=_per_layer(visible, len(ids)),
+            opacities=_per_layer(opacity, len(ids)),
+            modes=_per_layer(blend_mode, len(ids)),
+            locks=_per_layer(locked, len(ids)),
+        )
+        return len(ids)
+
+    def set_visible(self, layers: Iterable[Any], flags: Any = True) -> int:
+        """Show or hide many layers with a single call to Photoshop."""
+        return self.set_layers(layers, visible=flags)
+
+    def set_opacity(self, layers: Iterable[Any], values: Any) -> int:
+        """Change the opacity, in percent, of many layers with a single call to Photoshop."""
+        return self.set_layers(layers, opacity=values)
+
+    def set_blend_mode(self, layers: Iterable[Any], modes: Any) -> int:
+        """Change the blend mode of many layers with a single call to Photoshop."""
+        return self.set_layers(layers, blend_mode=modes)
+
+    def set_locked(self, layers: Iterable[Any], flags: Any = True) -> int:
+        """Lock or unlock many layers with a single call to Photoshop."""
+        return self.set_layers(layers, locked=flags)
+
+    def rename(self, layers: Iterable[Any], names: Any) -> int:
+        """Rename many layers with a single call to Photoshop."""
+        return self.set_layers(layers, name=names)
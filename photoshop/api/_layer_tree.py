@@ -0,0 +1,245 @@
+"""Read the layer hierarchy of a document with a single `doJavaScript` call.
+
+The program walks the layers of the document with Action Manager
+descriptors, addressed by index, which Photoshop answers without creating a
+DOM object per layer. It returns one array per property, kept as they are in
+a `LayerTree`: a document of thousands of layers costs a few arrays rather
+than an object per layer, and `LayerNode` objects are only created for the
+layers a caller looks at.
+
+Layers are listed in the order of the Layers panel, from the top, each layer
+set followed by its content. ``kind`` is the Action Manager ``layerKind``,
+like `ArtLayer.kind`: 1 for pixel layers, 3 for text layers, 5 for smart
+objects and `GROUP_KIND` for layer sets.
+
+"""
+
+# Import built-in modules
+from array import array
+import json
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api._layer_ref import LayerRef
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+# The Action Manager `layerKind` of layer sets.
+GROUP_KIND = 7
+
+_PROGRAM = r"""
+(function () {
+%(functions)s
+var s = stringIDToTypeID;
+var documentID = %(document)s;
+function property(name) {
+    var ref = new ActionReference();
+    ref.putProperty(s("property"), s(name));
+    ref.putIdentifier(s("document"), documentID);
+    return executeActionGet(ref);
+}
+var count = property("numberOfLayers").getInteger(s("numberOfLayers"));
+var first = property("hasBackgroundLayer").getBoolean(s("hasBackgroundLayer")) ? 0 : 1;
+var tree = {id: [], itemIndex: [], parent: [], kind: [], visible: [], bounds: [], opacity: [], name: []};
+var parents = [0];
+for (var i = count; i >= first; i--) {
+    var ref = new ActionReference();
+    ref.putIndex(s("layer"), i);
+    ref.putIdentifier(s("document"), documentID);
+    var desc = executeActionGet(ref);
+    var section = typeIDToStringID(desc.getEnumerationValue(s("layerSection")));
+    if (section == "layerSectionEnd") {
+        parents.pop();
+        continue;
+    }
+    var id = desc.getInteger(s("layerID"));
+    var bounds = desc.getObjectValue(s("bounds"));
+    tree.id.push(id);
+    tree.itemIndex.push(desc.getInteger(s("itemIndex")));
+    tree.parent.push(parents[parents.length - 1]);
+    tree.kind.push(desc.getInteger(s("layerKind")));
+    tree.visible.push(desc.getBoolean(s("visible")));
+    tree.bounds.push(
+        bounds.getUnitDoubleValue(s("left")),
+        bounds.getUnitDoubleValue(s("top")),
+        bounds.getUnitDoubleValue(s("right")),
+        bounds.getUnitDoubleValue(s("bottom"))
+    );
+    tree.opacity.push(Math.round(desc.getInteger(s("opacity")) * 100 / 255));
+    tree.name.push(desc.getString(s("name")));
+    if (section == "layerSectionStart") parents.push(id);
+}
+return __json(tree);
+})();
+"""
+
+
+class LayerNode:
+    """One layer of a `LayerTree`, reading its values from the arrays of the tree."""
+
+    __slots__ = ("tree", "position")
+
+    def __init__(self, tree: "LayerTree", position: int):
+        self.tree = tree
+        self.position = position
+
+    def __repr__(self):
+        return f"<LayerNode {self.id} {self.name!r}>"
+
+    def __eq__(self, other):
+        return isinstance(other, LayerNode) and other.tree is self.tree and other.position == self.position
+
+    def __hash__(self):
+        return hash((id(self.tree), self.position))
+
+    @property
+    def id(self) -> int:
+        """int: The layer ID, unique in the document and kept while the layer exists."""
+        return self.tree.ids[self.position]
+
+    @property
+    def item_index(self) -> int:
+        """int: The Action Manager index of the layer, counting from the bottom of the document."""
+        return self.tree.item_indexes[self.position]
+
+    @property
+    def parent_id(self) -> int:
+        """int: The ID of the layer set containing the layer, 0 for the document."""
+        return self.tree.parent_ids[self.position]
+
+    @property
+    def parent(self) -> Optional["LayerNode"]:
+        """Optional[LayerNode]: The layer set containing the layer, None for the document."""
+        return self.tree.get(self.parent_id)
+
+    @property
+    def kind(self) -> int:
+        """int: The Action Manager ``layerKind`` of the layer."""
+        return self.tree.kinds[self.position]
+
+    @property
+    def is_group(self) -> bool:
+        """bool: Whether the layer is a layer set."""
+        return self.kind == GROUP_KIND
+
+    @property
+    def visible(self) -> bool:
+        return bool(self.tree.visibility[self.position])
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Tuple[float, float, float, float]: Left, top, right and bottom in pixels."""
+        start = self.position * 4
+        end = start + 4
+        return tuple(self.tree.bounds[start:end])
+
+    @property
+    def opacity(self) -> float:
+        """float: The opacity in percent."""
+        return self.tree.opacities[self.position]
+
+    @property
+    def name(self) -> str:
+        return self.tree.names[self.position]
+
+    @property
+    def depth(self) -> int:
+        """int: The number of layer sets containing the layer."""
+        depth, parent = 0, self.parent_id
+        while parent:
+            depth += 1
+            parent = self.tree.parent_ids[self.tree.position_of(parent)]
+        return depth
+
+    @property
+    def children(self) -> List["LayerNode"]:
+        """List[LayerNode]: The layers directly inside this layer set, from the top."""
+        return self.tree.children(self.id)
+
+    @property
+    def ref(self) -> LayerRef:
+        """LayerRef: The reference of the layer, valid as long as the layer exists."""
+        return LayerRef(self.tree.document_id, self.id)
+
+
+class LayerTree:
+    """The layers of a document, stored as one array per property, see the module documentation.
+
+    Args:
+        document_id: The ID of the document.
+        columns: The arrays returned by the layer tree program, by property name.
+
+    """
+
+    def __init__(self, document_id: int, columns: Dict[str, List[Any]]):
+        self.document_id = document_id
+        self.ids = array("q", columns["id"])
+        self.item_indexes = array("q", columns["itemIndex"])
+        self.parent_ids = array("q", columns["parent"])
+        self.kinds = array("b", columns["kind"])
+        self.visibility = array("b", columns["visible"])
+        self.bounds = array("d", columns["bounds"])
+        self.opacities = array("d", columns["opacity"])
+        self.names: List[str] = columns["name"]
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __repr__(self):
+        return f"<LayerTree of {len(self)} layers>"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[LayerNode]:
+        for position in range(len(self.ids)):
+            yield LayerNode(self, position)
+
+    def __getitem__(self, position: int) -> LayerNode:
+        if position < 0:
+            position += len(self.ids)
+        if not 0 <= position < len(self.ids):
+            raise IndexError("LayerTree index out of range")
+        return LayerNode(self, position)
+
+    def __contains__(self, layer_id: int) -> bool:
+        return layer_id in self._position_map()
+
+    def _position_map(self) -> Dict[int, int]:
+        if self._positions is None:
+            self._positions = {layer_id: position for position, layer_id in enumerate(self.ids)}
+        return self._positions
+
+    def position_of(self, layer_id: int) -> int:
+        """Get the position of a layer in the tree by its ID.
+
+        Raises:
+            KeyError: The document has no layer with this ID.
+
+        """
+        return self._position_map()[layer_id]
+
+    def get(self, layer_id: int) -> Optional[LayerNode]:
+        """Get a layer by its ID, None if the document has no layer with this ID."""
+        position = self._position_map().get(layer_id)
+        return None if position is None else LayerNode(self, position)
+
+    def children(self, parent_id: int = 0) -> List[LayerNode]:
+        """Get the layers directly inside a layer set, or the document for 0, from the top."""
+        return [LayerNode(self, position) for position, parent in enumerate(self.parent_ids) if parent == parent_id]
+
+
+def read(document: Any) -> LayerTree:
+    """Read the layer tree of the document of a wrapper with one program."""
+    locator = _jsx.locate(document, document.__dict__["app"], "document")
+    body = _PROGRAM % {"functions": _jsx.JSON_FUNCTION, "document": _jsx.literal(locator["doc"])}
+    script = _jsx.program("layer_tree", {"doc": locator["doc"]}, body)
+    try:
+        columns = json.loads(document.eval_javascript(script))
+    except ValueError as err:
+        raise PhotoshopPythonAPIError(f"Unable to read the layer tree: {err}") from err
+    return LayerTree(locator["doc"], columns)
@@ -1,50 +1,55 @@
 # Import local modules
+from photoshop.api import _dispid_cache
+from photoshop.api import _layer_ref
+from photoshop.api import _snapshot
 from photoshop.api._artlayer import ArtLayer
-from photoshop.api._core import Photoshop
+from photoshop.api._collection import Collection
+from photoshop.api._layer_setters import LayerSetters
 from photoshop.api.errors import PhotoshopPythonAPIError
 
 
+def _layer(dispatch) -> ArtLayer:
+    """Wrap a layer or layer set, which do not share the DISPIDs of one interface, see `_dispid_cache`."""
+    return ArtLayer(_dispid_cache.set_interface(dispatch, None))
+
+
 # pylint: disable=too-many-public-methods
-class Layers(Photoshop):
+class Layers(LayerSetters, Collection):
     """The layers collection in the document."""
 
+    _method_flags = (
+        "add",
+        "item",
+    )
+    _collection_name = "layers"
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "add",
-            "item",
-        )
-
-    @property
-    def _layers(self):
-        return list(self.app)
-
-    def __len__(self):
-        return self.length
 
     def __getitem__(self, key):
-        item = self._layers[key]
-        return ArtLayer(item)
+        if isinstance(key, slice):
+            return [_layer(item) for item in self._item(key)]
+        return _layer(self._item(key))
 
-    @property
-    def length(self):
-        return len(self._layers)
+    def _layers_document_id(self) -> int:
+        return self._owner_locator()["doc"]
 
     def removeAll(self):
-        """Deletes all elements."""
-        for layer in self.app:
-            ArtLayer(layer).remove()
+        """Deletes all elements with a single action, undone as one history state."""
+        ids = [layer["id"] for layer in _snapshot.snapshot_collection(self, ["id"])]
+        _layer_ref.delete(self._layers_document_id(), ids)
+        self._invalidate()
 
     def item(self, index):
-        return ArtLayer(self.app.item(index))
+        return _layer(self.app.item(index))
 
     def __iter__(self):
-        for layer in self._layers:
-            yield ArtLayer(layer)
+        for layer in self._elements():
+            yield _layer(layer)
 
     def getByName(self, name: str) -> ArtLayer:
         """Get the first element in the collection with the provided name."""
-        for layer in self.app:
-            if layer.name == name:
-                return ArtLayer(layer)
-        raise PhotoshopPythonAPIError("X")
+        layer = self._find(name)
+        if layer is None:
+            raise PhotoshopPythonAPIError(f'Could not find a layer named "{name}"')
+        return _layer(layer)
@@ -5,12 +5,13 @@ from photoshop.api._core import Photoshop
 class MeasurementLog(Photoshop):
     """The log of measurements taken."""
 
+    _method_flags = (
+        "exportMeasurements",
+        "deleteMeasurements",
+    )
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "exportMeasurements",
-            "deleteMeasurements",
-        )
 
     def exportMeasurements(self, file_path: str, range_: int = None, data_point=None):
         if data_point is None:
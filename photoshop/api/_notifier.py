@@ -13,11 +13,10 @@ from photoshop.api._core import Photoshop
 
 
 class Notifier(Photoshop):
+    _method_flags = ("remove",)
+
     def __init__(self, parent=None):
         super().__init__()
-        self._flag_as_method(
-            "remove",
-        )
 
     @property
     def event(self):
@@ -22,12 +22,13 @@ from photoshop.api._notifier import Notifier
 class Notifiers(Photoshop):
     """The `notifiers` currently configured (in the Scripts Events Manager menu in the application)."""
 
+    _method_flags = (
+        "add",
+        "removeAll",
+    )
+
     def __init__(self, parent: Optional[Any] = None):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "add",
-            "removeAll",
-        )
 
     @property
     def _notifiers(self) -> list:
@@ -11,34 +11,35 @@ from photoshop.api.solid_color import SolidColor
 class Selection(Photoshop):
     """The selected area of the document."""
 
+    _method_flags = (
+        "clear",
+        "contract",
+        "copy",
+        "cut",
+        "deselect",
+        "expand",
+        "feather",
+        "fill",
+        "grow",
+        "invert",
+        "load",
+        "makeWorkPath",
+        "resize",
+        "resizeBoundary",
+        "rotate",
+        "rotateBoundary",
+        "select",
+        "selectBorder",
+        "similar",
+        "smooth",
+        "store",
+        "stroke",
+        "translate",
+        "translateBoundary",
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "clear",
-            "contract",
-            "copy",
-            "cut",
-            "deselect",
-            "expand",
-            "feather",
-            "fill",
-            "grow",
-            "invert",
-            "load",
-            "makeWorkPath",
-            "resize",
-            "resizeBoundary",
-            "rotate",
-            "rotateBoundary",
-            "select",
-            "selectBorder",
-            "similar",
-            "smooth",
-            "store",
-            "stroke",
-            "translate",
-            "translateBoundary",
-        )
 
     @property
     def bounds(self):
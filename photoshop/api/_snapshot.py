@@ -0,0 +1,191 @@
+"""Read many properties of an object with a single `doJavaScript` call.
+
+Each field is a property name, or a dotted path through properties returning
+objects, e.g. ``activeLayer.name`` or ``selection.bounds``. Values come back
+typed: UnitValues as floats, enumeration values as members of
+`photoshop.api.enumerations`, lists as lists and DOM objects as a dict of their
+typename and ID. Fields Photoshop cannot read, e.g. the ``path`` of an unsaved
+document or the ``bounds`` of an empty selection, are None.
+
+"""
+
+# Import built-in modules
+import json
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api.enumerations import AntiAlias
+from photoshop.api.enumerations import BitsPerChannelType
+from photoshop.api.enumerations import BlendMode
+from photoshop.api.enumerations import ChannelType
+from photoshop.api.enumerations import ColorModel
+from photoshop.api.enumerations import Direction
+from photoshop.api.enumerations import DocumentMode
+from photoshop.api.enumerations import Justification
+from photoshop.api.enumerations import LayerKind
+from photoshop.api.enumerations import TextType
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+# Enumeration types of properties, by the typename of the object owning the property.
+FIELD_TYPES = {
+    "Document": {"mode": DocumentMode, "bitsPerChannel": BitsPerChannelType},
+    "ArtLayer": {"kind": LayerKind, "blendMode": BlendMode},
+    "LayerSet": {"blendMode": BlendMode},
+    "TextItem": {
+        "kind": TextType,
+        "justification": Justification,
+        "antiAliasMethod": AntiAlias,
+        "direction": Direction,
+    },
+    "SolidColor": {"model": ColorModel},
+    "Channel": {"kind": ChannelType},
+}
+
+# Fields read by `snapshot` when none are given, by the typename of the object,
+# and by `snapshot_collection` for each element, by the typename of the collection.
+DEFAULT_FIELDS = {
+    "Application": ("name", "version", "currentTool"),
+    "Document": (
+        "id",
+        "name",
+        "fullName",
+        "width",
+        "height",
+        "resolution",
+        "mode",
+        "bitsPerChannel",
+        "colorProfileName",
+        "saved",
+    ),
+    "ArtLayer": (
+        "id",
+        "name",
+        "kind",
+        "visible",
+        "allLocked",
+        "opacity",
+        "fillOpacity",
+        "blendMode",
+        "isBackgroundLayer",
+        "bounds",
+    ),
+    "Documents": ("id", "name", "path", "width", "height", "resolution", "mode", "bitsPerChannel"),
+}
+
+# `__fields(target, fields)` reads each field as its owner typename and value, null if it cannot be read.
+_FIELDS_FUNCTION = r"""
+function __fields(target, fields) {
+    var values = [];
+    for (var i = 0; i < fields.length; i++) {
+        var parts = fields[i].split(".");
+        try {
+            var owner = target;
+            for (var j = 0; j < parts.length - 1; j++) owner = owner[parts[j]];
+            values.push([owner.typename, owner[parts[parts.length - 1]]]);
+        } catch (e) {
+            values.push(null);
+        }
+    }
+    return values;
+}
+"""
+
+_PROGRAM = r"""
+(function () {
+%(functions)s
+return __json(__fields(%(target)s, %(fields)s));
+})();
+"""
+
+_COLLECTION_PROGRAM = r"""
+(function () {
+%(functions)s
+var elements = %(target)s[%(collection)s];
+var fields = %(fields)s;
+var rows = [];
+for (var i = 0; i < elements.length; i++) rows.push(__fields(elements[i], fields));
+return __json(rows);
+})();
+"""
+
+
+def decode(typename: Optional[str], name: str, value: Any) -> Any:
+    """Convert a value read by a program to the enumeration member of its property, if it has one."""
+    enum = FIELD_TYPES.get(typename, {}).get(name)
+    if enum is None or not isinstance(value, int) or isinstance(value, bool):
+        return value
+    try:
+        return enum(value)
+    except ValueError:
+        return value
+
+
+def snapshot(wrapper: Any, kind: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Read the fields of the object of a wrapper with one program.
+
+    Args:
+        wrapper: The API object, e.g. a `Document`.
+        kind: How programs find the object, see `_jsx.locate`.
+        fields: Property names or dotted paths, `DEFAULT_FIELDS` of the wrapper class by default.
+
+    Returns:
+        The values by field, in the order of `fields`.
+
+    """
+    fields = list(fields or DEFAULT_FIELDS[type(wrapper).__name__])
+    locator = _jsx.locate(wrapper, wrapper.__dict__["app"], kind)
+    body = _PROGRAM % {
+        "functions": _jsx.JSON_FUNCTION + _jsx.FIND_FUNCTIONS + _FIELDS_FUNCTION,
+        "target": _jsx.reference(locator),
+        "fields": _jsx.literal(fields),
+    }
+    script = _jsx.program("snapshot", {"target": locator, "fields": fields}, body)
+    return _decode_values(fields, _run(wrapper, script))
+
+
+def snapshot_collection(collection: Any, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """Read the fields of every element of a collection with one program.
+
+    Args:
+        collection: The collection wrapper, e.g. `Documents`.
+        fields: Property names or dotted paths, `DEFAULT_FIELDS` of the collection class by default.
+
+    Returns:
+        The values by field of each element, in the order of the collection.
+
+    """
+    fields = list(fields or DEFAULT_FIELDS[type(collection).__name__])
+    locator = collection._owner_locator()
+    name = collection._collection_name
+    body = _COLLECTION_PROGRAM % {
+        "functions": _jsx.JSON_FUNCTION + _jsx.FIND_FUNCTIONS + _FIELDS_FUNCTION,
+        "target": _jsx.reference(locator),
+        "collection": _jsx.literal(name),
+        "fields": _jsx.literal(fields),
+    }
+    script = _jsx.program("snapshot", {"target": locator, "collection": name, "fields": fields}, body)
+    return [_decode_values(fields, values) for values in _run(collection, script)]
+
+
+def _run(wrapper: Any, script: str) -> Any:
+    try:
+        return json.loads(wrapper.eval_javascript(script))
+    except ValueError as err:
+        raise PhotoshopPythonAPIError(f"Unable to read the snapshot: {err}") from err
+
+
+def _decode_values(fields: List[str], values: List[Any]) -> Dict[str, Any]:
+    result = {}
+    for field, entry in zip(fields, values):
+        if entry is None:
+            result[field] = None
+        else:
+            typename, value = entry
+            result[field] = decode(typename, field.rsplit(".", 1)[-1], value)
+    return result
@@ -1,13 +1,11 @@
 # Import built-in modules
+from ctypes import ArgumentError
 from typing import Any
 from typing import Union
 
-# Import third-party modules
-from comtypes import ArgumentError
-from comtypes import COMError
-
 # Import local modules
 from photoshop.api._core import Photoshop
+from photoshop.api.errors import COMError
 from photoshop.api.errors import PhotoshopPythonAPIError
 from photoshop.api.text_font import TextFont
 
@@ -0,0 +1,68 @@
+"""On-disk cache of the Photoshop version resolved from the Windows registry.
+
+Set the ``PS_VERSION_CACHE`` environment variable to a file path to enable it.
+Each entry records the installation folder of Photoshop and its modification
+time, so reinstalling or upgrading Photoshop invalidates the cached version.
+
+"""
+
+# Import built-in modules
+import json
+import os
+from typing import Optional
+
+
+ENV_NAME = "PS_VERSION_CACHE"
+
+
+def get_cache_path() -> Optional[str]:
+    """str: The cache file path configured through ``PS_VERSION_CACHE``, if any."""
+    return os.getenv(ENV_NAME) or None
+
+
+def load_version(cache_path: str) -> Optional[str]:
+    """Read the cached Photoshop version ID.
+
+    Args:
+        cache_path: The path of the cache file.
+
+    Returns:
+        The cached version ID, or None if the cache is missing or out of date.
+
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+        if os.path.getmtime(data["install_path"]) != data["mtime"]:
+            return None
+        return data["version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_version(cache_path: str, version: str, install_path: str):
+    """Persist the resolved Photoshop version ID.
+
+    Args:
+        cache_path: The path of the cache file.
+        version: Photoshop version ID, e.g. 180.
+        install_path: The installation folder of this Photoshop version.
+
+    """
+    try:
+        data = {"version": version, "install_path": install_path, "mtime": os.path.getmtime(install_path)}
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
+def clear(cache_path: str):
+    """Remove the cache file if it exists."""
+    try:
+        os.remove(cache_path)
+    except OSError:
+        pass
@@ -19,20 +19,21 @@ class ActionList(Photoshop):
 
     object_name = "ActionList"
 
+    _method_flags = (
+        "getBoolean",
+        "getClass",
+        "getData",
+        "getDouble",
+        "getEnumerationType",
+        "getEnumerationValue",
+        "getInteger",
+        "getLargeInteger",
+        "getList",
+        "getObjectType",
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "getBoolean",
-            "getClass",
-            "getData",
-            "getDouble",
-            "getEnumerationType",
-            "getEnumerationValue",
-            "getInteger",
-            "getLargeInteger",
-            "getList",
-            "getObjectType",
-        )
 
     @property
     def count(self):
@@ -23,24 +23,25 @@ class ActionReference(Photoshop):
 
     object_name = "ActionReference"
 
+    _method_flags = (
+        "getContainer",
+        "getDesiredClass",
+        "getEnumeratedType",
+        "getEnumeratedValue",
+        "getForm",
+        "getIdentifier",
+        "getIndex",
+        "putName",
+        "putClass",
+        "putEnumerated",
+        "putIdentifier",
+        "putIndex",
+        "putOffset",
+        "putProperty",
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "getContainer",
-            "getDesiredClass",
-            "getEnumeratedType",
-            "getEnumeratedValue",
-            "getForm",
-            "getIdentifier",
-            "getIndex",
-            "putName",
-            "putClass",
-            "putEnumerated",
-            "putIdentifier",
-            "putIndex",
-            "putOffset",
-            "putProperty",
-        )
 
     def getContainer(self):
         return self.app.getContainer()
@@ -14,14 +14,15 @@ app.documents.add(800, 600, 72, "docRef")
 import os
 from pathlib import Path
 import time
+from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Union
 
-# Import third-party modules
-from _ctypes import COMError
-
 # Import local modules
+from photoshop.api import _snapshot
 from photoshop.api._artlayer import ArtLayer
 from photoshop.api._core import Photoshop
 from photoshop.api._document import Document
@@ -33,6 +34,7 @@ from photoshop.api._preferences import Preferences
 from photoshop.api._text_fonts import TextFonts
 from photoshop.api.enumerations import DialogModes
 from photoshop.api.enumerations import PurgeTarget
+from photoshop.api.errors import COMError
 from photoshop.api.errors import PhotoshopPythonAPIError
 from photoshop.api.solid_color import SolidColor
 
@@ -45,31 +47,32 @@ class Application(Photoshop):
 
     """
 
+    _method_flags = (
+        "batch",
+        "charIDToTypeID",
+        "doAction",
+        "doJavaScript",
+        "eraseCustomOptions",
+        "executeAction",
+        "executeActionGet",
+        "featureEnabled",
+        "getCustomOptions",
+        "isQuicktimeAvailable",
+        "load",
+        "open",
+        "openDialog",
+        "purge",
+        "putCustomOptions",
+        "refresh",
+        "stringIDToTypeID",
+        "toolSupportsBrushes",
+        "toolSupportsPresets",
+        "typeIDToCharID",
+        "typeIDToStringID",
+    )
+
     def __init__(self, version: Optional[str] = None):
         super().__init__(ps_version=version)
-        self._flag_as_method(
-            "batch",
-            "charIDToTypeID",
-            "doAction",
-            "doJavaScript",
-            "eraseCustomOptions",
-            "executeAction",
-            "executeActionGet",
-            "featureEnabled",
-            "getCustomOptions",
-            "isQuicktimeAvailable",
-            "load",
-            "open",
-            "openDialog",
-            "purge",
-            "putCustomOptions",
-            "refresh",
-            "stringIDToTypeID",
-            "toolSupportsBrushes",
-            "toolSupportsPresets",
-            "typeIDToCharID",
-            "typeIDToStringID",
-        )
 
     @property
     def activeLayer(self) -> ArtLayer:
@@ -472,6 +475,19 @@ class Application(Photoshop):
         """Returns false if dialog is cancelled, true otherwise."""
         return self.eval_javascript("app.showColorPicker();")
 
+    def snapshot(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Read many properties with a single call to Photoshop.
+
+        Args:
+            fields: Property names or dotted paths, e.g. ``activeDocument.name`` or
+                ``foregroundColor.rgb.hexValue``. The name, version and current tool by default.
+
+        Returns:
+            dict: The typed values by field, see `photoshop.api._snapshot`.
+
+        """
+        return _snapshot.snapshot(self, "application", fields)
+
     def stringIDToTypeID(self, string_id):
         return self.app.stringIDToTypeID(string_id)
 
@@ -0,0 +1,131 @@
+"""Backends creating the objects wrapped by the Photoshop API classes.
+
+- ``com``: Photoshop through COM automation on Windows, the default.
+- ``simulated``: an in-process Photoshop written in Python, for tests and
+  benchmarks on any platform.
+
+Select the backend with the ``PS_BACKEND`` environment variable or at runtime:
+
+```python
+
+from photoshop.api import backends
+from photoshop.api.backends import SimulatedBackend
+
+with backends.use_backend(SimulatedBackend(latency=0.002)):
+    ...
+```
+
+"""
+
+# Import built-in modules
+from contextlib import contextmanager
+import os
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# Import local modules
+from photoshop.api import _dispid_cache
+from photoshop.api.backends.base import Backend
+
+
+ENV_NAME = "PS_BACKEND"
+
+# Dispatch types resolving members dynamically like `comtypes.client.dynamic._Dispatch`.
+dispatch_types: Tuple[type, ...] = ()
+
+_backend: Optional[Backend] = None
+
+
+def register_dispatch_type(dispatch_type: type):
+    """Let wrappers share method flag and DISPID tables with dispatch objects of this type."""
+    global dispatch_types
+    if dispatch_type not in dispatch_types:
+        dispatch_types = (*dispatch_types, dispatch_type)
+
+
+def create_backend(name: str) -> Backend:
+    """Create a backend by name.
+
+    Args:
+        name: The backend name, ``com`` or ``simulated``.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    if name == "com":
+        # Import local modules
+        from photoshop.api.backends.com import COMBackend
+
+        return COMBackend()
+    if name == "simulated":
+        # Import local modules
+        from photoshop.api.backends.simulated import SimulatedBackend
+
+        return SimulatedBackend()
+    raise ValueError(f"Unknown Photoshop backend: '{name}'.")
+
+
+def get_backend() -> Backend:
+    """Backend: The current backend, created from ``PS_BACKEND`` on first use."""
+    global _backend
+    if _backend is None:
+        _backend = create_backend(os.getenv(ENV_NAME) or "com")
+    return _backend
+
+
+def set_backend(backend: Union[str, Backend, None]) -> Optional[Backend]:
+    """Replace the current backend.
+
+    Args:
+        backend: A backend, a backend name, or None to recreate it from ``PS_BACKEND`` on next use.
+
+    Returns:
+        The previous backend.
+
+    """
+    global _backend
+    previous, _backend = _backend, create_backend(backend) if isinstance(backend, str) else backend
+    # DISPIDs are only valid for the Photoshop they were resolved from.
+    _dispid_cache.clear()
+    return previous
+
+
+@contextmanager
+def use_backend(backend: Union[str, Backend]):
+    """Use a backend for the duration of a `with` block."""
+    previous = set_backend(backend)
+    try:
+        yield get_backend()
+    finally:
+        set_backend(previous)
+
+
+def __getattr__(name):
+    # Keep `from photoshop.api.backends import SimulatedBackend` cheap for the COM case.
+    if name == "COMBackend":
+        # Import local modules
+        from photoshop.api.backends.com import (
+            COMBackend,  # pylint: disable=import-outside-toplevel
+        )
+
+        return COMBackend
+    if name == "SimulatedBackend":
+        # Import local modules
+        from photoshop.api.backends.simulated import (
+            SimulatedBackend,  # pylint: disable=import-outside-toplevel
+        )
+
+        return SimulatedBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "Backend",
+    "COMBackend",
+    "SimulatedBackend",
+    "create_backend",
+    "get_backend",
+    "register_dispatch_type",
+    "set_backend",
+    "use_backend",
+]
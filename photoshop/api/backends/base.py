@@ -0,0 +1,60 @@
+"""The interface every backend implements."""
+
+# Import built-in modules
+from typing import Any
+from typing import List
+
+
+class Backend:
+    """Creates the objects wrapped by the Photoshop API classes.
+
+    A backend also keeps the state the core shares between all objects created
+    through it, so switching backends never mixes objects of two Photoshops.
+
+    Attributes:
+        application: The application object shared by child wrappers, see `Photoshop.adobe`.
+        resolved_version: The version ID that successfully created an object.
+
+    """
+
+    name: str = ""
+
+    def __init__(self):
+        self.application: Any = None
+        self.resolved_version = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} '{self.name}'>"
+
+    def create_object(self, prog_id: str) -> Any:
+        """Create the object registered under a program ID, e.g. Photoshop.Application.140.
+
+        Raises:
+            OSError: If no object is registered under this program ID.
+
+        """
+        raise NotImplementedError
+
+    def get_versions(self) -> List[str]:
+        """list: Installed Photoshop version ID's, sorted from latest to oldest."""
+        return [""]
+
+    def get_application_path(self, version: str) -> str:
+        """Get the installation folder of a Photoshop version.
+
+        Raises:
+            OSError: If the installation folder is unknown.
+
+        """
+        raise OSError(f"Unable to find the installation folder of Photoshop '{version}'.")
+
+    def initialize_thread(self):
+        """Prepare the calling thread for creating and using objects, e.g. enter a COM apartment."""
+
+    def uninitialize_thread(self):
+        """Release what `initialize_thread` acquired for the calling thread."""
+
+    def reset(self):
+        """Forget the shared application object and the resolved version."""
+        self.application = None
+        self.resolved_version = None
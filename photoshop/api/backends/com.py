@@ -0,0 +1,101 @@
+"""Photoshop through COM automation, the default backend on Windows."""
+
+# Import built-in modules
+from contextlib import suppress
+import platform
+from typing import Any
+from typing import List
+
+
+try:
+    # Import built-in modules
+    import winreg
+
+    # Import third-party modules
+    from comtypes import COINIT_APARTMENTTHREADED
+    from comtypes import CoInitializeEx
+    from comtypes import CoUninitialize
+    from comtypes.client import CreateObject
+    from comtypes.client.dynamic import _Dispatch as FullyDynamicDispatch
+except ImportError:
+    # COM is only available on Windows.
+    winreg = None
+    COINIT_APARTMENTTHREADED = None
+    CoInitializeEx = None
+    CoUninitialize = None
+    CreateObject = None
+    FullyDynamicDispatch = None
+
+# Import local modules
+from photoshop.api.backends import register_dispatch_type
+from photoshop.api.backends.base import Backend
+
+
+if FullyDynamicDispatch is not None:
+    register_dispatch_type(FullyDynamicDispatch)
+
+
+class COMBackend(Backend):
+    """Creates Photoshop objects through comtypes and finds installed versions in the Windows registry."""
+
+    name = "com"
+    reg_path = "SOFTWARE\\Adobe\\Photoshop"
+
+    def create_object(self, prog_id: str) -> Any:
+        if CreateObject is None:
+            raise OSError("comtypes is not available, unable to create COM objects.")
+        return CreateObject(prog_id, dynamic=True)
+
+    def initialize_thread(self):
+        # comtypes only initializes COM for the thread importing it.
+        if CoInitializeEx is not None:
+            CoInitializeEx(COINIT_APARTMENTTHREADED)
+
+    def uninitialize_thread(self):
+        if CoUninitialize is not None:
+            CoUninitialize()
+
+    def get_versions(self) -> List[str]:
+        if winreg is None:
+            return []
+        with suppress(OSError, IndexError):
+            key = self._open_key(self.reg_path)
+            key_count = winreg.QueryInfoKey(key)[0]
+            versions = [winreg.EnumKey(key, i).split(".")[0] for i in range(key_count)]
+            # Sort from latest version to oldest, use blank version as a fallback
+            return [*sorted(versions, reverse=True), ""]
+        return []
+
+    def get_application_path(self, version: str) -> str:
+        if winreg is None or not version:
+            return super().get_application_path(version)
+        key = self._open_key(self.reg_path)
+        for index in range(winreg.QueryInfoKey(key)[0]):
+            sub_key = winreg.EnumKey(key, index)
+            if sub_key.split(".")[0] == version:
+                return winreg.QueryValueEx(self._open_key(f"{self.reg_path}\\{sub_key}"), "ApplicationPath")[0]
+        return super().get_application_path(version)
+
+    @staticmethod
+    def _open_key(key: str) -> "winreg.HKEYType":
+        """Open the register key.
+
+        Args:
+            key: Photoshop application key path.
+
+        Returns:
+            The handle to the specified key.
+
+        Raises:
+            OSError: if registry key cannot be read.
+        """
+        machine_type = platform.machine()
+        mappings = {"AMD64": winreg.KEY_WOW64_64KEY}
+        access = winreg.KEY_READ | mappings.get(machine_type, winreg.KEY_WOW64_32KEY)
+        try:
+            return winreg.OpenKey(key=winreg.HKEY_LOCAL_MACHINE, sub_key=key, access=access)
+        except FileNotFoundError as err:
+            raise OSError(
+                "Failed to read the registration: <{path}>\n"
+                "Please check if you have Photoshop installed correctly.".format(path=f"HKEY_LOCAL_MACHINE\\{key}")
+            ) from err
@@ -0,0 +1,2086 @@
+"""An in-process Photoshop written in Python.
+
+The simulated backend speaks the same dynamic dispatch protocol as comtypes:
+every dispatch object resolves member names through `GetIDsOfNames` and
+reaches the model through `Invoke`, collections are enumerated one item per
+round trip, and the property getter of a method that was not flagged as one
+runs the method, like Photoshop does. The API classes therefore run exactly
+the same code paths as against COM, on any platform.
+
+Each round trip can be slowed down to the cost of a real COM call and is
+counted, so the number of round trips of an operation is easy to measure:
+
+```python
+
+from photoshop import Session
+from photoshop.api import backends
+from photoshop.api.backends import SimulatedBackend
+
+with backends.use_backend(SimulatedBackend(latency=0.001)) as backend:
+    with Session(action="new_document") as ps:
+        ps.active_document.artLayers.add()
+    print(backend.stats["invoke"], backend.member_calls.most_common(3))
+```
+
+Scripts and actions cannot be evaluated, register a handler for the ones a
+workflow relies on with `register_script` and `register_action`. The programs
+built by the API itself, see `photoshop.api._jsx`, are evaluated by Python
+handlers, add more with `register_program`.
+
+"""
+
+# Import built-in modules
+from collections import Counter
+import copy
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# Import local modules
+from photoshop.api import _jsx
+from photoshop.api.backends import register_dispatch_type
+from photoshop.api.backends.base import Backend
+from photoshop.api.errors import COMError
+
+
+DISPID_NEWENUM = -4
+DISPATCH_METHOD = 1
+DISPATCH_PROPERTYGET = 2
+DISPATCH_PROPERTYPUT = 4
+DISPATCH_PROPERTYPUTREF = 8
+
+DISP_E_EXCEPTION = -2147352567
+DISP_E_MEMBERNOTFOUND = -2147352573
+DISP_E_UNKNOWNNAME = -2147352570
+DISP_E_BADPARAMCOUNT = -2147352562
+REGDB_E_CLASSNOTREG = -2147221164
+RPC_E_CALL_REJECTED = -2147418111
+
+# The same as `comtypes.client.dynamic.ERRORS_BAD_CONTEXT` for the errors raised here.
+ERRORS_BAD_CONTEXT = (DISP_E_MEMBERNOTFOUND, DISP_E_BADPARAMCOUNT)
+
+# DISPIDs of member names, shared by all models like the interfaces of one Photoshop build.
+_dispids: Dict[str, int] = {}
+_names: Dict[int, str] = {}
+
+
+def _get_dispid(name: str) -> int:
+    key = name.lower()
+    dispid = _dispids.get(key)
+    if dispid is None:
+        dispid = _dispids[key] = len(_dispids) + 1
+        _names[dispid] = key
+    return dispid
+
+
+def _com_error(hresult: int, text: str, description: Optional[str] = None) -> COMError:
+    return COMError(hresult, text, (description, "Adobe Photoshop", None, 0, None))
+
+
+class SimError(Exception):
+    """Raised by models for errors Photoshop reports as `DISP_E_EXCEPTION`."""
+
+
+"""
+* Dispatch protocol
+"""
+
+
+class SimMethodCaller:
+    """Calls a member of a simulated dispatch object, like `comtypes.client.dynamic.MethodCaller`."""
+
+    def __init__(self, _id: int, _obj: "SimDispatch"):
+        self._id = _id
+        self._obj = _obj
+
+    def __call__(self, *args):
+        return self._obj._comobj.Invoke(self._id, *args)
+
+    def __getitem__(self, *args):
+        return self._obj._comobj.Invoke(self._id, *args, _invkind=DISPATCH_PROPERTYGET)
+
+
+class SimDispatch:
+    """Expose a simulated object through fully dynamic dispatch, like `comtypes.client.dynamic._Dispatch`."""
+
+    def __init__(self, comobj: "SimComObject"):
+        self.__dict__["_comobj"] = comobj
+        self.__dict__["_ids"] = {}
+        self.__dict__["_methods"] = set()
+
+    def __enum(self) -> "SimEnumVariant":
+        return self._comobj.Invoke(DISPID_NEWENUM)
+
+    def __hash__(self):
+        return hash(self._comobj)
+
+    def __eq__(self, other):
+        return isinstance(other, SimDispatch) and self._comobj == other._comobj
+
+    def __repr__(self):
+        return f"<SimDispatch {self._comobj.model!r}>"
+
+    def __getitem__(self, index: int):
+        enum = self.__enum()
+        if index > 0:
+            if enum.Skip(index) != 0:
+                raise IndexError("index out of range")
+        item, fetched = enum.Next(1)
+        if not fetched:
+            raise IndexError("index out of range")
+        return item
+
+    def _FlagAsMethod(self, *names: str):
+        """Flag these attribute names as being methods."""
+        self._methods.update(names)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        dispid = self._ids.get(name)
+        if not dispid:
+            dispid = self._comobj.GetIDsOfNames(name)[0]
+            self._ids[name] = dispid
+
+        if name in self._methods:
+            result = SimMethodCaller(dispid, self)
+            self.__dict__[name] = result
+            return result
+
+        try:
+            result = self._comobj.Invoke(dispid, _invkind=DISPATCH_PROPERTYGET)
+        except COMError as err:
+            if err.args[0] not in ERRORS_BAD_CONTEXT:
+                raise
+            result = SimMethodCaller(dispid, self)
+            self.__dict__[name] = result
+        return result
+
+    def __setattr__(self, name: str, value: Any):
+        dispid = self._ids.get(name)
+        if not dispid:
+            dispid = self._comobj.GetIDsOfNames(name)[0]
+            self._ids[name] = dispid
+        flags = DISPATCH_PROPERTYPUTREF if _is_object(value) else DISPATCH_PROPERTYPUT
+        return self._comobj.Invoke(dispid, value, _invkind=flags)
+
+    def __iter__(self):
+        # Like comtypes, the enumerator is requested right away and the items one by one.
+        return _iterate(self.__enum())
+
+
+def _iterate(enum: "SimEnumVariant"):
+    while True:
+        item, fetched = enum.Next(1)
+        if not fetched:
+            return
+        yield item
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, SimDispatch) or isinstance(getattr(value, "_comobj", None), SimComObject)
+
+
+class SimComObject:
+    """The `IDispatch` interface of one simulated object."""
+
+    __slots__ = ("backend", "model")
+
+    def __init__(self, backend: "SimulatedBackend", model: "SimObject"):
+        self.backend = backend
+        self.model = model
+
+    def __hash__(self):
+        return id(self.model)
+
+    def __eq__(self, other):
+        return isinstance(other, SimComObject) and self.model is other.model
+
+    def GetIDsOfNames(self, *names: str) -> List[int]:
+        self.backend._round_trip("GetIDsOfNames")
+        self.backend._check_rejection()
+        for name in names:
+            if self.model._resolve(name) is None:
+                raise _com_error(DISP_E_UNKNOWNNAME, "Unknown name.")
+        return [_get_dispid(name) for name in names]
+
+    def Invoke(self, dispid: int, *args, _invkind: int = DISPATCH_METHOD):
+        return self.backend._invoke(self.model, dispid, args, _invkind)
+
+
+class SimEnumVariant:
+    """Enumerates a collection one item per round trip, like `IEnumVARIANT`."""
+
+    def __init__(self, backend: "SimulatedBackend", items: List["SimObject"]):
+        self.backend = backend
+        self.items = items
+        self.position = 0
+
+    def Next(self, celt: int = 1):
+        self.backend._round_trip("IEnumVARIANT")
+        if self.position >= len(self.items):
+            return None, 0
+        item = self.items[self.position]
+        self.position += 1
+        return self.backend._to_variant(item), 1
+
+    def Skip(self, celt: int) -> int:
+        self.backend._round_trip("IEnumVARIANT")
+        self.position += celt
+        return 0 if self.position <= len(self.items) else 1
+
+
+"""
+* Models
+"""
+
+
+class Field:
+    """A readable and writable property of a model, stored on the instance."""
+
+    def __init__(self, default: Any = None):
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self.name, self.default)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+class SimObject:
+    """Base of all simulated Photoshop objects.
+
+    Public properties and `Field`s are exposed as COM properties, public
+    methods as COM methods, and the names in `_noop_methods` as methods doing nothing.
+    """
+
+    _typename = ""
+    _noop_methods = ()
+    # Properties programs read as `SimFile` objects.
+    _file_members = ()
+    _member_table: Dict[str, tuple] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._member_table = {}
+
+    def __init__(self, parent: "SimObject" = None):
+        self._parent = parent
+
+    def __repr__(self):
+        return f"<{self._typename or self.__class__.__name__}>"
+
+    @classmethod
+    def _resolve(cls, name: str) -> Optional[tuple]:
+        """Get the Python attribute name of a member and whether it is a method."""
+        table = cls._member_table
+        if not table:
+            for attr in dir(cls):
+                if attr.startswith("_"):
+                    continue
+                value = inspect.getattr_static(cls, attr)
+                table[attr.lower()] = (attr, not isinstance(value, (property, Field)))
+            for attr in cls._noop_methods:
+                table[attr.lower()] = (attr, True)
+        return table.get(name.lower())
+
+    def __getattr__(self, name):
+        if name in self._noop_methods:
+            return self._noop
+        raise AttributeError(name)
+
+    @staticmethod
+    def _noop(*args):
+        return None
+
+    def _items(self) -> List["SimObject"]:
+        raise SimError("This object is not a collection.")
+
+    @property
+    def typename(self) -> str:
+        return self._typename
+
+    @property
+    def parent(self) -> "SimObject":
+        return self._parent
+
+
+class SimFile:
+    """A File or Folder object, what programs read from path properties COM returns as strings."""
+
+    def __init__(self, path: str):
+        self.fsName = os.path.normpath(path)
+
+    def __repr__(self):
+        return f"<File {self.fsName}>"
+
+
+class SimBag(SimObject):
+    """An object accepting any property, e.g. save options."""
+
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, typename: str = "", parent: SimObject = None, **values):
+        super().__init__(parent)
+        self._typename = typename or self._typename
+        self._values = {key.lower(): value for key, value in self._defaults.items()}
+        self._values.update((key.lower(), value) for key, value in values.items())
+
+    @classmethod
+    def _resolve(cls, name: str) -> Optional[tuple]:
+        return super()._resolve(name) or (name, False)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            return super().__getattr__(name)
+        return self._values.get(name.lower())
+
+    def __setattr__(self, name, value):
+        if name.startswith("_") or hasattr(type(self), name):
+            super().__setattr__(name, value)
+        else:
+            self._values[name.lower()] = value
+
+    def __deepcopy__(self, memo):
+        result = copy.copy(self)
+        result.__dict__["_values"] = copy.deepcopy(self._values, memo)
+        return result
+
+
+class SimCollection(SimObject):
+    """A collection, enumerable and indexed from 1 through `item`."""
+
+    @property
+    def length(self) -> int:
+        return len(self._items())
+
+    def item(self, index: int) -> SimObject:
+        items = self._items()
+        if not 1 <= index <= len(items):
+            raise SimError("No such element")
+        return items[index - 1]
+
+    def getByName(self, name: str) -> SimObject:
+        for item in self._items():
+            if item.name == name:
+                return item
+        raise SimError("No such element")
+
+
+class SimRGBColor(SimObject):
+    _typename = "RGBColor"
+    red = Field(0.0)
+    green = Field(0.0)
+    blue = Field(0.0)
+
+    @property
+    def hexValue(self) -> str:
+        return "".join(f"{round(channel):02X}" for channel in (self.red, self.green, self.blue))
+
+    @hexValue.setter
+    def hexValue(self, value: str):
+        self.red, self.green, self.blue = (float(channel) for channel in bytes.fromhex(value))
+
+
+class SimSolidColor(SimObject):
+    _typename = "SolidColor"
+    model = Field(2)
+
+    def __init__(self, parent: SimObject = None, red: float = 0.0, green: float = 0.0, blue: float = 0.0):
+        super().__init__(parent)
+        self._rgb = SimRGBColor(self)
+        self._rgb.red, self._rgb.green, self._rgb.blue = red, green, blue
+        self._others = {
+            name: SimBag(typename, self)
+            for name, typename in (
+                ("cmyk", "CMYKColor"),
+                ("gray", "GrayColor"),
+                ("hsb", "HSBColor"),
+                ("lab", "LabColor"),
+            )
+        }
+
+    @property
+    def rgb(self) -> SimRGBColor:
+        return self._rgb
+
+    @rgb.setter
+    def rgb(self, value: SimRGBColor):
+        self._rgb.red, self._rgb.green, self._rgb.blue = value.red, value.green, value.blue
+
+    @property
+    def cmyk(self) -> SimBag:
+        return self._others["cmyk"]
+
+    @property
+    def gray(self) -> SimBag:
+        return self._others["gray"]
+
+    @property
+    def hsb(self) -> SimBag:
+        return self._others["hsb"]
+
+    @property
+    def lab(self) -> SimBag:
+        return self._others["lab"]
+
+    def isEqual(self, color: "SimSolidColor") -> bool:
+        return self._rgb.hexValue == color.rgb.hexValue
+
+    def _copy_from(self, color: "SimSolidColor"):
+        self.rgb = color.rgb
+        self.model = color.model
+
+
+class SimTextItem(SimBag):
+    _typename = "TextItem"
+    _defaults = {
+        "contents": "",
+        "font": "ArialMT",
+        "size": 12.0,
+        "position": (0.0, 0.0),
+        "justification": 1,
+        "kind": 1,
+        "antiAliasMethod": 3,
+        "tracking": 0.0,
+        "leading": 14.4,
+        "useAutoLeading": True,
+    }
+
+    def __init__(self, parent: SimObject = None):
+        super().__init__(parent=parent)
+        self._values["color"] = SimSolidColor(self)
+
+    def convertToShape(self):
+        self._parent.kind = 1
+
+    def createPath(self):
+        return None
+
+
+class SimLayer(SimObject):
+    """Members shared by art layers and layer sets."""
+
+    name = Field("")
+    visible = Field(True)
+    opacity = Field(100.0)
+    blendMode = Field(2)
+    allLocked = Field(False)
+    linkedLayers = Field(())
+    _noop_methods = ("link", "unlink", "resize", "rotate")
+
+    def __init__(self, parent: SimObject, name: str):
+        super().__init__(parent)
+        self.name = name
+        self._document = parent if isinstance(parent, SimDocument) else parent._document
+        self._id = self._document._next_layer_id()
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def itemIndex(self) -> int:
+        """int: The Action Manager index of the layer, counting from the bottom of the document."""
+        return self._document._item_indexes()[self._id]
+
+    @property
+    def bounds(self) -> tuple:
+        return self._document._full_bounds()
+
+    def delete(self):
+        self._document._remove_layer(self)
+
+    def remove(self):
+        self.delete()
+
+    def duplicate(self, relativeObject: "SimLayer" = None, insertionLocation: int = None) -> "SimLayer":
+        layer = self._copy(self._parent, f"{self.name} copy")
+        self._parent._children.insert(self._parent._children.index(self), layer)
+        if relativeObject is not None:
+            layer.move(relativeObject, 3 if insertionLocation is None else insertionLocation)
+        return layer
+
+    def move(self, relativeObject: SimObject, insertionLocation: int):
+        if isinstance(relativeObject, SimLayerSet) and insertionLocation in (0, 1, 2):
+            container, index = relativeObject, 0 if insertionLocation != 2 else len(relativeObject._children)
+        elif isinstance(relativeObject, SimDocument):
+            container, index = relativeObject, 0 if insertionLocation != 2 else len(relativeObject._children)
+        elif isinstance(relativeObject, SimLayer) and insertionLocation in (3, 4):
+            container = relativeObject._parent
+            index = container._children.index(relativeObject) + (insertionLocation == 4)
+        else:
+            raise SimError("Illegal argument - argument 2")
+        if self is container or (isinstance(self, SimLayerSet) and self._contains(container)):
+            raise SimError("Cannot move a layer set into itself.")
+        if container is self._parent and self._parent._children.index(self) < index:
+            index -= 1
+        self._parent._children.remove(self)
+        container._children.insert(index, self)
+        self._parent = container
+
+    def _copy(self, parent: SimObject, name: str) -> "SimLayer":
+        layer = copy.copy(self)
+        layer.__dict__.update(copy.deepcopy({k: v for k, v in self.__dict__.items() if k not in _LAYER_LINKS}))
+        layer._parent, layer._document, layer.name = parent, parent._document_of(), name
+        layer._id = layer._document._next_layer_id()
+        return layer
+
+
+# Attributes of a layer pointing to other objects of the document, never copied.
+_LAYER_LINKS = ("_parent", "_document", "_children", "_text_item")
+
+
+class SimArtLayer(SimLayer):
+    _typename = "ArtLayer"
+    fillOpacity = Field(100.0)
+    grouped = Field(False)
+    pixelsLocked = Field(False)
+    positionLocked = Field(False)
+    transparentPixelsLocked = Field(False)
+    layerMaskDensity = Field(100.0)
+    layerMaskFeather = Field(0.0)
+    filterMaskDensity = Field(100.0)
+    filterMaskFeather = Field(0.0)
+    vectorMaskDensity = Field(100.0)
+    vectorMaskFeather = Field(0.0)
+    _noop_methods = SimLayer._noop_methods + (
+        "adjustBrightnessContrast",
+        "adjustColorBalance",
+        "adjustCurves",
+        "adjustLevels",
+        "applyAddNoise",
+        "applyAverage",
+        "applyBlur",
+        "applyBlurMore",
+        "applyClouds",
+        "applyCustomFilter",
+        "applyDeInterlace",
+        "applyDespeckle",
+        "applyDifferenceClouds",
+        "applyDiffuseGlow",
+        "applyDisplace",
+        "applyDustAndScratches",
+        "applyGaussianBlur",
+        "applyGlassEffect",
+        "applyHighPass",
+        "applyLensBlur",
+        "applyLensFlare",
+        "applyMaximum",
+        "applyMedianNoise",
+        "applyMinimum",
+        "applyMotionBlur",
+        "applyNTSC",
+        "applyOceanRipple",
+        "applyOffset",
+        "applyPinch",
+        "clear",
+        "copy",
+        "cut",
+        "invert",
+        "posterize",
+        "rasterize",
+    )
+
+    def __init__(self, parent: SimObject, name: str, is_background: bool = False, bounds: tuple = None):
+        super().__init__(parent, name)
+        self._is_background = is_background
+        self._bounds = tuple(bounds) if bounds else (0.0, 0.0, 0.0, 0.0)
+        self._kind = 1
+        self._text_item = None
+
+    @property
+    def bounds(self) -> tuple:
+        return self._bounds
+
+    @property
+    def isBackgroundLayer(self) -> bool:
+        return self._is_background
+
+    @isBackgroundLayer.setter
+    def isBackgroundLayer(self, value: bool):
+        self._is_background = bool(value)
+
+    @property
+    def kind(self) -> int:
+        return self._kind
+
+    @kind.setter
+    def kind(self, value: int):
+        if self._is_background:
+            raise SimError("The background layer cannot be converted.")
+        self._kind = int(value)
+        self._text_item = SimTextItem(self) if self._kind == 2 else None
+
+    @property
+    def textItem(self) -> SimTextItem:
+        if self._text_item is None:
+            raise SimError("The layer is not a text layer.")
+        return self._text_item
+
+    def translate(self, deltaX: float, deltaY: float):
+        left, top, right, bottom = self._bounds
+        self._bounds = (left + deltaX, top + deltaY, right + deltaX, bottom + deltaY)
+
+    def merge(self) -> "SimArtLayer":
+        children = self._parent._children
+        index = children.index(self)
+        if index + 1 >= len(children) or not isinstance(children[index + 1], SimArtLayer):
+            raise SimError("Merge Down is not available.")
+        below = children[index + 1]
+        self.delete()
+        return below
+
+    def _copy(self, parent: SimObject, name: str) -> "SimArtLayer":
+        layer = super()._copy(parent, name)
+        layer._is_background = False
+        if self._text_item is not None:
+            layer._text_item = copy.deepcopy(self._text_item)
+            layer._text_item._parent = layer
+        return layer
+
+
+class SimLayerContainer:
+    """Mixin for objects holding layers, the document and layer sets."""
+
+    _children: List[SimLayer]
+
+    @property
+    def artLayers(self) -> "SimLayerCollection":
+        return SimLayerCollection(self, "ArtLayers", SimArtLayer)
+
+    @property
+    def layerSets(self) -> "SimLayerCollection":
+        return SimLayerCollection(self, "LayerSets", SimLayerSet)
+
+    @property
+    def layers(self) -> "SimLayerCollection":
+        return SimLayerCollection(self, "Layers", SimLayer)
+
+    def _contains(self, layer: SimObject) -> bool:
+        for child in self._children:
+            if child is layer or (isinstance(child, SimLayerSet) and child._contains(layer)):
+                return True
+        return False
+
+    def _walk(self):
+        for child in self._children:
+            yield child
+            if isinstance(child, SimLayerSet):
+                yield from child._walk()
+
+
+class SimLayerSet(SimLayerContainer, SimLayer):
+    _typename = "LayerSet"
+    enabledChannels = Field(())
+
+    def __init__(self, parent: SimObject, name: str):
+        super().__init__(parent, name)
+        self._children = []
+
+    def __iter__(self):
+        return iter(self._children)
+
+    def _items(self) -> List[SimLayer]:
+        return list(self._children)
+
+    def _document_of(self) -> "SimDocument":
+        return self._document
+
+    @property
+    def bounds(self) -> tuple:
+        boxes = [layer.bounds for layer in self._children]
+        if not boxes:
+            return (0.0, 0.0, 0.0, 0.0)
+        return (
+            min(box[0] for box in boxes),
+            min(box[1] for box in boxes),
+            max(box[2] for box in boxes),
+            max(box[3] for box in boxes),
+        )
+
+    def translate(self, deltaX: float, deltaY: float):
+        for child in self._children:
+            child.translate(deltaX, deltaY)
+
+    def merge(self) -> SimArtLayer:
+        layer = SimArtLayer(self._parent, self.name, bounds=self.bounds)
+        self._parent._children[self._parent._children.index(self)] = layer
+        if self._document._active_layer is self or self._contains(self._document._active_layer):
+            self._document._active_layer = layer
+        return layer
+
+    def add(self) -> SimArtLayer:
+        return self.artLayers.add()
+
+    def _copy(self, parent: SimObject, name: str) -> "SimLayerSet":
+        layer_set = super()._copy(parent, name)
+        layer_set._children = [child._copy(layer_set, child.name) for child in self._children]
+        return layer_set
+
+
+class SimLayerCollection(SimCollection):
+    """The art layers, layer sets or all layers directly inside a document or layer set."""
+
+    def __init__(self, owner: SimObject, typename: str, kind: type):
+        super().__init__(owner)
+        self._typename = typename
+        self._kind = kind
+
+    def _items(self) -> List[SimLayer]:
+        return [layer for layer in self._parent._children if isinstance(layer, self._kind)]
+
+    def add(self) -> SimLayer:
+        document = self._parent._document_of()
+        if self._kind is SimLayer:
+            raise SimError("Layers cannot be added to this collection.")
+        is_set = self._kind is SimLayerSet
+        count = document._next_name_counter("Group" if is_set else "Layer")
+        layer = SimLayerSet(self._parent, f"Group {count}") if is_set else SimArtLayer(self._parent, f"Layer {count}")
+        children = self._parent._children
+        active = document._active_layer
+        children.insert(children.index(active) if active in children else 0, layer)
+        document._active_layer = layer
+        return layer
+
+    def removeAll(self):
+        for layer in self._items():
+            layer.delete()
+
+
+class SimChannel(SimObject):
+    _typename = "Channel"
+    name = Field("")
+    visible = Field(True)
+    opacity = Field(50.0)
+
+    def __init__(self, parent: SimObject, name: str, kind: int):
+        super().__init__(parent)
+        self.name = name
+        self._kind = kind
+        self._color = SimSolidColor(self, red=255.0)
+
+    @property
+    def kind(self) -> int:
+        return self._kind
+
+    @property
+    def color(self) -> SimSolidColor:
+        return self._color
+
+    @property
+    def histogram(self) -> tuple:
+        return (0,) * 256
+
+    def remove(self):
+        if self._kind == 1:
+            raise SimError("Component channels cannot be deleted.")
+        self._parent._channels.remove(self)
+
+    def duplicate(self, targetDocument: SimObject = None) -> "SimChannel":
+        channel = SimChannel(self._parent, f"{self.name} copy", 2)
+        self._parent._channels.append(channel)
+        return channel
+
+
+class SimChannels(SimCollection):
+    _typename = "Channels"
+
+    def _items(self) -> List[SimChannel]:
+        return list(self._parent._channels)
+
+    def add(self) -> SimChannel:
+        channels = self._parent._channels
+        channel = SimChannel(self._parent, f"Alpha {sum(c.kind != 1 for c in channels) + 1}", 2)
+        channels.append(channel)
+        return channel
+
+    def removeAll(self):
+        self._parent._channels[:] = [channel for channel in self._parent._channels if channel.kind == 1]
+
+
+class SimSelection(SimObject):
+    _typename = "Selection"
+    _noop_methods = (
+        "clear",
+        "contract",
+        "copy",
+        "cut",
+        "expand",
+        "feather",
+        "fill",
+        "grow",
+        "invert",
+        "load",
+        "makeWorkPath",
+        "resizeBoundary",
+        "rotate",
+        "rotateBoundary",
+        "selectBorder",
+        "similar",
+        "smooth",
+        "store",
+        "stroke",
+        "translateBoundary",
+    )
+
+    def __init__(self, parent: SimObject):
+        super().__init__(parent)
+        self._bounds = None
+
+    @property
+    def bounds(self) -> tuple:
+        if self._bounds is None:
+            raise SimError("There is no selection.")
+        return self._bounds
+
+    @property
+    def solid(self) -> bool:
+        return self._bounds is not None
+
+    def select(self, region, type=None, feather=None, antiAlias=None):  # pylint: disable=redefined-builtin
+        xs = [point[0] for point in region]
+        ys = [point[1] for point in region]
+        self._bounds = (float(min(xs)), float(min(ys)), float(max(xs)), float(max(ys)))
+
+    def selectAll(self):
+        self._bounds = self._parent._full_bounds()
+
+    def deselect(self):
+        self._bounds = None
+
+    def resize(self, horizontal=None, vertical=None, anchor=None):
+        return None
+
+    def translate(self, deltaX: float, deltaY: float):
+        left, top, right, bottom = self.bounds
+        self._bounds = (left + deltaX, top + deltaY, right + deltaX, bottom + deltaY)
+
+
+class SimDocument(SimLayerContainer, SimObject):
+    _typename = "Document"
+    _file_members = ("fullName", "path")
+    name = Field("")
+    resolution = Field(72.0)
+    mode = Field(2)
+    bitsPerChannel = Field(8)
+    pixelAspectRatio = Field(1.0)
+    colorProfileName = Field("sRGB IEC61966-2.1")
+    quickMaskMode = Field(False)
+    _noop_methods = (
+        "changeMode",
+        "convertProfile",
+        "crop",
+        "export",
+        "print",
+        "printOneCopy",
+        "rasterizeAllLayers",
+        "recordMeasurements",
+        "revealAll",
+        "splitChannels",
+        "trap",
+        "trim",
+    )
+
+    def __init__(self, application: "SimApplication", width: float, height: float, name: str, fill: int = 1):
+        super().__init__(application)
+        self._application = application
+        self._id = application._next_document_id()
+        self._width, self._height = float(width), float(height)
+        self.name = name
+        self._path = ""
+        self._saved = False
+        self._layer_ids = 0
+        self._name_counters = Counter()
+        self._children = []
+        self._active_layer = None
+        self._channels = [SimChannel(self, channel, 1) for channel in ("Red", "Green", "Blue")]
+        self._selection = SimSelection(self)
+        if fill == 3:
+            self._name_counters["Layer"] += 1
+            self._children.append(SimArtLayer(self, "Layer 1", bounds=(0.0, 0.0, 0.0, 0.0)))
+        else:
+            self._children.append(SimArtLayer(self, "Background", is_background=True, bounds=self._full_bounds()))
+        self._active_layer = self._children[0]
+
+    def _document_of(self) -> "SimDocument":
+        return self
+
+    def _next_layer_id(self) -> int:
+        self._layer_ids += 1
+        return self._layer_ids
+
+    def _next_name_counter(self, prefix: str) -> int:
+        self._name_counters[prefix] += 1
+        return self._name_counters[prefix]
+
+    def _full_bounds(self) -> tuple:
+        return (0.0, 0.0, self._width, self._height)
+
+    def _item_indexes(self) -> Dict[int, int]:
+        """Map layer IDs to Action Manager item indexes, from 1 at the bottom, counting layer set ends."""
+        order = []
+
+        def add(container):
+            for layer in reversed(container._children):
+                if isinstance(layer, SimLayerSet):
+                    order.append(None)  # The hidden layer set end marker.
+                    add(layer)
+                order.append(layer)
+
+        add(self)
+        return {layer._id: index for index, layer in enumerate(order, 1) if layer is not None}
+
+    def _remove_layer(self, layer: SimLayer):
+        siblings = layer._parent._children
+        index = siblings.index(layer)
+        siblings.remove(layer)
+        if self._active_layer is layer or (isinstance(layer, SimLayerSet) and layer._contains(self._active_layer)):
+            if siblings:
+                self._active_layer = siblings[min(index, len(siblings) - 1)]
+            else:
+                self._active_layer = layer._parent if isinstance(layer._parent, SimLayer) else None
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def width(self) -> float:
+        return self._width
+
+    @property
+    def height(self) -> float:
+        return self._height
+
+    @property
+    def fullName(self) -> str:
+        if not self._path:
+            raise SimError("The document has not yet been saved.")
+        return self._path
+
+    @property
+    def path(self) -> str:
+        if not self._path:
+            raise SimError("The document has not yet been saved.")
+        return os.path.dirname(self._path)
+
+    @property
+    def saved(self) -> bool:
+        return self._saved
+
+    @property
+    def activeLayer(self) -> SimLayer:
+        if self._active_layer is None:
+            raise SimError("No such element")
+        return self._active_layer
+
+    @activeLayer.setter
+    def activeLayer(self, layer: SimLayer):
+        if not isinstance(layer, SimLayer) or layer._document is not self:
+            raise SimError("The layer belongs to another document.")
+        self._active_layer = layer
+
+    @property
+    def backgroundLayer(self) -> SimArtLayer:
+        for layer in self._children:
+            if isinstance(layer, SimArtLayer) and layer.isBackgroundLayer:
+                return layer
+        raise SimError("No such element")
+
+    @property
+    def channels(self) -> SimChannels:
+        return SimChannels(self)
+
+    @property
+    def componentChannels(self) -> tuple:
+        return tuple(channel for channel in self._channels if channel.kind == 1)
+
+    @property
+    def activeChannels(self) -> tuple:
+        return self.componentChannels
+
+    @property
+    def selection(self) -> SimSelection:
+        return self._selection
+
+    @property
+    def histogram(self) -> tuple:
+        return (0,) * 256
+
+    def close(self, saving: int = None):
+        self._application._close_document(self)
+
+    def duplicate(self, name: str = None, mergeLayersOnly: bool = False) -> "SimDocument":
+        document = SimDocument(self._application, self._width, self._height, name or f"{self.name} copy")
+        document._children = [layer._copy(document, layer.name) for layer in self._children]
+        document._active_layer = document._children[0] if document._children else None
+        self._application._add_document(document)
+        return document
+
+    def flatten(self):
+        layer = SimArtLayer(self, "Background", is_background=True, bounds=self._full_bounds())
+        self._children[:] = [layer]
+        self._active_layer = layer
+
+    def mergeVisibleLayers(self):
+        visible = [layer for layer in self._children if layer.visible]
+        if not visible:
+            return
+        merged = SimArtLayer(self, visible[-1].name, bounds=self._full_bounds())
+        self._children[self._children.index(visible[0])] = merged
+        for layer in visible[1:]:
+            self._children.remove(layer)
+        self._active_layer = merged
+
+    def resizeImage(self, width: float = None, height: float = None, resolution: float = None, resampleMethod=None):
+        self._width = float(width or self._width)
+        self._height = float(height or self._height)
+        if resolution:
+            self.resolution = resolution
+
+    def resizeCanvas(self, width: float = None, height: float = None, anchor=None):
+        self.resizeImage(width, height)
+
+    def save(self):
+        if not self._path:
+            raise SimError("The document has not yet been saved.")
+        self._write(self._path)
+
+    def saveAs(self, filePath: str, options: SimObject = None, asCopy: bool = True, extensionType: int = None):
+        self._write(filePath, options)
+        if not asCopy:
+            self._path = filePath
+
+    def _write(self, file_path: str, options: SimObject = None):
+        """Write a small JSON description of the document in place of the image data."""
+        data = {
+            "document": self.name,
+            "width": self._width,
+            "height": self._height,
+            "options": options.typename if options is not None else None,
+            "layers": [layer.name for layer in self._walk()],
+        }
+        try:
+            with open(file_path, "w", encoding="utf-8") as image_file:
+                json.dump(data, image_file)
+        except OSError as err:
+            raise SimError(f"Could not save the document: {err}") from err
+        self._saved = True
+
+
+class SimDocuments(SimCollection):
+    _typename = "Documents"
+
+    def _items(self) -> List[SimDocument]:
+        return list(self._parent._documents)
+
+    def add(
+        self,
+        width: float = 960,
+        height: float = 540,
+        resolution: float = 72.0,
+        name: str = None,
+        mode: int = None,
+        initialFill: int = None,
+        pixelAspectRatio: float = None,
+        bitsPerChannel: int = None,
+        colorProfileName: str = None,
+    ) -> SimDocument:
+        application = self._parent
+        name = name or f"Untitled-{application._next_name_counter()}"
+        document = SimDocument(application, width, height, name, initialFill or 1)
+        document.resolution = resolution or 72.0
+        if mode:
+            document.mode = mode
+        if bitsPerChannel:
+            document.bitsPerChannel = bitsPerChannel
+        application._add_document(document)
+        return document
+
+
+class SimActionDescriptor(SimObject):
+    """Stores typed values by key, like `ActionDescriptor`."""
+
+    _typename = "ActionDescriptor"
+
+    def __init__(self, parent: SimObject = None):
+        super().__init__(parent)
+        self._values = {}
+
+    def __deepcopy__(self, memo):
+        result = SimActionDescriptor()
+        result._values = copy.deepcopy(self._values, memo)
+        return result
+
+    def _put(self, key: int, value_type: int, *value):
+        self._values[key] = (value_type, value)
+
+    def _get(self, key: int, value_type: int) -> tuple:
+        entry = self._values.get(key)
+        if entry is None or entry[0] != value_type:
+            raise SimError(f"The key {key} is not present.")
+        return entry[1]
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+
+    def erase(self, key: int):
+        self._values.pop(key, None)
+
+    def getKey(self, index: int) -> int:
+        return list(self._values)[index]
+
+    def getType(self, key: int) -> int:
+        if key not in self._values:
+            raise SimError(f"The key {key} is not present.")
+        return self._values[key][0]
+
+    def hasKey(self, key: int) -> bool:
+        return key in self._values
+
+    def isEqual(self, otherDesc: "SimActionDescriptor") -> bool:
+        return self._values == otherDesc._values
+
+    def putBoolean(self, key: int, value: bool):
+        self._put(key, 5, bool(value))
+
+    def getBoolean(self, key: int) -> bool:
+        return self._get(key, 5)[0]
+
+    def putClass(self, key: int, value: int):
+        self._put(key, 10, value)
+
+    def getClass(self, key: int) -> int:
+        return self._get(key, 10)[0]
+
+    def putData(self, key: int, value: str):
+        self._put(key, 12, value)
+
+    def getData(self, key: int) -> str:
+        return self._get(key, 12)[0]
+
+    def putDouble(self, key: int, value: float):
+        self._put(key, 2, float(value))
+
+    def getDouble(self, key: int) -> float:
+        return self._get(key, 2)[0]
+
+    def putEnumerated(self, key: int, enumType: int, value: int):
+        self._put(key, 8, enumType, value)
+
+    def getEnumerationType(self, key: int) -> int:
+        return self._get(key, 8)[0]
+
+    def getEnumerationValue(self, key: int) -> int:
+        return self._get(key, 8)[1]
+
+    def putInteger(self, key: int, value: int):
+        self._put(key, 1, int(value))
+
+    def getInteger(self, key: int) -> int:
+        return self._get(key, 1)[0]
+
+    def putLargeInteger(self, key: int, value: int):
+        self._put(key, 13, int(value))
+
+    def getLargeInteger(self, key: int) -> int:
+        return self._get(key, 13)[0]
+
+    def putList(self, key: int, value: "SimActionList"):
+        self._put(key, 6, copy.deepcopy(value))
+
+    def getList(self, key: int) -> "SimActionList":
+        return self._get(key, 6)[0]
+
+    def putObject(self, key: int, classID: int, value: "SimActionDescriptor"):
+        self._put(key, 7, classID, copy.deepcopy(value))
+
+    def getObjectType(self, key: int) -> int:
+        return self._get(key, 7)[0]
+
+    def getObjectValue(self, key: int) -> "SimActionDescriptor":
+        return self._get(key, 7)[1]
+
+    def putPath(self, key: int, value: str):
+        self._put(key, 11, value)
+
+    def getPath(self, key: int) -> str:
+        return self._get(key, 11)[0]
+
+    def putReference(self, key: int, value: "SimActionReference"):
+        self._put(key, 9, copy.deepcopy(value))
+
+    def getReference(self, key: int) -> "SimActionReference":
+        return self._get(key, 9)[0]
+
+    def putString(self, key: int, value: str):
+        self._put(key, 4, str(value))
+
+    def getString(self, key: int) -> str:
+        return self._get(key, 4)[0]
+
+    def putUnitDouble(self, key: int, unitID: int, value: float):
+        self._put(key, 3, unitID, float(value))
+
+    def getUnitDoubleType(self, key: int) -> int:
+        return self._get(key, 3)[0]
+
+    def getUnitDoubleValue(self, key: int) -> float:
+        return self._get(key, 3)[1]
+
+
+class SimActionList(SimObject):
+    """Stores typed values by index, like `ActionList`."""
+
+    _typename = "ActionList"
+
+    def __init__(self, parent: SimObject = None):
+        super().__init__(parent)
+        self._values = []
+
+    def __deepcopy__(self, memo):
+        result = SimActionList()
+        result._values = copy.deepcopy(self._values, memo)
+        return result
+
+    def _get(self, index: int, value_type: int) -> tuple:
+        if not 0 <= index < len(self._values) or self._values[index][0] != value_type:
+            raise SimError(f"The index {index} is not present.")
+        return self._values[index][1]
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+
+    def getType(self, index: int) -> int:
+        return self._values[index][0]
+
+    def putBoolean(self, value: bool):
+        self._values.append((5, (bool(value),)))
+
+    def getBoolean(self, index: int) -> bool:
+        return self._get(index, 5)[0]
+
+    def putClass(self, value: int):
+        self._values.append((10, (value,)))
+
+    def getClass(self, index: int) -> int:
+        return self._get(index, 10)[0]
+
+    def putDouble(self, value: float):
+        self._values.append((2, (float(value),)))
+
+    def getDouble(self, index: int) -> float:
+        return self._get(index, 2)[0]
+
+    def putEnumerated(self, enumType: int, value: int):
+        self._values.append((8, (enumType, value)))
+
+    def getEnumerationType(self, index: int) -> int:
+        return self._get(index, 8)[0]
+
+    def getEnumerationValue(self, index: int) -> int:
+        return self._get(index, 8)[1]
+
+    def putInteger(self, value: int):
+        self._values.append((1, (int(value),)))
+
+    def getInteger(self, index: int) -> int:
+        return self._get(index, 1)[0]
+
+    def putLargeInteger(self, value: int):
+        self._values.append((13, (int(value),)))
+
+    def getLargeInteger(self, index: int) -> int:
+        return self._get(index, 13)[0]
+
+    def putList(self, value: "SimActionList"):
+        self._values.append((6, (copy.deepcopy(value),)))
+
+    def getList(self, index: int) -> "SimActionList":
+        return self._get(index, 6)[0]
+
+    def putObject(self, classID: int, value: SimActionDescriptor):
+        self._values.append((7, (classID, copy.deepcopy(value))))
+
+    def getObjectType(self, index: int) -> int:
+        return self._get(index, 7)[0]
+
+    def getObjectValue(self, index: int) -> SimActionDescriptor:
+        return self._get(index, 7)[1]
+
+    def putReference(self, value: "SimActionReference"):
+        self._values.append((9, (copy.deepcopy(value),)))
+
+    def getReference(self, index: int) -> "SimActionReference":
+        return self._get(index, 9)[0]
+
+    def putString(self, value: str):
+        self._values.append((4, (str(value),)))
+
+    def getString(self, index: int) -> str:
+        return self._get(index, 4)[0]
+
+    def putUnitDouble(self, unitID: int, value: float):
+        self._values.append((3, (unitID, float(value))))
+
+    def getUnitDoubleType(self, index: int) -> int:
+        return self._get(index, 3)[0]
+
+    def getUnitDoubleValue(self, index: int) -> float:
+        return self._get(index, 3)[1]
+
+
+class SimActionReference(SimObject):
+    """A chain of references to objects, like `ActionReference`.
+
+    Each part is a `(desired class, form, value)` tuple, the form being a
+    `ReferenceFormType` value.
+    """
+
+    _typename = "ActionReference"
+
+    def __init__(self, parent: SimObject = None, parts: list = None):
+        super().__init__(parent)
+        self._parts = list(parts or ())
+
+    def __deepcopy__(self, memo):
+        return SimActionReference(parts=self._parts)
+
+    def _first(self) -> tuple:
+        if not self._parts:
+            raise SimError("The reference is empty.")
+        return self._parts[0]
+
+    def putClass(self, desiredClass: int):
+        self._parts.append((desiredClass, 7, None))
+
+    def putEnumerated(self, desiredClass: int, enumType: int, value: int):
+        self._parts.append((desiredClass, 5, (enumType, value)))
+
+    def putIdentifier(self, desiredClass: int, value: int):
+        self._parts.append((desiredClass, 3, int(value)))
+
+    def putIndex(self, desiredClass: int, value: int):
+        self._parts.append((desiredClass, 2, int(value)))
+
+    def putName(self, desiredClass: int, value: str):
+        self._parts.append((desiredClass, 1, str(value)))
+
+    def putOffset(self, desiredClass: int, value: int):
+        self._parts.append((desiredClass, 4, int(value)))
+
+    def putProperty(self, desiredClass: int, value: int):
+        self._parts.append((desiredClass, 6, value))
+
+    def getContainer(self) -> "SimActionReference":
+        return SimActionReference(parts=self._parts[1:])
+
+    def getDesiredClass(self) -> int:
+        return self._first()[0]
+
+    def getForm(self) -> int:
+        return self._first()[1]
+
+    def getEnumeratedType(self) -> int:
+        return self._first()[2][0]
+
+    def getEnumeratedValue(self) -> int:
+        return self._first()[2][1]
+
+    def getIdentifier(self) -> int:
+        return self._first()[2]
+
+    def getIndex(self) -> int:
+        return self._first()[2]
+
+    def getName(self) -> str:
+        return self._first()[2]
+
+    def getOffset(self) -> int:
+        return self._first()[2]
+
+    def getProperty(self) -> int:
+        return self._first()[2]
+
+
+class SimApplication(SimObject):
+    _typename = "Application"
+    displayDialogs = Field(3)
+    currentTool = Field("moveTool")
+    notifiersEnabled = Field(False)
+    _noop_methods = ("beep", "bringToFront", "doAction", "eraseCustomOptions", "putCustomOptions", "refresh")
+
+    def __init__(self, backend: "SimulatedBackend"):
+        super().__init__(None)
+        self._backend = backend
+        self._documents = []
+        self._active_document = None
+        self._document_ids = 0
+        self._untitled = 0
+        self._foreground = SimSolidColor(self)
+        self._background = SimSolidColor(self, 255.0, 255.0, 255.0)
+        self._type_ids = {}
+        self._string_ids = {}
+
+    def _next_document_id(self) -> int:
+        self._document_ids += 1
+        return self._document_ids
+
+    def _next_name_counter(self) -> int:
+        self._untitled += 1
+        return self._untitled
+
+    def _add_document(self, document: SimDocument):
+        self._documents.append(document)
+        self._active_document = document
+
+    def _close_document(self, document: SimDocument):
+        self._documents.remove(document)
+        if self._active_document is document:
+            self._active_document = self._documents[-1] if self._documents else None
+
+    @property
+    def parent(self) -> "SimApplication":
+        return self
+
+    @property
+    def name(self) -> str:
+        return "Adobe Photoshop"
+
+    @property
+    def version(self) -> str:
+        return self._backend.application_version
+
+    @property
+    def path(self) -> str:
+        return self._backend.install_path or ""
+
+    @property
+    def documents(self) -> SimDocuments:
+        return SimDocuments(self)
+
+    @property
+    def activeDocument(self) -> SimDocument:
+        if self._active_document is None:
+            raise SimError("No such element")
+        return self._active_document
+
+    @activeDocument.setter
+    def activeDocument(self, document: SimDocument):
+        if document not in self._documents:
+            raise SimError("The document is not open.")
+        self._active_document = document
+
+    @property
+    def foregroundColor(self) -> SimSolidColor:
+        return self._foreground
+
+    @foregroundColor.setter
+    def foregroundColor(self, color: SimSolidColor):
+        self._foreground._copy_from(color)
+
+    @property
+    def backgroundColor(self) -> SimSolidColor:
+        return self._background
+
+    @backgroundColor.setter
+    def backgroundColor(self, color: SimSolidColor):
+        self._background._copy_from(color)
+
+    @property
+    def freeMemory(self) -> int:
+        return 2**32
+
+    def open(self, document: str, as_format: int = None, as_smart_object: bool = False) -> SimDocument:
+        if not os.path.exists(document):
+            raise SimError(f"File {document} does not exist.")
+        opened = SimDocument(self, 960, 540, os.path.basename(document))
+        opened._path, opened._saved = document, True
+        self._add_document(opened)
+        return opened
+
+    def load(self, document: str):
+        self.open(document)
+
+    def batch(self, inputFiles: tuple, action: str, actionSet: str, options: SimObject = None) -> str:
+        """Play an action on files, writing a small JSON file per input to the destination folder.
+
+        Files that do not exist are logged to the error file of the options when it is set,
+        like Photoshop does, and stop the batch otherwise.
+        """
+        error_file = options.errorFile if options is not None else None
+        folder = options.destinationFolder if options is not None and options.destination == 3 else None
+        errors = []
+        for path in inputFiles:
+            if not os.path.exists(path):
+                if not error_file:
+                    raise SimError(f"File {path} does not exist.")
+                errors.append(f"Could not open {path} because the file could not be found.")
+                continue
+            if folder:
+                with open(os.path.join(folder, os.path.basename(path)), "w", encoding="utf-8") as output:
+                    json.dump({"source": path, "action": action, "actionSet": actionSet}, output)
+        if errors:
+            with open(error_file, "a", encoding="utf-8") as log:
+                log.write("".join(f"{error}\n" for error in errors))
+        return ""
+
+    def charIDToTypeID(self, charID: str) -> int:
+        return int.from_bytes(charID.encode("latin-1").ljust(4)[:4], "big")
+
+    def typeIDToCharID(self, typeID: int) -> str:
+        return typeID.to_bytes(4, "big").decode("latin-1")
+
+    def stringIDToTypeID(self, stringID: str) -> int:
+        type_id = self._type_ids.get(stringID)
+        if type_id is None:
+            type_id = self._type_ids[stringID] = 0x7000_0000 + len(self._type_ids)
+            self._string_ids[type_id] = stringID
+        return type_id
+
+    def typeIDToStringID(self, typeID: int) -> str:
+        return self._string_ids.get(typeID, "")
+
+    def featureEnabled(self, name: str) -> bool:
+        return True
+
+    def purge(self, target: int):
+        return None
+
+    def doJavaScript(self, javascript: str, arguments=None, executionMode=None) -> str:
+        return self._backend._run_script(self, javascript, arguments)
+
+    def executeAction(self, eventID: int, descriptor: SimActionDescriptor = None, displayDialogs=None):
+        return self._backend._run_action(self, eventID, descriptor)
+
+    def executeActionGet(self, reference: SimActionReference) -> SimActionDescriptor:
+        return self._backend._run_action(self, "get", reference)
+
+
+"""
+* Backend
+"""
+
+
+def _normalize_script(script: str) -> str:
+    return " ".join(script.split())
+
+
+def _layer_kind(layer: SimLayer) -> int:
+    """The Action Manager `layerKind` of a layer."""
+    if isinstance(layer, SimLayerSet):
+        return 7
+    # Pixel, text and smart object layers, anything else is an adjustment layer.
+    return {1: 1, 2: 3, 17: 5}.get(layer.kind, 2)
+
+
+def _active_layer_kind(application: SimApplication, arguments: Any) -> str:
+    """The Action Manager `layerKind` of the active layer, as read by `ArtLayer.kind`."""
+    return str(_layer_kind(application.activeDocument.activeLayer))
+
+
+# Scripts the API classes run themselves, by their normalized text.
+_BUILTIN_SCRIPTS = {
+    _normalize_script(script): handler
+    for script, handler in (
+        ("app.activeDocument.activeLayer.typename", lambda app, args: app.activeDocument.activeLayer.typename),
+        (
+            """
+            var ref = new ActionReference();
+            ref.putEnumerated(charIDToTypeID("Lyr "), charIDToTypeID("Ordn"), charIDToTypeID("Trgt"));
+            var desc = executeActionGet(ref);
+            var layerType = desc.getInteger(stringIDToTypeID("layerKind"));
+            layerType;
+            """,
+            _active_layer_kind,
+        ),
+    )
+}
+
+
+def _program_value(value: Any) -> Any:
+    """Convert a model value to what a program returns as JSON.
+
+    DOM objects become their typename and ID, File and Folder objects their path.
+    """
+    if isinstance(value, SimObject):
+        return {"typename": value.typename, "id": getattr(value, "id", None)}
+    if isinstance(value, SimFile):
+        return value.fsName
+    if isinstance(value, (list, tuple)):
+        return [_program_value(item) for item in value]
+    return value
+
+
+def _locate(application: SimApplication, locator: Optional[Dict[str, Any]]) -> SimObject:
+    """Find the object of a locator built by `photoshop.api._jsx.locate`."""
+    if locator is None:
+        return application
+    document = next((doc for doc in application._documents if doc.id == locator["doc"]), None)
+    if document is None:
+        raise SimError(f"No document with ID {locator['doc']}")
+    if "layer" not in locator:
+        return document
+    layer = next((layer for layer in document._walk() if layer.id == locator["layer"]), None)
+    if layer is None:
+        raise SimError(f"No layer with ID {locator['layer']}")
+    return layer.textItem if locator.get("text") else layer
+
+
+def _read(target: Any, name: str) -> Any:
+    """Read a property the way a program does, methods as None and paths as `SimFile` objects."""
+    member = target._resolve(name) if isinstance(target, SimObject) else None
+    if member is None:
+        raise SimError(f"undefined is not an object: {name}")
+    attr, is_method = member
+    if is_method:
+        return None
+    value = getattr(target, attr)
+    return SimFile(value) if attr in target._file_members else value
+
+
+def _run_snapshot(application: SimApplication, payload: Dict[str, Any]) -> List[Any]:
+    """Read the fields of a `photoshop.api._snapshot.snapshot` or `snapshot_collection` program."""
+    target = _locate(application, payload["target"])
+    if "collection" in payload:
+        elements = _read(target, payload["collection"])._items()
+        return [_read_fields(element, payload["fields"]) for element in elements]
+    return _read_fields(target, payload["fields"])
+
+
+def _read_fields(target: SimObject, fields: List[str]) -> List[Any]:
+    values = []
+    for field in fields:
+        parts = field.split(".")
+        try:
+            owner = target
+            for part in parts[:-1]:
+                owner = _read(owner, part)
+            values.append([owner.typename, _program_value(_read(owner, parts[-1]))])
+        except (SimError, AttributeError):
+            values.append(None)
+    return values
+
+
+def _run_names(application: SimApplication, payload: Dict[str, Any]) -> List[str]:
+    """Read the element names of a `photoshop.api._collection.Collection` name index program."""
+    collection = _read(_locate(application, payload["target"]), payload["collection"])
+    return [element.name for element in collection._items()]
+
+
+def _run_layer_tree(application: SimApplication, payload: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Read the layers of a `photoshop.api._layer_tree` program, from the top of the Layers panel."""
+    document = _locate(application, {"doc": payload["doc"]})
+    indexes = document._item_indexes()
+    tree = {key: [] for key in ("id", "itemIndex", "parent", "kind", "visible", "bounds", "opacity", "name")}
+
+    def add(container: SimObject, parent_id: int):
+        for layer in container._children:
+            tree["id"].append(layer.id)
+            tree["itemIndex"].append(indexes[layer.id])
+            tree["parent"].append(parent_id)
+            tree["kind"].append(_layer_kind(layer))
+            tree["visible"].append(layer.visible)
+            tree["bounds"].extend(layer.bounds)
+            tree["opacity"].append(round(layer.opacity))
+            tree["name"].append(layer.name)
+            if isinstance(layer, SimLayerSet):
+                add(layer, layer.id)
+
+    add(document, 0)
+    return tree
+
+
+def _read_action_key(layer: SimLayer, key: str) -> Any:
+    """The value of an Action Manager property of a layer, None if it has no such property."""
+    if key == "layerID":
+        return layer.id
+    if key == "itemIndex":
+        return layer.itemIndex
+    if key == "layerKind":
+        return _layer_kind(layer)
+    if key == "opacity":
+        return round(layer.opacity * 255 / 100)
+    if key == "bounds":
+        return dict(zip(("left", "top", "right", "bottom"), layer.bounds))
+    if key == "layerLocking":
+        return {"protectAll": layer.allLocked}
+    if key in ("name", "visible"):
+        return getattr(layer, key)
+    return None
+
+
+def _read_action_value(value: Any) -> Any:
+    """Convert an Action Manager value to what a program reads, rectangles as lists and other objects as None."""
+    if not isinstance(value, dict):
+        return value
+    if all(side in value for side in ("left", "top", "right", "bottom")):
+        return [value["left"], value["top"], value["right"], value["bottom"]]
+    return None
+
+
+def _run_layer_ref(application: SimApplication, payload: Dict[str, Any]) -> Any:
+    """Run the operation of a `photoshop.api._layer_ref` program on layers found by ID."""
+    document = _locate(application, {"doc": payload["doc"]})
+    layers = [_locate(application, {"doc": payload["doc"], "layer": layer_id}) for layer_id in payload["layers"]]
+    op = payload["op"]
+    if op == "read":
+        return [_read_action_value(_read_action_key(layers[0], key)) for key in payload["keys"]]
+    if op == "set":
+        for layer in layers:
+            if payload.get("name") is not None:
+                layer.name = payload["name"]
+            if payload.get("opacity") is not None:
+                layer.opacity = float(payload["opacity"])
+    elif op == "show":
+        for layer in layers:
+            layer.visible = payload["event"] == "show"
+    elif op == "select":
+        application._active_document = document
+        document._active_layer = layers[-1]
+    elif op == "apply":
+        # Import local modules
+        from photoshop.api import _layer_ref  # pylint: disable=import-outside-toplevel
+
+        modes = {string_id: int(mode) for mode, string_id in _layer_ref.BLEND_MODES.items()}
+        columns = {"names": "name", "visibility": "visible", "opacities": "opacity", "locks": "allLocked"}
+        for position, layer in enumerate(layers):
+            for key, name in columns.items():
+                if payload.get(key) and payload[key][position] is not None:
+                    setattr(layer, name, payload[key][position])
+            if payload.get("modes") and payload["modes"][position] is not None:
+                layer.blendMode = modes[payload["modes"][position]]
+    elif op == "delete":
+        for layer in layers:
+            # Layers inside a layer set deleted earlier in the list are already gone.
+            if document._contains(layer):
+                layer.delete()
+    else:
+        raise SimError(f"Unknown layer operation: {op}")
+    return None
+
+
+def _run_export_layers(application: SimApplication, payload: Dict[str, Any]) -> List[Optional[str]]:
+    """Save each layer to a file from a new document, like a `photoshop.api._export_layers` program."""
+    source = _locate(application, {"doc": payload["doc"]})
+    errors = []
+    for layer_id, path in zip(payload["layers"], payload["paths"]):
+        try:
+            layer = _locate(application, {"doc": payload["doc"], "layer": layer_id})
+            copy = SimDocument(application, source._width, source._height, layer.name)
+            copy._children = [layer._copy(copy, layer.name)]
+            for child in copy._children:
+                child.visible = True
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            copy._write(path)
+        except (SimError, OSError) as err:
+            errors.append(str(err))
+        else:
+            errors.append(None)
+    application._active_document = source
+    return errors
+
+
+def _run_batch(application: SimApplication, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the operations of a `photoshop.api._batch.Batch` program."""
+    results = []
+
+    def value_of(value: Any) -> Any:
+        if isinstance(value, list):
+            return tuple(value_of(item) for item in value)
+        if not isinstance(value, dict):
+            return value
+        if "$ref" in value:
+            return results[value["$ref"]]
+        if "$color" in value:
+            color = SimSolidColor()
+            color.rgb.hexValue = value["$color"]
+            return color
+        return _locate(application, value["$target"])
+
+    for index, op in enumerate(payload["ops"]):
+        try:
+            target = value_of(op["target"])
+            member = target._resolve(op["name"]) if isinstance(target, SimObject) else None
+            if member is None:
+                raise SimError(f"undefined is not an object: {op['name']}")
+            attr, is_method = member
+            result = None
+            if op["op"] == "set":
+                setattr(target, attr, value_of(op["value"]))
+            elif op["op"] == "call":
+                if not is_method:
+                    raise SimError(f"{op['name']} is not a function")
+                result = getattr(target, attr)(*value_of(op["args"]))
+            else:
+                result = _read(target, op["name"])
+        except (SimError, TypeError) as err:
+            # Both are exceptions thrown by the ExtendScript program.
+            error = {"index": index, "message": str(err)}
+            return {"results": _program_value(results), "error": error}
+        results.append(result)
+    return {"results": _program_value(results), "error": None}
+
+
+# Programs built by `photoshop.api._jsx.program`, by name.
+_BUILTIN_PROGRAMS = {
+    "batch": _run_batch,
+    "export_layers": _run_export_layers,
+    "layer_ref": _run_layer_ref,
+    "layer_tree": _run_layer_tree,
+    "names": _run_names,
+    "snapshot": _run_snapshot,
+}
+
+
+class SimulatedBackend(Backend):
+    """A simulated Photoshop for tests and benchmarks, without Windows or Photoshop.
+
+    Args:
+        latency: Seconds every round trip takes, e.g. 0.0005 for a typical COM call.
+        member_latency: Extra seconds per member name, e.g. ``{"saveAs": 0.2}``.
+        versions: The version ID's reported as installed, latest first.
+        install_path: The folder reported as the installation folder of every version.
+
+    Attributes:
+        stats: Number of round trips by kind: ``GetIDsOfNames``, ``invoke`` and ``IEnumVARIANT``,
+            and of the calls rejected, see `reject`.
+        member_calls: Number of `Invoke` calls per lower case member name.
+
+    """
+
+    name = "simulated"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        member_latency: Dict[str, float] = None,
+        versions: List[str] = ("190",),
+        install_path: str = None,
+    ):
+        super().__init__()
+        self.latency = latency
+        self.member_latency = {name.lower(): value for name, value in (member_latency or {}).items()}
+        self.versions = list(versions)
+        self.install_path = install_path
+        self.application_version = "25.0.0"
+        self.stats = Counter()
+        self.member_calls = Counter()
+        self._scripts: Dict[str, Callable] = {}
+        self._actions: Dict[Any, Callable] = {}
+        self._programs: Dict[str, Callable] = {}
+        self._rejections: List[int] = []
+        self._lock = threading.RLock()
+        self.model = SimApplication(self)
+
+    def create_object(self, prog_id: str) -> SimDispatch:
+        parts = prog_id.split(".")
+        if parts[0] != "Photoshop" or len(parts) not in (2, 3) or (len(parts) == 3 and parts[2] not in self.versions):
+            raise OSError(REGDB_E_CLASSNOTREG, f"Class not registered: '{prog_id}'.")
+        name = parts[1]
+        factories = {
+            "Application": lambda: self.model,
+            "SolidColor": SimSolidColor,
+            "RGBColor": SimRGBColor,
+            "ActionDescriptor": SimActionDescriptor,
+            "ActionList": SimActionList,
+            "ActionReference": SimActionReference,
+        }
+        if name in factories:
+            model = factories[name]()
+        elif name.endswith(("Color", "Options")) or name == "ExportOptionsSaveForWeb":
+            model = SimBag(name)
+        else:
+            raise OSError(REGDB_E_CLASSNOTREG, f"Class not registered: '{prog_id}'.")
+        return self._to_variant(model)
+
+    def get_versions(self) -> List[str]:
+        return [*self.versions, ""]
+
+    def get_application_path(self, version: str) -> str:
+        if self.install_path and (not version or version in self.versions):
+            return self.install_path
+        return super().get_application_path(version)
+
+    def reset(self):
+        super().reset()
+        self.model = SimApplication(self)
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset the round trip counters."""
+        self.stats.clear()
+        self.member_calls.clear()
+
+    @property
+    def round_trips(self) -> int:
+        """int: The number of round trips since the counters were reset."""
+        return sum(self.stats.values())
+
+    def register_script(self, script: str, handler: Callable[[SimApplication, Any], Any]):
+        """Evaluate a script passed to `doJavaScript` with a Python function.
+
+        Args:
+            script: The script text, compared ignoring differences in whitespace.
+            handler: Called with the application model and the script arguments, returns the script result.
+
+        """
+        self._scripts[_normalize_script(script)] = handler
+
+    def register_program(self, name: str, handler: Callable[[SimApplication, Any], Any]):
+        """Evaluate the programs built by `photoshop.api._jsx.program` with a Python function.
+
+        Args:
+            name: The program name.
+            handler: Called with the application model and the program payload,
+                returns the program result, which is passed to Photoshop as JSON.
+
+        """
+        self._programs[name] = handler
+
+    def register_action(self, event_id: Any, handler: Callable[[SimApplication, Any], Any]):
+        """Execute an action passed to `executeAction` with a Python function.
+
+        Args:
+            event_id: The event type ID, or ``get`` for `executeActionGet`.
+            handler: Called with the application model and the descriptor, or
+                the reference for ``get``, returns the result descriptor.
+
+        """
+        self._actions[event_id] = handler
+
+    def reject(self, count: int = 1, hresult: int = RPC_E_CALL_REJECTED):
+        """Reject the next calls like a busy Photoshop, without running them.
+
+        Args:
+            count: Number of calls rejected.
+            hresult: The error code, ``RPC_E_CALL_REJECTED`` or ``RPC_E_SERVERCALL_RETRYLATER``.
+
+        """
+        with self._lock:
+            self._rejections.extend([hresult] * count)
+
+    def _check_rejection(self):
+        with self._lock:
+            if self._rejections:
+                self.stats["rejected"] += 1
+                hresult = self._rejections.pop(0)
+                raise _com_error(hresult, "Call was rejected by callee.")
+
+    def _round_trip(self, kind: str, member: str = ""):
+        # Photoshop handles one call at a time.
+        with self._lock:
+            self.stats[kind] += 1
+            delay = self.latency
+            if member:
+                self.member_calls[member] += 1
+                delay += self.member_latency.get(member, 0.0)
+            if delay:
+                time.sleep(delay)
+
+    def _invoke(self, model: SimObject, dispid: int, args: tuple, invkind: int):
+        with self._lock:
+            self._check_rejection()
+            if dispid == DISPID_NEWENUM:
+                self._round_trip("invoke", "_newenum")
+                try:
+                    return SimEnumVariant(self, model._items())
+                except SimError as err:
+                    raise _com_error(DISP_E_MEMBERNOTFOUND, "Member not found.") from err
+            name = _names.get(dispid, "")
+            self._round_trip("invoke", name)
+            member = model._resolve(name)
+            if member is None:
+                raise _com_error(DISP_E_MEMBERNOTFOUND, "Member not found.")
+            attr, is_method = member
+            args = tuple(self._to_model(arg) for arg in args)
+            try:
+                if invkind & (DISPATCH_PROPERTYPUT | DISPATCH_PROPERTYPUTREF):
+                    if is_method or len(args) != 1:
+                        raise _com_error(DISP_E_MEMBERNOTFOUND, "Member not found.")
+                    setattr(model, attr, args[0])
+                    return None
+                if not is_method:
+                    if args:
+                        raise _com_error(DISP_E_BADPARAMCOUNT, "Invalid number of parameters.")
+                    return self._to_variant(getattr(model, attr))
+                # Like Photoshop, the property getter of a method calls the method.
+                method = getattr(model, attr)
+                try:
+                    inspect.signature(method).bind(*args)
+                except TypeError as err:
+                    raise _com_error(DISP_E_BADPARAMCOUNT, "Invalid number of parameters.") from err
+                return self._to_variant(method(*args))
+            except SimError as err:
+                raise _com_error(DISP_E_EXCEPTION, "Exception occurred.", str(err)) from err
+
+    def _run_script(self, application: SimApplication, javascript: str, arguments: Any) -> Any:
+        program = _jsx.parse_program(javascript)
+        if program is not None:
+            name, payload = program
+            handler = self._programs.get(name) or _BUILTIN_PROGRAMS.get(name)
+            if handler is None:
+                raise SimError(f"The simulated backend cannot evaluate the {name} program.")
+            return json.dumps(handler(application, payload))
+        script = _normalize_script(javascript)
+        handler = self._scripts.get(script) or _BUILTIN_SCRIPTS.get(script)
+        if handler is not None:
+            return handler(application, arguments)
+        if script.startswith(("alert(", "app.beep(", "app.bringToFront(", "app.refresh")):
+            return "undefined"
+        raise SimError(f"The simulated backend cannot evaluate this script: {script[:80]}")
+
+    def _run_action(self, application: SimApplication, event_id: Any, argument: Any) -> SimActionDescriptor:
+        handler = self._actions.get(event_id)
+        if handler is None:
+            if event_id == "get":
+                raise SimError("The requested property is not available in the simulated backend.")
+            return SimActionDescriptor()
+        return handler(application, argument) or SimActionDescriptor()
+
+    def _to_variant(self, value: Any) -> Any:
+        """Convert a value returned by a model to what a COM call returns."""
+        if isinstance(value, SimObject):
+            return SimDispatch(SimComObject(self, value))
+        if isinstance(value, (list, tuple)):
+            return tuple(self._to_variant(item) for item in value)
+        return value
+
+    def _to_model(self, value: Any) -> Any:
+        """Convert an argument to what the model receives, accepting what fits in a VARIANT."""
+        if value is None or isinstance(value, (bool, str, float)):
+            return value
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, (list, tuple)):
+            return tuple(self._to_model(item) for item in value)
+        comobj = getattr(value, "_comobj", None)
+        if isinstance(comobj, SimComObject):
+            return comobj.model
+        raise TypeError(f"Cannot put {value!r} in VARIANT")
+
+
+register_dispatch_type(SimDispatch)
@@ -1,5 +1,10 @@
-# Import third-party modules
-from comtypes import COMError
+try:
+    # Import third-party modules
+    from comtypes import COMError
+except ImportError:
+
+    class COMError(Exception):
+        """Stand-in for `comtypes.COMError` on platforms without COM support."""
 
 
 class PhotoshopPythonAPIError(Exception):
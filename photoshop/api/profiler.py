@@ -0,0 +1,316 @@
+"""Opt-in profiler for the calls made to Photoshop.
+
+Once enabled, every dispatch object wrapped by an API class records its
+round trips: call counts, cumulative time and a latency histogram per wrapper
+class and member, plus the Python stack of every call slower than a threshold.
+Dispatch objects returned by those calls are profiled too, labelled with the
+member that returned them until an API class wraps them.
+
+When disabled, wrapping a dispatch object costs a single global lookup.
+
+Examples:
+    ```python
+
+        from photoshop import Session
+
+        with Session(action="new_document", profile=True) as ps:
+            ...
+        # The report is logged to the "photoshop" logger at INFO level when the session exits.
+
+        from photoshop.api import profiler
+
+        with profiler.profile(slow_threshold=0.05) as prof:
+            ...
+        print(prof.report(limit=20))
+    ```
+
+"""
+
+# Import built-in modules
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+import threading
+import time
+import traceback
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+# Import local modules
+from photoshop.api import backends
+
+
+ENV_NAME = "PS_PROFILE"
+
+# Upper bounds of the latency histogram buckets, in seconds.
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf"))
+
+
+class MemberStats:
+    """Calls of one member of one wrapper class."""
+
+    __slots__ = ("count", "total", "max", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * len(BUCKETS)
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.histogram[bisect_left(BUCKETS, duration)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """float: The upper bound of the histogram bucket holding this percentile, capped at the slowest call."""
+        rank = self.count * percent / 100.0
+        seen = 0
+        for bound, calls in zip(BUCKETS, self.histogram):
+            seen += calls
+            if calls and seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class SlowCall(NamedTuple):
+    owner: str
+    member: str
+    duration: float
+    stack: List[str]
+
+
+class Profiler:
+    """Collects the calls made to Photoshop while it is the active profiler.
+
+    Args:
+        slow_threshold: Seconds after which a call is logged with its Python stack.
+        max_slow_calls: Number of slow calls kept, the oldest are dropped first.
+
+    """
+
+    def __init__(self, slow_threshold: float = 0.1, max_slow_calls: int = 100):
+        self.slow_threshold = slow_threshold
+        self.stats: Dict[Tuple[str, str], MemberStats] = {}
+        self.slow_calls = deque(maxlen=max_slow_calls)
+        self._lock = threading.Lock()
+
+    def record(self, owner: str, member: str, duration: float):
+        """Record one call of `member` on a dispatch object wrapped by the `owner` class."""
+        with self._lock:
+            stats = self.stats.get((owner, member))
+            if stats is None:
+                stats = self.stats[(owner, member)] = MemberStats()
+            stats.add(duration)
+        if duration >= self.slow_threshold:
+            # Drop the frames of the profiler itself.
+            stack = traceback.format_stack()[:-2]
+            self.slow_calls.append(SlowCall(owner, member, duration, stack))
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+            self.slow_calls.clear()
+
+    @property
+    def total_calls(self) -> int:
+        return sum(stats.count for stats in self.stats.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(stats.total for stats in self.stats.values())
+
+    def report(self, limit: Optional[int] = None, sort: str = "total", stack_depth: int = 5) -> str:
+        """Format the recorded calls as a table.
+
+        Args:
+            limit: Maximum number of members listed.
+            sort: The column to sort by, descending: ``total``, ``count``, ``mean`` or ``max``.
+            stack_depth: Number of stack frames shown per slow call.
+
+        """
+        rows = sorted(self.stats.items(), key=lambda item: getattr(item[1], sort), reverse=True)[:limit]
+        width = max([len(f"{owner}.{member}") for (owner, member), _ in rows] + [6])
+        lines = [
+            f"Photoshop calls: {self.total_calls}, total {self.total_time * 1000:.1f} ms",
+            f"{'member':<{width}} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'max ms':>8}",
+        ]
+        for (owner, member), stats in rows:
+            lines.append(
+                f"{f'{owner}.{member}':<{width}} {stats.count:>7} {stats.total * 1000:>10.2f} "
+                f"{stats.mean * 1000:>9.3f} {stats.percentile(50) * 1000:>8.3f} "
+                f"{stats.percentile(95) * 1000:>8.3f} {stats.max * 1000:>8.3f}"
+            )
+        if self.slow_calls:
+            lines.append(f"Calls slower than {self.slow_threshold * 1000:.0f} ms: {len(self.slow_calls)}")
+            for call in self.slow_calls:
+                lines.append(f"  {call.owner}.{call.member} took {call.duration * 1000:.1f} ms")
+                for frame in call.stack[-stack_depth:]:
+                    lines.extend(f"    {line}" for line in frame.rstrip().splitlines())
+        return "\n".join(lines)
+
+
+_active: Optional[Profiler] = None
+
+# Profiling subclasses of the dispatch types, see `instrument`.
+_profiled_classes: Dict[type, type] = {}
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Optional[Profiler]: The active profiler, if profiling is enabled."""
+    return _active
+
+
+def enable(profiler: Optional[Profiler] = None, **kwargs) -> Profiler:
+    """Start profiling the dispatch objects wrapped from now on.
+
+    Args:
+        profiler: The profiler to record into, a new `Profiler` created with `kwargs` by default.
+
+    Returns:
+        The active profiler.
+
+    """
+    global _active
+    _active = profiler or Profiler(**kwargs)
+    return _active
+
+
+def disable() -> Optional[Profiler]:
+    """Stop profiling and return the profiler that was active."""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+@contextmanager
+def profile(**kwargs):
+    """Profile the calls made in a `with` block, restoring the previously active profiler afterwards."""
+    global _active
+    previous = _active
+    profiler = enable(**kwargs)
+    try:
+        yield profiler
+    finally:
+        _active = previous
+
+
+class _ProfiledMethod:
+    """Time the calls of a method caller cached on a profiled dispatch object."""
+
+    __slots__ = ("caller", "dispatch", "name")
+
+    def __init__(self, caller: Any, dispatch: Any, name: str):
+        self.caller = caller
+        self.dispatch = dispatch
+        self.name = name
+
+    def __call__(self, *args):
+        profiler = _active
+        if profiler is None:
+            return self.caller(*args)
+        owner = self.dispatch.__dict__["_profile_owner"]
+        start = time.perf_counter()
+        try:
+            result = self.caller(*args)
+        finally:
+            profiler.record(owner, self.name, time.perf_counter() - start)
+        return _adopt_result(result, owner, self.name)
+
+    def __getitem__(self, *args):
+        return self.caller.__getitem__(*args)
+
+
+def _adopt_result(result: Any, owner: str, member: str) -> Any:
+    if isinstance(result, backends.dispatch_types):
+        instrument(result, f"{owner}.{member}")
+    return result
+
+
+def _profiled_class(dispatch_class: type) -> type:
+    """Create a subclass of a dispatch type timing property reads, writes, method calls and iteration."""
+    base_getattr = dispatch_class.__getattr__
+    base_setattr = dispatch_class.__setattr__
+    base_iter = dispatch_class.__iter__
+
+    def __getattr__(self, name):
+        profiler = _active
+        if profiler is None or name.startswith("_"):
+            return base_getattr(self, name)
+        owner = self.__dict__["_profile_owner"]
+        start = time.perf_counter()
+        try:
+            result = base_getattr(self, name)
+        except Exception:
+            profiler.record(owner, name, time.perf_counter() - start)
+            raise
+        duration = time.perf_counter() - start
+        cached = self.__dict__.get(name)
+        if cached is not None and cached is result:
+            # A method caller, time its calls instead of the name lookup.
+            result = self.__dict__[name] = _ProfiledMethod(result, self, name)
+            return result
+        profiler.record(owner, name, duration)
+        return _adopt_result(result, owner, name)
+
+    def __setattr__(self, name, value):
+        profiler = _active
+        if profiler is None:
+            return base_setattr(self, name, value)
+        start = time.perf_counter()
+        try:
+            return base_setattr(self, name, value)
+        finally:
+            profiler.record(self.__dict__["_profile_owner"], name, time.perf_counter() - start)
+
+    def __iter__(self):
+        iterator = base_iter(self)
+        while True:
+            profiler = _active
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            if profiler is not None:
+                owner = self.__dict__["_profile_owner"]
+                profiler.record(owner, "[item]", time.perf_counter() - start)
+                _adopt_result(item, owner, "[item]")
+            yield item
+
+    namespace = {"__getattr__": __getattr__, "__setattr__": __setattr__, "__iter__": __iter__}
+    return type(f"Profiled{dispatch_class.__name__}", (dispatch_class,), namespace)
+
+
+def instrument(dispatch: Any, owner: str):
+    """Record the calls made through a dispatch object under the name of the class wrapping it.
+
+    Args:
+        dispatch: A dispatch object of one of `backends.dispatch_types`.
+        owner: The name of the wrapper class, e.g. ArtLayer.
+
+    """
+    attributes = dispatch.__dict__
+    attributes["_profile_owner"] = owner
+    dispatch_class = type(dispatch)
+    if dispatch_class in _profiled_classes.values():
+        return
+    profiled = _profiled_classes.get(dispatch_class)
+    if profiled is None:
+        profiled = _profiled_classes[dispatch_class] = _profiled_class(dispatch_class)
+    # Dispatch types forward attribute writes to Photoshop, bypass them.
+    object.__setattr__(dispatch, "__class__", profiled)
+    for name, value in list(attributes.items()):
+        if not name.startswith("_"):
+            attributes[name] = _ProfiledMethod(value, dispatch, name)
@@ -0,0 +1,273 @@
+"""Retry the calls Photoshop rejects while it is busy.
+
+Photoshop rejects COM calls with ``RPC_E_CALL_REJECTED`` or
+``RPC_E_SERVERCALL_RETRYLATER`` while a modal dialog is open or while it is
+busy with a previous command. The server did not run a rejected call, so it is
+safe to send it again.
+
+Every dispatch object wrapped by an API class retries rejected property reads,
+writes and method calls with jittered exponential backoff until the deadline
+of the active `RetryPolicy` passes, then raises the last error. Dispatch
+objects returned by those calls retry too.
+
+The deadline defaults to the ``PS_RETRY_DEADLINE`` environment variable, in
+seconds, 30 by default; 0 disables retrying.
+
+Examples:
+    ```python
+
+        from photoshop.api import retry
+
+        retry.set_policy(retry.RetryPolicy(deadline=120, max_delay=5))
+        ...
+        print(retry.stats.retries, retry.stats.waited)
+    ```
+
+"""
+
+# Import built-in modules
+import os
+import random
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+# Import local modules
+from photoshop.api import backends
+from photoshop.api.errors import COMError
+
+
+ENV_NAME = "PS_RETRY_DEADLINE"
+
+RPC_E_CALL_REJECTED = -2147418111  # 0x80010001
+RPC_E_SERVERCALL_RETRYLATER = -2147417846  # 0x8001010A
+
+# HRESULTs of the calls the server rejected without running them.
+RETRYABLE_ERRORS = frozenset((RPC_E_CALL_REJECTED, RPC_E_SERVERCALL_RETRYLATER))
+
+
+def is_retryable(error: BaseException) -> bool:
+    """bool: Whether Photoshop rejected a call because it is busy."""
+    if not isinstance(error, COMError) or not error.args or not isinstance(error.args[0], int):
+        return False
+    hresult = error.args[0]
+    # comtypes reports HRESULTs as signed integers, accept the unsigned form too.
+    if hresult > 0x7FFFFFFF:
+        hresult -= 0x100000000
+    return hresult in RETRYABLE_ERRORS
+
+
+class RetryPolicy:
+    """How long and how often rejected calls are retried.
+
+    Args:
+        deadline: Seconds after the first attempt after which the error is raised.
+        initial_delay: Seconds waited before the first retry.
+        max_delay: Upper bound of the wait between two attempts.
+        multiplier: Growth of the wait after every attempt.
+        jitter: Fraction of every wait that is randomized, so concurrent callers spread out.
+
+    """
+
+    def __init__(
+        self,
+        deadline: float = 30.0,
+        initial_delay: float = 0.02,
+        max_delay: float = 1.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+    ):
+        self.deadline = deadline
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def __repr__(self):
+        return f"RetryPolicy(deadline={self.deadline}, initial_delay={self.initial_delay}, max_delay={self.max_delay})"
+
+    def delay(self, attempt: int) -> float:
+        """float: Seconds to wait before retrying after `attempt` failed attempts."""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        return delay * (1.0 - self.jitter * random.random())
+
+
+class RetryStats:
+    """Counters of the retried calls, shared by all threads.
+
+    Attributes:
+        retries: Number of attempts repeated.
+        retried_calls: Number of calls that were rejected at least once.
+        failures: Number of calls still rejected at the deadline.
+        waited: Seconds spent waiting between attempts.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self):
+        return (
+            f"RetryStats(retries={self.retries}, retried_calls={self.retried_calls}, "
+            f"failures={self.failures}, waited={self.waited:.3f})"
+        )
+
+    def reset(self):
+        with self._lock:
+            self.retries = 0
+            self.retried_calls = 0
+            self.failures = 0
+            self.waited = 0.0
+
+    def _record(self, attempts: int, waited: float, failed: bool):
+        with self._lock:
+            self.retries += attempts - 1
+            self.retried_calls += 1
+            self.failures += failed
+            self.waited += waited
+
+
+stats = RetryStats()
+
+
+def _policy_from_environment() -> Optional[RetryPolicy]:
+    deadline = float(os.getenv(ENV_NAME, "30"))
+    return RetryPolicy(deadline=deadline) if deadline > 0 else None
+
+
+_policy: Optional[RetryPolicy] = _policy_from_environment()
+
+# Retrying subclasses of the dispatch types, see `install`.
+_retrying_classes: Dict[type, type] = {}
+
+
+def get_policy() -> Optional[RetryPolicy]:
+    """Optional[RetryPolicy]: The active policy, None if rejected calls are not retried."""
+    return _policy
+
+
+def set_policy(policy: Optional[RetryPolicy]) -> Optional[RetryPolicy]:
+    """Retry the calls made from now on with another policy, None to stop retrying.
+
+    Returns:
+        The policy that was active.
+
+    """
+    global _policy
+    previous, _policy = _policy, policy
+    return previous
+
+
+def call(func: Callable, *args, **kwargs) -> Any:
+    """Call a function, retrying it while Photoshop rejects it according to the active policy."""
+    try:
+        return func(*args, **kwargs)
+    except COMError as err:
+        policy = _policy
+        if policy is None or not is_retryable(err):
+            raise
+        error = err
+    start = time.monotonic()
+    attempts, waited = 1, 0.0
+    while True:
+        delay = min(policy.delay(attempts), start + policy.deadline - time.monotonic())
+        if delay < 0:
+            stats._record(attempts, waited, True)
+            raise error
+        time.sleep(delay)
+        waited += delay
+        attempts += 1
+        try:
+            result = func(*args, **kwargs)
+        except COMError as err:
+            if not is_retryable(err):
+                stats._record(attempts, waited, False)
+                raise
+            error = err
+        else:
+            stats._record(attempts, waited, False)
+            return result
+
+
+class _RetryingMethod:
+    """Retry the calls of a method caller cached on a retrying dispatch object."""
+
+    __slots__ = ("caller",)
+
+    def __init__(self, caller: Any):
+        self.caller = caller
+
+    def __call__(self, *args):
+        return _adopt_result(call(self.caller, *args))
+
+    def __getitem__(self, *args):
+        return _adopt_result(call(self.caller.__getitem__, *args))
+
+
+def _adopt_result(result: Any) -> Any:
+    if isinstance(result, backends.dispatch_types):
+        install(result)
+    return result
+
+
+def _retrying_class(dispatch_class: type) -> type:
+    """Create a subclass of a dispatch type retrying property reads, writes, method calls and enumeration."""
+    base_getattr = getattr(dispatch_class, "__getattr__", None)
+    base_setattr = dispatch_class.__setattr__
+    base_iter = getattr(dispatch_class, "__iter__", None)
+    base_getitem = getattr(dispatch_class, "__getitem__", None)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            return base_getattr(self, name)
+        result = call(base_getattr, self, name)
+        cached = self.__dict__.get(name)
+        if cached is not None and cached is result:
+            # A method caller, retry its calls.
+            result = self.__dict__[name] = _RetryingMethod(result)
+            return result
+        return _adopt_result(result)
+
+    def __setattr__(self, name, value):
+        return call(base_setattr, self, name, value)
+
+    def __iter__(self):
+        for item in call(base_iter, self):
+            yield _adopt_result(item)
+
+    def __getitem__(self, index):
+        return _adopt_result(call(base_getitem, self, index))
+
+    namespace = {"_retries_calls": True, "__setattr__": __setattr__}
+    if base_getattr is not None:
+        namespace["__getattr__"] = __getattr__
+    if base_iter is not None:
+        namespace["__iter__"] = __iter__
+    if base_getitem is not None:
+        namespace["__getitem__"] = __getitem__
+    return type(f"Retrying{dispatch_class.__name__}", (dispatch_class,), namespace)
+
+
+def install(dispatch: Any):
+    """Retry the calls made through a dispatch object while Photoshop rejects them.
+
+    Args:
+        dispatch: A dispatch object of one of `backends.dispatch_types`.
+
+    """
+    dispatch_class = type(dispatch)
+    if getattr(dispatch_class, "_retries_calls", False):
+        return
+    retrying = _retrying_classes.get(dispatch_class)
+    if retrying is None:
+        retrying = _retrying_classes[dispatch_class] = _retrying_class(dispatch_class)
+    # Dispatch types forward attribute writes to Photoshop, bypass them.
+    object.__setattr__(dispatch, "__class__", retrying)
+    attributes = dispatch.__dict__
+    for name, value in list(attributes.items()):
+        if not name.startswith("_") and not isinstance(value, _RetryingMethod):
+            attributes[name] = _RetryingMethod(value)
@@ -23,11 +23,10 @@ class SolidColor(Photoshop):
 
     object_name = "SolidColor"
 
+    _method_flags = ("isEqual",)
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "isEqual",
-        )
 
     @property
     def cmyk(self) -> CMYKColor:
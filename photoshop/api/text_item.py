@@ -1,4 +1,5 @@
 # Import local modules
+from photoshop.api import _batch
 from photoshop.api._core import Photoshop
 from photoshop.api.enumerations import AntiAlias
 from photoshop.api.enumerations import AutoKernType
@@ -15,13 +16,15 @@ class TextItem(Photoshop):
     """The text that is associated with the layer. Valid only when ‘kind’ is text layer."""
 
     object_name = "Application"
+    app = _batch.BatchedApp("text")
+
+    _method_flags = (
+        "convertToShape",
+        "createPath",
+    )
 
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self._flag_as_method(
-            "convertToShape",
-            "createPath",
-        )
 
     @property
     def alternateLigatures(self):
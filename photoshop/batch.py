@@ -0,0 +1,563 @@
+"""Process many files with Photoshop, resuming where a previous run stopped.
+
+`BatchRunner` opens each input of a manifest, applies a recipe, saves the
+result and closes the document, all in one Photoshop session. The recipe is
+either a function taking the session, the document and the `BatchItem`, or the
+name of a Photoshop action, played with ``doAction``.
+
+After each item, a line is appended to the journal, a JSON lines file, and
+flushed to disk. A new run with the same journal skips the items completed
+before whose output still exists, so a run that crashed, or was stopped,
+continues where it stopped. Items that failed are run again unless
+``retry_failed`` is False. An item failing does not stop the run: its error is
+written to the journal and the next item starts.
+
+`BatchRunner.run` returns a `BatchReport`, with the throughput of the run in
+items per minute and the median and 95th percentile latency of each stage:
+``open``, ``recipe``, ``save`` and ``close``.
+
+`NativeBatch` keeps the speed of Photoshop's own batch command,
+`Application.batch`, without running the whole file list at once: it runs the
+command on chunks of files, sized to take about ``target_seconds`` each, and
+reads the error log of each chunk before starting the next one. Files named in
+the log are retried alone, then quarantined. A chunk whose batch call fails is
+split in halves until the failing file runs alone, so one bad file only costs
+its own chunk. Dialogs are disabled while it runs, so a file cannot stop the
+run on a modal dialog.
+
+Examples:
+    ```python
+
+        from photoshop.batch import BatchRunner
+        from photoshop.batch import load_manifest
+
+        def recipe(ps, doc, item):
+            doc.resizeImage(1920)
+
+        runner = BatchRunner(
+            load_manifest("inputs.txt"),
+            recipe,
+            journal="night.jsonl",
+            output_dir="D:/out",
+            extension=".jpg",
+        )
+        print(runner.run())
+    ```
+
+"""
+
+# Import built-in modules
+from collections import Counter
+from collections import deque
+import json
+import math
+import os
+from pathlib import Path
+import re
+import tempfile
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+PathType = Union[str, os.PathLike]
+
+STAGES = ("open", "recipe", "save", "close")
+
+# The save options class of `photoshop.Session` used for an output extension.
+SAVE_OPTIONS = {
+    ".bmp": "BMPSaveOptions",
+    ".gif": "GIFSaveOptions",
+    ".jpeg": "JPEGSaveOptions",
+    ".jpg": "JPEGSaveOptions",
+    ".pdf": "PDFSaveOptions",
+    ".png": "PNGSaveOptions",
+    ".psd": "PhotoshopSaveOptions",
+    ".tga": "TargaSaveOptions",
+    ".tif": "TiffSaveOptions",
+    ".tiff": "TiffSaveOptions",
+}
+
+
+class BatchItem(NamedTuple):
+    """One file to process and the file to save the result to."""
+
+    source: str
+    output: str
+
+
+class ItemResult(NamedTuple):
+    """The outcome of one item, as written to the journal."""
+
+    item: BatchItem
+    status: str
+    error: Optional[str]
+    stages: Dict[str, float]
+
+
+def load_manifest(path: PathType) -> List[Union[str, Tuple[str, str]]]:
+    """Read a manifest file: one input path per line, optionally followed by a tab and the output path.
+
+    Empty lines and lines starting with ``#`` are ignored.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as manifest:
+        for line in manifest:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            source, _, output = line.partition("\t")
+            entries.append((source, output) if output else source)
+    return entries
+
+
+def default_save_options(session: Any, item: BatchItem) -> Any:
+    """Make the save options of `SAVE_OPTIONS` for the extension of the output.
+
+    Raises:
+        ValueError: The extension has no save options.
+
+    """
+    name = SAVE_OPTIONS.get(Path(item.output).suffix.lower())
+    if name is None:
+        raise ValueError(f"No save options for {item.output}, give BatchRunner a save_options function.")
+    return getattr(session, name)()
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """The nearest rank percentile of sorted values, 0.0 without values."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(len(values) * percent / 100.0))
+    return values[rank - 1]
+
+
+def _normalize(text: str) -> str:
+    """Compare paths whatever separator Photoshop wrote them with, and without case on Windows."""
+    return os.path.normcase(text.replace("\\", "/"))
+
+
+def _names(line: str, name: str) -> bool:
+    """Whether a normalized log line names a path or file name as a whole, not inside a longer name."""
+    return re.search(r"(?<![\w.-])" + re.escape(name) + r"(?![\w-]|\.\w)", line) is not None
+
+
+class BatchReport:
+    """The counts, throughput and stage latencies of a run of a `BatchRunner`."""
+
+    def __init__(self):
+        self.done = 0
+        self.failed = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+        self.results: List[ItemResult] = []
+        self._durations: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+
+    def add(self, result: ItemResult):
+        self.results.append(result)
+        if result.status == "done":
+            self.done += 1
+        else:
+            self.failed += 1
+        for stage, duration in result.stages.items():
+            self._durations[stage].append(duration)
+
+    @property
+    def items_per_minute(self) -> float:
+        """float: Items processed, done or failed, per minute of the run."""
+        processed = self.done + self.failed
+        return processed * 60.0 / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, stage: str, percent: float) -> float:
+        """Get a latency percentile of a stage, in seconds, e.g. ``percentile("save", 95)``."""
+        return _percentile(sorted(self._durations[stage]), percent)
+
+    def summary(self) -> Dict[str, Any]:
+        """The report as a dict, e.g. to write it as JSON."""
+        return {
+            "done": self.done,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed": self.elapsed,
+            "items_per_minute": self.items_per_minute,
+            "stages": {
+                stage: {"p50": self.percentile(stage, 50), "p95": self.percentile(stage, 95)}
+                for stage in STAGES
+                if self._durations[stage]
+            },
+        }
+
+    def __str__(self):
+        lines = [
+            f"{self.done} done, {self.failed} failed, {self.skipped} skipped "
+            f"in {self.elapsed:.1f}s ({self.items_per_minute:.1f} items/min)"
+        ]
+        for stage, latency in self.summary()["stages"].items():
+            lines.append(f"  {stage:<7} p50 {latency['p50'] * 1000:9.1f}ms  p95 {latency['p95'] * 1000:9.1f}ms")
+        return "\n".join(lines)
+
+
+class BatchRunner:
+    """Open, process and save the files of a manifest, see the module documentation.
+
+    Args:
+        manifest: The inputs, as paths, or pairs of the input path and the output path.
+        recipe: A function called with the session, the document and the `BatchItem`,
+            or the name of a Photoshop action.
+        journal: The JSON lines file recording the outcome of each item.
+        output_dir: The folder of the outputs not given by the manifest, named after their input.
+        extension: The extension of the outputs not given by the manifest, e.g. ``.jpg``.
+        save_options: Makes the save options from the session and the item, see
+            `default_save_options`. None for recipes saving the document themselves.
+        action_set: The action set of the action played when `recipe` is an action name.
+        retry_failed: Whether to run again the items that failed in a previous run.
+        on_item: Called with the `ItemResult` of each item as soon as it is written to the journal.
+        ps_version: The version of Photoshop, see `photoshop.Session`.
+
+    """
+
+    def __init__(
+        self,
+        manifest: Iterable[Union[PathType, Tuple[PathType, PathType]]],
+        recipe: Union[Callable[[Any, Any, BatchItem], Any], str],
+        journal: PathType,
+        output_dir: Optional[PathType] = None,
+        extension: str = ".psd",
+        save_options: Optional[Callable[[Any, BatchItem], Any]] = default_save_options,
+        action_set: str = "Default Actions",
+        retry_failed: bool = True,
+        on_item: Optional[Callable[[ItemResult], None]] = None,
+        ps_version: Optional[str] = None,
+    ):
+        self.items = [self._item(entry, output_dir, extension) for entry in manifest]
+        self.recipe = recipe
+        self.journal = Path(journal)
+        self.save_options = save_options
+        self.action_set = action_set
+        self.retry_failed = retry_failed
+        self.on_item = on_item
+        self.ps_version = ps_version
+
+    @staticmethod
+    def _item(entry: Any, output_dir: Optional[PathType], extension: str) -> BatchItem:
+        if isinstance(entry, (tuple, list)):
+            source, output = entry
+            return BatchItem(os.fspath(source), os.fspath(output))
+        if output_dir is None:
+            raise ValueError(f"No output for {entry}: give an output_dir or pairs of input and output paths.")
+        source = os.fspath(entry)
+        return BatchItem(source, os.fspath(Path(output_dir, Path(source).stem + extension)))
+
+    def read_journal(self) -> Dict[BatchItem, Dict[str, Any]]:
+        """Read the last record of each item in the journal, ignoring a line cut by a crash."""
+        records: Dict[BatchItem, Dict[str, Any]] = {}
+        if not self.journal.exists():
+            return records
+        with open(self.journal, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[BatchItem(record["source"], record["output"])] = record
+        return records
+
+    def pending(self) -> List[BatchItem]:
+        """Get the items a run would process, in the order of the manifest."""
+        records = self.read_journal()
+        items = []
+        for item in self.items:
+            record = records.get(item)
+            if record is not None:
+                if record["status"] == "done" and os.path.exists(item.output):
+                    continue
+                if record["status"] == "failed" and not self.retry_failed:
+                    continue
+            items.append(item)
+        return items
+
+    def run(self) -> BatchReport:
+        """Process the pending items in one Photoshop session and report the run."""
+        # Import local modules
+        from photoshop.session import Session  # pylint: disable=import-outside-toplevel
+
+        report = BatchReport()
+        start = time.perf_counter()
+        items = self.pending()
+        report.skipped = len(self.items) - len(items)
+        if items:
+            self.journal.parent.mkdir(parents=True, exist_ok=True)
+            with Session(ps_version=self.ps_version) as session, open(self.journal, "a", encoding="utf-8") as journal:
+                for item in items:
+                    result = self._process(session, item)
+                    self._write(journal, result)
+                    report.add(result)
+                    if self.on_item is not None:
+                        self.on_item(result)
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _process(self, session: Any, item: BatchItem) -> ItemResult:
+        """Run the stages of one item, timing each one, and close its document whatever happens."""
+        stages: Dict[str, float] = {}
+        document = None
+        error = None
+        stage = "open"
+        try:
+            started = time.perf_counter()
+            document = session.app.open(item.source)
+            stages["open"] = time.perf_counter() - started
+
+            stage, started = "recipe", time.perf_counter()
+            if isinstance(self.recipe, str):
+                session.app.doAction(self.recipe, self.action_set)
+            else:
+                self.recipe(session, document, item)
+            stages["recipe"] = time.perf_counter() - started
+
+            if self.save_options is not None:
+                stage, started = "save", time.perf_counter()
+                Path(item.output).parent.mkdir(parents=True, exist_ok=True)
+                document.saveAs(item.output, self.save_options(session, item), True)
+                stages["save"] = time.perf_counter() - started
+        except Exception as err:  # pylint: disable=broad-except
+            error = f"{stage}: {type(err).__name__}: {err}"
+        if document is not None:
+            started = time.perf_counter()
+            try:
+                document.close()
+            except Exception as err:  # pylint: disable=broad-except
+                error = error or f"close: {type(err).__name__}: {err}"
+            stages["close"] = time.perf_counter() - started
+        return ItemResult(item, "failed" if error else "done", error, stages)
+
+    @staticmethod
+    def _write(journal: Any, result: ItemResult):
+        """Append the record of an item and make sure it reached the disk before the next item."""
+        record = {
+            "source": result.item.source,
+            "output": result.item.output,
+            "status": result.status,
+            "error": result.error,
+            "stages": result.stages,
+            "time": time.time(),
+        }
+        journal.write(json.dumps(record) + "\n")
+        journal.flush()
+        os.fsync(journal.fileno())
+
+
+def run(
+    manifest: Iterable[Union[PathType, Tuple[PathType, PathType]]],
+    recipe: Union[Callable[[Any, Any, BatchItem], Any], str],
+    journal: PathType,
+    **kwargs,
+) -> BatchReport:
+    """Process the files of a manifest, see `BatchRunner` for the arguments."""
+    return BatchRunner(manifest, recipe, journal, **kwargs).run()
+
+
+class ChunkResult(NamedTuple):
+    """The outcome of one call to `Application.batch` by a `NativeBatch`."""
+
+    index: int
+    files: List[str]
+    seconds: float
+    failed: Dict[str, str]
+    error: Optional[str]
+
+    @property
+    def files_per_minute(self) -> float:
+        """float: The throughput of the chunk."""
+        return len(self.files) * 60.0 / self.seconds if self.seconds else 0.0
+
+
+class NativeBatchReport:
+    """The files done and quarantined, and the chunks, of a run of a `NativeBatch`."""
+
+    def __init__(self):
+        self.done: List[str] = []
+        self.quarantined: Dict[str, str] = {}
+        self.chunks: List[ChunkResult] = []
+        self.elapsed = 0.0
+
+    @property
+    def files_per_minute(self) -> float:
+        """float: Files done per minute of the run."""
+        return len(self.done) * 60.0 / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        lines = [
+            f"{len(self.done)} done, {len(self.quarantined)} quarantined in {len(self.chunks)} chunks, "
+            f"{self.elapsed:.1f}s ({self.files_per_minute:.1f} files/min)"
+        ]
+        for chunk in self.chunks:
+            outcome = chunk.error or (f"{len(chunk.failed)} failed" if chunk.failed else "ok")
+            lines.append(
+                f"  chunk {chunk.index:<4} {len(chunk.files):4} files {chunk.seconds:8.2f}s "
+                f"{chunk.files_per_minute:8.1f} files/min  {outcome}"
+            )
+        for path, reason in self.quarantined.items():
+            lines.append(f"  quarantined {path}: {reason}")
+        return "\n".join(lines)
+
+
+class NativeBatch:
+    """Run `Application.batch` on chunks of a file list, see the module documentation.
+
+    The chunk size starts at `chunk_size`, doubles at most after each chunk until a chunk takes
+    about `target_seconds`, and is halved after a chunk with failures. Files of a chunk whose
+    batch call failed may have been processed before the failure and are processed again.
+
+    Args:
+        files: The paths of the input files.
+        action: The name of the action played on each file.
+        action_set: The name of the action set of the action.
+        options: Properties of the `BatchOptions`, e.g. ``{"destination": 3, "destinationFolder": path}``.
+            ``suppressOpen`` and ``suppressProfile`` are True unless set here, ``errorFile`` is
+            set by the driver.
+        chunk_size: The number of files of the first chunk.
+        min_chunk_size: The smallest number of files of a chunk after failures, except while the
+            file making a batch call fail is isolated.
+        max_chunk_size: The largest number of files of a chunk.
+        target_seconds: The duration of a chunk the size is adapted to.
+        retries: The number of times a failing file is run again alone before it is quarantined.
+        work_dir: The folder of the error logs, a new temporary folder by default.
+        on_chunk: Called with the `ChunkResult` of each chunk as soon as its log was read.
+        ps_version: The version of Photoshop, see `photoshop.Session`.
+
+    """
+
+    def __init__(
+        self,
+        files: Iterable[PathType],
+        action: str,
+        action_set: str = "Default Actions",
+        options: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 8,
+        min_chunk_size: int = 1,
+        max_chunk_size: int = 256,
+        target_seconds: float = 60.0,
+        retries: int = 1,
+        work_dir: Optional[PathType] = None,
+        on_chunk: Optional[Callable[[ChunkResult], None]] = None,
+        ps_version: Optional[str] = None,
+    ):
+        if not 1 <= min_chunk_size <= chunk_size <= max_chunk_size:
+            raise ValueError("Expected 1 <= min_chunk_size <= chunk_size <= max_chunk_size.")
+        self.files = [os.fspath(path) for path in files]
+        self.action = action
+        self.action_set = action_set
+        self.options = {"suppressOpen": True, "suppressProfile": True, **(options or {})}
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_seconds = target_seconds
+        self.retries = retries
+        self.work_dir = work_dir
+        self.on_chunk = on_chunk
+        self.ps_version = ps_version
+
+    def run(self) -> NativeBatchReport:
+        """Run the batch command on all files, chunk by chunk."""
+        # Import local modules
+        from photoshop.session import Session  # pylint: disable=import-outside-toplevel
+
+        report = NativeBatchReport()
+        start = time.perf_counter()
+        work_dir = Path(self.work_dir or tempfile.mkdtemp(prefix="photoshop-batch-"))
+        work_dir.mkdir(parents=True, exist_ok=True)
+        pending = deque(self.files)
+        retry: deque = deque()
+        attempts: Counter = Counter()
+        size = self.chunk_size
+        # The number of files at the front of `pending` put back after a failed batch call.
+        suspects = 0
+        with Session(ps_version=self.ps_version) as session:
+            dialogs = session.app.displayDialogs
+            session.app.displayDialogs = session.DialogModes.DisplayNoDialogs
+            try:
+                while pending or retry:
+                    retrying = bool(retry)
+                    if retrying:
+                        chunk = [retry.popleft()]
+                    else:
+                        chunk = [pending.popleft() for _ in range(min(size, len(pending)))]
+                        suspects = max(0, suspects - len(chunk))
+                    result = self._run_chunk(session, work_dir, len(report.chunks), chunk)
+                    report.chunks.append(result)
+                    if self.on_chunk is not None:
+                        self.on_chunk(result)
+                    if result.error is not None and len(chunk) > 1:
+                        # Run the files again in halves, down to the file making the batch call fail.
+                        pending.extendleft(reversed(chunk))
+                        suspects += len(chunk)
+                        # Down to single files, below min_chunk_size, or the failing file never runs alone.
+                        size = len(chunk) // 2
+                        continue
+                    if result.error is not None:
+                        # The file making the batch call fail was found, the files after it are not suspect.
+                        suspects = 0
+                    failed = {path: result.error for path in chunk} if result.error else result.failed
+                    for path in chunk:
+                        if path not in failed:
+                            report.done.append(path)
+                        elif attempts[path] < self.retries:
+                            attempts[path] += 1
+                            retry.append(path)
+                        else:
+                            report.quarantined[path] = failed[path]
+                    if not retrying and not suspects:
+                        size = self._next_size(size, result)
+            finally:
+                session.app.displayDialogs = dialogs
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _next_size(self, size: int, result: ChunkResult) -> int:
+        """The size of the next chunk: half after failures, else closer to `target_seconds`."""
+        if result.failed or result.error:
+            return max(self.min_chunk_size, size // 2)
+        if len(result.files) < size:
+            # The last chunk says little about the speed of a full chunk.
+            return size
+        wanted = int(len(result.files) * self.target_seconds / result.seconds) if result.seconds else size * 2
+        return max(self.min_chunk_size, min(self.max_chunk_size, size * 2, wanted))
+
+    def _run_chunk(self, session: Any, work_dir: Path, index: int, chunk: List[str]) -> ChunkResult:
+        """Run the batch command on one chunk and read the files named in its error log."""
+        log = work_dir / f"errors_{index:05d}.txt"
+        if log.exists():
+            log.unlink()
+        options = session.BatchOptions()
+        for name, value in self.options.items():
+            setattr(options, name, value)
+        options.errorFile = str(log)
+        error = None
+        started = time.perf_counter()
+        try:
+            session.app.batch(chunk, self.action, self.action_set, options)
+        except Exception as err:  # pylint: disable=broad-except
+            error = f"{type(err).__name__}: {err}"
+        seconds = time.perf_counter() - started
+        failed = {}
+        if log.exists():
+            lines = [line.strip() for line in log.read_text(encoding="utf-8", errors="replace").splitlines()]
+            normalized = [_normalize(line) for line in lines]
+            for path in chunk:
+                # Photoshop names the files by path or by name, depending on the error.
+                full = _normalize(path)
+                name = os.path.basename(full)
+                matches = [index for index, line in enumerate(normalized) if _names(line, full)] or [
+                    index for index, line in enumerate(normalized) if _names(line, name)
+                ]
+                if matches:
+                    failed[path] = lines[matches[0]]
+        return ChunkResult(index, chunk, seconds, failed, error)
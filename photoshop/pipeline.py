@@ -0,0 +1,333 @@
+"""Keep Photoshop busy while Python prepares the next inputs and finishes the last outputs.
+
+A `Pipeline` passes each item through three groups of stages: ``prepare``
+stages, e.g. copying an input from a network share or computing parameters,
+the Photoshop stage, and ``finish`` stages, e.g. hashing or uploading an
+output. Only the Photoshop stage is serialized: it runs on the worker thread
+of an `STAExecutor`, which owns the Photoshop session, see `photoshop.sta`.
+Every other `Stage` runs on its own threads, or its own process pool, so
+while Photoshop works on one item the following items are prepared and the
+previous ones finished.
+
+Stages are connected by bounded queues. A stage faster than the next one
+blocks once the queue between them is full, so inputs are never prepared
+much further ahead than Photoshop can use them.
+
+Each stage is a function taking the value returned by the previous stage,
+the item itself for the first one. The Photoshop function also takes the
+`Session`, first. An item failing in a stage skips the following stages, its
+`PipelineResult` holds the error. Results are returned in the order items
+complete, with the index of their item in the inputs.
+
+Examples:
+    ```python
+
+        import shutil
+
+        from photoshop.pipeline import Pipeline
+        from photoshop.pipeline import Stage
+
+        def stage_in(path):
+            return shutil.copy(path, "C:/staging")
+
+        def edit(ps, path):
+            doc = ps.app.open(path)
+            doc.resizeImage(1920)
+            output = path.replace(".psd", ".jpg")
+            doc.saveAs(output, ps.JPEGSaveOptions(), True)
+            doc.close()
+            return output
+
+        with Pipeline(edit, prepare=[Stage(stage_in, workers=8)], finish=[Stage(upload, workers=4)]) as pipeline:
+            for result in pipeline.run(paths):
+                print(result.item, result.error or result.value)
+            print(f"Photoshop was busy {pipeline.utilization():.0%} of the time")
+    ```
+
+"""
+
+# Import built-in modules
+from concurrent.futures import ProcessPoolExecutor
+import queue
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+# Import local modules
+from photoshop.sta import STAExecutor
+
+
+PHOTOSHOP = "photoshop"
+
+# Marks the end of the items in a queue.
+_DONE = object()
+
+# Seconds between two checks of the cancellation of a run by a thread waiting on a queue.
+_POLL_INTERVAL = 0.05
+
+
+class Stage:
+    """A Python stage of a `Pipeline`.
+
+    Args:
+        fn: The function, taking the value of the previous stage and returning the value of this one.
+        workers: The number of items processed at the same time.
+        processes: Run the function in a process pool, for CPU bound work. The function, its
+            argument and its value must be picklable.
+        name: The name of the stage, the name of the function by default.
+
+    """
+
+    def __init__(self, fn: Callable[[Any], Any], workers: int = 1, processes: bool = False, name: Optional[str] = None):
+        if workers < 1:
+            raise ValueError("A stage needs at least one worker.")
+        self.fn = fn
+        self.workers = workers
+        self.processes = processes
+        self.name = name or getattr(fn, "__name__", repr(fn))
+
+    def __repr__(self):
+        return f"<Stage {self.name} workers={self.workers}{' processes' if self.processes else ''}>"
+
+
+class PipelineResult(NamedTuple):
+    """The outcome of one item of a `Pipeline`."""
+
+    index: int
+    item: Any
+    value: Any
+    error: Optional[BaseException]
+    stage: Optional[str]
+
+
+class _Packet:
+    """An item travelling through the stages."""
+
+    __slots__ = ("index", "item", "value", "error", "stage")
+
+    def __init__(self, index: int, item: Any):
+        self.index = index
+        self.item = item
+        self.value = item
+        self.error: Optional[BaseException] = None
+        self.stage: Optional[str] = None
+
+
+class Pipeline:
+    """Runs Python stages around a serialized Photoshop stage, see the module documentation.
+
+    Args:
+        photoshop: The Photoshop stage, taking the `Session` and the value of the last prepare stage.
+        prepare: The stages before the Photoshop stage, as `Stage` objects or functions.
+        finish: The stages after the Photoshop stage, as `Stage` objects or functions.
+        queue_size: The number of items waiting between two stages before the first one blocks.
+        session: The arguments of the `Session` entered on the Photoshop thread, exited by `close`.
+
+    Attributes:
+        busy: The seconds each stage spent processing items in the last run, summed over its workers.
+        elapsed: The duration of the last run in seconds.
+
+    """
+
+    def __init__(
+        self,
+        photoshop: Callable[[Any, Any], Any],
+        prepare: Sequence[Union[Stage, Callable[[Any], Any]]] = (),
+        finish: Sequence[Union[Stage, Callable[[Any], Any]]] = (),
+        queue_size: int = 4,
+        session: Optional[Dict[str, Any]] = None,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1.")
+        self.prepare = [stage if isinstance(stage, Stage) else Stage(stage) for stage in prepare]
+        self.finish = [stage if isinstance(stage, Stage) else Stage(stage) for stage in finish]
+        self.photoshop = Stage(photoshop, name=PHOTOSHOP)
+        self.queue_size = queue_size
+        self.busy: Dict[str, float] = {}
+        self.elapsed = 0.0
+        self._session_arguments = session or {}
+        self._session = None
+        self._sta: Optional[STAExecutor] = None
+        self._pools: Dict[int, ProcessPoolExecutor] = {}
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._running = False
+        self._feed_error: Optional[BaseException] = None
+
+    @property
+    def stages(self) -> List[Stage]:
+        """List[Stage]: All stages, in the order items go through them."""
+        return [*self.prepare, self.photoshop, *self.finish]
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Exit the session, then stop the Photoshop thread and the process pools."""
+        if self._sta is not None:
+            try:
+                self._sta.submit(self._session.__exit__, None, None, None).result()
+            finally:
+                self._sta.shutdown()
+                self._sta = self._session = None
+        for pool in self._pools.values():
+            pool.shutdown()
+        self._pools.clear()
+
+    def utilization(self, stage: str = PHOTOSHOP) -> float:
+        """Get the share of the last run a stage spent processing items, per worker."""
+        workers = next(candidate.workers for candidate in self.stages if candidate.name == stage)
+        return self.busy.get(stage, 0.0) / (self.elapsed * workers) if self.elapsed else 0.0
+
+    def run(self, items: Iterable[Any]) -> Iterator[PipelineResult]:
+        """Process items and iterate over their results as they complete.
+
+        The stages start with the iteration, nothing runs for a run that is never iterated.
+        They stop early when the iteration is stopped, e.g. by ``break``, once the items
+        they are processing are done.
+
+        Raises:
+            RuntimeError: The pipeline is already running.
+
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("The pipeline is already running.")
+            self._running = True
+        threads: List[threading.Thread] = []
+        started = time.perf_counter()
+        try:
+            if self._sta is None:
+                # pylint: disable=import-outside-toplevel
+                # Import local modules
+                from photoshop.session import Session
+
+                sta = STAExecutor(name="photoshop-pipeline")
+                try:
+                    self._session = sta.submit(lambda: Session(**self._session_arguments).__enter__()).result()
+                except BaseException:
+                    sta.shutdown()
+                    raise
+                self._sta = sta
+            stages = self.stages
+            queues = [queue.Queue(self.queue_size) for _ in range(len(stages) + 1)]
+            self._cancel.clear()
+            self._feed_error = None
+            self.busy = {stage.name: 0.0 for stage in stages}
+            started = time.perf_counter()
+            threads.append(threading.Thread(target=self._feed, args=(items, queues[0], stages[0].workers), daemon=True))
+            for position, stage in enumerate(stages):
+                following = stages[position + 1].workers if position + 1 < len(stages) else 1
+                remaining = [stage.workers]
+                for _ in range(stage.workers):
+                    arguments = (
+                        stage,
+                        self._caller(stage),
+                        queues[position],
+                        queues[position + 1],
+                        remaining,
+                        following,
+                    )
+                    threads.append(threading.Thread(target=self._work, args=arguments, daemon=True))
+            for thread in threads:
+                thread.start()
+            while True:
+                packet = queues[-1].get()
+                if packet is _DONE:
+                    break
+                yield PipelineResult(packet.index, packet.item, packet.value, packet.error, packet.stage)
+            if self._feed_error is not None:
+                raise self._feed_error
+        finally:
+            self._cancel.set()
+            for thread in threads:
+                if thread.ident is not None:
+                    thread.join()
+            self.elapsed = time.perf_counter() - started
+            self._running = False
+
+    def _caller(self, stage: Stage) -> Callable[[Any], Any]:
+        """The function running a stage on the value of an item, on the thread of one of its workers."""
+        if stage is self.photoshop:
+            return lambda value: self._sta.submit(stage.fn, self._session, value).result()
+        if stage.processes:
+            pool = self._pools.get(id(stage))
+            if pool is None:
+                pool = self._pools[id(stage)] = ProcessPoolExecutor(stage.workers)
+            return lambda value: pool.submit(stage.fn, value).result()
+        return stage.fn
+
+    def _get(self, inbox: queue.Queue) -> Any:
+        while not self._cancel.is_set():
+            try:
+                return inbox.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _put(self, outbox: queue.Queue, value: Any) -> bool:
+        """Wait for room in a queue, False if the run was cancelled first."""
+        while not self._cancel.is_set():
+            try:
+                outbox.put(value, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _feed(self, items: Iterable[Any], outbox: queue.Queue, workers: int):
+        try:
+            for index, item in enumerate(items):
+                if not self._put(outbox, _Packet(index, item)):
+                    return
+        except BaseException as err:  # pylint: disable=broad-except
+            self._feed_error = err
+        for _ in range(workers):
+            self._put(outbox, _DONE)
+
+    def _work(
+        self,
+        stage: Stage,
+        call: Callable[[Any], Any],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        remaining: List[int],
+        following: int,
+    ):
+        try:
+            while True:
+                packet = self._get(inbox)
+                if packet is _DONE:
+                    break
+                if packet.error is None:
+                    started = time.perf_counter()
+                    try:
+                        packet.value = call(packet.value)
+                    except Exception as err:  # pylint: disable=broad-except
+                        packet.error, packet.stage = err, stage.name
+                    duration = time.perf_counter() - started
+                    with self._lock:
+                        self.busy[stage.name] += duration
+                if not self._put(outbox, packet):
+                    return
+        finally:
+            # The last worker of a stage tells the workers of the next one that no item follows,
+            # even when a stage raised a BaseException, or the run would wait for them forever.
+            with self._lock:
+                remaining[0] -= 1
+                last = not remaining[0]
+            if last:
+                for _ in range(following):
+                    self._put(outbox, _DONE)
@@ -0,0 +1,43 @@
+"""Automate a Photoshop running on another machine.
+
+An `Agent` runs next to Photoshop, e.g. on a Windows render box, and hosts
+sessions for the `Client` objects connecting to it over TCP. The client
+mirrors the API: sessions, applications, documents and layers are
+`RemoteObject` objects whose attributes and methods are used like the local
+ones. Files the agent exports are streamed back with `Client.fetch`.
+
+Start an agent with ``python -m photoshop.remote --token SECRET``, add
+``--backend simulated`` to serve a simulated Photoshop on any platform.
+
+Examples:
+    ```python
+
+        from photoshop.remote import Client
+
+        with Client("render-box", token="SECRET") as client:
+            with client.session(action="new_document") as ps:
+                layer = ps.active_document.artLayers.add()
+                layer.name = "Title"
+    ```
+
+"""
+
+# Import local modules
+from photoshop.remote.agent import Agent
+from photoshop.remote.client import Client
+from photoshop.remote.client import Pipeline
+from photoshop.remote.client import RemoteError
+from photoshop.remote.client import RemoteObject
+from photoshop.remote.client import RemotePromise
+from photoshop.remote.protocol import DEFAULT_PORT
+
+
+__all__ = [
+    "Agent",
+    "Client",
+    "DEFAULT_PORT",
+    "Pipeline",
+    "RemoteError",
+    "RemoteObject",
+    "RemotePromise",
+]
@@ -0,0 +1,44 @@
+"""Run an agent hosting Photoshop for remote clients, see `photoshop.remote`."""
+
+# Import built-in modules
+import argparse
+import os
+import sys
+
+# Import local modules
+from photoshop.api import backends
+from photoshop.remote.agent import Agent
+from photoshop.remote.protocol import DEFAULT_PORT
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m photoshop.remote", description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on, default: %(default)s.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on, 0 for any free port.")
+    parser.add_argument(
+        "--token",
+        default=os.getenv("PS_AGENT_TOKEN"),
+        help="Secret clients must send, default: the PS_AGENT_TOKEN environment variable.",
+    )
+    parser.add_argument("--root", action="append", default=[], help="Folder clients can fetch files from.")
+    parser.add_argument(
+        "--backend", help="Backend to use, e.g. simulated, default: the PS_BACKEND environment variable."
+    )
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        backends.set_backend(args.backend)
+    agent = Agent(args.host, args.port, token=args.token, roots=args.root)
+    host, port = agent.address
+    print(f"Serving Photoshop on {host}:{port}", flush=True)
+    try:
+        agent.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        agent.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""The agent process hosting Photoshop for remote clients.
+
+Every connection sends requests made of operations on the objects the agent
+hosts. A reader thread per connection queues the requests on the
+`STAExecutor` owning the Photoshop connection, so a client can send its next
+requests while Photoshop still runs the previous ones. The operations of a
+request run one after another and stop at the first one that fails.
+
+Operations, ``target`` being an object sent to the client before or the
+result of an earlier operation of the request (``{"$ref": index}``):
+
+- ``{"op": "session", "kwargs": {...}}``: Open a `Session`.
+- ``{"op": "exit", "target": ...}``: Exit a session opened by ``session``.
+- ``{"op": "get", "target": ..., "name": ...}``: Read an attribute, methods
+  are returned as ``{"$method": true}``.
+- ``{"op": "set", "target": ..., "name": ..., "value": ...}``: Write an attribute.
+- ``{"op": "call", "target": ..., "name": ..., "args": [...]}``: Call a method,
+  or the target itself if ``name`` is null.
+- ``{"op": "iter" | "len", "target": ...}`` and ``{"op": "item", "target": ..., "key": ...}``.
+
+A request ``{"id": ..., "fetch": path}`` streams a file in chunks instead,
+once the earlier requests of the connection ran. Only files in the folders
+the agent serves can be fetched.
+
+"""
+
+# Import built-in modules
+from enum import Enum
+import hmac
+import itertools
+import os
+import socketserver
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+# Import local modules
+from photoshop.api import backends
+from photoshop.remote import protocol
+from photoshop.sta import STAExecutor
+
+
+# The result of a `get` operation reading a method.
+_METHOD = object()
+
+
+def _is_method(value: Any) -> bool:
+    """bool: Whether a value read from an attribute is meant to be called, e.g. a method or a class."""
+    # Import local modules
+    from photoshop.api._core import Photoshop  # pylint: disable=import-outside-toplevel
+
+    if isinstance(value, type):
+        return not issubclass(value, Enum)
+    if isinstance(value, Photoshop) or isinstance(value, backends.dispatch_types):
+        return False
+    return callable(value)
+
+
+def _check_name(name: Any) -> str:
+    # Private attributes would give access to the Python objects behind the API.
+    if not isinstance(name, str) or name.startswith("_"):
+        raise AttributeError(f"Attribute {name!r} cannot be accessed remotely.")
+    return name
+
+
+class _Connection(socketserver.StreamRequestHandler):
+    """Serves the requests of one client, the objects sent to it are kept until it releases them."""
+
+    agent: "Agent"
+
+    def setup(self):
+        super().setup()
+        self.agent = self.server.agent
+        self.objects: Dict[int, Any] = {}
+        self.handles = itertools.count(1)
+        self.sessions: List[Any] = []
+        self.send_lock = threading.Lock()
+
+    def handle(self):
+        if not self._handshake():
+            return
+        try:
+            while True:
+                try:
+                    message, blobs = protocol.read_frame(self.rfile)
+                except (EOFError, OSError, protocol.ProtocolError):
+                    return
+                if "fetch" in message:
+                    # Wait for the earlier requests, e.g. the one saving the file.
+                    self.agent.executor.submit(int).result()
+                    self._fetch(message["id"], message["fetch"])
+                else:
+                    self.agent.executor.submit(self._run, message, blobs)
+        except RuntimeError:
+            # The agent was closed.
+            return
+        finally:
+            try:
+                self.agent.executor.submit(self._close).result()
+            except RuntimeError:
+                pass
+
+    def _handshake(self) -> bool:
+        try:
+            message, _ = protocol.read_frame(self.rfile)
+        except (EOFError, OSError, protocol.ProtocolError):
+            return False
+        token = self.agent.token
+        if message.get("hello") != protocol.PROTOCOL_VERSION:
+            self._send({"error": f"Protocol version {protocol.PROTOCOL_VERSION} required."})
+            return False
+        if token is not None and not hmac.compare_digest(str(message.get("token", "")), token):
+            self._send({"error": "Invalid token."})
+            return False
+        self._send({"hello": protocol.PROTOCOL_VERSION})
+        return True
+
+    def _send(self, message: Dict[str, Any], blobs: Sequence[bytes] = ()):
+        frame = protocol.pack_frame(message, blobs)
+        with self.send_lock:
+            try:
+                self.wfile.write(frame)
+            except OSError:
+                # The client disconnected, its objects are released once the reader notices.
+                pass
+
+    """
+    * Requests, run on the thread owning the Photoshop connection.
+    """
+
+    def _run(self, message: Dict[str, Any], blobs: List[bytes]):
+        for handle in message.get("release", ()):
+            self.objects.pop(handle, None)
+        results: List[Dict[str, Any]] = []
+        refs: List[Any] = []
+        out_blobs: List[bytes] = []
+        for op in message.get("ops", ()):
+            try:
+                value = self._apply(op, blobs, refs)
+                if value is _METHOD:
+                    result = {"value": {"$method": True}}
+                else:
+                    result = {"value": protocol.encode(value, out_blobs, self._encode_object)}
+            except Exception as err:  # pylint: disable=broad-except
+                results.append({"error": {"type": type(err).__name__, "message": str(err)}})
+                break
+            refs.append(value)
+            results.append(result)
+        self._send({"id": message["id"], "results": results}, out_blobs)
+
+    def _apply(self, op: Dict[str, Any], blobs: List[bytes], refs: List[Any]) -> Any:
+        def decode(value):
+            return protocol.decode(value, blobs, lambda obj: self._decode_object(obj, refs))
+
+        kind = op["op"]
+        if kind == "session":
+            # pylint: disable=import-outside-toplevel
+            # Import local modules
+            from photoshop.session import Session
+
+            session = Session(**decode(op.get("kwargs", {}))).__enter__()
+            self.sessions.append(session)
+            return session
+        target = decode(op["target"])
+        if kind == "exit":
+            self.sessions.remove(target)
+            return target.__exit__(None, None, None)
+        if kind == "get":
+            value = getattr(target, _check_name(op["name"]))
+            return _METHOD if _is_method(value) else value
+        if kind == "set":
+            return setattr(target, _check_name(op["name"]), decode(op["value"]))
+        if kind == "call":
+            func = target if op.get("name") is None else getattr(target, _check_name(op["name"]))
+            return func(*decode(op.get("args", [])))
+        if kind == "iter":
+            return list(target)
+        if kind == "len":
+            return len(target)
+        if kind == "item":
+            return target[decode(op["key"])]
+        raise protocol.ProtocolError(f"Unknown operation: {kind!r}")
+
+    def _encode_object(self, value: Any) -> Dict[str, Any]:
+        handle = next(self.handles)
+        self.objects[handle] = value
+        return {"$obj": handle, "type": type(value).__name__}
+
+    def _decode_object(self, value: Dict[str, Any], refs: List[Any]) -> Any:
+        if "$ref" in value:
+            return refs[value["$ref"]]
+        if "$obj" in value:
+            try:
+                return self.objects[value["$obj"]]
+            except KeyError:
+                raise protocol.ProtocolError(f"Unknown object handle: {value['$obj']}") from None
+        raise protocol.ProtocolError(f"Invalid value: {value!r}")
+
+    def _close(self):
+        """Exit the sessions the client left open and release its objects."""
+        for session in reversed(self.sessions):
+            try:
+                session.__exit__(None, None, None)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        self.sessions.clear()
+        self.objects.clear()
+
+    """
+    * Files
+    """
+
+    def _fetch(self, request_id: int, path: str):
+        try:
+            path = self.agent.check_path(path)
+            with open(path, "rb") as stream:
+                index = 0
+                while True:
+                    chunk = stream.read(self.agent.chunk_size)
+                    more = len(chunk) == self.agent.chunk_size
+                    self._send({"id": request_id, "chunk": index, "more": more}, [chunk])
+                    if not more:
+                        return
+                    index += 1
+        except Exception as err:  # pylint: disable=broad-except
+            self._send({"id": request_id, "error": {"type": type(err).__name__, "message": str(err)}})
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    agent: "Agent"
+
+
+class Agent:
+    """Hosts Photoshop sessions for the clients connecting to a TCP port.
+
+    Args:
+        host: The address to listen on. The protocol is not encrypted, listen on a private network only.
+        port: The port to listen on, 0 for any free port.
+        token: The secret clients must send before their first request, None to accept every client.
+        roots: The folders files can be fetched from.
+        chunk_size: Bytes sent per frame when streaming a file.
+
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = protocol.DEFAULT_PORT,
+        token: Optional[str] = None,
+        roots: Sequence[str] = (),
+        chunk_size: int = 1024 * 1024,
+    ):
+        self.token = token
+        self.roots = [os.path.realpath(root) for root in roots]
+        self.chunk_size = chunk_size
+        self.executor = STAExecutor(name="photoshop-agent")
+        self.server = _Server((host, port), _Connection)
+        self.server.agent = self
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self):
+        host, port = self.address
+        return f"<Agent {host}:{port}>"
+
+    def __enter__(self) -> "Agent":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def address(self):
+        """Tuple[str, int]: The address and port the agent listens on."""
+        return self.server.server_address[:2]
+
+    def serve_forever(self):
+        """Serve clients until `close` is called from another thread."""
+        self.server.serve_forever()
+
+    def start(self) -> "Agent":
+        """Serve clients from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="photoshop-agent-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """Stop serving and release the Photoshop connection."""
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+        self.executor.shutdown()
+
+    def check_path(self, path: str) -> str:
+        """Get the real path of a file clients may fetch.
+
+        Raises:
+            PermissionError: The file is not in one of `roots`.
+
+        """
+        real_path = os.path.realpath(path)
+        for root in self.roots:
+            if os.path.commonpath([real_path, root]) == root:
+                return real_path
+        raise PermissionError(f"The agent does not serve {path}.")
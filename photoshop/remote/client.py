@@ -0,0 +1,509 @@
+"""The client of an `Agent`, mirroring the objects it hosts.
+
+`Client.session` opens a `Session` in the agent and returns a `RemoteObject`
+for it. Reading an attribute of a remote object, writing one and calling a
+method each take one round trip; documents, layers and the other objects
+returned are remote objects again, numbers, strings, tuples and enumeration
+values are returned as they are. Method names are remembered per class, so
+calling a method a second time is a single round trip.
+
+Requests are pipelined: several threads can use one client at the same time.
+Inside ``with client.pipeline():`` the operations of the thread are not sent
+until the block exits, they are sent as one request and the results are
+available from the `RemotePromise` objects returned in the block.
+
+Examples:
+    ```python
+
+        from photoshop.remote import Client
+
+        with Client("render-box", token="...") as client, client.session(action="new_document") as ps:
+            doc = ps.active_document
+            with client.pipeline():
+                for index in range(20):
+                    layer = doc.artLayers.add()
+                    layer.name = f"Layer {index}"
+            doc.saveAs("C:/exports/doc.psd", ps.PhotoshopSaveOptions(), True)
+            data = client.fetch("C:/exports/doc.psd")
+    ```
+
+"""
+
+# Import built-in modules
+from collections import Counter
+from concurrent.futures import Future
+import itertools
+import queue
+import socket
+import threading
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Import local modules
+from photoshop.api.errors import PhotoshopPythonAPIError
+from photoshop.remote import protocol
+
+
+class RemoteError(PhotoshopPythonAPIError):
+    """An operation failed in the agent.
+
+    Attributes:
+        remote_type: The name of the exception class raised in the agent.
+
+    """
+
+    def __init__(self, message: str, remote_type: str = ""):
+        super().__init__(f"{remote_type}: {message}" if remote_type else message)
+        self.remote_type = remote_type
+
+
+def _remote_error(error: Dict[str, Any]) -> RemoteError:
+    return RemoteError(error.get("message", ""), error.get("type", ""))
+
+
+class _Stream:
+    """The chunks of a file being fetched, see `Client.stream`."""
+
+    def __init__(self):
+        self.chunks: "queue.SimpleQueue" = queue.SimpleQueue()
+
+
+class Client:
+    """A connection to an `Agent`.
+
+    Args:
+        host: The address of the agent.
+        port: The port of the agent.
+        token: The secret of the agent, if it has one.
+        timeout: Seconds to wait for the result of a request, None to wait as long as Photoshop takes.
+
+    Attributes:
+        stats: Number of ``requests`` and ``ops`` sent and of ``bytes`` received.
+
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = protocol.DEFAULT_PORT,
+        token: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.timeout = timeout
+        self.stats = Counter()
+        self._socket = socket.create_connection((host, port))
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Any] = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._released: List[int] = []
+        self._methods: Dict[str, set] = {}
+        self._local = threading.local()
+        self._closed = False
+        self._handshake(token)
+        self._thread = threading.Thread(target=self._read, name="photoshop-remote-client", daemon=True)
+        self._thread.start()
+
+    def __repr__(self):
+        host, port = self._socket.getpeername()[:2] if not self._closed else ("closed", "")
+        return f"<Client {host}:{port}>"
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the connection, the agent releases the objects of this client."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+        self._thread.join()
+
+    def session(self, **kwargs) -> "RemoteObject":
+        """Open a `Session` in the agent, the arguments are the ones of `Session`.
+
+        The session is exited at the end of a `with` block, or when the client closes.
+        """
+        return self.execute([{"op": "session", "kwargs": self._encode(kwargs, [])}])[0]
+
+    def pipeline(self) -> "Pipeline":
+        """Send the operations of this thread made in a `with` block as one request."""
+        return Pipeline(self)
+
+    def fetch(self, path: str, file: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Download a file from a folder the agent serves.
+
+        Args:
+            path: The path of the file on the agent.
+            file: A binary file to write the content to, the content is returned by default.
+
+        """
+        chunks = self.stream(path)
+        if file is None:
+            return b"".join(chunks)
+        for chunk in chunks:
+            file.write(chunk)
+        return None
+
+    def stream(self, path: str) -> Iterator[bytes]:
+        """Iterate over the chunks of a file the agent streams, see `fetch`."""
+        request_id = next(self._ids)
+        stream = _Stream()
+        with self._pending_lock:
+            self._pending[request_id] = stream
+        self._send({"id": request_id, "fetch": path})
+        return self._chunks(request_id, stream)
+
+    def _chunks(self, request_id: int, stream: _Stream) -> Iterator[bytes]:
+        try:
+            while True:
+                item = stream.chunks.get(timeout=self.timeout)
+                if isinstance(item, Exception):
+                    raise item
+                chunk, more = item
+                yield chunk
+                if not more:
+                    return
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+    """
+    * Requests
+    """
+
+    def submit(self, ops: List[Dict[str, Any]], blobs: List[bytes] = ()) -> Future:
+        """Send operations as one request without waiting for the results.
+
+        Returns:
+            The future of the results, decoded, with the errors as `RemoteError` objects.
+
+        """
+        request_id = next(self._ids)
+        future = Future()
+        with self._pending_lock:
+            if self._closed:
+                raise PhotoshopPythonAPIError("The client is closed.")
+            self._pending[request_id] = future
+            released, self._released = self._released, []
+        message = {"id": request_id, "ops": ops}
+        if released:
+            message["release"] = released
+        self.stats["requests"] += 1
+        self.stats["ops"] += len(ops)
+        self._send(message, blobs)
+        return future
+
+    def execute(self, ops: List[Dict[str, Any]], blobs: List[bytes] = ()) -> List[Any]:
+        """Send operations as one request and wait for the results.
+
+        Raises:
+            RemoteError: An operation failed.
+
+        """
+        results = self.submit(ops, blobs).result(self.timeout)
+        for result in results:
+            if isinstance(result, RemoteError):
+                raise result
+        if len(results) < len(ops):
+            raise RemoteError("The agent did not run every operation.")
+        return results
+
+    def _handshake(self, token: Optional[str]):
+        message = {"hello": protocol.PROTOCOL_VERSION}
+        if token is not None:
+            message["token"] = token
+        self._socket.sendall(protocol.pack_frame(message))
+        reply, _ = protocol.read_frame(self._reader)
+        if "error" in reply:
+            self._socket.close()
+            raise RemoteError(reply["error"], "ConnectionRefused")
+
+    def _send(self, message: Dict[str, Any], blobs: List[bytes] = ()):
+        frame = protocol.pack_frame(message, blobs)
+        with self._send_lock:
+            self._socket.sendall(frame)
+
+    def _read(self):
+        error: Exception = PhotoshopPythonAPIError("The connection to the agent was closed.")
+        try:
+            while True:
+                message, blobs = protocol.read_frame(self._reader)
+                self.stats["bytes"] += sum(len(blob) for blob in blobs)
+                with self._pending_lock:
+                    pending = self._pending.get(message.get("id"))
+                    if not isinstance(pending, _Stream):
+                        self._pending.pop(message.get("id"), None)
+                if isinstance(pending, _Stream):
+                    if "error" in message:
+                        pending.chunks.put(_remote_error(message["error"]))
+                    else:
+                        pending.chunks.put((blobs[0] if blobs else b"", message["more"]))
+                elif pending is not None:
+                    pending.set_result(self._decode_results(message, blobs))
+        except (EOFError, OSError, protocol.ProtocolError) as err:
+            if not self._closed:
+                error = PhotoshopPythonAPIError(f"The connection to the agent was lost: {err}")
+        finally:
+            self._closed = True
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            for item in pending.values():
+                if isinstance(item, _Stream):
+                    item.chunks.put(error)
+                else:
+                    item.set_exception(error)
+
+    def _decode_results(self, message: Dict[str, Any], blobs: List[bytes]) -> List[Any]:
+        results = []
+        for result in message["results"]:
+            if "error" in result:
+                results.append(_remote_error(result["error"]))
+            elif result["value"] == {"$method": True}:
+                results.append(_METHOD)
+            else:
+                results.append(protocol.decode(result["value"], blobs, self._decode_object))
+        return results
+
+    def _decode_object(self, value: Dict[str, Any]) -> "RemoteObject":
+        if "$obj" not in value:
+            raise protocol.ProtocolError(f"Invalid value: {value!r}")
+        return RemoteObject(self, value["$obj"], value.get("type", ""))
+
+    def _encode(self, value: Any, blobs: List[bytes]) -> Any:
+        return protocol.encode(value, blobs, self._encode_object)
+
+    @staticmethod
+    def _encode_object(value: Any) -> Dict[str, Any]:
+        if isinstance(value, RemoteObject):
+            return {"$obj": value._handle}
+        if isinstance(value, RemotePromise):
+            return value._reference()
+        raise TypeError(f"Cannot send {value!r} to the agent.")
+
+    def _pipeline(self) -> Optional["Pipeline"]:
+        return getattr(self._local, "pipeline", None)
+
+    def _operation(self, op: str, target: Any, **fields) -> Any:
+        """Run one operation on a remote object, or record it in the pipeline of this thread."""
+        pipeline = self._pipeline()
+        if pipeline is not None:
+            return pipeline.record(op, target, **fields)
+        blobs: List[bytes] = []
+        message = {"op": op, "target": self._encode(target, blobs)}
+        for key, value in fields.items():
+            message[key] = self._encode(value, blobs)
+        return self.execute([message], blobs)[0]
+
+
+# The result of reading a method, see `RemoteObject.__getattr__`.
+_METHOD = object()
+
+
+class RemoteObject:
+    """An object hosted by the agent, e.g. a `Document` or an `ArtLayer`.
+
+    Attributes are read, written and called in the agent.
+    """
+
+    __slots__ = ("_client", "_handle", "_type", "__weakref__")
+
+    def __init__(self, client: Client, handle: int, typename: str):
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_handle", handle)
+        object.__setattr__(self, "_type", typename)
+
+    def __repr__(self):
+        return f"<RemoteObject {self._type} #{self._handle}>"
+
+    def __del__(self):
+        # Sent with the next request.
+        self._client._released.append(self._handle)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        client = self._client
+        if name in client._methods.get(self._type, ()):
+            return RemoteMethod(self, name)
+        value = client._operation("get", self, name=name)
+        if value is _METHOD:
+            client._methods.setdefault(self._type, set()).add(name)
+            return RemoteMethod(self, name)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        self._client._operation("set", self, name=name, value=value)
+
+    def __call__(self, *args) -> Any:
+        return self._client._operation("call", self, name=None, args=list(args))
+
+    def __iter__(self):
+        return iter(self._client._operation("iter", self))
+
+    def __len__(self) -> int:
+        return self._client._operation("len", self)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._client._operation("item", self, key=key)
+
+    def __enter__(self) -> "RemoteObject":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._client.execute([{"op": "exit", "target": {"$obj": self._handle}}])
+
+
+class RemoteMethod:
+    """A method of a remote object, called in the agent."""
+
+    __slots__ = ("target", "name")
+
+    def __init__(self, target: RemoteObject, name: str):
+        self.target = target
+        self.name = name
+
+    def __repr__(self):
+        return f"<RemoteMethod {self.target._type}.{self.name}>"
+
+    def __call__(self, *args) -> Any:
+        return self.target._client._operation("call", self.target, name=self.name, args=list(args))
+
+
+_PENDING = object()
+
+
+class RemotePromise:
+    """The result of an operation recorded in a `Pipeline`, and a proxy recording the uses of that result.
+
+    Reading an attribute records a read, calling the promise turns that read
+    into a method call and assigning an attribute records a write. Use
+    `result` once the pipeline was sent.
+    """
+
+    __slots__ = ("_pipeline", "_index", "_value")
+
+    def __init__(self, pipeline: "Pipeline", index: int):
+        object.__setattr__(self, "_pipeline", pipeline)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_value", _PENDING)
+
+    def __repr__(self):
+        return f"<RemotePromise #{self._index} {'pending' if self._value is _PENDING else 'done'}>"
+
+    def __getattr__(self, name: str) -> "RemotePromise":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._pipeline.record("get", self, name=name)
+
+    def __setattr__(self, name: str, value: Any):
+        self._pipeline.record("set", self, name=name, value=value)
+
+    def __call__(self, *args) -> "RemotePromise":
+        op = self._pipeline._ops[self._index]
+        if op["op"] != "get" or self._pipeline._sent:
+            raise TypeError(f"{self!r} is not a method.")
+        op["op"], op["args"] = "call", list(args)
+        return self
+
+    def __iter__(self):
+        raise TypeError("Collections cannot be iterated in a pipeline.")
+
+    def result(self) -> Any:
+        """The value read or returned.
+
+        Raises:
+            RemoteError: The operation failed, or did not run because an earlier one failed.
+
+        """
+        if self._value is _PENDING:
+            raise PhotoshopPythonAPIError("The pipeline was not sent yet.")
+        if isinstance(self._value, RemoteError):
+            raise self._value
+        return self._value
+
+    def _reference(self) -> Dict[str, Any]:
+        if self._pipeline._sent:
+            value = self.result()
+            if isinstance(value, RemoteObject):
+                return {"$obj": value._handle}
+            raise TypeError(f"Cannot use {value!r} as an object.")
+        return {"$ref": self._index}
+
+    def _resolve(self, value: Any):
+        object.__setattr__(self, "_value", value)
+
+
+class Pipeline:
+    """Operations of one thread sent as one request, see `Client.pipeline`."""
+
+    def __init__(self, client: Client):
+        self.client = client
+        self.promises: List[RemotePromise] = []
+        self._ops: List[Dict[str, Any]] = []
+        self._values: List[Tuple[str, Any]] = []
+        self._sent = False
+
+    def __enter__(self) -> "Pipeline":
+        if self.client._pipeline() is not None:
+            raise PhotoshopPythonAPIError("Pipelines cannot be nested.")
+        self.client._local.pipeline = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.client._local.pipeline = None
+        if exc_type is None:
+            self.send()
+
+    def __len__(self):
+        return len(self._ops)
+
+    def record(self, op: str, target: Any, **fields) -> RemotePromise:
+        """Record an operation, its values are encoded when the pipeline is sent."""
+        if self._sent:
+            raise PhotoshopPythonAPIError("The pipeline was already sent.")
+        promise = RemotePromise(self, len(self._ops))
+        self._ops.append({"op": op, "target": target, **fields})
+        self.promises.append(promise)
+        return promise
+
+    def send(self):
+        """Send the recorded operations and resolve their promises.
+
+        Raises:
+            RemoteError: An operation failed, the later ones did not run.
+
+        """
+        if self._sent:
+            return
+        blobs: List[bytes] = []
+        ops = []
+        for op in self._ops:
+            ops.append({key: value if key == "op" else self.client._encode(value, blobs) for key, value in op.items()})
+        self._sent = True
+        if not ops:
+            return
+        results = self.client.submit(ops, blobs).result(self.client.timeout)
+        skipped = RemoteError("Not executed, an earlier operation of the pipeline failed.")
+        for index, promise in enumerate(self.promises):
+            value = results[index] if index < len(results) else skipped
+            if value is _METHOD:
+                value = RemoteError("The attribute is a method, call it in the pipeline to use it.")
+            promise._resolve(value)
+        for result in results:
+            if isinstance(result, RemoteError):
+                raise result
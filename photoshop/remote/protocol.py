@@ -0,0 +1,148 @@
+"""The frames and values exchanged by the agent and its clients.
+
+A frame is a header of two unsigned 32 bit big endian integers, the sizes of
+a JSON message and of the binary data following it. The ``blobs`` entry of the
+message lists the sizes of the byte strings the binary data is split into.
+
+Values are JSON, with the types JSON cannot express tagged by a dict of one
+``$`` key: ``$tuple``, ``$dict``, ``$bin`` (the index of a blob), ``$enum`` and
+``$enumtype`` (members and classes of `photoshop.api.enumerations`). Objects
+living in the agent are sent as ``{"$obj": handle, "type": class name}``.
+
+"""
+
+# Import built-in modules
+from enum import Enum
+import json
+import struct
+from typing import Any
+from typing import BinaryIO
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+# Import local modules
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+PROTOCOL_VERSION = 1
+
+DEFAULT_PORT = 7010
+
+# Frames larger than this are rejected, stream files with `fetch` instead.
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+_HEADER = struct.Struct("!II")
+
+
+class ProtocolError(PhotoshopPythonAPIError):
+    """A peer sent a frame that is not valid."""
+
+
+def pack_frame(message: Dict[str, Any], blobs: Sequence[bytes] = ()) -> bytes:
+    """Serialize a message and the byte strings its values refer to."""
+    if blobs:
+        message = dict(message, blobs=[len(blob) for blob in blobs])
+    data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return b"".join((_HEADER.pack(len(data), sum(len(blob) for blob in blobs)), data, *blobs))
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) < size:
+        raise EOFError("The connection was closed.")
+    return data
+
+
+def read_frame(stream: BinaryIO) -> Tuple[Dict[str, Any], List[bytes]]:
+    """Read the next frame of a buffered stream.
+
+    Raises:
+        EOFError: The peer closed the connection.
+        ProtocolError: The frame is too large or not valid.
+
+    """
+    size, binary_size = _HEADER.unpack(_read_exactly(stream, _HEADER.size))
+    if size + binary_size > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame of {size + binary_size} bytes exceeds the limit.")
+    try:
+        message = json.loads(_read_exactly(stream, size))
+    except ValueError as err:
+        raise ProtocolError(f"Invalid message: {err}") from err
+    data = _read_exactly(stream, binary_size) if binary_size else b""
+    blobs, start = [], 0
+    for length in message.get("blobs", ()):
+        end = start + length
+        blobs.append(data[start:end])
+        start = end
+    return message, blobs
+
+
+def _enumerations():
+    # Import local modules
+    from photoshop.api import enumerations  # pylint: disable=import-outside-toplevel
+
+    return enumerations
+
+
+def _enumeration(name: str) -> type:
+    enumeration = getattr(_enumerations(), name, None)
+    if not isinstance(enumeration, type) or not issubclass(enumeration, Enum):
+        raise ProtocolError(f"Unknown enumeration: {name!r}")
+    return enumeration
+
+
+def encode(value: Any, blobs: List[bytes], encode_object: Callable[[Any], Dict[str, Any]]) -> Any:
+    """Convert a value to its JSON form, appending byte strings to `blobs`.
+
+    Args:
+        value: The value.
+        blobs: The byte strings of the frame.
+        encode_object: Converts the values that are not data, e.g. Photoshop objects.
+
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, Enum):
+        if type(value).__module__ == _enumerations().__name__:
+            return {"$enum": type(value).__name__, "value": value.value}
+        return value.value
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        blobs.append(bytes(value))
+        return {"$bin": len(blobs) - 1}
+    if isinstance(value, list):
+        return [encode(item, blobs, encode_object) for item in value]
+    if isinstance(value, tuple):
+        return {"$tuple": [encode(item, blobs, encode_object) for item in value]}
+    if isinstance(value, dict):
+        return {
+            "$dict": [
+                [encode(key, blobs, encode_object), encode(item, blobs, encode_object)] for key, item in value.items()
+            ]
+        }
+    if isinstance(value, type) and issubclass(value, Enum) and value.__module__ == _enumerations().__name__:
+        return {"$enumtype": value.__name__}
+    return encode_object(value)
+
+
+def decode(value: Any, blobs: List[bytes], decode_object: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Convert a value from its JSON form, see `encode`."""
+    if isinstance(value, list):
+        return [decode(item, blobs, decode_object) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "$tuple" in value:
+        return tuple(decode(item, blobs, decode_object) for item in value["$tuple"])
+    if "$dict" in value:
+        return {decode(key, blobs, decode_object): decode(item, blobs, decode_object) for key, item in value["$dict"]}
+    if "$bin" in value:
+        return blobs[value["$bin"]]
+    if "$enum" in value:
+        return _enumeration(value["$enum"])(value["value"])
+    if "$enumtype" in value:
+        return _enumeration(value["$enumtype"])
+    return decode_object(value)
@@ -27,36 +27,44 @@ with Session(action="new_document") as ps:
 """
 
 # Import built-in modules
+from logging import getLogger
+import os
 from typing import Any
+from typing import Optional
+from typing import TYPE_CHECKING
 
 # Import local modules
-from photoshop.api import ActionDescriptor
-from photoshop.api import ActionList
-from photoshop.api import ActionReference
-from photoshop.api import Application
-from photoshop.api import BMPSaveOptions
-from photoshop.api import BatchOptions
-from photoshop.api import CMYKColor
-from photoshop.api import EPSSaveOptions
-from photoshop.api import EventID
-from photoshop.api import ExportOptionsSaveForWeb
-from photoshop.api import GIFSaveOptions
-from photoshop.api import GrayColor
-from photoshop.api import HSBColor
-from photoshop.api import JPEGSaveOptions
-from photoshop.api import LabColor
-from photoshop.api import PDFSaveOptions
-from photoshop.api import PNGSaveOptions
-from photoshop.api import PhotoshopSaveOptions
-from photoshop.api import RGBColor
-from photoshop.api import SolidColor
-from photoshop.api import TargaSaveOptions
-from photoshop.api import TextItem
-from photoshop.api import TiffSaveOptions
-from photoshop.api import enumerations
+from photoshop import api
 from photoshop.api import errors
 
 
+if TYPE_CHECKING:
+    # Import local modules
+    from photoshop.api import ActionDescriptor
+    from photoshop.api import ActionList
+    from photoshop.api import ActionReference
+    from photoshop.api import Application
+    from photoshop.api._batch import Batch
+
+
+class _ApiName:
+    """A class attribute resolving the `photoshop.api` name of the same name on first access.
+
+    The resolved value replaces the descriptor, so the API modules are only
+    imported once a session uses them and later accesses are plain class
+    attribute reads.
+    """
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        value = getattr(api, self.name)
+        setattr(self.owner, self.name, value)
+        return value
+
+
 # pylint: disable=too-many-arguments
 class Session:
     """Session of photoshop.
@@ -70,6 +78,162 @@ class Session:
 
     """
 
+    EventID = _ApiName()
+    SolidColor = _ApiName()
+    TextItem = _ApiName()
+    BatchOptions = _ApiName()
+
+    # The save options.
+    GIFSaveOptions = _ApiName()
+    JPEGSaveOptions = _ApiName()
+    PDFSaveOptions = _ApiName()
+    EPSSaveOptions = _ApiName()
+    PNGSaveOptions = _ApiName()
+    PhotoshopSaveOptions = _ApiName()
+    ExportOptionsSaveForWeb = _ApiName()
+    BMPSaveOptions = _ApiName()
+    TiffSaveOptions = _ApiName()
+    TargaSaveOptions = _ApiName()
+
+    # The colors.
+    LabColor = _ApiName()
+    HSBColor = _ApiName()
+    CMYKColor = _ApiName()
+    RGBColor = _ApiName()
+    GrayColor = _ApiName()
+
+    # From enumerations
+    LensType = _ApiName()
+    AdjustmentReference = _ApiName()
+    AnchorPosition = _ApiName()
+    AntiAlias = _ApiName()
+    AutoKernType = _ApiName()
+    BMPDepthType = _ApiName()
+    BatchDestinationType = _ApiName()
+    BitmapConversionType = _ApiName()
+    BitmapHalfToneType = _ApiName()
+    BitsPerChannelType = _ApiName()
+    BlendMode = _ApiName()
+    ByteOrderType = _ApiName()
+    CameraRAWSettingsType = _ApiName()
+    CameraRAWSize = _ApiName()
+    Case = _ApiName()
+    ChangeMode = _ApiName()
+    ChannelType = _ApiName()
+    ColorBlendMode = _ApiName()
+    ColorModel = _ApiName()
+    ColorPicker = _ApiName()
+    ColorProfileType = _ApiName()
+    ColorReductionType = _ApiName()
+    ColorSpaceType = _ApiName()
+    CopyrightedType = _ApiName()
+    CreateFields = _ApiName()
+    CropToType = _ApiName()
+    DCSType = _ApiName()
+    DepthMaource = _ApiName()
+    DescValueType = _ApiName()
+    DialogModes = _ApiName()
+    Direction = _ApiName()
+    DisplacementMapType = _ApiName()
+    DitherType = _ApiName()
+    DocumentFill = _ApiName()
+    DocumentMode = _ApiName()
+    EditLogItemsType = _ApiName()
+    ElementPlacement = _ApiName()
+    EliminateFields = _ApiName()
+    ExportType = _ApiName()
+    ExtensionType = _ApiName()
+    FileNamingType = _ApiName()
+    FontPreviewType = _ApiName()
+    ForcedColors = _ApiName()
+    FormatOptionsType = _ApiName()
+    GalleryConstrainType = _ApiName()
+    GalleryFontType = _ApiName()
+    GallerySecurityTextColorType = _ApiName()
+    GallerySecurityTextPositionType = _ApiName()
+    GallerySecurityTextRotateType = _ApiName()
+    GallerySecurityType = _ApiName()
+    GalleryThumbSizeType = _ApiName()
+    Geometry = _ApiName()
+    GridLineStyle = _ApiName()
+    GridSize = _ApiName()
+    GuideLineStyle = _ApiName()
+    IllustratorPathType = _ApiName()
+    Intent = _ApiName()
+    JavaScriptExecutionMode = _ApiName()
+    Justification = _ApiName()
+    Language = _ApiName()
+    LayerCompressionType = _ApiName()
+    LayerKind = _ApiName()
+    LayerType = _ApiName()
+    MagnificationType = _ApiName()
+    MatteType = _ApiName()
+    MeasurementRange = _ApiName()
+    MeasurementSource = _ApiName()
+    NewDocumentMode = _ApiName()
+    NoiseDistribution = _ApiName()
+    OffsetUndefinedAreas = _ApiName()
+    OpenDocumentMode = _ApiName()
+    OpenDocumentType = _ApiName()
+    OperatingSystem = _ApiName()
+    Orientation = _ApiName()
+    OtherPaintingCursors = _ApiName()
+    PDFCompatibilityType = _ApiName()
+    PDFEncodingType = _ApiName()
+    PDFResampleType = _ApiName()
+    PDFStandardType = _ApiName()
+    PICTBitsPerPixel = _ApiName()
+    PICTCompression = _ApiName()
+    PaintingCursors = _ApiName()
+    PaletteType = _ApiName()
+    PathKind = _ApiName()
+    PhotoCDColorSpace = _ApiName()
+    PhotoCDSize = _ApiName()
+    PicturePackageTextType = _ApiName()
+    PointKind = _ApiName()
+    PointType = _ApiName()
+    PolarConversionType = _ApiName()
+    PreviewType = _ApiName()
+    PurgeTarget = _ApiName()
+    QueryStateType = _ApiName()
+    RadialBlurMethod = _ApiName()
+    RadialBlurBest = _ApiName()
+    RasterizeType = _ApiName()
+    ReferenceFormType = _ApiName()
+    ResampleMethod = _ApiName()
+    ResetTarget = _ApiName()
+    RippleSize = _ApiName()
+    SaveBehavior = _ApiName()
+    SaveDocumentType = _ApiName()
+    SaveEncoding = _ApiName()
+    SaveLogItemsType = _ApiName()
+    SaveOptions = _ApiName()
+    SelectionType = _ApiName()
+    ShapeOperation = _ApiName()
+    SmartBlurMode = _ApiName()
+    SmartBlurQuality = _ApiName()
+    SourceSpaceType = _ApiName()
+    SpherizeMode = _ApiName()
+    StrikeThruType = _ApiName()
+    StrokeLocation = _ApiName()
+    TargaBitsPerPixels = _ApiName()
+    TextComposer = _ApiName()
+    TextType = _ApiName()
+    TextureType = _ApiName()
+    TiffEncodingType = _ApiName()
+    ToolType = _ApiName()
+    TransitionType = _ApiName()
+    TrimType = _ApiName()
+    TypeUnits = _ApiName()
+    UndefinedAreas = _ApiName()
+    UnderlineType = _ApiName()
+    Units = _ApiName()
+    Urgency = _ApiName()
+    Wartyle = _ApiName()
+    WaveType = _ApiName()
+    WhiteBalanceType = _ApiName()
+    ZigZagType = _ApiName()
+
     def __init__(
         self,
         file_path: str = None,
@@ -77,6 +241,7 @@ class Session:
         callback: Any = None,
         auto_close: bool = False,
         ps_version: str = None,
+        profile: Optional[bool] = None,
     ):
         """Session of Photoshop.
 
@@ -112,6 +277,9 @@ class Session:
                     - 2022
                     - 2021
                     - cs6
+            profile: Record the calls made to Photoshop and log a report to the ``photoshop`` logger at INFO
+                level when exiting the session, see `photoshop.api.profiler`. Enabled by the ``PS_PROFILE``
+                environment variable by default.
 
         """
         super().__init__()
@@ -122,165 +290,20 @@ class Session:
         self._action = action
         self._active_document = None
 
-        self.app: Application = Application(version=ps_version)
-        self.ActionReference: ActionReference = ActionReference()
-        self.ActionDescriptor: ActionDescriptor = ActionDescriptor()
-        self.ActionList: ActionList = ActionList()
-        self.EventID = EventID
-        self.SolidColor = SolidColor
-        self.TextItem = TextItem
-        self.BatchOptions = BatchOptions
-
-        # The save options.
-        self.GIFSaveOptions = GIFSaveOptions
-        self.JPEGSaveOptions = JPEGSaveOptions
-        self.PDFSaveOptions = PDFSaveOptions
-        self.EPSSaveOptions = EPSSaveOptions
-        self.PNGSaveOptions = PNGSaveOptions
-        self.PhotoshopSaveOptions = PhotoshopSaveOptions
-        self.ExportOptionsSaveForWeb = ExportOptionsSaveForWeb
-        self.BMPSaveOptions = BMPSaveOptions
-        self.TiffSaveOptions = TiffSaveOptions
-        self.TargaSaveOptions = TargaSaveOptions
-
-        # The colors.
-        self.LabColor = LabColor
-        self.HSBColor = HSBColor
-        self.CMYKColor = CMYKColor
-        self.RGBColor = RGBColor
-        self.GrayColor = GrayColor
-
-        # From enumerations
-        self.LensType = enumerations.LensType
-        self.AdjustmentReference = enumerations.AdjustmentReference
-        self.AnchorPosition = enumerations.AnchorPosition
-        self.AntiAlias = enumerations.AntiAlias
-        self.AutoKernType = enumerations.AutoKernType
-        self.BMPDepthType = enumerations.BMPDepthType
-        self.BatchDestinationType = enumerations.BatchDestinationType
-        self.BitmapConversionType = enumerations.BitmapConversionType
-        self.BitmapHalfToneType = enumerations.BitmapHalfToneType
-        self.BitsPerChannelType = enumerations.BitsPerChannelType
-        self.BlendMode = enumerations.BlendMode
-        self.ByteOrderType = enumerations.ByteOrderType
-        self.CameraRAWSettingsType = enumerations.CameraRAWSettingsType
-        self.CameraRAWSize = enumerations.CameraRAWSize
-        self.Case = enumerations.Case
-        self.ChangeMode = enumerations.ChangeMode
-        self.ChannelType = enumerations.ChannelType
-        self.ColorBlendMode = enumerations.ColorBlendMode
-        self.ColorModel = enumerations.ColorModel
-        self.ColorPicker = enumerations.ColorPicker
-        self.ColorProfileType = enumerations.ColorProfileType
-        self.ColorReductionType = enumerations.ColorReductionType
-        self.ColorSpaceType = enumerations.ColorSpaceType
-        self.CopyrightedType = enumerations.CopyrightedType
-        self.CreateFields = enumerations.CreateFields
-        self.CropToType = enumerations.CropToType
-        self.DCSType = enumerations.DCSType
-        self.DepthMaource = enumerations.DepthMaource
-        self.DescValueType = enumerations.DescValueType
-        self.DialogModes = enumerations.DialogModes
-        self.Direction = enumerations.Direction
-        self.DisplacementMapType = enumerations.DisplacementMapType
-        self.DitherType = enumerations.DitherType
-        self.DocumentFill = enumerations.DocumentFill
-        self.DocumentMode = enumerations.DocumentMode
-        self.EditLogItemsType = enumerations.EditLogItemsType
-        self.ElementPlacement = enumerations.ElementPlacement
-        self.EliminateFields = enumerations.EliminateFields
-        self.ExportType = enumerations.ExportType
-        self.ExtensionType = enumerations.ExtensionType
-        self.FileNamingType = enumerations.FileNamingType
-        self.FontPreviewType = enumerations.FontPreviewType
-        self.ForcedColors = enumerations.ForcedColors
-        self.FormatOptionsType = enumerations.FormatOptionsType
-        self.GalleryConstrainType = enumerations.GalleryConstrainType
-        self.GalleryFontType = enumerations.GalleryFontType
-        self.GallerySecurityTextColorType = enumerations.GallerySecurityTextColorType
-        self.GallerySecurityTextPositionType = enumerations.GallerySecurityTextPositionType
-        self.GallerySecurityTextRotateType = enumerations.GallerySecurityTextRotateType
-        self.GallerySecurityType = enumerations.GallerySecurityType
-        self.GalleryThumbSizeType = enumerations.GalleryThumbSizeType
-        self.Geometry = enumerations.Geometry
-        self.GridLineStyle = enumerations.GridLineStyle
-        self.GridSize = enumerations.GridSize
-        self.GuideLineStyle = enumerations.GuideLineStyle
-        self.IllustratorPathType = enumerations.IllustratorPathType
-        self.Intent = enumerations.Intent
-        self.JavaScriptExecutionMode = enumerations.JavaScriptExecutionMode
-        self.Justification = enumerations.Justification
-        self.Language = enumerations.Language
-        self.LayerCompressionType = enumerations.LayerCompressionType
-        self.LayerKind = enumerations.LayerKind
-        self.LayerType = enumerations.LayerType
-        self.MagnificationType = enumerations.MagnificationType
-        self.MatteType = enumerations.MatteType
-        self.MeasurementRange = enumerations.MeasurementRange
-        self.MeasurementSource = enumerations.MeasurementSource
-        self.NewDocumentMode = enumerations.NewDocumentMode
-        self.NoiseDistribution = enumerations.NoiseDistribution
-        self.OffsetUndefinedAreas = enumerations.OffsetUndefinedAreas
-        self.OpenDocumentMode = enumerations.OpenDocumentMode
-        self.OpenDocumentType = enumerations.OpenDocumentType
-        self.OperatingSystem = enumerations.OperatingSystem
-        self.Orientation = enumerations.Orientation
-        self.OtherPaintingCursors = enumerations.OtherPaintingCursors
-        self.PDFCompatibilityType = enumerations.PDFCompatibilityType
-        self.PDFEncodingType = enumerations.PDFEncodingType
-        self.PDFResampleType = enumerations.PDFResampleType
-        self.PDFStandardType = enumerations.PDFStandardType
-        self.PICTBitsPerPixel = enumerations.PICTBitsPerPixel
-        self.PICTCompression = enumerations.PICTCompression
-        self.PaintingCursors = enumerations.PaintingCursors
-        self.PaletteType = enumerations.PaletteType
-        self.PathKind = enumerations.PathKind
-        self.PhotoCDColorSpace = enumerations.PhotoCDColorSpace
-        self.PhotoCDSize = enumerations.PhotoCDSize
-        self.PicturePackageTextType = enumerations.PicturePackageTextType
-        self.PointKind = enumerations.PointKind
-        self.PointType = enumerations.PointType
-        self.PolarConversionType = enumerations.PolarConversionType
-        self.PreviewType = enumerations.PreviewType
-        self.PurgeTarget = enumerations.PurgeTarget
-        self.QueryStateType = enumerations.QueryStateType
-        self.RadialBlurMethod = enumerations.RadialBlurMethod
-        self.RadialBlurBest = enumerations.RadialBlurBest
-        self.RasterizeType = enumerations.RasterizeType
-        self.ReferenceFormType = enumerations.ReferenceFormType
-        self.ResampleMethod = enumerations.ResampleMethod
-        self.ResetTarget = enumerations.ResetTarget
-        self.RippleSize = enumerations.RippleSize
-        self.SaveBehavior = enumerations.SaveBehavior
-        self.SaveDocumentType = enumerations.SaveDocumentType
-        self.SaveEncoding = enumerations.SaveEncoding
-        self.SaveLogItemsType = enumerations.SaveLogItemsType
-        self.SaveOptions = enumerations.SaveOptions
-        self.SelectionType = enumerations.SelectionType
-        self.ShapeOperation = enumerations.ShapeOperation
-        self.SmartBlurMode = enumerations.SmartBlurMode
-        self.SmartBlurQuality = enumerations.SmartBlurQuality
-        self.SourceSpaceType = enumerations.SourceSpaceType
-        self.SpherizeMode = enumerations.SpherizeMode
-        self.StrikeThruType = enumerations.StrikeThruType
-        self.StrokeLocation = enumerations.StrokeLocation
-        self.TargaBitsPerPixels = enumerations.TargaBitsPerPixels
-        self.TextComposer = enumerations.TextComposer
-        self.TextType = enumerations.TextType
-        self.TextureType = enumerations.TextureType
-        self.TiffEncodingType = enumerations.TiffEncodingType
-        self.ToolType = enumerations.ToolType
-        self.TransitionType = enumerations.TransitionType
-        self.TrimType = enumerations.TrimType
-        self.TypeUnits = enumerations.TypeUnits
-        self.UndefinedAreas = enumerations.UndefinedAreas
-        self.UnderlineType = enumerations.UnderlineType
-        self.Units = enumerations.Units
-        self.Urgency = enumerations.Urgency
-        self.Wartyle = enumerations.Wartyle
-        self.WaveType = enumerations.WaveType
-        self.WhiteBalanceType = enumerations.WhiteBalanceType
-        self.ZigZagType = enumerations.ZigZagType
+        # Import local modules
+        from photoshop.api import profiler
+
+        if profile is None:
+            profile = os.getenv(profiler.ENV_NAME, "False").lower() in ["y", "t", "on", "yes", "true", "1"]
+        self._profiler = profiler.get_profiler()
+        self._owns_profiler = bool(profile) and self._profiler is None
+        if self._owns_profiler:
+            self._profiler = profiler.enable()
+
+        self.app: "Application" = api.Application(version=ps_version)
+        self.ActionReference: "ActionReference" = api.ActionReference()
+        self.ActionDescriptor: "ActionDescriptor" = api.ActionDescriptor()
+        self.ActionList: "ActionList" = api.ActionList()
 
     @property
     def active_document(self):
@@ -316,6 +339,27 @@ class Session:
         """Set active document."""
         self._active_document = active_document
 
+    def batch(self) -> "Batch":
+        """Record the changes made in a `with` block and apply them with a single `doJavaScript` call.
+
+        Examples:
+            ```python
+
+                with Session(action="new_document") as ps:
+                    with ps.batch():
+                        for index in range(10):
+                            layer = ps.active_document.artLayers.add()
+                            layer.name = f"Layer {index}"
+            ```
+
+        See `photoshop.api._batch` for what can be recorded.
+
+        """
+        # Import local modules
+        from photoshop.api._batch import Batch
+
+        return Batch(self.app)
+
     def _action_open(self):
         self.active_document = self.app.open(self.path)
 
@@ -349,3 +393,14 @@ class Session:
             raise errors.PhotoshopPythonAPIError(err)
         finally:
             self.close()
+            self._report_profile()
+
+    def _report_profile(self):
+        """Log the calls recorded while the session was open, when the session enabled the profiler."""
+        if not self._owns_profiler:
+            return
+        # Import local modules
+        from photoshop.api import profiler
+
+        getLogger("photoshop").info(self._profiler.report())
+        profiler.disable()
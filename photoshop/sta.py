@@ -0,0 +1,283 @@
+"""Share one Photoshop connection between threads through a single-threaded apartment.
+
+COM objects belong to the apartment of the thread that created them, a
+`Session` created in one thread cannot be used from another one. An
+`STAExecutor` owns a worker thread that enters a single-threaded apartment and
+creates and uses every Photoshop object. Other threads submit calls to its
+queue and get futures back; while Photoshop runs one call the next ones are
+already queued, so it never waits for a caller to connect.
+
+Objects returned through `STAExecutor.call` and `STAExecutor.session` are
+wrapped in an `STAProxy`, which forwards attribute reads, writes, calls and
+iteration to the worker thread. Objects created by functions passed to
+`submit` must only be used by functions running on the worker thread.
+
+Examples:
+    ```python
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        from photoshop.sta import STAExecutor
+
+        with STAExecutor() as sta, sta.session(action="new_document") as ps:
+            doc = ps.active_document
+
+            def add_layer(index):
+                layer = doc.artLayers.add()
+                layer.name = f"Layer {index}"
+
+            with ThreadPoolExecutor(8) as pool:
+                list(pool.map(add_layer, range(20)))
+    ```
+
+"""
+
+# Import built-in modules
+from concurrent.futures import BrokenExecutor
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from enum import Enum
+import operator
+import queue
+import threading
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+
+# Import local modules
+from photoshop.api import backends
+
+
+# Results of these types are returned as they are, other objects are wrapped in an `STAProxy`.
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, bytearray, Enum)
+
+
+def _drop(*objects: Any):
+    """Release the last references to objects on the worker thread, see `STAProxy.__del__`."""
+
+
+class STAExecutor(Executor):
+    """Runs every call on one worker thread owning the Photoshop connection.
+
+    The worker thread prepares itself with `Backend.initialize_thread` of the
+    current backend, which enters a single-threaded apartment for COM.
+
+    Args:
+        initializer: Called on the worker thread before the first call.
+        initargs: The arguments of `initializer`.
+        name: The name of the worker thread.
+
+    """
+
+    def __init__(
+        self,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        name: str = "photoshop-sta",
+    ):
+        self._initializer = initializer
+        self._initargs = initargs
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Reentrant, `STAProxy.__del__` may run on a thread already holding it, during garbage collection.
+        self._shutdown_lock = threading.RLock()
+        self._shutdown = False
+        self._broken: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self._work, name=name, daemon=True)
+        self.thread.start()
+
+    def __repr__(self):
+        state = "broken" if self._broken else "shut down" if self._shutdown else "running"
+        return f"<STAExecutor {self.thread.name} {state}>"
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run a function on the worker thread.
+
+        `STAProxy` arguments are replaced by the objects they wrap.
+
+        Returns:
+            The future of the value the function returns, unwrapped.
+
+        """
+        with self._shutdown_lock:
+            if self._broken is not None:
+                raise BrokenExecutor(f"The worker thread failed to start: {self._broken}")
+            if self._shutdown:
+                raise RuntimeError("Cannot schedule new calls after shutdown.")
+            future = Future()
+            self._queue.put((future, fn, _unwrap(args), _unwrap(kwargs)))
+        return future
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a function on the worker thread and wait for the value it returns.
+
+        Calls made from the worker thread itself run immediately.
+
+        Returns:
+            The value, objects other than numbers, strings and enumeration values wrapped in an `STAProxy`.
+
+        """
+        if threading.get_ident() == self.thread.ident:
+            return self._wrap(fn(*_unwrap(args), **_unwrap(kwargs)))
+        return self._wrap(self.submit(fn, *args, **kwargs).result())
+
+    def session(self, *args, **kwargs) -> "STAProxy":
+        """Create a `Session` on the worker thread, the arguments are the ones of `Session`."""
+        # Import local modules
+        from photoshop.session import Session
+
+        return self.call(Session, *args, **kwargs)
+
+    def proxy(self, obj: Any) -> "STAProxy":
+        """Wrap an object created on the worker thread so other threads can use it."""
+        return STAProxy(self, obj)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop the worker thread once the queued calls ran.
+
+        Args:
+            wait: Wait for the worker thread to exit.
+            cancel_futures: Cancel the calls that did not start yet.
+
+        """
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                if cancel_futures:
+                    self._cancel_queued()
+                self._queue.put(None)
+        if wait and threading.get_ident() != self.thread.ident:
+            self.thread.join()
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, _PLAIN_TYPES) or isinstance(value, STAProxy):
+            return value
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._wrap(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return STAProxy(self, value)
+
+    def _cancel_queued(self):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and item[0] is not None:
+                item[0].cancel()
+
+    def _work(self):
+        backend = backends.get_backend()
+        try:
+            backend.initialize_thread()
+        except BaseException as err:
+            self._fail(err)
+            return
+        try:
+            if self._initializer is not None:
+                try:
+                    self._initializer(*self._initargs)
+                except BaseException as err:
+                    self._fail(err)
+                    return
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                future, fn, args, kwargs = item
+                # Release the references to the arguments on this thread.
+                del item
+                if future is None:
+                    fn(*args)
+                elif future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(*args, **kwargs)
+                    except BaseException as err:
+                        future.set_exception(err)
+                    else:
+                        future.set_result(result)
+                future = fn = args = kwargs = result = None
+        finally:
+            backend.uninitialize_thread()
+
+    def _fail(self, error: BaseException):
+        with self._shutdown_lock:
+            self._broken = error
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and item[0] is not None and item[0].set_running_or_notify_cancel():
+                item[0].set_exception(BrokenExecutor(f"The worker thread failed to start: {error}"))
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, STAProxy):
+        return value._target
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+class STAProxy:
+    """Forwards the uses of an object owned by the worker thread of an `STAExecutor` to that thread.
+
+    Each attribute read, write, call, `len`, item access and iteration is one
+    call on the worker thread; returned objects are wrapped again.
+    """
+
+    __slots__ = ("_executor", "_target")
+
+    def __init__(self, executor: STAExecutor, target: Any):
+        object.__setattr__(self, "_executor", executor)
+        object.__setattr__(self, "_target", target)
+
+    def __repr__(self):
+        # The repr of Photoshop objects reads from Photoshop, only use the type here.
+        return f"<STAProxy {type(self._target).__name__}>"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._executor.call(getattr, self._target, name)
+
+    def __setattr__(self, name: str, value: Any):
+        self._executor.call(setattr, self._target, name, value)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._executor.call(self._target, *args, **kwargs)
+
+    def __len__(self) -> int:
+        return self._executor.call(len, self._target)
+
+    def __bool__(self) -> bool:
+        return self._executor.call(bool, self._target)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._executor.call(operator.getitem, self._target, key)
+
+    def __iter__(self):
+        # Photoshop collections are enumerated in one call on the worker thread.
+        return iter(self._executor.call(list, self._target))
+
+    def __enter__(self) -> Any:
+        return self._executor.call(operator.methodcaller("__enter__"), self._target)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._executor.call(operator.methodcaller("__exit__", exc_type, exc_val, exc_tb), self._target)
+
+    def __del__(self):
+        # COM objects must be released by the thread that owns them.
+        executor = self._executor
+        if threading.get_ident() == executor.thread.ident:
+            return
+        # Nothing is queued after the sentinel of `STAExecutor.shutdown`.
+        with executor._shutdown_lock:
+            if not executor._shutdown:
+                executor._queue.put((None, _drop, (self._target,), None))
@@ -0,0 +1,73 @@
+"""Microbenchmarks for attribute access on wrapper objects.
+
+Compares reads through the `__getattr__` fallback of `Photoshop` with the
+previous `__getattribute__` override, which wrapped every attribute read,
+including plain Python attributes, in a try/except. A plain Python class with
+a `__getattr__` hook is listed as the baseline: CPython does not specialize
+attribute reads on such classes, so that is the lowest cost reachable while
+keeping the fallback to the dispatch object.
+
+Usage:
+    python test/benchmarks/bench_attribute_access.py [iterations]
+
+"""
+
+# Import built-in modules
+import sys
+import timeit
+
+# Import local modules
+from photoshop.api._artlayer import ArtLayer
+
+
+class StandInDispatch:
+    """Dispatch object answering every member from a Python attribute."""
+
+    name = "Layer 1"
+
+
+class PlainObject:
+    def __init__(self):
+        self.app = StandInDispatch()
+
+    @property
+    def name(self):
+        return self.app.name
+
+    def __getattr__(self, item):
+        return getattr(self.__dict__["app"], item)
+
+
+class BeforeLayer(ArtLayer):
+    """ArtLayer with the attribute lookup used before the `__getattr__` fallback."""
+
+    def __getattribute__(self, item):
+        try:
+            return super().__getattribute__(item)
+        except AttributeError:
+            return getattr(self.app, item)
+
+
+class AfterLayer(ArtLayer):
+    pass
+
+
+def main(iterations=1000000):
+    plain, before, after = PlainObject(), BeforeLayer(StandInDispatch()), AfterLayer(StandInDispatch())
+    cases = [
+        ("instance attribute", "obj.app"),
+        ("property", "obj.name"),
+        ("forwarded to dispatch", "obj.id"),
+    ]
+    StandInDispatch.id = 1
+    print(f"{'read':<24}{'plain (ns)':>12}{'before (ns)':>13}{'after (ns)':>12}")
+    for label, statement in cases:
+        timings = []
+        for obj in (plain, before, after):
+            seconds = timeit.timeit(statement, globals={"obj": obj}, number=iterations)
+            timings.append(seconds / iterations * 1e9)
+        print(f"{label:<24}{timings[0]:>12.1f}{timings[1]:>13.1f}{timings[2]:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
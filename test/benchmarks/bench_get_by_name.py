@@ -0,0 +1,69 @@
+"""Benchmark looking up layers by name in a large document.
+
+Looks up 100 layers of a 300 layer document against the simulated backend,
+standing in for Photoshop with a fixed latency per round trip:
+
+- ``enumerate``: the previous `ArtLayers.getByName`, reading the name of every
+  layer until one matches.
+- ``getByName``: the native ``getByName`` member, one round trip per lookup.
+- ``cached``: inside `Collection.cached`, the names of all layers are read
+  with one program and each lookup only reads the layer found.
+
+Usage:
+    python test/benchmarks/bench_get_by_name.py [layers] [lookups] [latency]
+
+"""
+
+# Import built-in modules
+import sys
+import time
+
+# Import local modules
+from photoshop.api import Application
+from photoshop.api import backends
+from photoshop.api._artlayer import ArtLayer
+from photoshop.api.backends import SimulatedBackend
+
+
+def enumerate_names(layers, name):
+    for layer in layers.app:
+        if layer.name == name:
+            return ArtLayer(layer)
+
+
+def get_by_name(layers, name):
+    return layers.getByName(name)
+
+
+def main(layer_count=300, lookups=100, latency=0.0001):
+    backend = SimulatedBackend()
+    with backends.use_backend(backend):
+        doc = Application().documents.add()
+        for _ in range(layer_count - 1):
+            doc.artLayers.add()
+        names = [f"Layer {index}" for index in range(1, layer_count, max(1, layer_count // lookups))][:lookups]
+        print(f"{layer_count} layers, {len(names)} lookups, {latency * 1e6:.0f} us per round trip")
+        print(f"{'lookup':<12}{'round trips':>14}{'seconds':>10}")
+        for label, find, cached in (
+            ("enumerate", enumerate_names, False),
+            ("getByName", get_by_name, False),
+            ("cached", get_by_name, True),
+        ):
+            layers = doc.artLayers
+            backend.reset_stats()
+            backend.latency = latency
+            start = time.perf_counter()
+            if cached:
+                with layers.cached():
+                    found = [find(layers, name) for name in names]
+            else:
+                found = [find(layers, name) for name in names]
+            seconds = time.perf_counter() - start
+            round_trips = backend.round_trips
+            backend.latency = 0.0
+            assert [layer.name for layer in found] == names
+            print(f"{label:<12}{round_trips:>14}{seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]), *map(float, sys.argv[3:]))
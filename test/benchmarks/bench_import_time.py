@@ -0,0 +1,61 @@
+"""Benchmark the time it takes to import the package, using ``python -X importtime``.
+
+Every statement runs in a fresh interpreter. The reported time is the
+cumulative import time of the top-level modules the statement imported, the
+median of the runs. ``import photoshop.api.application`` loads every wrapper
+class and enumeration, the cost paid by every import before the package
+names were resolved lazily.
+
+Usage:
+    python test/benchmarks/bench_import_time.py [runs]
+
+"""
+
+# Import built-in modules
+import os
+import statistics
+import subprocess
+import sys
+
+
+STATEMENTS = (
+    "import photoshop",
+    "from photoshop import Session",
+    "from photoshop import Session; Session.LayerKind",
+    "from photoshop.api import SolidColor",
+    "import photoshop.api.application",
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def import_time(statement):
+    """Get the microseconds spent importing the modules of the package and their dependencies."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stderr
+    total = 0
+    for line in output.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Count the top-level entries only, nested ones are part of their cumulative time.
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def main(runs=15):
+    print(f"{'statement':<52}{'median (ms)':>12}{'min (ms)':>10}")
+    for statement in STATEMENTS:
+        times = [import_time(statement) for _ in range(runs)]
+        print(f"{statement:<52}{statistics.median(times) / 1000:>12.1f}{min(times) / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Benchmark the cost of wrapping dispatch objects in Photoshop wrapper classes.
+
+Compares the current construction path, which attaches the per-class method
+flag table by reference, with the previous behaviour of flagging every method
+name on each new dispatch object.
+
+Usage:
+    python test/benchmarks/bench_wrapper_construction.py [iterations]
+
+"""
+
+# Import built-in modules
+import sys
+import timeit
+
+# Import local modules
+from photoshop.api import backends
+from photoshop.api._artlayer import ArtLayer
+from photoshop.api._document import Document
+from photoshop.api._layerSet import LayerSet
+from photoshop.api._selection import Selection
+from photoshop.api.text_item import TextItem
+
+
+class StandInDispatch:
+    """Mimics the state comtypes keeps on a fully dynamic dispatch object."""
+
+    def __init__(self):
+        self.__dict__["_ids"] = {}
+        self.__dict__["_methods"] = set()
+
+    def _FlagAsMethod(self, *names):
+        self._methods.update(names)
+
+
+def construct(wrapper_class):
+    wrapper_class(StandInDispatch())
+
+
+def construct_and_flag(wrapper_class):
+    """The construction cost before flag tables were declared per class."""
+    wrapper = wrapper_class(StandInDispatch())
+    wrapper.app.__dict__["_methods"] = set()
+    wrapper.app._FlagAsMethod(*wrapper_class._method_table)
+
+
+def main(iterations=20000):
+    backends.register_dispatch_type(StandInDispatch)
+    print(f"{'wrapper':<12}{'flags':>7}{'before (us)':>14}{'after (us)':>13}")
+    for wrapper_class in (ArtLayer, Document, LayerSet, Selection, TextItem):
+        before = timeit.timeit(lambda: construct_and_flag(wrapper_class), number=iterations)
+        after = timeit.timeit(lambda: construct(wrapper_class), number=iterations)
+        print(
+            f"{wrapper_class.__name__:<12}{len(wrapper_class._method_table):>7}"
+            f"{before / iterations * 1e6:>14.2f}{after / iterations * 1e6:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -5,6 +5,19 @@ import os
 import pytest
 
 
+@pytest.fixture()
+def backend(monkeypatch):
+    """A fresh `SimulatedBackend`, ignoring the Photoshop version set in the environment."""
+    # Import local modules
+    from photoshop.api import backends
+    from photoshop.api.backends import SimulatedBackend
+
+    monkeypatch.delenv("PS_VERSION", raising=False)
+    monkeypatch.delenv("PS_VERSION_CACHE", raising=False)
+    with backends.use_backend(SimulatedBackend()) as simulated:
+        yield simulated
+
+
 @pytest.fixture()
 def photoshop_app():
     # Import local modules
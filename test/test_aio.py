@@ -0,0 +1,81 @@
+"""Test automating Photoshop from asyncio."""
+
+# Import built-in modules
+import asyncio
+import threading
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.aio import AsyncProxy
+from photoshop.aio import AsyncSession
+from photoshop.api import backends
+from photoshop.api.backends import SimulatedBackend
+from photoshop.api.enumerations import LayerKind
+
+
+def test_session_documents_and_layers(backend):
+    backend.register_script("app.version", lambda application, arguments: "25.0.0")
+
+    async def main():
+        async with AsyncSession(action="new_document") as ps:
+            doc = await ps.active_document
+            assert isinstance(doc, AsyncProxy)
+            layer = await doc.artLayers.add()
+            await layer.set("name", "Title")
+            await doc.activeLayer.set("opacity", 40)
+            names = [await item.name async for item in doc.layers]
+            assert names == ["Title", "Background"]
+            assert await doc.artLayers[0].opacity == 40
+            assert await layer.kind == LayerKind.NormalLayer
+            assert await ps.app.doJavaScript("app.version") == "25.0.0"
+            assert await doc.run(lambda document: [layer.name for layer in document.layers]) == names
+            return ps
+
+    ps = asyncio.run(main())
+    assert ps._proxy is None
+
+
+def test_the_event_loop_keeps_running(monkeypatch):
+    monkeypatch.delenv("PS_VERSION", raising=False)
+    slow = SimulatedBackend(member_latency={"add": 0.05})
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.ensure_future(tick())
+        async with AsyncSession(action="new_document") as ps:
+            doc = await ps.active_document
+            for _ in range(3):
+                await doc.artLayers.add()
+        ticker.cancel()
+        return ticks
+
+    with backends.use_backend(slow):
+        assert asyncio.run(main()) >= 10
+
+
+def test_timeouts_and_cancellation(backend):
+    release = threading.Event()
+
+    async def main():
+        async with AsyncSession(action="new_document", timeout=0.05) as ps:
+            with pytest.raises(asyncio.TimeoutError):
+                await ps.run(lambda session: release.wait())
+            # Queued behind the running call, cancelled before it started.
+            name = asyncio.ensure_future(ps.active_document.name)
+            await asyncio.sleep(0.01)
+            name.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await name
+            assert await ps.active_document.name == "Untitled-1"
+
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+"""Test recording changes in a batch and applying them with one doJavaScript call."""
+
+# Import built-in modules
+import threading
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api import _jsx
+from photoshop.api._batch import BatchFuture
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+@pytest.fixture()
+def ps(backend):
+    with Session(action="new_document") as session:
+        yield session
+
+
+def test_changes_are_sent_in_one_script(backend, ps):
+    doc = ps.active_document
+    layers = [doc.artLayers.add() for _ in range(10)]
+    for layer in layers:
+        layer.name
+    backend.reset_stats()
+    with ps.batch() as batch:
+        for index, layer in enumerate(layers):
+            layer.name = f"Layer {index}"
+            layer.visible = index % 2 == 0
+            layer.opacity = 50
+    assert len(batch) == 30
+    assert backend.member_calls["dojavascript"] == 1
+    assert not {"name", "visible", "opacity"} & set(backend.member_calls)
+    assert [layer.name for layer in doc.layers][:3] == ["Layer 9", "Layer 8", "Layer 7"]
+    assert [layer.visible for layer in layers[:3]] == [True, False, True]
+    assert layers[0].opacity == 50
+
+
+def test_reads_resolve_after_the_batch(ps):
+    doc = ps.active_document
+    with ps.batch():
+        name = doc.name
+        layer = doc.artLayers.add()
+        assert isinstance(name, BatchFuture)
+        with pytest.raises(PhotoshopPythonAPIError):
+            name.result()
+    assert name.result() == "Untitled-1"
+    assert layer.app.result() == {"typename": "ArtLayer", "id": 2}
+    assert name.exception() is None
+
+
+def test_objects_created_in_a_batch(ps):
+    doc = ps.active_document
+    top = doc.artLayers.add()
+    with ps.batch():
+        copy = top.duplicate()
+        copy.name = "Copy"
+        copy.translate(5, 5)
+        group = doc.layerSets.add()
+        copy.move(group, ps.ElementPlacement.PlaceInside)
+    assert [layer.name for layer in doc.layerSets[0].layers] == ["Copy"]
+    assert doc.layerSets[0].layers[0].bounds == (5.0, 5.0, 5.0, 5.0)
+    with pytest.raises(PhotoshopPythonAPIError):
+        copy.name = "Too late"
+
+
+def test_text_items_and_colors(ps):
+    layer = ps.active_document.artLayers.add()
+    layer.kind = ps.LayerKind.TextLayer
+    text = layer.textItem
+    color = ps.SolidColor()
+    color.rgb.red = 255
+    with ps.batch():
+        text.contents = "Hello"
+        text.color = color
+        layer.textItem.size = 40
+    assert (text.contents, text.size) == ("Hello", 40)
+    assert text.color.rgb.hexValue == "FF0000"
+
+
+def test_exceptions_discard_the_batch(backend, ps):
+    layer = ps.active_document.artLayers.add()
+    layer.name = "Kept"
+    with pytest.raises(ValueError):
+        with ps.batch():
+            layer.name = "Discarded"
+            name = layer.name
+            raise ValueError
+    assert layer.name == "Kept"
+    assert isinstance(name.exception(), PhotoshopPythonAPIError)
+    assert not isinstance(layer.app, BatchFuture)
+
+
+def test_batches_only_record_in_their_thread(ps):
+    layer = ps.active_document.artLayers.add()
+    names = []
+    with ps.batch():
+        layer.name = "Batched"
+        thread = threading.Thread(target=lambda: names.append(layer.name))
+        thread.start()
+        thread.join()
+    assert names == ["Layer 1"]
+    assert layer.name == "Batched"
+
+
+def test_objects_are_found_once_per_program(ps):
+    doc = ps.active_document
+    first, second = doc.artLayers.add(), doc.artLayers.add()
+    with ps.batch() as batch:
+        for index in range(10):
+            first.name = f"First {index}"
+            second.name = f"Second {index}"
+        first.move(second, ps.ElementPlacement.PlaceAfter)
+        doc.activeLayer = first
+    script = batch.compile()
+    assert script.count("= __document(") == 1
+    assert script.count("= __layer(") == 2
+    assert (first.name, second.name) == ("First 9", "Second 9")
+
+
+def test_bulk_setters_find_their_document_in_a_batch(ps):
+    doc = ps.active_document
+    group = doc.layerSets.add()
+    layer = doc.artLayers.add()
+    with ps.batch():
+        doc.set_visible([layer], False)
+        group.set_locked([layer])
+    assert not layer.visible and layer.allLocked
+
+
+def test_failed_operation_stops_the_batch(ps):
+    doc = ps.active_document
+    layer = doc.artLayers.add()
+    with pytest.raises(PhotoshopPythonAPIError, match="translate"):
+        with ps.batch():
+            layer.name = "First"
+            moved = layer.app.translate(1, 2, 3)
+            last = doc.name
+    assert layer.name == "First"
+    assert moved.exception() is not None
+    assert "Not executed" in str(last.exception())
+
+
+def test_program_is_marked():
+    script = _jsx.program("batch", {"value": "*/"}, "1;")
+    assert _jsx.parse_program(script) == ("batch", {"value": "*/"})
+    assert _jsx.parse_program("app.activeDocument.name") is None
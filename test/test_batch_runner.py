@@ -0,0 +1,193 @@
+"""Test the resumable batch runner."""
+
+# Import built-in modules
+import json
+import os
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api.backends.simulated import SimApplication
+from photoshop.api.backends.simulated import SimError
+from photoshop.batch import BatchRunner
+from photoshop.batch import NativeBatch
+from photoshop.batch import load_manifest
+
+
+@pytest.fixture()
+def inputs(tmp_path):
+    paths = []
+    for index in range(5):
+        path = tmp_path / "in" / f"image_{index}.psd"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("")
+        paths.append(str(path))
+    return paths
+
+
+def add_title(ps, doc, item):
+    doc.artLayers.add().name = "Title"
+
+
+def read_output(path):
+    with open(path, encoding="utf-8") as output:
+        return json.load(output)
+
+
+def test_run_processes_and_reports(backend, inputs, tmp_path):
+    results = []
+    runner = BatchRunner(
+        inputs, add_title, tmp_path / "journal.jsonl", tmp_path / "out", ".png", on_item=results.append
+    )
+    report = runner.run()
+    assert (report.done, report.failed, report.skipped) == (5, 0, 0)
+    assert [result.item for result in results] == runner.items
+    output = read_output(tmp_path / "out" / "image_0.png")
+    assert output["layers"] == ["Title", "Background"]
+    assert output["options"] == "PNGSaveOptions"
+    assert backend.member_calls["close"] == 5
+    summary = report.summary()
+    assert set(summary["stages"]) == {"open", "recipe", "save", "close"}
+    assert summary["stages"]["save"]["p50"] <= summary["stages"]["save"]["p95"]
+    assert report.items_per_minute > 0
+    assert "5 done, 0 failed, 0 skipped" in str(report)
+
+
+def test_run_resumes_after_a_crash(backend, inputs, tmp_path):
+    journal = tmp_path / "journal.jsonl"
+
+    def crash_on_third(ps, doc, item):
+        if item.source == inputs[2]:
+            raise KeyboardInterrupt
+        add_title(ps, doc, item)
+
+    with pytest.raises(KeyboardInterrupt):
+        BatchRunner(inputs, crash_on_third, journal, tmp_path / "out").run()
+    with open(journal, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"source": "cut by the cra')
+    (tmp_path / "out" / "image_0.psd").unlink()
+    runner = BatchRunner(inputs, add_title, journal, tmp_path / "out")
+    assert [item.source for item in runner.pending()] == [inputs[0]] + inputs[2:]
+    report = runner.run()
+    assert (report.done, report.failed, report.skipped) == (4, 0, 1)
+    assert not runner.pending()
+
+
+def test_failed_items_are_recorded(backend, inputs, tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    manifest = tmp_path / "manifest.txt"
+    missing = str(tmp_path / "in" / "missing.psd")
+    manifest.write_text(f"# Tonight\n{inputs[0]}\t{tmp_path / 'a.tif'}\n\n{missing}\t{tmp_path / 'b.tif'}\n")
+    assert load_manifest(manifest) == [(inputs[0], str(tmp_path / "a.tif")), (missing, str(tmp_path / "b.tif"))]
+    report = BatchRunner(load_manifest(manifest), "Vignette (selection)", journal).run()
+    assert (report.done, report.failed) == (1, 1)
+    assert backend.member_calls["doaction"] == 1
+    assert report.results[1].error.startswith("open: ")
+    assert set(report.results[1].stages) == set()
+    assert not BatchRunner(load_manifest(manifest), "Vignette (selection)", journal, retry_failed=False).pending()
+    with pytest.raises(ValueError):
+        BatchRunner(inputs, add_title, journal)
+
+
+def test_large_documents_need_their_own_save_options(backend, inputs, tmp_path):
+    # PhotoshopSaveOptions would write a PSD file under the .psb name.
+    runner = BatchRunner(
+        inputs[:1], add_title, tmp_path / "journal.jsonl", output_dir=tmp_path / "out", extension=".psb"
+    )
+    report = runner.run()
+    assert report.failed == 1
+    assert "No save options" in report.results[0].error
+
+
+def make_files(folder, count):
+    folder.mkdir()
+    paths = [folder / f"image_{index:02d}.psd" for index in range(count)]
+    for path in paths:
+        path.write_text("")
+    return [str(path) for path in paths]
+
+
+def test_native_batch_grows_chunks_and_quarantines_missing_files(backend, tmp_path):
+    files = make_files(tmp_path / "in", 30)
+    missing = [str(tmp_path / "in" / "gone_1.psd"), str(tmp_path / "in" / "gone_2.psd")]
+    (tmp_path / "out").mkdir()
+    chunks = []
+    batch = NativeBatch(
+        files[:5] + missing[:1] + files[5:] + missing[1:],
+        "Quadrant Colors",
+        options={"destination": 3, "destinationFolder": str(tmp_path / "out")},
+        chunk_size=2,
+        work_dir=tmp_path / "logs",
+        on_chunk=chunks.append,
+    )
+    report = batch.run()
+    assert sorted(report.done) == files
+    assert sorted(report.quarantined) == missing
+    assert "could not be found" in report.quarantined[missing[0]]
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [os.path.basename(path) for path in files]
+    assert chunks == report.chunks
+    # A chunk with a missing file halves the size, each missing file is retried once alone.
+    assert [len(chunk.files) for chunk in chunks] == [2, 4, 1, 2, 4, 8, 12, 1]
+    assert backend.member_calls["batch"] == 8
+    assert "32 files" not in str(report) and "2 quarantined in 8 chunks" in str(report)
+
+
+def test_native_batch_isolates_a_file_failing_the_batch_call(backend, tmp_path, monkeypatch):
+    files = make_files(tmp_path / "in", 8)
+    batch_files = SimApplication.batch
+
+    def stall_on_fourth(application, inputFiles, *args):
+        if files[3] in inputFiles:
+            raise SimError("The command was cancelled by a dialog.")
+        return batch_files(application, inputFiles, *args)
+
+    monkeypatch.setattr(SimApplication, "batch", stall_on_fourth)
+    report = NativeBatch(files, "Quadrant Colors", chunk_size=8, retries=0, work_dir=tmp_path / "logs").run()
+    assert report.done == files[:3] + files[4:]
+    assert list(report.quarantined) == [files[3]]
+    assert "cancelled by a dialog" in report.quarantined[files[3]]
+    assert [len(chunk.files) for chunk in report.chunks] == [8, 4, 2, 2, 1, 1, 1, 2, 1]
+    with pytest.raises(ValueError):
+        NativeBatch(files, "Quadrant Colors", chunk_size=0)
+
+
+def test_native_batch_isolates_a_failing_file_below_the_minimum_chunk_size(backend, tmp_path, monkeypatch):
+    files = make_files(tmp_path / "in", 8)
+    batch_files = SimApplication.batch
+
+    def stall_on_sixth(application, inputFiles, *args):
+        if files[5] in inputFiles:
+            raise SimError("The command was cancelled by a dialog.")
+        return batch_files(application, inputFiles, *args)
+
+    monkeypatch.setattr(SimApplication, "batch", stall_on_sixth)
+    batch = NativeBatch(files, "Quadrant Colors", chunk_size=8, min_chunk_size=4, retries=0, work_dir=tmp_path / "logs")
+    report = batch.run()
+    assert report.done == files[:5] + files[6:]
+    assert list(report.quarantined) == [files[5]]
+    assert [len(chunk.files) for chunk in report.chunks] == [8, 4, 4, 2, 1, 1, 2]
+
+
+def test_native_batch_matches_whole_names_in_the_log(backend, tmp_path, monkeypatch):
+    (tmp_path / "in").mkdir()
+    paths = [tmp_path / "in" / name for name in ("a.psd", "ba.psd", "image_1.psd", "image_11.psd")]
+    for path in paths:
+        path.write_text("")
+    files = [str(path) for path in paths]
+
+    def log_failures(application, inputFiles, action, actionSet, options):
+        # Photoshop names a file by its path, with backslashes on Windows, or by its name.
+        lines = []
+        if files[1] in inputFiles:
+            lines.append("Could not process ba.psd.")
+        if files[2] in inputFiles:
+            lines.append("Could not process " + files[2].replace("/", "\\") + ".")
+        with open(options.errorFile, "a", encoding="utf-8") as log:
+            log.write("".join(line + "\n" for line in lines))
+        return ""
+
+    monkeypatch.setattr(SimApplication, "batch", log_failures)
+    report = NativeBatch(files, "Quadrant Colors", chunk_size=4, retries=0, work_dir=tmp_path / "logs").run()
+    assert sorted(report.quarantined) == files[1:3]
+    assert sorted(report.done) == [files[0], files[3]]
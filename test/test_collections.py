@@ -0,0 +1,129 @@
+"""Test counting and indexing the collection wrappers."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api import Application
+from photoshop.api._artlayer import ArtLayer
+from photoshop.api.errors import PhotoshopPythonAPIError
+
+
+@pytest.fixture()
+def doc(backend):
+    doc = Application().documents.add()
+    for _ in range(5):
+        doc.artLayers.add()
+    backend.reset_stats()
+    return doc
+
+
+def test_length_and_indexes_use_native_members(backend, doc):
+    layers = doc.layers
+    names = [layers[index].name for index in range(len(layers))]
+    assert names == ["Layer 5", "Layer 4", "Layer 3", "Layer 2", "Layer 1", "Background"]
+    assert backend.member_calls["length"] == 1
+    assert backend.member_calls["item"] == 6
+    assert backend.stats["IEnumVARIANT"] == 0
+
+
+def test_indexes(backend, doc):
+    assert doc.artLayers[-1].name == "Background"
+    assert doc.artLayers.getByIndex(1).name == "Layer 4"
+    assert doc.artLayers["Layer 2"].name == "Layer 2"
+    assert [layer.name for layer in doc.layers[1:3]] == ["Layer 4", "Layer 3"]
+    assert doc.channels[0].name == "Red"
+    assert doc.channels.length == 3
+    with pytest.raises(IndexError):
+        doc.artLayers[6]
+    with pytest.raises(IndexError):
+        doc.layers[-7]
+
+
+def test_cached_elements_are_dropped_on_change(backend, doc):
+    layers = doc.artLayers
+    with layers.cached():
+        names = [layers[index].name for index in range(len(layers))]
+        assert backend.member_calls["_newenum"] == 1
+        assert backend.member_calls["item"] == backend.member_calls["length"] == 0
+        layers.add()
+        assert len(layers) == 7
+        assert layers[0].name == "Layer 6"
+        assert backend.member_calls["_newenum"] == 2
+    assert len(names) == 6
+    assert isinstance(layers[0], ArtLayer)
+    assert backend.member_calls["item"] == 1
+
+
+def test_names_are_found_with_native_member(backend, doc):
+    assert doc.artLayers.getByName("Layer 3").name == "Layer 3"
+    assert doc.layers.getByName("Background").name == "Background"
+    assert backend.member_calls["getbyname"] == 2
+    assert backend.stats["IEnumVARIANT"] == 0
+    with pytest.raises(PhotoshopPythonAPIError, match="Layer 9"):
+        doc.artLayers.getByName("Layer 9")
+
+
+def test_name_index_is_read_once(backend, doc):
+    layers = doc.artLayers
+    layers[5].name = "Layer 1"
+    group = doc.layerSets.add()
+    group.artLayers.add().name = "Nested"
+    first = layers[4].id
+    backend.reset_stats()
+    with layers.cached():
+        assert layers.getByName("Layer 1").id == first
+        assert [layers.getByName(f"Layer {index}").name for index in range(2, 6)] == [
+            "Layer 2",
+            "Layer 3",
+            "Layer 4",
+            "Layer 5",
+        ]
+        assert layers.indexes_of("Layer 1") == [4, 5]
+        assert backend.member_calls["dojavascript"] == 1
+        assert backend.member_calls["item"] == 5
+        assert backend.member_calls["getbyname"] == 0
+        with pytest.raises(PhotoshopPythonAPIError):
+            layers.getByName("Nested")
+        layers.add().name = "Added"
+        assert layers.getByName("Added").name == "Added"
+        assert backend.member_calls["dojavascript"] == 2
+    assert group.artLayers.indexes_of("Nested") == [0]
+
+
+def test_documents_and_channels_by_name(backend, doc):
+    app = Application()
+    app.documents.add(name="second")
+    documents = app.documents
+    with documents.cached():
+        assert documents.getByName("second").name == "second"
+        assert documents.indexes_of("Untitled-1") == [0]
+    assert doc.channels.getByName("Green").name == "Green"
+    with pytest.raises(PhotoshopPythonAPIError):
+        doc.channels.getByName("Alpha 1")
+
+
+def test_elements_by_name_key(doc):
+    assert doc.channels["Red"].name == "Red"
+    with pytest.raises(IndexError):
+        doc.channels["Alpha 1"]
+    assert doc.artLayers["Layer 2"].name == "Layer 2"
+    assert doc.artLayers[0].name == "Layer 5"
+    with pytest.raises(PhotoshopPythonAPIError):
+        doc.artLayers["Missing"]
+    assert doc.layers["Background"].name == "Background"
+    assert Application().documents["Untitled-1"].name == "Untitled-1"
+
+
+def test_documents_are_not_activated(backend, doc):
+    app = Application()
+    second = app.documents.add(name="second")
+    backend.reset_stats()
+    assert [document.name for document in app.documents] == ["Untitled-1", "second"]
+    assert backend.member_calls["activedocument"] == 0
+    assert app.activeDocument.name == "second"
+    assert [document.name for document in app.documents.iterate(activate=True)] == ["Untitled-1", "second"]
+    assert app.activeDocument.name == "second"
+    doc.activate()
+    assert app.activeDocument.name == doc.name
+    assert second.name == "second"
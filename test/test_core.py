@@ -0,0 +1,241 @@
+"""Test the construction of wrapper objects and the Photoshop version discovery."""
+
+# Import built-in modules
+import os
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api import _core
+from photoshop.api import backends
+from photoshop.api._artlayer import ArtLayer
+from photoshop.api._core import Photoshop
+from photoshop.api._document import Document
+from photoshop.api.backends import Backend
+from photoshop.api.solid_color import SolidColor
+
+
+class FakeDispatch:
+    """Stand-in for a dynamic COM dispatch object."""
+
+    def __init__(self, name=""):
+        self.name = name
+
+    def doJavaScript(self, javascript, arguments=None, execution_mode=None):
+        return javascript
+
+
+class DynamicDispatch(FakeDispatch):
+    """Stand-in for `comtypes.client.dynamic._Dispatch` and its method flags."""
+
+    def __init__(self, name=""):
+        super().__init__(name)
+        self._ids = {}
+        self._methods = set()
+
+    def _FlagAsMethod(self, *names):
+        self._methods.update(names)
+
+
+class CountingBackend(Backend):
+    """Backend with Photoshop 170 installed, counting registry lookups and COM activations."""
+
+    name = "counting"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = {"CreateObject": 0, "versions": 0}
+
+    def create_object(self, prog_id):
+        self.calls["CreateObject"] += 1
+        if not prog_id.endswith(".170"):
+            raise OSError(f"Invalid class string: {prog_id}")
+        return FakeDispatch(prog_id)
+
+    def get_versions(self):
+        self.calls["versions"] += 1
+        return ["190", "180", "170", ""]
+
+
+@pytest.fixture()
+def dynamic_dispatch(monkeypatch):
+    monkeypatch.setattr(backends, "dispatch_types", (DynamicDispatch,))
+    return DynamicDispatch
+
+
+@pytest.fixture()
+def backend(monkeypatch):
+    monkeypatch.delenv("PS_VERSION", raising=False)
+    monkeypatch.delenv("PS_VERSION_CACHE", raising=False)
+    with backends.use_backend(CountingBackend()) as counting:
+        yield counting
+
+
+@pytest.fixture()
+def com_calls(backend):
+    """Count registry lookups and COM activations made while building wrappers."""
+    return backend.calls
+
+
+@pytest.fixture()
+def version_cache(tmp_path, monkeypatch):
+    """Persist the resolved version next to a fake Photoshop installation folder."""
+    install_path = tmp_path / "Adobe Photoshop"
+    install_path.mkdir()
+    cache_path = tmp_path / "cache" / "version.json"
+    monkeypatch.setenv("PS_VERSION_CACHE", str(cache_path))
+    monkeypatch.setattr(Photoshop, "_get_application_path", lambda self, version: str(install_path))
+    return install_path
+
+
+def test_child_wrappers_do_not_activate_com(com_calls):
+    layers = [ArtLayer(FakeDispatch(f"Layer {i}")) for i in range(500)]
+    Document(FakeDispatch("doc"))
+    SolidColor(FakeDispatch())
+    assert com_calls == {"CreateObject": 0, "versions": 0}
+    assert layers[42].app.name == "Layer 42"
+    assert layers[42].name == "Layer 42"
+
+
+def test_child_wrappers_share_application(com_calls):
+    first = ArtLayer(FakeDispatch())
+    second = Document(FakeDispatch())
+    assert first.eval_javascript("1 + 1") == "1 + 1"
+    assert second.eval_javascript("2 + 2") == "2 + 2"
+    assert first.adobe is second.adobe
+    assert com_calls == {"CreateObject": 3, "versions": 1}
+
+
+def test_application_seeds_shared_application(com_calls):
+    root = Photoshop()
+    layer = ArtLayer(FakeDispatch())
+    assert layer.adobe is root.app
+    assert com_calls == {"CreateObject": 3, "versions": 1}
+
+
+def test_resolved_version_is_reused_in_process(com_calls):
+    assert Photoshop().app_id == "170"
+    assert com_calls == {"CreateObject": 3, "versions": 1}
+    assert Photoshop().program_name == "Photoshop.Application.170"
+    assert com_calls == {"CreateObject": 4, "versions": 1}
+
+
+def test_resolved_version_is_persisted(com_calls, version_cache, backend):
+    Photoshop()
+    assert os.path.isfile(os.environ["PS_VERSION_CACHE"])
+
+    # A new process starts with an empty in-memory cache.
+    backend.reset()
+    assert Photoshop().app_id == "170"
+    assert com_calls == {"CreateObject": 4, "versions": 1}
+
+
+def test_persisted_version_expires_with_installation(com_calls, version_cache, backend):
+    Photoshop()
+    stat = os.stat(version_cache)
+    os.utime(version_cache, (stat.st_atime, stat.st_mtime + 60))
+
+    backend.reset()
+    assert Photoshop().app_id == "170"
+    assert com_calls == {"CreateObject": 6, "versions": 2}
+
+
+def test_stale_version_falls_back_to_registry(com_calls, backend):
+    backend.resolved_version = "180"
+    assert Photoshop().app_id == "170"
+    assert com_calls == {"CreateObject": 4, "versions": 1}
+
+
+def test_method_table_is_shared_per_class(dynamic_dispatch):
+    first, second = ArtLayer(dynamic_dispatch()), ArtLayer(dynamic_dispatch())
+    assert first.app._methods is ArtLayer._method_table
+    assert second.app._methods is ArtLayer._method_table
+    assert {"duplicate", "applyGaussianBlur", "convertToSmartObject"} <= ArtLayer._method_table
+    assert "duplicate" not in SolidColor._method_table
+
+
+def test_method_table_includes_base_classes():
+    class CustomLayer(ArtLayer):
+        _method_flags = ("customMethod",)
+
+    assert CustomLayer._method_table == ArtLayer._method_table | {"customMethod"}
+
+
+def test_flag_as_method_does_not_leak_into_class_table(dynamic_dispatch):
+    layer = ArtLayer(dynamic_dispatch())
+    layer._flag_as_method("extraMethod")
+    assert "extraMethod" in layer.app._methods
+    assert "extraMethod" not in ArtLayer._method_table
+    assert ArtLayer(dynamic_dispatch()).app._methods is ArtLayer._method_table
+
+
+def test_rewrapping_keeps_existing_flags(dynamic_dispatch):
+    dispatch = dynamic_dispatch()
+    dispatch._FlagAsMethod("extraMethod")
+    Document(dispatch)
+    assert dispatch._methods == Document._method_table | {"extraMethod"}
+
+
+class CountingDispatch(FakeDispatch):
+    """Count attribute reads that reach the dispatch object."""
+
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.reads = []
+
+    def __getattribute__(self, item):
+        if item not in ("reads", "__dict__", "__class__"):
+            object.__getattribute__(self, "reads").append(item)
+        return object.__getattribute__(self, item)
+
+
+class ForwardingLayer(ArtLayer):
+    """Fresh subclass, so forwarded names do not leak between tests."""
+
+
+def test_python_attributes_do_not_reach_dispatch():
+    layer = ForwardingLayer(CountingDispatch())
+    assert layer._has_parent is True
+    assert layer.typename == "ForwardingLayer"
+    assert layer.app.reads == []
+
+
+def test_forwarded_attributes_are_remembered_per_class():
+    layer = ForwardingLayer(CountingDispatch("Layer 1"))
+    assert layer.doJavaScript("1") == "1"
+    assert isinstance(ForwardingLayer.__dict__["doJavaScript"], _core._Forwarded)
+    assert "doJavaScript" not in ArtLayer.__dict__
+
+    other = ForwardingLayer(CountingDispatch())
+    assert other.doJavaScript("2") == "2"
+    assert other.app.reads == ["doJavaScript"]
+
+    other.doJavaScript = "instance attribute"
+    assert other.doJavaScript == "instance attribute"
+
+
+def test_missing_attributes_are_remembered_per_class():
+    layer = ForwardingLayer(CountingDispatch())
+    with pytest.raises(AttributeError):
+        layer.notAMember
+    assert "notAMember" in ForwardingLayer._unresolved_names
+
+    other = ForwardingLayer(CountingDispatch())
+    with pytest.raises(AttributeError):
+        other.notAMember
+    assert other.app.reads == []
+
+
+def test_special_names_are_not_forwarded():
+    layer = ForwardingLayer(CountingDispatch())
+    assert not hasattr(layer, "__deepcopy__")
+    assert layer.app.reads == []
+
+
+def test_properties_are_not_shadowed():
+    layer = ForwardingLayer(CountingDispatch())
+    with pytest.raises(AttributeError):
+        layer.textItem
+    assert "textItem" not in ForwardingLayer.__dict__
+    assert "textItem" not in ForwardingLayer._unresolved_names
@@ -0,0 +1,121 @@
+"""Test the DISPID tables shared between dispatch objects of one interface."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api import _dispid_cache
+from photoshop.api import backends
+from photoshop.api._artlayer import ArtLayer
+from photoshop.api._document import Document
+
+
+class FakeIDispatch:
+    """In-process IDispatch serving a fixed set of members."""
+
+    dispids = {"name": 1, "visible": 2, "Width": 3}
+
+    def __init__(self, calls, **values):
+        self.calls = calls
+        self.values = values
+
+    def GetIDsOfNames(self, name):
+        self.calls["GetIDsOfNames"] += 1
+        return [self.dispids[name]]
+
+    def Invoke(self, dispid, *args, _invkind=1):
+        self.calls["Invoke"] += 1
+        name = next(key for key, value in self.dispids.items() if value == dispid)
+        if args:
+            self.values[name] = args[0]
+            return None
+        return self.values[name]
+
+
+class FakeDispatch:
+    """The name resolution of `comtypes.client.dynamic._Dispatch`."""
+
+    def __init__(self, comobj):
+        self.__dict__["_comobj"] = comobj
+        self.__dict__["_ids"] = {}
+        self.__dict__["_methods"] = set()
+
+    def __getattr__(self, name):
+        dispid = self._ids.get(name)
+        if not dispid:
+            dispid = self._comobj.GetIDsOfNames(name)[0]
+            self._ids[name] = dispid
+        return self._comobj.Invoke(dispid)
+
+    def __setattr__(self, name, value):
+        dispid = self._ids.get(name)
+        if not dispid:
+            dispid = self._comobj.GetIDsOfNames(name)[0]
+            self._ids[name] = dispid
+        self._comobj.Invoke(dispid, value, _invkind=4)
+
+
+@pytest.fixture()
+def calls(monkeypatch):
+    monkeypatch.setattr(backends, "dispatch_types", (FakeDispatch,))
+    monkeypatch.setattr(_dispid_cache, "_tables", {})
+    return {"GetIDsOfNames": 0, "Invoke": 0}
+
+
+def test_names_resolve_once_per_interface(calls):
+    layers = [ArtLayer(FakeDispatch(FakeIDispatch(calls, name=f"Layer {i}", visible=True))) for i in range(100)]
+    assert [layer.name for layer in layers] == [f"Layer {i}" for i in range(100)]
+    assert all(layer.visible for layer in layers)
+    assert calls == {"GetIDsOfNames": 2, "Invoke": 200}
+
+    stats = _dispid_cache.get_stats()["ArtLayer"]
+    assert stats["names"] == 2
+    assert (stats["hits"], stats["misses"]) == (198, 2)
+    assert stats["hit_rate"] == pytest.approx(0.99)
+
+
+def test_property_writes_use_cached_dispids(calls):
+    ArtLayer(FakeDispatch(FakeIDispatch(calls, visible=True))).visible = False
+    layer = ArtLayer(FakeDispatch(FakeIDispatch(calls, visible=True)))
+    layer.visible = False
+    assert layer.app._comobj.values["visible"] is False
+    assert calls == {"GetIDsOfNames": 1, "Invoke": 2}
+
+
+def test_interfaces_have_separate_tables(calls):
+    ArtLayer(FakeDispatch(FakeIDispatch(calls, name="layer"))).name
+    Document(FakeDispatch(FakeIDispatch(calls, name="doc"))).name
+    assert calls["GetIDsOfNames"] == 2
+    assert set(_dispid_cache.get_stats()) == {"ArtLayer", "Document"}
+
+
+def test_names_resolved_before_wrapping_are_kept(calls):
+    dispatch = FakeDispatch(FakeIDispatch(calls, Width=960))
+    assert dispatch.Width == 960
+    Document(dispatch)
+    assert Document(FakeDispatch(FakeIDispatch(calls, Width=540))).width == 540
+    assert calls == {"GetIDsOfNames": 1, "Invoke": 2}
+
+
+def test_clear_forgets_dispids(calls):
+    ArtLayer(FakeDispatch(FakeIDispatch(calls, name="layer"))).name
+    _dispid_cache.clear()
+    ArtLayer(FakeDispatch(FakeIDispatch(calls, name="layer"))).name
+    assert calls["GetIDsOfNames"] == 2
+    assert _dispid_cache.get_stats()["ArtLayer"]["misses"] == 1
+
+
+def test_dispatch_objects_of_unknown_interface_keep_their_names(calls):
+    layer_set = _dispid_cache.set_interface(FakeDispatch(FakeIDispatch(calls, name="group")), None)
+    assert ArtLayer(layer_set).name == "group"
+    assert ArtLayer(FakeDispatch(FakeIDispatch(calls, name="layer"))).name == "layer"
+    assert calls["GetIDsOfNames"] == 2
+    assert layer_set._ids is not _dispid_cache.get_table("ArtLayer")
+
+
+def test_first_wrapper_names_the_interface(calls):
+    dispatch = FakeDispatch(FakeIDispatch(calls, name="doc"))
+    Document(dispatch).name
+    ArtLayer(dispatch)
+    assert dispatch._ids is _dispid_cache.get_table("Document")
+    assert "ArtLayer" not in _dispid_cache.get_stats()
@@ -0,0 +1,57 @@
+"""Test exporting layers as separate files."""
+
+# Import built-in modules
+import json
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api._export_layers import file_name
+
+
+@pytest.fixture()
+def ps(backend):
+    with Session(action="new_document") as session:
+        yield session
+
+
+def test_export_top_level_layers_in_chunks(backend, ps, tmp_path):
+    doc = ps.active_document
+    for name in ("Sky", "Sea", "Boat: red"):
+        doc.artLayers.add().name = name
+    doc.artLayers.getByName("Sea").visible = False
+    backend.reset_stats()
+    exported = []
+    records = doc.export_layers(tmp_path / "out", "png", chunk_size=3, on_file=exported.append)
+    # One call reads the layer tree, one call per chunk exports the layers.
+    assert backend.member_calls["dojavascript"] == 3
+    assert exported == records
+    assert [record["name"] for record in records] == ["Boat: red", "Sea", "Sky", "Background"]
+    assert [record["error"] for record in records] == [None] * 4
+    assert records[0]["path"] == str(tmp_path / "out" / "000_Boat_ red.png")
+    with open(records[1]["path"], encoding="utf-8") as image_file:
+        assert json.load(image_file)["layers"] == ["Sea"]
+    assert [node.visible for node in doc.layer_tree()] == [True, False, True, True]
+    assert len(ps.app.documents) == 1
+
+
+def test_export_selected_layers(ps, tmp_path):
+    doc = ps.active_document
+    group = doc.layerSets.add()
+    layer = doc.artLayers.add()
+    layer.move(group, ps.ElementPlacement.PlaceInside)
+    records = doc.export_layers(tmp_path, "jpg", {"quality": 10}, layers=[layer, group], naming="{id}")
+    assert [record["path"] for record in records] == [
+        str(tmp_path / f"{layer.id}.jpg"),
+        str(tmp_path / f"{group.id}.jpg"),
+    ]
+    with open(records[1]["path"], encoding="utf-8") as image_file:
+        assert json.load(image_file)["layers"] == [group.name, layer.name]
+    with pytest.raises(ValueError):
+        doc.export_layers(tmp_path, "webp")
+
+
+def test_file_names_are_safe():
+    assert file_name("{index:02d}-{name}", 3, 7, "a/b*c. ") == "03-a_b_c"
@@ -6,8 +6,15 @@ from __future__ import division
 from __future__ import print_function
 
 # Import built-in modules
+import ast
 import importlib
+import os
 import pkgutil
+import subprocess
+import sys
+
+# Import third-party modules
+import pytest
 
 # Import local modules
 import photoshop
@@ -23,3 +30,45 @@ def test_imports():
     for _, name, _ in iter_packages:
         module_name = name if name.startswith(prefix) else prefix + name
         importlib.import_module(module_name)
+
+
+def _modules_imported_by(statement):
+    """Get the photoshop modules a fresh interpreter imports to run a statement."""
+    script = "import sys; {}; print(sorted(name for name in sys.modules if name.startswith('photoshop')))".format(
+        statement,
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], cwd=os.path.dirname(photoshop.__path__[0]))
+    return set(ast.literal_eval(output.decode().strip()))
+
+
+def test_session_import_is_lazy():
+    modules = _modules_imported_by("from photoshop import Session; Session.LayerKind")
+    assert "photoshop.session" in modules
+    assert "photoshop.api.enumerations" in modules
+    assert "photoshop.api.application" not in modules
+    assert "photoshop.api._core" not in modules
+
+
+def test_api_names_resolve_on_access():
+    # Import local modules
+    from photoshop import api
+    from photoshop.api import enumerations
+    from photoshop.api.application import Application
+
+    assert api.Application is Application
+    assert api.LayerKind is enumerations.LayerKind
+    assert {"Application", "LayerKind", "constants"} <= set(dir(api))
+    with pytest.raises(AttributeError):
+        api.NotAnEnumeration
+
+
+def test_session_exposes_names_on_the_class():
+    # Import local modules
+    from photoshop import Session
+    from photoshop.api import enumerations
+    from photoshop.api.solid_color import SolidColor
+
+    assert Session.BlendMode is enumerations.BlendMode
+    assert Session.SolidColor is SolidColor
+    # The first access replaced the class attribute with the enumeration.
+    assert vars(Session)["BlendMode"] is enumerations.BlendMode
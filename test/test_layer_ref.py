@@ -0,0 +1,118 @@
+"""Test addressing layers by their layer ID."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api import LayerRef
+from photoshop.api.errors import COMError
+
+
+@pytest.fixture()
+def ps(backend):
+    with Session(action="new_document") as session:
+        yield session
+
+
+def test_reference_reads_and_edits_with_one_call(backend, ps):
+    doc = ps.active_document
+    layer = doc.artLayers.add()
+    ref = LayerRef.of(layer)
+    assert ref == LayerRef(doc.id, layer.id)
+    assert len({ref, LayerRef(doc.id, layer.id)}) == 1
+    backend.reset_stats()
+    assert ref.read("name", "visible", "opacity", "layerKind", "missing") == {
+        "name": "Layer 1",
+        "visible": True,
+        "opacity": 255,
+        "layerKind": 1,
+        "missing": None,
+    }
+    ref.set(name="Title", opacity=50)
+    ref.visible = False
+    assert backend.stats["invoke"] == backend.member_calls["dojavascript"] == 3
+    assert (layer.name, layer.opacity, layer.visible) == ("Title", 50, False)
+    assert (ref.name, ref.opacity, ref.visible) == ("Title", 50, False)
+    assert ref.bounds == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_objects_other_than_rectangles_read_as_none(ps):
+    layer = ps.active_document.artLayers.add()
+    ref = LayerRef.of(layer)
+    assert ref.read("layerLocking", "bounds", "name") == {
+        "layerLocking": None,
+        "bounds": [0.0, 0.0, 0.0, 0.0],
+        "name": "Layer 1",
+    }
+
+
+def test_reference_survives_reordering(ps):
+    doc = ps.active_document
+    first = doc.artLayers.add()
+    ref = LayerRef.of(first)
+    index = ref.item_index
+    group = doc.layerSets.add()
+    first.move(group, ps.ElementPlacement.PlaceInside)
+    assert ref.item_index != index
+    ref.select()
+    assert doc.activeLayer.id == first.id
+    assert ref.kind == 1
+    first.delete()
+    with pytest.raises(COMError):
+        ref.name
+
+
+def test_tree_nodes_reference_their_layer(ps):
+    doc = ps.active_document
+    doc.artLayers.add().name = "Top"
+    doc.activeLayer = doc.artLayers.getByName("Background")
+    tree = doc.layer_tree()
+    assert tree[0].ref == LayerRef(doc.id, tree[0].id)
+    tree[0].ref.select()
+    assert doc.activeLayer.name == "Top"
+
+
+def test_delete_layers_with_one_action(backend, ps):
+    doc = ps.active_document
+    layers = [doc.artLayers.add() for _ in range(4)]
+    group = doc.layerSets.add()
+    layers[0].move(group, ps.ElementPlacement.PlaceInside)
+    tree = doc.layer_tree()
+    backend.reset_stats()
+    deleted = doc.delete_layers([layers[1], LayerRef.of(layers[2]).layer_id, tree.get(group.id), layers[0]])
+    assert deleted == 4
+    assert backend.member_calls["dojavascript"] == 1
+    assert [node.name for node in doc.layer_tree()] == ["Layer 4", "Background"]
+    with pytest.raises(ValueError):
+        doc.delete_layers([LayerRef(doc.id + 1, layers[3].id)])
+
+
+def test_deleting_keeps_the_active_document(ps):
+    doc = ps.active_document
+    layer = doc.artLayers.add()
+    other = ps.app.documents.add()
+    assert doc.delete_layers([layer]) == 1
+    assert ps.app.activeDocument.id == other.id
+    assert [node.name for node in doc.layer_tree()] == ["Background"]
+
+
+def test_delete_layers_matching_a_predicate(ps):
+    doc = ps.active_document
+    for name in ("Keep", "Draft 1", "Draft 2"):
+        doc.artLayers.add().name = name
+    assert doc.delete_layers(where=lambda node: node.name.startswith("Draft")) == 2
+    assert doc.delete_layers() == 0
+    assert [node.name for node in doc.layer_tree()] == ["Keep", "Background"]
+
+
+def test_remove_all_layers_of_a_set_with_one_action(backend, ps):
+    doc = ps.active_document
+    group = doc.layerSets.add()
+    for _ in range(3):
+        doc.artLayers.add().move(group, ps.ElementPlacement.PlaceInside)
+    backend.reset_stats()
+    group.artLayers.removeAll()
+    assert backend.member_calls["dojavascript"] == 2
+    assert len(group.artLayers) == 0
+    assert [node.name for node in doc.layer_tree()] == [group.name, "Background"]
@@ -0,0 +1,80 @@
+"""Test setting properties of many layers with one call."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api import LayerRef
+from photoshop.api.enumerations import BlendMode
+
+
+@pytest.fixture()
+def ps(backend):
+    with Session(action="new_document") as session:
+        yield session
+
+
+def test_save_and_restore_visibility_with_one_call_each(backend, ps):
+    doc = ps.active_document
+    for _ in range(5):
+        doc.artLayers.add()
+    doc.artLayers[1].visible = False
+    tree = doc.layer_tree()
+    visibility = [node.visible for node in tree]
+    backend.reset_stats()
+    assert doc.layers.set_visible(tree, False) == 6
+    assert backend.member_calls["dojavascript"] == 1
+    assert not any(node.visible for node in doc.layer_tree())
+    doc.layers.set_visible(tree, visibility)
+    assert [node.visible for node in doc.layer_tree()] == visibility
+
+
+def test_set_many_properties(backend, ps):
+    doc = ps.active_document
+    layers = [doc.artLayers.add() for _ in range(3)]
+    backend.reset_stats()
+    doc.artLayers.set_layers(
+        layers,
+        name=["A", None, "C"],
+        opacity=40,
+        blend_mode=(BlendMode.Multiply, BlendMode.Screen, None),
+        locked=True,
+    )
+    assert backend.member_calls["dojavascript"] == 1
+    assert [layer.name for layer in layers] == ["A", "Layer 2", "C"]
+    assert [layer.opacity for layer in layers] == [40, 40, 40]
+    assert [layer.blendMode for layer in layers] == [BlendMode.Multiply, BlendMode.Screen, BlendMode.NormalBlend]
+    assert all(layer.allLocked for layer in layers)
+    with pytest.raises(ValueError):
+        doc.set_opacity(layers, [10, 20])
+
+
+def test_layer_set_renames_its_layers(ps):
+    doc = ps.active_document
+    group = doc.layerSets.add()
+    for _ in range(2):
+        doc.artLayers.add().move(group, ps.ElementPlacement.PlaceInside)
+    children = doc.layer_tree().children(group.id)
+    assert group.rename(children, ["Front", "Back"]) == 2
+    group.set_locked(children)
+    assert [layer.name for layer in group.artLayers] == ["Front", "Back"]
+    assert doc.set_layers([]) == 0
+
+
+def test_setting_nothing_makes_no_call(backend, ps):
+    doc = ps.active_document
+    layer = doc.artLayers.add()
+    backend.reset_stats()
+    assert doc.set_layers([layer], name=[None]) == 1
+    LayerRef.of(layer).set()
+    assert backend.member_calls["dojavascript"] == 0
+
+
+def test_setting_keeps_the_active_document(ps):
+    doc = ps.active_document
+    layer = doc.artLayers.add()
+    other = ps.app.documents.add()
+    doc.set_visible([layer], False)
+    assert ps.app.activeDocument.id == other.id
+    assert not layer.visible
@@ -0,0 +1,59 @@
+"""Test reading the layer tree of a document with a single call."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api._layer_tree import GROUP_KIND
+from photoshop.api._layer_tree import LayerTree
+
+
+@pytest.fixture()
+def doc(backend):
+    with Session(action="new_document") as ps:
+        doc = ps.active_document
+        group = doc.layerSets.add()
+        inner = group.artLayers.add()
+        inner.name = "Inner"
+        inner.visible = False
+        nested = group.layerSets.add()
+        nested.artLayers.add().opacity = 40
+        doc.layer_tree()
+        yield doc
+
+
+def test_layer_tree_is_read_with_one_call(backend, doc):
+    backend.reset_stats()
+    tree = doc.layer_tree()
+    assert backend.round_trips == 1
+    assert isinstance(tree, LayerTree)
+    assert [(node.name, node.depth) for node in tree] == [
+        ("Group 1", 0),
+        ("Group 2", 1),
+        ("Layer 2", 2),
+        ("Inner", 1),
+        ("Background", 0),
+    ]
+    assert [layer.id for layer in doc.layers] == [node.id for node in tree.children()]
+
+
+def test_layer_records(doc):
+    tree = doc.layer_tree()
+    group, nested, layer, inner, background = tree
+    assert group.is_group and nested.is_group and not inner.is_group
+    assert group.kind == GROUP_KIND
+    assert inner.kind == 1
+    assert nested.parent == group
+    assert layer.parent_id == nested.id
+    assert group.parent is None
+    assert group.children == [nested, inner]
+    assert not inner.visible and background.visible
+    assert layer.opacity == 40.0
+    assert background.bounds == (0.0, 0.0, 960.0, 540.0)
+    assert [node.item_index for node in tree] == sorted((node.item_index for node in tree), reverse=True)
+    assert background.item_index == 1
+    assert tree.get(inner.id) == inner
+    assert tree.get(0) is None
+    assert tree[-1] == background
+    assert inner.id in tree
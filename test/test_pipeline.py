@@ -0,0 +1,136 @@
+"""Test running Python stages around a serialized Photoshop stage."""
+
+# Import built-in modules
+import threading
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.pipeline import Pipeline
+from photoshop.pipeline import Stage
+
+
+def test_stages_overlap_photoshop(backend):
+    count = 6
+    preparing, editing, finishing = ([threading.Event() for _ in range(count)] for _ in range(3))
+    overlaps = []
+    threads = set()
+
+    # Each stage waits until the neighbouring stage started its neighbouring item, which only
+    # happens if both run at the same time. Without overlap every wait times out.
+    def prepare(index):
+        preparing[index].set()
+        if index > 0:
+            overlaps.append(editing[index - 1].wait(5))
+        return index
+
+    def edit(ps, index):
+        threads.add(threading.get_ident())
+        editing[index].set()
+        if index + 1 < count:
+            overlaps.append(preparing[index + 1].wait(5))
+        if index > 0:
+            overlaps.append(finishing[index - 1].wait(5))
+        doc = ps.app.documents.add(name=f"Image {index}")
+        doc.close()
+        return doc.name
+
+    def finish(name):
+        index = int(name.split()[-1])
+        finishing[index].set()
+        if index + 1 < count:
+            overlaps.append(editing[index + 1].wait(5))
+        return name
+
+    prepare_stages = [Stage(prepare, workers=2), lambda value: value]
+    with Pipeline(edit, prepare=prepare_stages, finish=[Stage(finish, workers=2)]) as pipeline:
+        results = list(pipeline.run(range(count)))
+    assert overlaps == [True] * (4 * (count - 1))
+    assert sorted(result.index for result in results) == list(range(count))
+    assert {result.value for result in results} == {f"Image {index}" for index in range(count)}
+    assert len(threads) == 1 and threading.get_ident() not in threads
+    assert [stage.name for stage in pipeline.stages] == ["prepare", "<lambda>", "photoshop", "finish"]
+    assert 0.0 < pipeline.utilization() <= 1.0
+    assert backend.member_calls["add"] == count
+
+
+def test_errors_skip_the_following_stages(backend):
+    finished = []
+
+    def check(value):
+        if value == 2:
+            raise ValueError("bad input")
+        return value
+
+    with Pipeline(lambda ps, value: value * 10, prepare=[check], finish=[finished.append]) as pipeline:
+        results = {result.index: result for result in pipeline.run(range(4))}
+        assert sorted(finished) == [0, 10, 30]
+        assert isinstance(results[2].error, ValueError) and results[2].stage == "check"
+        assert results[3].value is None and results[3].error is None
+        # The Photoshop thread is reused by the next run.
+        assert len(list(pipeline.run([5]))) == 1
+        assert finished[-1] == 50
+
+
+def test_queues_apply_backpressure(backend):
+    prepared = []
+
+    def prepare(value):
+        prepared.append(value)
+        return value
+
+    with Pipeline(lambda ps, value: value, prepare=[prepare], queue_size=1) as pipeline:
+        results = pipeline.run(range(50))
+        for consumed, result in enumerate(results, 1):
+            # At most one item in each queue, one in the Photoshop stage and one waiting to be queued.
+            assert len(prepared) - consumed <= 4
+            if consumed == 10:
+                break
+        results.close()
+        assert len(prepared) <= 14
+
+
+def test_runs_start_with_the_iteration(backend):
+    prepared = []
+    with Pipeline(lambda ps, value: value, prepare=[prepared.append]) as pipeline:
+        pipeline.run(range(3))
+        assert not prepared
+        assert len(list(pipeline.run(range(3)))) == 3
+        assert prepared == [0, 1, 2]
+
+
+def test_the_session_is_entered_and_exited_on_the_photoshop_thread(backend):
+    exited = []
+    pipeline = Pipeline(
+        lambda ps, value: ps.active_document.name, session={"action": "new_document", "callback": exited.append}
+    )
+    with pipeline:
+        assert [result.error for result in pipeline.run([0])] == [None]
+        # The action of the session made the document the stage reads.
+        assert backend.member_calls["add"] == 1
+        assert not exited
+    assert len(exited) == 1
+
+
+class Abort(BaseException):
+    pass
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_a_stage_raising_a_base_exception_ends_the_run(backend):
+    def finish(value):
+        if value == 1:
+            raise Abort
+        return value
+
+    with Pipeline(lambda ps, value: value, finish=[finish]) as pipeline:
+        results = pipeline.run(range(3))
+        assert [result.value for result in results] == [0]
+
+
+def test_process_stages(backend):
+    with Pipeline(lambda ps, value: value + "!", prepare=[Stage(str.upper, workers=2, processes=True)]) as pipeline:
+        assert sorted(result.value for result in pipeline.run(["a", "b", "c"])) == ["A!", "B!", "C!"]
+    with pytest.raises(ValueError):
+        Stage(str.upper, workers=0)
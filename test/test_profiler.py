@@ -0,0 +1,91 @@
+"""Test the profiler of the calls made to Photoshop."""
+
+# Import built-in modules
+import logging
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api import Application
+from photoshop.api import profiler
+
+
+@pytest.fixture()
+def backend(backend, monkeypatch):
+    monkeypatch.delenv(profiler.ENV_NAME, raising=False)
+    backend.member_latency = {"saveas": 0.02}
+    yield backend
+    profiler.disable()
+
+
+def test_disabled_profiler_leaves_dispatch_untouched(backend):
+    doc = Application().documents.add()
+    assert type(doc.app) not in profiler._profiled_classes.values()
+    assert "_profile_owner" not in doc.app.__dict__
+
+
+def test_calls_are_recorded_per_wrapper_class(backend):
+    app = Application()
+    with profiler.profile() as prof:
+        doc = app.documents.add()
+        for _ in range(3):
+            doc.artLayers.add()
+        names = [layer.name for layer in doc.layers]
+        doc.layers[0].visible = False
+    assert len(names) == 4
+    assert prof.stats[("ArtLayers", "add")].count == 3
+    assert prof.stats[("ArtLayer", "name")].count == 4
+    assert prof.stats[("ArtLayer", "visible")].count == 1
+    assert prof.stats[("Layers", "[item]")].count == 4
+    assert prof.stats[("Layers", "item")].count == 1
+    stats = prof.stats[("Documents", "add")]
+    assert sum(stats.histogram) == stats.count == 1
+    assert stats.max == stats.total
+
+
+def test_slow_calls_are_logged_with_stack(backend, tmp_path):
+    with profiler.profile(slow_threshold=0.01) as prof:
+        doc = Application().documents.add()
+        doc.saveAs(str(tmp_path / "doc.psd"), None, True)
+    (call,) = prof.slow_calls
+    assert (call.owner, call.member) == ("Document", "saveAs")
+    assert call.duration >= 0.02
+    assert "test_profiler.py" in "".join(call.stack)
+    assert "Document.saveAs" in prof.report()
+
+
+def test_report_is_sorted(backend, tmp_path):
+    with profiler.profile() as prof:
+        doc = Application().documents.add()
+        doc.saveAs(str(tmp_path / "doc.psd"), None, True)
+        doc.name
+    lines = prof.report(limit=2).splitlines()
+    assert lines[2].startswith("Document.saveAs")
+    assert len(lines) == 4
+
+
+def test_session_logs_report_on_exit(backend, caplog):
+    caplog.set_level(logging.INFO, logger="photoshop")
+    with Session(action="new_document", profile=True) as ps:
+        ps.active_document.artLayers.add()
+    assert "ArtLayers.add" in caplog.text
+    assert profiler.get_profiler() is None
+
+
+def test_session_only_reports_its_own_profiler(backend, caplog):
+    caplog.set_level(logging.INFO, logger="photoshop")
+    with profiler.profile() as prof:
+        with Session(action="new_document", profile=True):
+            pass
+        assert profiler.get_profiler() is prof
+    assert not caplog.records
+
+
+def test_session_profile_from_environment(backend, caplog, monkeypatch):
+    caplog.set_level(logging.INFO, logger="photoshop")
+    monkeypatch.setenv(profiler.ENV_NAME, "1")
+    with Session(action="new_document"):
+        pass
+    assert "Documents.add" in caplog.text
@@ -0,0 +1,118 @@
+"""Test automating Photoshop through an agent."""
+
+# Import built-in modules
+import os
+import subprocess
+import sys
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api.enumerations import LayerKind
+from photoshop.remote import Agent
+from photoshop.remote import Client
+from photoshop.remote import RemoteError
+from photoshop.remote import RemoteObject
+
+
+@pytest.fixture()
+def agent(backend, tmp_path):
+    with Agent(port=0, token="secret", roots=[str(tmp_path)], chunk_size=4) as running:
+        yield running
+
+
+@pytest.fixture()
+def client(agent):
+    with Client(*agent.address, token="secret") as connected:
+        yield connected
+
+
+def test_remote_objects(client):
+    with client.session(action="new_document") as ps:
+        doc = ps.active_document
+        assert isinstance(doc, RemoteObject)
+        assert repr(doc).startswith("<RemoteObject Document")
+        layer = doc.artLayers.add()
+        layer.name = "Title"
+        assert ps.LayerKind is LayerKind
+        layer.kind = LayerKind.TextLayer
+        layer.textItem.contents = "Hello"
+        assert layer.textItem.contents == "Hello"
+        assert [item.name for item in doc.layers] == ["Title", "Background"]
+        assert len(doc.artLayers) == 2
+        assert doc.artLayers[0].name == "Title"
+        assert isinstance(layer.bounds, tuple)
+        color = ps.SolidColor()
+        color.rgb.red = 255
+        layer.textItem.color = color
+        assert layer.textItem.color.rgb.hexValue == "FF0000"
+        with pytest.raises(RemoteError, match="cannot be accessed"):
+            client.execute([{"op": "get", "target": {"$obj": layer._handle}, "name": "__class__"}])
+        with pytest.raises(AttributeError):
+            doc._private
+        with pytest.raises(RemoteError):
+            doc.notAMember
+
+
+def test_methods_are_remembered(client):
+    with client.session(action="new_document") as ps:
+        layers = ps.active_document.artLayers
+        layers.add()
+        requests = client.stats["requests"]
+        layers.add()
+        assert client.stats["requests"] == requests + 1
+
+
+def test_pipeline_sends_one_request(client):
+    with client.session(action="new_document") as ps:
+        doc = ps.active_document
+        requests = client.stats["requests"]
+        with client.pipeline() as pipeline:
+            for index in range(10):
+                layer = doc.artLayers.add()
+                layer.name = f"Layer {index}"
+            name = doc.activeLayer.name
+        assert client.stats["requests"] == requests + 1
+        assert len(pipeline) == 32
+        assert name.result() == "Layer 9"
+        assert len(doc.artLayers) == 11
+        with pytest.raises(RemoteError):
+            with client.pipeline():
+                doc.artLayers.add()
+                doc.notAMember
+                skipped = doc.name
+        with pytest.raises(RemoteError, match="Not executed"):
+            skipped.result()
+
+
+def test_fetch_streams_files(agent, client, tmp_path):
+    path = tmp_path / "export.bin"
+    path.write_bytes(bytes(range(10)))
+    assert list(client.stream(str(path))) == [bytes(range(4)), bytes(range(4, 8)), bytes(range(8, 10))]
+    assert client.fetch(str(path)) == bytes(range(10))
+    with pytest.raises(RemoteError, match="PermissionError"):
+        client.fetch(os.path.abspath(__file__))
+
+
+def test_token_is_required(agent):
+    with pytest.raises(RemoteError, match="Invalid token"):
+        Client(*agent.address, token="wrong")
+
+
+def test_agent_process_with_simulated_backend():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    env.pop("PS_VERSION", None)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "photoshop.remote", "--port", "0", "--backend", "simulated", "--token", "secret"],
+        stdout=subprocess.PIPE,
+        env=env,
+        universal_newlines=True,
+    )
+    try:
+        port = int(process.stdout.readline().rsplit(":", 1)[1])
+        with Client(port=port, token="secret", timeout=10) as client, client.session(action="new_document") as ps:
+            assert ps.active_document.name == "Untitled-1"
+    finally:
+        process.terminate()
+        process.wait(10)
@@ -0,0 +1,57 @@
+"""Test retrying the calls Photoshop rejects while busy."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api import Application
+from photoshop.api import retry
+from photoshop.api.errors import COMError
+
+
+@pytest.fixture()
+def backend(backend):
+    previous = retry.set_policy(retry.RetryPolicy(deadline=1.0, initial_delay=0.001, max_delay=0.004))
+    retry.stats.reset()
+    yield backend
+    retry.set_policy(previous)
+
+
+def test_rejected_reads_are_retried(backend):
+    doc = Application().documents.add()
+    backend.reject(3)
+    assert doc.name == "Untitled-1"
+    assert backend.stats["rejected"] == 3
+    assert (retry.stats.retries, retry.stats.retried_calls, retry.stats.failures) == (3, 1, 0)
+    assert retry.stats.waited > 0
+
+
+def test_rejected_calls_run_once(backend):
+    doc = Application().documents.add()
+    backend.reject(2, retry.RPC_E_SERVERCALL_RETRYLATER)
+    doc.artLayers.add()
+    backend.reject(1)
+    assert [layer.name for layer in doc.layers] == ["Layer 1", "Background"]
+    assert retry.stats.retries == 3
+
+
+def test_deadline(backend):
+    retry.set_policy(retry.RetryPolicy(deadline=0.02, initial_delay=0.005))
+    doc = Application().documents.add()
+    backend.reject(1000)
+    with pytest.raises(COMError):
+        doc.name
+    assert retry.stats.failures == 1
+    assert 0.01 <= retry.stats.waited <= 0.05
+
+
+def test_disabled_policy_and_other_errors(backend):
+    app = Application()
+    with pytest.raises(COMError):
+        app.doJavaScript("unknown()")
+    assert retry.stats.retried_calls == 0
+    retry.set_policy(None)
+    backend.reject(1)
+    with pytest.raises(COMError):
+        app.documents.add()
+    assert retry.is_retryable(COMError(0x80010001, "Call was rejected by callee.", None))
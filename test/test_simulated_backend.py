@@ -0,0 +1,151 @@
+"""Test the API classes against the simulated Photoshop backend."""
+
+# Import built-in modules
+import json
+import time
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api import Application
+from photoshop.api import backends
+from photoshop.api._artlayer import ArtLayer
+from photoshop.api.errors import COMError
+
+
+def test_backend_is_selected_by_name(monkeypatch):
+    monkeypatch.setenv(backends.ENV_NAME, "simulated")
+    with backends.use_backend(None):
+        assert backends.get_backend().name == "simulated"
+    with pytest.raises(ValueError):
+        backends.create_backend("unknown")
+
+
+def test_application_uses_latest_version(backend):
+    app = Application()
+    assert app.program_name == "Photoshop.Application.190"
+    assert app.version == "25.0.0"
+    with pytest.raises(OSError):
+        backend.create_object("Photoshop.Application.170")
+
+
+def test_session_creates_documents_and_layers(backend, tmp_path):
+    with Session(action="new_document") as ps:
+        doc = ps.active_document
+        assert (doc.name, doc.width, doc.height) == ("Untitled-1", 960, 540)
+        assert doc.activeLayer.name == "Background"
+
+        layer = doc.artLayers.add()
+        layer.name = "Title"
+        layer.kind = ps.LayerKind.TextLayer
+        assert layer.app.kind == ps.LayerKind.TextLayer
+        layer.textItem.contents = "Hello, World!"
+        text_color = ps.SolidColor()
+        text_color.rgb.green = 255
+        layer.textItem.color = text_color
+        doc.layerSets.add()
+
+        assert doc.artLayers.getByName("Title").textItem.contents == "Hello, World!"
+        assert layer.textItem.color.rgb.hexValue == "00FF00"
+        assert [item.name for item in doc.layers] == ["Group 1", "Title", "Background"]
+        assert len(doc.artLayers) == 2
+        assert len(doc.layerSets) == 1
+
+        jpg = tmp_path / "hello_world.jpg"
+        doc.saveAs(str(jpg), ps.JPEGSaveOptions(quality=5), asCopy=True)
+        assert json.loads(jpg.read_text())["options"] == "JPEGSaveOptions"
+
+
+def test_documents_collection(backend):
+    app = Application()
+    first = app.documents.add(name="first")
+    app.documents.add(name="second")
+    assert [doc.name for doc in app.documents] == ["first", "second"]
+    assert app.documents.getByName("first").name == "first"
+    first.close()
+    assert len(app.documents) == 1
+    assert app.activeDocument.name == "second"
+
+
+def test_layer_operations(backend):
+    doc = Application().documents.add()
+    top = doc.artLayers.add()
+    top.translate(10, 20)
+    copy = top.duplicate()
+    assert copy.name == f"{top.name} copy"
+    assert copy.bounds == (10.0, 20.0, 10.0, 20.0)
+    copy.remove()
+    assert len(doc.artLayers) == 2
+    doc.artLayers.removeAll()
+    assert len(doc.artLayers) == 0
+
+
+def test_action_descriptors(backend):
+    app = Application()
+    desc = Session().ActionDescriptor
+    key = app.charIDToTypeID("Wdth")
+    desc.putInteger(key, 42)
+    assert desc.hasKey(key)
+    assert desc.getInteger(key) == 42
+    assert app.typeIDToCharID(key) == "Wdth"
+    assert app.typeIDToStringID(app.stringIDToTypeID("layerKind")) == "layerKind"
+
+
+def test_scripts_and_actions(backend):
+    backend.register_script("app.activeDocument.name", lambda app, args: app.activeDocument.name)
+    backend.register_action("get", lambda app, reference: None)
+    app = Application()
+    app.documents.add(name="scripted")
+    assert app.doJavaScript("  app.activeDocument.name  ") == "scripted"
+    assert app.executeActionGet(Session().ActionReference) is not None
+    with pytest.raises(COMError):
+        app.doJavaScript("app.activeDocument.suspendHistory()")
+
+
+def test_round_trips_are_counted(backend):
+    doc = Application().documents.add()
+    backend.reset_stats()
+    layers = [ArtLayer(layer) for layer in doc.app.artLayers]
+    assert backend.stats["IEnumVARIANT"] == 2
+    assert [layer.name for layer in layers] == ["Background"]
+    assert backend.member_calls["name"] == 1
+
+
+def test_names_resolve_once_per_wrapper_class(backend):
+    doc = Application().documents.add()
+    for _ in range(3):
+        doc.artLayers.add()
+    backend.reset_stats()
+    assert len([layer.name for layer in doc.artLayers[:]]) == 4
+    assert backend.member_calls["name"] == 4
+    assert backend.stats["GetIDsOfNames"] <= 2
+
+
+def test_layers_of_mixed_interfaces_resolve_names_on_their_own(backend):
+    doc = Application().documents.add()
+    doc.layerSets.add()
+    doc.artLayers.add()
+    backend.reset_stats()
+    assert [layer.name for layer in doc.layers] == ["Layer 1", "Group 1", "Background"]
+    # The layer set is wrapped in an ArtLayer but must not share the ArtLayer DISPIDs.
+    assert backend.stats["GetIDsOfNames"] >= 3
+
+
+def test_unflagged_methods_run_when_read(backend):
+    """Like Photoshop, reading a method as a property calls it, see `Photoshop._flag_as_method`."""
+    doc = Application().documents.add()
+    layer = doc.artLayers.add()
+    dispatch = backend.create_object("Photoshop.Application").activeDocument.activeLayer
+    assert dispatch.name == layer.name
+    dispatch.delete
+    assert len(doc.artLayers) == 1
+
+
+def test_latency_is_applied_per_round_trip(backend):
+    backend.member_latency = {"name": 0.01}
+    doc = Application().documents.add()
+    start = time.perf_counter()
+    assert doc.name == "Untitled-1"
+    assert time.perf_counter() - start >= 0.01
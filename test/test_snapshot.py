@@ -0,0 +1,96 @@
+"""Test reading many properties with a single doJavaScript call."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop import Session
+from photoshop.api.enumerations import BlendMode
+from photoshop.api.enumerations import DocumentMode
+from photoshop.api.enumerations import LayerKind
+
+
+@pytest.fixture()
+def ps(backend):
+    with Session(action="new_document") as session:
+        yield session
+
+
+def test_document_snapshot(backend, ps):
+    doc = ps.active_document
+    doc.snapshot(["name"])
+    backend.reset_stats()
+    values = doc.snapshot()
+    assert backend.round_trips == 1
+    assert values["name"] == "Untitled-1"
+    assert (values["width"], values["height"]) == (960.0, 540.0)
+    assert values["mode"] is DocumentMode.RGB
+    assert values["fullName"] is None
+
+
+def test_dotted_fields(ps):
+    doc = ps.active_document
+    doc.layerSets.add()
+    fields = [
+        "activeLayer.typename",
+        "activeLayer.kind",
+        "layers.length",
+        "selection.bounds",
+        "channels",
+        "missing.name",
+    ]
+    values = doc.snapshot(fields)
+    assert values == {
+        "activeLayer.typename": "LayerSet",
+        "activeLayer.kind": None,
+        "layers.length": 2,
+        "selection.bounds": None,
+        "channels": {"typename": "Channels", "id": None},
+        "missing.name": None,
+    }
+
+
+def test_layer_and_application_snapshots(backend, ps):
+    layer = ps.active_document.artLayers.add()
+    layer.kind = ps.LayerKind.TextLayer
+    layer.textItem.contents = "Hello"
+    values = layer.snapshot(["kind", "blendMode", "bounds", "textItem.contents"])
+    assert values["kind"] is LayerKind.TextLayer
+    assert values["blendMode"] is BlendMode.NormalBlend
+    assert values["bounds"] == [0.0, 0.0, 0.0, 0.0]
+    assert values["textItem.contents"] == "Hello"
+    backend.reset_stats()
+    values = ps.app.snapshot(["currentTool", "activeDocument.activeLayer.name", "foregroundColor.rgb.hexValue"])
+    assert values == {
+        "currentTool": "moveTool",
+        "activeDocument.activeLayer.name": "Layer 1",
+        "foregroundColor.rgb.hexValue": "000000",
+    }
+    assert backend.round_trips == 1
+
+
+def test_describe_documents(backend, ps, tmp_path):
+    saved = ps.app.documents.add(name="saved")
+    saved.saveAs(str(tmp_path / "saved.psd"), None, False)
+    collection = ps.app.documents
+    collection.describe(["name"])
+    backend.reset_stats()
+    documents = collection.describe()
+    assert backend.round_trips == 1
+    assert [doc["name"] for doc in documents] == ["Untitled-1", "saved"]
+    assert documents[0]["path"] is None
+    assert documents[1]["path"] == str(tmp_path)
+    assert (documents[1]["width"], documents[1]["height"]) == (960.0, 540.0)
+    assert documents[1]["mode"] is DocumentMode.RGB
+    assert ps.app.documents.describe(["name", "activeLayer.name"])[0] == {
+        "name": "Untitled-1",
+        "activeLayer.name": "Background",
+    }
+
+
+def test_paths_are_read_as_strings(ps, tmp_path):
+    doc = ps.active_document
+    doc.saveAs(str(tmp_path / "image.psd"), None, False)
+    values = doc.snapshot(["path", "fullName"])
+    assert values == {"path": str(tmp_path), "fullName": str(tmp_path / "image.psd")}
+    assert ps.app.snapshot(["activeDocument.fullName"]) == {"activeDocument.fullName": str(tmp_path / "image.psd")}
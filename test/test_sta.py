@@ -0,0 +1,100 @@
+"""Test sharing one Photoshop connection between threads through an STA worker thread."""
+
+# Import built-in modules
+from concurrent.futures import BrokenExecutor
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from photoshop.api import backends
+from photoshop.api.backends import SimulatedBackend
+from photoshop.sta import STAExecutor
+from photoshop.sta import STAProxy
+
+
+class ThreadRecordingBackend(SimulatedBackend):
+    """Records the threads making round trips and preparing themselves."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+        self.initialized = []
+
+    def initialize_thread(self):
+        self.initialized.append(threading.get_ident())
+
+    def uninitialize_thread(self):
+        self.initialized.remove(threading.get_ident())
+
+    def _round_trip(self, kind, member=""):
+        self.threads.add(threading.get_ident())
+        super()._round_trip(kind, member)
+
+
+@pytest.fixture()
+def backend(monkeypatch):
+    monkeypatch.delenv("PS_VERSION", raising=False)
+    with backends.use_backend(ThreadRecordingBackend()) as recording:
+        yield recording
+
+
+@pytest.fixture()
+def sta(backend):
+    with STAExecutor() as executor:
+        yield executor
+
+
+def test_threads_share_one_session(backend, sta):
+    with sta.session(action="new_document") as ps:
+        doc = ps.active_document
+        assert isinstance(doc, STAProxy)
+        assert repr(doc) == "<STAProxy Document>"
+
+        def add_layer(index):
+            layer = doc.artLayers.add()
+            layer.name = f"Layer {index}"
+            return layer.name
+
+        with ThreadPoolExecutor(8) as pool:
+            names = list(pool.map(add_layer, range(24)))
+        assert names == [f"Layer {index}" for index in range(24)]
+        assert len(doc.artLayers) == 25
+        assert {layer.name for layer in doc.artLayers} >= set(names)
+        assert doc.artLayers[0].name in names
+    assert backend.threads == {sta.thread.ident}
+    assert backend.initialized == [sta.thread.ident]
+
+
+def test_submit_returns_futures(sta):
+    futures = [sta.submit(threading.get_ident) for _ in range(10)]
+    assert {future.result() for future in futures} == {sta.thread.ident}
+    with pytest.raises(ZeroDivisionError):
+        sta.call(lambda: 1 / 0)
+    # Calls made on the worker thread run immediately instead of waiting for themselves.
+    assert sta.call(lambda: sta.call(threading.get_ident)) == sta.thread.ident
+
+
+def test_shutdown(backend):
+    sta = STAExecutor()
+    started, release = threading.Event(), threading.Event()
+    running = sta.submit(lambda: started.set() or release.wait())
+    queued = sta.submit(int)
+    started.wait()
+    sta.shutdown(wait=False, cancel_futures=True)
+    release.set()
+    sta.thread.join()
+    assert running.result() is True
+    assert queued.cancelled()
+    assert backend.initialized == []
+    with pytest.raises(RuntimeError):
+        sta.submit(int)
+
+
+def test_failing_initializer_breaks_the_executor(backend):
+    sta = STAExecutor(initializer=lambda: 1 / 0)
+    sta.thread.join()
+    with pytest.raises(BrokenExecutor):
+        sta.submit(int)
@@ -14,6 +14,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from photoshop_api_extended import api
+from photoshop.api import retry
 
 
 class BatchTester:
@@ -176,14 +177,6 @@ class BatchTester:
                 print(f"  ✓ 成功: {result['message'][:60]}...")
             else:
                 print(f"  ✗ 失败: {result['message'][:60]}...")
-                if 'busy' in result['message'].lower():
-                    print(f"    提示: COM繁忙，重新测试...")
-                    time.sleep(1)
-                    retry_result = api.execute(action, params)
-                    if retry_result['success']:
-                        print(f"    重试成功!")
-                        group_results[-1]['success'] = True
-                        group_results[-1]['message'] = retry_result['message']
 
             time.sleep(delay)
 
@@ -278,6 +271,8 @@ class BatchTester:
         print(f" 总计: {total} 个测试")
         print(f" 成功: {success} 个 ({success/total*100:.1f}%)")
         print(f" 失败: {total-success} 个")
+        # COM繁忙时 photoshop.api 会自动退避重试
+        print(f" COM繁忙重试: {retry.stats.retries} 次, 等待 {retry.stats.waited:.1f} 秒")
         print('=' * 70)
 
         # 保存结果到文件
@@ -287,7 +282,9 @@ class BatchTester:
                 'total': total,
                 'success': success,
                 'failed': total - success,
-                'success_rate': success / total * 100
+                'success_rate': success / total * 100,
+                'com_retries': retry.stats.retries,
+                'com_retry_wait': retry.stats.waited
             },
             'results': all_results
         }
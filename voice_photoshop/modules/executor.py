@@ -91,9 +91,10 @@ class PhotoshopExecutor:
             import photoshop
             self.ps = photoshop
             
-            # 初始化Session
-            from photoshop import Session
-            self.session = Session()
+            # 初始化Session，Photoshop调用在后台COM线程执行，不阻塞事件循环
+            from photoshop.aio import AsyncSession
+            self.session = AsyncSession()
+            await self.session.__aenter__()
             
             self.initialized = True
             logger.info("Photoshop executor initialized successfully")
@@ -133,8 +134,8 @@ class PhotoshopExecutor:
             execution_globals = {"ps": self.ps}
             execution_locals = {}
             
-            # 执行代码
-            exec(code, execution_globals, execution_locals)
+            # 在COM线程上执行代码
+            await self.session.run(lambda _session: exec(code, execution_globals, execution_locals))
             
             logger.info(f"Successfully executed action: {action_name}", params=params)
             
@@ -186,7 +187,7 @@ class PhotoshopExecutor:
     async def cleanup(self):
         """清理资源"""
         if self.session:
-            self.session.close()
+            await self.session.__aexit__(None, None, None)
         logger.info("Photoshop executor cleaned up")
 
 